@@ -33,7 +33,7 @@ from core.models import (
 # Phase 1: Database and API Routers
 from backend.database import init_db, SessionLocal
 from backend.models import JobHistory as DBJobHistory, JobStatus
-from backend.routers import accounts, tts, scheduler, bgm, preview, drafts  # Phase 3: Draft 라우터 추가
+from backend.routers import accounts, tts, scheduler, bgm, preview, drafts, storage  # Phase 3: Draft 라우터 추가
 from backend.scheduler import scheduler_instance  # ✨ NEW
 from sqlalchemy import func
 
@@ -42,8 +42,12 @@ async def lifespan(app: FastAPI):
     # 시작 시 실행
     init_db()
     print("[FastAPI] 데이터베이스 초기화 완료")
+    # Draft / 작업 / 프리뷰 참조 등록 (StorageGC와 TTS 캐시 LRU가 참조 중인 파일을 지우지 않도록)
+    from backend.workers import register_storage_gc_sources
+    register_storage_gc_sources()
     scheduler_instance.start()
     scheduler_instance.load_account_schedules()
+    scheduler_instance.add_storage_gc_schedule()
     print("[FastAPI] 스케줄러 시작 완료")
     yield
     # 종료 시 실행
@@ -77,6 +81,7 @@ app.include_router(scheduler.router)
 app.include_router(bgm.router)  # Phase 5: BGM API
 app.include_router(preview.router)  # Phase 3: Preview API
 app.include_router(drafts.router)  # Phase 3: Draft API (Human-in-the-Loop)
+app.include_router(storage.router)  # 저장 공간 GC (관리자)
 
 
 # ==================== 정적 파일 서빙 (Phase 3) ====================
@@ -124,6 +129,7 @@ class CreateVideoRequest(BaseModel):
     tts_provider: Optional[str] = None  # gtts, elevenlabs, google_cloud
     tts_settings: Optional[Dict[str, Any]] = None  # ✨ NEW: TTS 상세 설정
     bgm_settings: Optional[Dict[str, Any]] = None  # Phase 5: BGM 설정 (enabled, mood, volume)
+    encoder_profile: Optional[str] = None  # draft, preview, standard, archive (None이면 템플릿/기본값)
 
 
 class GetJobStatusRequest(BaseModel):
@@ -264,7 +270,8 @@ async def create_video(request: CreateVideoRequest):
             target_duration=request.duration,
             upload=request.upload,
             template=request.template,  # ✨ NEW
-            tts_settings=request.tts_settings  # ✨ NEW
+            tts_settings=request.tts_settings,  # ✨ NEW
+            encoder_profile=request.encoder_profile
         )
 
         return {
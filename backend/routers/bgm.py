@@ -9,6 +9,7 @@ from pathlib import Path
 import shutil
 
 from backend.schemas import MoodInfo, MoodsResponse, BGMInfo, BGMListResponse, BGMUploadResponse
+from core.services.media_probe import get_media_probe_service
 import os
 
 router = APIRouter(prefix="/api/bgm", tags=["BGM"])
@@ -80,28 +81,25 @@ async def list_bgm_files():
         bgm_manager = BGMManager()
         all_bgm = []
 
-        # 모든 분위기의 BGM 수집
+        # 모든 분위기의 BGM 파일 수집
+        audio_files = []
         for mood_folder in BGM_DIR.iterdir():
             if mood_folder.is_dir():
                 mood_name = mood_folder.name.upper()
+                audio_files.extend((mood_name, f) for f in mood_folder.glob("*.mp3"))
 
-                for audio_file in mood_folder.glob("*.mp3"):
-                    # 파일 정보 수집 (pydub로 길이 측정 시도)
-                    try:
-                        from pydub import AudioSegment
-                        audio = AudioSegment.from_file(str(audio_file))
-                        duration = len(audio) / 1000.0
-                    except Exception as e:
-                        # 길이 측정 실패 시 0.0 (pydub/ffmpeg 없을 수 있음)
-                        duration = 0.0
-
-                    bgm_info = BGMInfo(
-                        name=audio_file.stem,
-                        mood=mood_name,
-                        duration=duration,
-                        file_path=str(audio_file.relative_to(Path.cwd()))
-                    )
-                    all_bgm.append(bgm_info)
+        # 길이 측정 (미디어 색인 1회 조회, 새/변경 파일만 헤더 파싱)
+        infos = get_media_probe_service().probe_many(str(f) for _, f in audio_files)
+
+        for mood_name, audio_file in audio_files:
+            info = infos[str(audio_file)]
+            bgm_info = BGMInfo(
+                name=audio_file.stem,
+                mood=mood_name,
+                duration=info.duration if info else 0.0,  # 측정 실패 시 0.0
+                file_path=str(audio_file.relative_to(Path.cwd()))
+            )
+            all_bgm.append(bgm_info)
 
         return {
             "bgm_files": all_bgm,
@@ -146,14 +144,8 @@ async def upload_bgm(
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
 
-        # 파일 길이 측정
-        try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(str(file_path))
-            duration = len(audio) / 1000.0
-        except Exception as e:
-            # 길이 측정 실패 시 0.0 (pydub/ffmpeg 없을 수 있음)
-            duration = 0.0
+        # 파일 길이 측정 (헤더만 읽음, 측정 실패 시 0.0)
+        duration = get_media_probe_service().duration(str(file_path), default=0.0)
 
         return {
             "message": "BGM 업로드 성공",
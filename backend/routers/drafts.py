@@ -20,6 +20,7 @@ from core.planner import ContentPlanner
 from core.asset_manager import AssetManager
 from core.orchestrator import ContentOrchestrator
 from core.models import VideoFormat, ContentPlan, ScriptSegment
+from core.services.tts_cache import get_tts_cache
 
 router = APIRouter(prefix="/api/draft", tags=["Drafts"])
 
@@ -51,6 +52,7 @@ class FinalizeDraftRequest(BaseModel):
     upload: bool = False
     template: Optional[str] = None
     bgm_settings: Optional[Dict[str, Any]] = None
+    encoder_profile: Optional[str] = None  # draft, preview, standard, archive (None이면 템플릿/기본값)
 
 
 class SegmentResponse(BaseModel):
@@ -167,7 +169,8 @@ async def create_draft(
         asset_manager = None
         if request.collect_assets:
             print(f"[Draft API] 에셋 수집 시작...")
-            asset_manager = AssetManager(bgm_enabled=False)  # Draft에서는 BGM 수집 안 함
+            # Draft에서는 BGM 수집 안 함, TTS는 미리듣기와 같은 캐시
+            asset_manager = AssetManager(bgm_enabled=False, tts_cache=get_tts_cache())
             asset_bundle = asset_manager.collect_assets(content_plan)
             print(f"[Draft API] 에셋 수집 완료: 영상 {len(asset_bundle.videos)}개, TTS 생성됨")
 
@@ -423,7 +426,8 @@ async def finalize_draft(
             orchestrator.create_content_from_plan,
             content_plan=content_plan,
             upload=request.upload,
-            template=request.template
+            template=request.template,
+            encoder_profile=request.encoder_profile
         )
 
         # 4. Draft 상태 업데이트
@@ -33,6 +33,7 @@ class PreviewGenerateRequest(BaseModel):
     account_id: Optional[int] = Field(None, description="계정 ID")
     tts_settings: Optional[Dict[str, Any]] = Field(None, description="TTS 설정 오버라이드")
     low_resolution: bool = Field(default=True, description="저해상도 프리뷰 (540p)")
+    encoder_profile: str = Field(default="preview", description="인코더 프로필 (draft, preview, standard, archive)")
 
 
 class PreviewAdjustRequest(BaseModel):
@@ -79,6 +80,13 @@ async def generate_preview(request: PreviewGenerateRequest, background_tasks: Ba
     백그라운드에서 비동기로 처리됩니다.
     """
     import uuid
+    from core.services.encoder_profiles import ENCODER_PROFILES
+
+    if request.encoder_profile not in ENCODER_PROFILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 인코더 프로필: {request.encoder_profile} ({', '.join(ENCODER_PROFILES)})"
+        )
 
     # 작업 ID 생성
     job_id = f"preview_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
@@ -291,32 +299,39 @@ async def _generate_preview_task(job_id: str, request: PreviewGenerateRequest):
             for i, seg in enumerate(content_plan.segments)
         ]
 
-        # 2. 에셋 수집
+        # 저해상도 설정
+        from core.models import EditConfig
+
+        if request.low_resolution:
+            preview_config = EditConfig(
+                resolution=(540, 960),  # 절반 해상도
+                fps=24  # 낮은 FPS
+            )
+        else:
+            preview_config = EditConfig()
+
+        # 2. 에셋 수집 (프리뷰 해상도에 맞는 작은 렌디션)
         print(f"[Preview {job_id}] 에셋 수집 중...")
         asset_bundle = orchestrator.asset_manager.collect_assets(
             content_plan,
             account_id=request.account_id,
-            tts_settings_override=request.tts_settings
+            tts_settings_override=request.tts_settings,
+            edit_config=preview_config,
+            preview=request.low_resolution
         )
 
         if not asset_bundle:
             raise Exception("에셋 수집 실패")
 
+        # 렌더링이 끝날 때까지 저장 공간 GC가 에셋을 지우지 않도록 고정
+        from core.services.storage_gc import get_storage_gc, bundle_paths
+        get_storage_gc().pin(job_id, bundle_paths(asset_bundle))
+
         preview_jobs[job_id]["progress"] = 60
 
         # 3. 영상 편집 (저해상도)
         print(f"[Preview {job_id}] 프리뷰 렌더링 중...")
         from core.editor import VideoEditor
-        from core.models import EditConfig
-
-        # 저해상도 설정
-        if request.low_resolution:
-            preview_config = EditConfig(
-                resolution=(540, 960),  # 절반 해상도
-                fps=24  # 낮은 FPS
-            )
-        else:
-            preview_config = EditConfig()
 
         editor = VideoEditor(config=preview_config)
 
@@ -325,7 +340,8 @@ async def _generate_preview_task(job_id: str, request: PreviewGenerateRequest):
             content_plan,
             asset_bundle,
             output_filename=preview_filename,
-            template_name=request.template_name
+            template_name=request.template_name,
+            encoder_profile=request.encoder_profile
         )
 
         if not output_path:
@@ -354,6 +370,10 @@ async def _generate_preview_task(job_id: str, request: PreviewGenerateRequest):
         print(f"[Preview {job_id}] 오류: {e}")
         traceback.print_exc()
 
+    finally:
+        from core.services.storage_gc import get_storage_gc
+        get_storage_gc().unpin(job_id)
+
 
 async def _adjust_preview_task(job_id: str, adjustments: Dict[str, Any]):
     """
@@ -0,0 +1,39 @@
+"""
+Storage Admin API
+저장 공간 GC 보고서 및 실행 (downloads / output 디렉토리 용량 관리)
+"""
+from fastapi import APIRouter, HTTPException
+
+from backend.schemas import StorageGCRequest, StorageGCReportResponse
+
+router = APIRouter(prefix="/api/admin/storage", tags=["Admin"])
+
+
+@router.get("/gc", response_model=StorageGCReportResponse)
+def storage_gc_report():
+    """
+    저장 공간 GC dry-run 보고서
+
+    디렉토리별 크기 / 상한 / 참조 중인 파일과 지금 실행하면 삭제될 파일 목록을 반환합니다. (삭제하지 않음)
+    """
+    return _run(dry_run=True)
+
+
+@router.post("/gc", response_model=StorageGCReportResponse)
+def run_storage_gc(request: StorageGCRequest):
+    """
+    저장 공간 GC 실행 (기본 dry_run=True, 실제 삭제는 dry_run=false)
+
+    Draft / 진행 중인 작업 / 프리뷰 작업이 참조하는 파일과 최근 수정된 파일은 삭제하지 않습니다.
+    """
+    return _run(dry_run=request.dry_run)
+
+
+def _run(dry_run: bool) -> dict:
+    """GC Worker 실행 (참조 소스 조회 실패 시 아무것도 삭제하지 않고 500)"""
+    from backend.workers import run_storage_gc as run_storage_gc_worker
+
+    try:
+        return run_storage_gc_worker(dry_run=dry_run)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"저장 공간 GC 실패: {str(e)}")
@@ -6,19 +6,14 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 from typing import Optional
-import hashlib
-from pathlib import Path
 
-from backend.schemas import VoiceInfo, TTSVoicesResponse, MessageResponse
+from backend.schemas import VoiceInfo, TTSVoicesResponse, MessageResponse, TTSCacheStatsResponse
+from core.services.tts_cache import (
+    get_tts_cache, elevenlabs_cache_key, ELEVENLABS_MODEL, ELEVENLABS_OUTPUT_FORMAT
+)
 
 router = APIRouter(prefix="/api/tts", tags=["TTS"])
 
-# 미리듣기용 임시 디렉토리
-import os
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-PREVIEW_DIR = Path(os.getenv("TTS_PREVIEW_DIR", str(PROJECT_ROOT / "downloads" / "audio" / "preview")))
-PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
-
 
 class TTSPreviewRequest(BaseModel):
     """TTS 미리듣기 요청"""
@@ -36,63 +31,60 @@ async def preview_tts(request: TTSPreviewRequest):
 
     전체 영상을 생성하지 않고 설정값을 테스트할 수 있습니다.
     같은 텍스트 + 설정이면 캐시된 파일을 반환합니다.
+    영상 생성(AssetManager)과 같은 TTS 캐시를 쓰므로 미리듣기한 문장은 렌더링 시 다시 생성하지 않습니다.
     """
     try:
-        from elevenlabs.client import ElevenLabs
         import os
 
-        # API 키 확인
-        api_key = os.getenv("ELEVENLABS_API_KEY")
-        if not api_key:
-            raise HTTPException(status_code=500, detail="ELEVENLABS_API_KEY가 설정되지 않았습니다.")
-
-        # 캐시 파일명 생성
-        settings_str = f"{request.voice_id}_{request.stability}_{request.similarity_boost}_{request.style}"
-        cache_hash = hashlib.md5(
-            f"{request.text}_{settings_str}".encode()
-        ).hexdigest()[:10]
-        filename = f"preview_{cache_hash}.mp3"
-        filepath = PREVIEW_DIR / filename
-
-        # 캐시 확인
-        if filepath.exists():
-            return FileResponse(
-                path=str(filepath),
-                media_type="audio/mpeg",
-                filename=filename,
-                headers={"X-Cache": "HIT"}
+        cache = get_tts_cache()
+        key = elevenlabs_cache_key(
+            request.text, request.voice_id, request.stability, request.similarity_boost, request.style
+        )
+
+        def synthesize(temp_path: str) -> None:
+            from elevenlabs.client import ElevenLabs
+
+            # API 키 확인
+            api_key = os.getenv("ELEVENLABS_API_KEY")
+            if not api_key:
+                raise HTTPException(status_code=500, detail="ELEVENLABS_API_KEY가 설정되지 않았습니다.")
+
+            # TTS 생성
+            client = ElevenLabs(api_key=api_key)
+
+            audio_generator = client.text_to_speech.convert(
+                text=request.text,
+                voice_id=request.voice_id,
+                model_id=ELEVENLABS_MODEL,
+                output_format=ELEVENLABS_OUTPUT_FORMAT,
+                voice_settings={
+                    "stability": request.stability,
+                    "similarity_boost": request.similarity_boost,
+                    "style": request.style,
+                    "use_speaker_boost": True
+                }
             )
 
-        # TTS 생성
-        client = ElevenLabs(api_key=api_key)
-
-        audio_generator = client.text_to_speech.convert(
-            text=request.text,
-            voice_id=request.voice_id,
-            model_id="eleven_multilingual_v2",
-            output_format="mp3_44100_128",
-            voice_settings={
-                "stability": request.stability,
-                "similarity_boost": request.similarity_boost,
-                "style": request.style,
-                "use_speaker_boost": True
-            }
-        )
+            # 저장
+            with open(temp_path, 'wb') as f:
+                for chunk in audio_generator:
+                    if isinstance(chunk, bytes):
+                        f.write(chunk)
 
-        # 저장
-        with open(filepath, 'wb') as f:
-            for chunk in audio_generator:
-                if isinstance(chunk, bytes):
-                    f.write(chunk)
+        filepath, hit = cache.get_or_create(key, synthesize, provider="elevenlabs")
+        if not filepath:
+            raise HTTPException(status_code=500, detail="TTS 생성 실패: 빈 응답")
 
         # 파일 반환
         return FileResponse(
-            path=str(filepath),
+            path=filepath,
             media_type="audio/mpeg",
-            filename=filename,
-            headers={"X-Cache": "MISS"}
+            filename=f"preview_{key[:16]}.mp3",
+            headers={"X-Cache": "HIT" if hit else "MISS"}
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"TTS 생성 실패: {str(e)}")
 
@@ -193,15 +185,21 @@ async def list_voices():
     return {"voices": voices}
 
 
+@router.get("/cache/stats", response_model=TTSCacheStatsResponse)
+async def get_tts_cache_stats():
+    """
+    TTS 캐시 통계 (항목 수, 전체 크기 / 상한, hit/miss, 삭제 수, 제공자별 사용량)
+
+    hits / misses / evictions는 서버 프로세스 시작 이후 값, lifetime_hits는 색인에 누적된 값입니다.
+    """
+    return get_tts_cache().stats()
+
+
 @router.delete("/cache", response_model=MessageResponse)
 async def clear_preview_cache():
     """
-    미리듣기 캐시 삭제
+    TTS 캐시 삭제 (미리듣기와 영상 생성이 공유하는 캐시)
     """
-    import shutil
-
-    if PREVIEW_DIR.exists():
-        shutil.rmtree(PREVIEW_DIR)
-        PREVIEW_DIR.mkdir()
+    removed = get_tts_cache().clear()
 
-    return {"message": "미리듣기 캐시가 삭제되었습니다."}
\ No newline at end of file
+    return {"message": f"TTS 캐시가 삭제되었습니다. ({removed}개 항목)"}
\ No newline at end of file
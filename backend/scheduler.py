@@ -4,6 +4,7 @@ APScheduler 기반 자동화 작업 스케줄링
 """
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
 from pytz import timezone
@@ -12,6 +13,7 @@ import logging
 
 from backend.database import SessionLocal, SQLALCHEMY_DATABASE_URL
 from backend.models import Account
+from core.config import STORAGE_GC_INTERVAL_MINUTES
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -137,6 +139,33 @@ class AutomationScheduler:
         except Exception as e:
             logger.error(f"[Scheduler] 스케줄 등록 실패 ({account.channel_name}): {e}")
 
+    def add_storage_gc_schedule(self, interval_minutes: int = STORAGE_GC_INTERVAL_MINUTES):
+        """
+        저장 공간 GC 정기 실행 등록
+
+        Args:
+            interval_minutes: 실행 간격 (분, 0 이하면 등록하지 않음)
+        """
+        if interval_minutes <= 0:
+            logger.info("[Scheduler] 저장 공간 GC 정기 실행 비활성화")
+            return
+
+        try:
+            # Worker 함수 import (순환 참조 방지)
+            from backend.workers import run_storage_gc
+
+            self.scheduler.add_job(
+                func=run_storage_gc,
+                trigger=IntervalTrigger(minutes=interval_minutes, timezone=timezone('Asia/Seoul')),
+                id="storage_gc",
+                replace_existing=True,
+                name="Storage GC"
+            )
+            logger.info(f"[Scheduler] 저장 공간 GC 등록: {interval_minutes}분마다")
+
+        except Exception as e:
+            logger.error(f"[Scheduler] 저장 공간 GC 등록 실패: {e}")
+
     def remove_account_schedule(self, account_id: int):
         """
         특정 계정의 스케줄 제거
@@ -3,7 +3,7 @@ Pydantic Schemas for API Request/Response
 FastAPI 데이터 검증용
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, Optional, List, Dict
 from datetime import datetime
 from backend.models import ChannelType, JobStatus
 
@@ -152,6 +152,19 @@ class TTSVoicesResponse(BaseModel):
     voices: List[VoiceInfo]
 
 
+class TTSCacheStatsResponse(BaseModel):
+    """TTS 캐시 통계 응답"""
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    lifetime_hits: int
+    by_provider: Dict[str, Dict[str, int]]
+
+
 # ============================================================================
 # BGM Schemas
 # ============================================================================
@@ -188,4 +201,49 @@ class BGMUploadResponse(BaseModel):
     file_name: str
     mood: str
     duration: float
-    file_path: str
\ No newline at end of file
+    file_path: str
+
+# ============================================================================
+# Storage GC Schemas
+# ============================================================================
+
+class StorageGCRequest(BaseModel):
+    """저장 공간 GC 실행 요청"""
+    dry_run: bool = Field(True, description="True면 삭제하지 않고 삭제 대상만 보고")
+
+
+class StorageGCDirectoryReport(BaseModel):
+    """정책 디렉토리별 GC 결과"""
+    path: str
+    files: int
+    bytes: int
+    max_bytes: Optional[int] = None
+    max_age_days: Optional[float] = None
+    referenced_files: int
+    referenced_bytes: int
+    over_budget: bool
+    deleted_files: int
+    freed_bytes: int
+    bytes_after: int
+
+
+class StorageGCDeletedFile(BaseModel):
+    """삭제(예정) 파일"""
+    path: str
+    directory: str
+    bytes: int
+    reason: str  # age, budget, disk
+    last_used: str
+
+
+class StorageGCReportResponse(BaseModel):
+    """저장 공간 GC 보고서"""
+    dry_run: bool
+    started_at: str
+    elapsed: float
+    references: Dict[str, int]
+    directories: Dict[str, StorageGCDirectoryReport]
+    disk: Dict[str, Dict[str, Any]]
+    deleted: List[StorageGCDeletedFile]
+    freed_bytes: int
+    errors: List[Dict[str, str]]
@@ -1,12 +1,13 @@
 """
 Background Worker Functions
-자동 영상 생성 및 업로드 작업
+자동 영상 생성 및 업로드 작업 + 저장 공간 GC
 """
 import logging
 from datetime import datetime
+from typing import Any, Dict, List
 
 from backend.database import SessionLocal
-from backend.models import Account, JobHistory, JobStatus, ChannelType
+from backend.models import Account, JobHistory, JobStatus, ChannelType, DraftSegment
 from core.orchestrator import ContentOrchestrator
 from core.models import VideoFormat
 
@@ -128,4 +129,75 @@ def _generate_topic_for_channel_type(channel_type: ChannelType) -> str:
     if topics:
         return topics[0]
     else:
-        return f"{category} 관련 흥미로운 이야기"
\ No newline at end of file
+        return f"{category} 관련 흥미로운 이야기"
+
+
+def _draft_asset_paths() -> List[str]:
+    """DB에 남아 있는 Draft 세그먼트의 영상 / TTS 경로"""
+    db = SessionLocal()
+    try:
+        paths = []
+        for video_path, tts_path in db.query(DraftSegment.video_local_path, DraftSegment.tts_local_path):
+            paths.extend(path for path in (video_path, tts_path) if path)
+        return paths
+    finally:
+        db.close()
+
+
+def _active_job_paths() -> List[str]:
+    """완료/실패하지 않은 작업의 출력 경로 (에셋은 ContentOrchestrator가 실행 중 pin)"""
+    db = SessionLocal()
+    try:
+        rows = db.query(JobHistory.output_video_path).filter(
+            JobHistory.status.notin_([JobStatus.COMPLETED, JobStatus.FAILED]),
+            JobHistory.output_video_path.isnot(None)
+        )
+        return [path for (path,) in rows]
+    finally:
+        db.close()
+
+
+def _preview_paths() -> List[str]:
+    """메모리에 남아 있는 프리뷰 작업의 결과 영상 (에셋은 프리뷰 생성 중 pin)"""
+    from backend.routers.preview import preview_jobs
+
+    return [job.get("preview_path") for job in list(preview_jobs.values()) if job.get("preview_path")]
+
+
+def register_storage_gc_sources():
+    """
+    StorageGC에 backend 참조 소스 등록 (서버 시작 시 / GC 실행 전)
+
+    TTS 캐시의 자체 LRU 삭제도 같은 참조를 확인하므로 서버 시작 시 바로 등록합니다.
+
+    Returns:
+        StorageGC 싱글톤
+    """
+    from core.services.storage_gc import get_storage_gc
+
+    gc = get_storage_gc()
+    gc.add_reference_source("drafts", _draft_asset_paths)
+    gc.add_reference_source("jobs", _active_job_paths)
+    gc.add_reference_source("previews", _preview_paths)
+    return gc
+
+
+def run_storage_gc(dry_run: bool = False) -> Dict[str, Any]:
+    """
+    저장 공간 GC Worker (AutomationScheduler 정기 실행 / 관리자 API)
+
+    Draft / 진행 중인 작업 / 프리뷰 작업이 참조하는 파일은 삭제하지 않습니다.
+
+    Args:
+        dry_run: True면 삭제하지 않고 보고서만 생성
+
+    Returns:
+        StorageGC.collect 보고서
+    """
+    gc = register_storage_gc_sources()
+    report = gc.collect(dry_run=dry_run)
+    logger.info(
+        f"[Worker] 저장 공간 GC {'(dry-run) ' if dry_run else ''}완료: "
+        f"{len(report['deleted'])}개, {report['freed_bytes'] / 1024 ** 2:.1f}MB"
+    )
+    return report
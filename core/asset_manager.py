@@ -6,44 +6,89 @@ import os
 import sys
 import json
 import hashlib
+import importlib.util
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 
 from backend.database import SessionLocal  # Phase 3
 from backend.models import AccountSettings  # Phase 3
 
 from core.models import (
     ContentPlan,
+    ScriptSegment,
     StockVideoAsset,
     AudioAsset,
     AssetBundle,
     BGMAsset,
     TTSProvider,
     MoodType,
-    SegmentTiming  # Phase 2: TTS-영상 동기화
+    SegmentTiming,  # Phase 2: TTS-영상 동기화
+    WordTiming,
+    EditConfig
+)
+from core.config import (
+    ALIGNMENT_MODE,
+    LOCAL_CLIP_LIBRARY_ENABLED,
+    STOCK_HEDGED_SEARCH,
+    STOCK_DEDUP_ENABLED,
+    STOCK_DEDUP_MAX_DISTANCE,
+    STOCK_ADJACENT_MAX_DISTANCE,
 )
 
 # SHORTS_SPEC.md: Whisper 통합
+# (alignment_service는 whisper를 전사할 때 import하므로 패키지 설치 여부는 따로 확인)
 try:
     from core.services.alignment_service import get_alignment_service
-    WHISPER_AVAILABLE = True
+    WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
 except ImportError:
     WHISPER_AVAILABLE = False
+if not WHISPER_AVAILABLE:
     print("[WARNING] Whisper 서비스 사용 불가 (openai-whisper 미설치)")
 from providers.stock import PexelsProvider, PixabayProvider
 from core.bgm_manager import BGMManager
+from core.services.audio_timeline import AudioTimeline
+from core.services.clip_library import ClipLibrary, clip_id_of, get_clip_library
+from core.services.hedging import HedgeTracker, get_hedge_executor, get_hedge_tracker
+from core.services.media_probe import get_media_probe_service
+from core.services.rate_limiter import get_provider_limiter
+from core.services.rendition import render_target, orientation_of, covers
+from core.services.stock_search_cache import StockSearchCache, get_stock_search_cache, make_search_key
+from core.services.video_fingerprint import compute_fingerprint, fingerprint_distance
+from core.services.word_timing import get_word_timing_service
+from core.services.tts_cache import (
+    TTSCache, make_cache_key, elevenlabs_cache_key,
+    ELEVENLABS_MODEL, ELEVENLABS_OUTPUT_FORMAT
+)
+
+
+class AssetCollectionCancelled(Exception):
+    """다른 수집 단계가 실패해 현재 단계를 중단함"""
 
 
 class AssetManager:
     """에셋 수집 및 관리 모듈"""
 
+    # 제공자당 스톡 검색 결과 개수
+    SEARCH_PER_PAGE = 3
+
     def __init__(
         self,
         stock_providers: List[str] = None,
         tts_provider: str = "gtts",
         cache_enabled: bool = True,
         download_dir: str = "./downloads",
-        bgm_enabled: bool = True
+        bgm_enabled: bool = True,
+        tts_workers: int = 4,
+        tts_cache: Optional[TTSCache] = None,
+        alignment_mode: Optional[str] = None,
+        search_cache: Optional[StockSearchCache] = None,
+        clip_library: Optional[ClipLibrary] = None,
+        hedged_search: Optional[bool] = None,
+        hedge_tracker: Optional[HedgeTracker] = None,
+        dedup_enabled: Optional[bool] = None
     ):
         """
         AssetManager 초기화
@@ -54,12 +99,35 @@ class AssetManager:
             cache_enabled: 캐시 사용 여부
             download_dir: 다운로드 디렉토리
             bgm_enabled: BGM 사용 여부 (Phase 2)
+            tts_workers: 세그먼트 TTS 동시 생성 워커 수 (제공자별 한도는 rate_limiter에서 별도 적용)
+            tts_cache: TTS 결과 캐시 (None이면 <download_dir>/audio/tts_cache,
+                       미리듣기 API와 공유하려면 get_tts_cache()를 전달)
+            alignment_mode: 타임스탬프 정렬 방식 ("whisper" | "duration", None이면 config.ALIGNMENT_MODE,
+                            그것도 없으면 Whisper 사용 가능 시 "whisper")
+            search_cache: 스톡 검색 결과 캐시 (None이면 cache_enabled일 때 전역 캐시 data/stock_search.db)
+            clip_library: 로컬 클립 라이브러리 (None이면 cache_enabled일 때 <download_dir>/stock_videos 라이브러리)
+            hedged_search: 제공자 검색을 직렬 fallback 대신 겹쳐서 요청 (None이면 config.STOCK_HEDGED_SEARCH)
+            hedge_tracker: 헤지 대기 시간 / 채택 기록 (None이면 전역 기록)
+            dedup_enabled: 지각 해시로 같은 영상 합치기 + 인접 세그먼트 중복 피하기 (None이면 config.STOCK_DEDUP_ENABLED)
         """
         self.stock_providers = stock_providers or ['pexels', 'pixabay']
         self.tts_provider = tts_provider
         self.cache_enabled = cache_enabled
         self.download_dir = Path(download_dir)
         self.bgm_enabled = bgm_enabled
+        self.tts_workers = tts_workers
+        self.tts_cache = tts_cache
+        self._tts_cache_lock = threading.Lock()
+        self.alignment_mode = alignment_mode or ALIGNMENT_MODE or ("whisper" if WHISPER_AVAILABLE else "duration")
+        self.search_cache = search_cache
+        self.clip_library = clip_library
+        self.hedged_search = STOCK_HEDGED_SEARCH if hedged_search is None else hedged_search
+        self.hedge_tracker = hedge_tracker or get_hedge_tracker()
+        self.dedup_enabled = STOCK_DEDUP_ENABLED if dedup_enabled is None else dedup_enabled
+        # 중복 확인 → 하드링크 → 색인을 한 번에 (동시에 받은 같은 영상끼리도 비교되도록)
+        self._dedup_lock = threading.Lock()
+        self._download_locks: Dict[str, threading.Lock] = {}
+        self._download_locks_guard = threading.Lock()
 
         # 디렉토리 생성
         self.video_dir = self.download_dir / "stock_videos"
@@ -97,7 +165,9 @@ class AssetManager:
         generate_tts: bool = True,
         select_bgm: bool = True,
         account_id: Optional[int] = None, # ✨ NEW
-        tts_settings_override: Optional[Dict[str, Any]] = None # ✨ NEW
+        tts_settings_override: Optional[Dict[str, Any]] = None, # ✨ NEW
+        edit_config: Optional[EditConfig] = None,
+        preview: bool = False
     ) -> Optional[AssetBundle]:
         """
         ContentPlan을 기반으로 모든 에셋 수집
@@ -109,97 +179,686 @@ class AssetManager:
             select_bgm: BGM 선택 여부
             account_id: 계정 ID (DB 설정 조회용)
             tts_settings_override: TTS 설정 오버라이드 (프론트엔드 직접 설정용)
+            edit_config: 렌더링에 쓸 편집 설정 (스톡 영상 렌디션 선택 기준 해상도, None이면 기본값)
+            preview: 프리뷰 작업 여부 (True면 더 작은 렌디션으로 충분)
 
         Returns:
             AssetBundle 객체 또는 None
         """
         print(f"\n[AssetManager] 에셋 수집 시작: {content_plan.title}")
 
+        # ✨ 세 단계는 AssetBundle을 만들 때까지 공유하는 데이터가 없으므로 동시에 실행
+        #   (스톡 검색/다운로드: 네트워크, TTS: 제공자 API + 디코딩, BGM: 로컬 선택/검증)
+        cancel = threading.Event()
+        phases: Dict[str, Callable[[], Any]] = {}
+
         # 1. 스톡 영상 수집
-        video_assets = []
         if download_videos:
-            video_assets = self._collect_stock_videos(content_plan)
+            # 출력 배치를 업스케일 없이 채우는 가장 작은 렌디션만 받음
+            target = render_target((edit_config or EditConfig()).resolution, content_plan.format, preview)
+            phases["stock"] = lambda: self._collect_stock_videos(content_plan, cancel, target)
 
         # 2. TTS 음성 생성 (Phase 2: segment_timings 포함)
-        audio_asset = None
-        segment_timings = []
         if generate_tts:
-            audio_asset, segment_timings = self._generate_tts(content_plan, account_id, tts_settings_override)
+            phases["tts"] = lambda: self._generate_tts(content_plan, account_id, tts_settings_override, cancel)
 
         # 3. Phase 2: BGM 선택
-        bgm_asset = None
         if select_bgm and self.bgm_enabled and self.bgm_manager:
-            bgm_asset = self._select_bgm(content_plan)
+            phases["bgm"] = lambda: self._select_bgm(content_plan)
+
+        results, phase_timings = self._run_phases(phases, cancel)
+        video_assets = results.get("stock", [])
+        audio_asset, segment_timings = results.get("tts", (None, []))
+        bgm_asset = results.get("bgm")
 
         # 4. AssetBundle 생성 (Phase 2: segment_timings 포함)
         bundle = AssetBundle(
             videos=video_assets,
             audio=audio_asset,
             bgm=bgm_asset,
-            segment_timings=segment_timings  # Phase 2: TTS-영상 동기화용
+            segment_timings=segment_timings,  # Phase 2: TTS-영상 동기화용
+            phase_timings=phase_timings
         )
 
         bgm_msg = f", BGM {1 if bgm_asset else 0}개" if self.bgm_enabled else ""
         print(f"[SUCCESS] 에셋 수집 완료: 영상 {len(video_assets)}개, 음성 {1 if audio_asset else 0}개{bgm_msg}")
         return bundle
 
-    def _collect_stock_videos(self, content_plan: ContentPlan) -> List[StockVideoAsset]:
+    @staticmethod
+    def _check_cancelled(cancel: Optional[threading.Event]) -> None:
+        """취소 이벤트가 set되었으면 AssetCollectionCancelled 발생 (단계 내부 작업 단위 사이에서 호출)"""
+        if cancel is not None and cancel.is_set():
+            raise AssetCollectionCancelled()
+
+    def _run_phases(
+        self,
+        phases: Dict[str, Callable[[], Any]],
+        cancel: threading.Event
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        수집 단계를 스레드에서 동시에 실행하고 단계별 소요 시간 측정
+
+        한 단계가 예외로 실패하면 cancel을 set해 나머지 단계가 다음 작업 단위
+        (세그먼트 검색, TTS 요청) 전에 멈추게 하고, 모두 끝날 때까지 기다린 뒤 예외를 다시 발생시킵니다.
+        진행 중인 네트워크 요청 하나는 끝까지 기다리므로 절반만 기록된 파일은 남지 않습니다.
+
+        Args:
+            phases: {단계 이름: 인자 없는 실행 함수}
+            cancel: 단계들이 공유하는 취소 이벤트
+
+        Returns:
+            ({단계 이름: 반환값}, {단계 이름: 소요 시간(초), "total": 전체 소요 시간(초)})
+
+        Raises:
+            Exception: 가장 먼저 실패한 단계의 예외
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        if not phases:
+            return results, timings
+
+        def timed(name: str, func: Callable[[], Any]) -> Any:
+            phase_start = time.perf_counter()
+            try:
+                return func()
+            finally:
+                timings[name] = round(time.perf_counter() - phase_start, 3)
+
+        started = time.perf_counter()
+        error = None
+        with ThreadPoolExecutor(max_workers=len(phases), thread_name_prefix="collect") as executor:
+            futures = {executor.submit(timed, name, func): name for name, func in phases.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except AssetCollectionCancelled:
+                    print(f"[AssetManager] '{name}' 단계 취소됨")
+                except Exception as e:
+                    if error is None:
+                        error = e
+                        cancel.set()
+                        print(f"[ERROR] '{name}' 단계 실패 → 나머지 단계 취소: {e}")
+
+        total = round(time.perf_counter() - started, 3)
+        summary = ", ".join(f"{name} {timings[name]:.2f}초" for name in phases if name in timings)
+        print(f"[AssetManager] 단계별 소요: {summary} → 전체 {total:.2f}초 (순차 실행 시 {sum(timings.values()):.2f}초)")
+        timings["total"] = total
+
+        if error is not None:
+            raise error
+        return results, timings
+
+    def _collect_stock_videos(
+        self,
+        content_plan: ContentPlan,
+        cancel: Optional[threading.Event] = None,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> List[StockVideoAsset]:
         """
-        스크립트 세그먼트별로 스톡 영상 검색 및 다운로드
+        스크립트 세그먼트별로 스톡 영상 검색 및 다운로드 (모든 세그먼트 동시 진행)
+
+        기획이 끝나면 모든 image_search_query를 알고 있으므로 세그먼트별
+        캐시 확인 → 로컬 클립 라이브러리 → Pexels → Pixabay → keyword 재검색 → 다운로드 체인을
+        동시에 실행합니다.
+        HTTP 요청은 제공자별 keep-alive Session을 공유하고, 전체 동시 요청 수는
+        "stock" 리미터로, 제공자별 동시 요청/속도는 제공자 리미터로 제한합니다.
+        dedup_enabled면 이웃한 세그먼트에 거의 같은 영상이 연달아 나오지 않게 뒤 세그먼트를 다른 영상으로 바꿉니다.
 
         Args:
             content_plan: ContentPlan 객체
+            cancel: 취소 이벤트 (set되면 시작하지 않은 세그먼트는 건너뜀)
+            target_size: 렌디션이 채워야 하는 최소 크기 (rendition.render_target, None이면 제공자 기본값)
 
         Returns:
-            StockVideoAsset 리스트
+            StockVideoAsset 리스트 (세그먼트 순서)
         """
-        all_assets = []
+        segments = content_plan.segments
+        if not segments:
+            return []
+
+        # 같은 검색어 조합은 한 번만 검색/다운로드
+        queries = list(dict.fromkeys((seg.image_search_query, seg.keyword) for seg in segments))
+        workers = max(1, min(len(queries), get_provider_limiter("stock").max_concurrency))
+        print(f"[AssetManager] 스톡 영상 동시 검색: 세그먼트 {len(segments)}개 (검색어 {len(queries)}개, 동시 {workers}개)")
+
+        # 워커 시작 전에 라이브러리 연결 (처음이면 기존 캐시 색인)
+        self._get_clip_library()
+
+        # 모든 세그먼트 검색을 검색 캐시에서 한 번에 조회 (hit는 API 호출 없음)
+        prefetched = self._prefetch_searches(queries, target_size)
+
+        results: Dict[tuple, Optional[StockVideoAsset]] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stock") as executor:
+            futures = {
+                executor.submit(
+                    self._collect_segment_video, i, len(queries), image_query, keyword, cancel, target_size, prefetched
+                ): (image_query, keyword)
+                for i, (image_query, keyword) in enumerate(queries, 1)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
 
-        for i, segment in enumerate(content_plan.segments, 1):
-            # Phase 2: image_search_query 우선 사용, 없으면 keyword fallback
-            search_query = segment.image_search_query or segment.keyword
-            using_field = "image_search_query" if segment.image_search_query else "keyword"
+        picked: List[Tuple[ScriptSegment, StockVideoAsset]] = []
+        used = set()
+        for seg in segments:
+            asset = results.get((seg.image_search_query, seg.keyword))
+            if asset:
+                # 같은 검색어를 쓰는 세그먼트마다 별도 객체 (편집 단계에서 개별 수정 가능)
+                picked.append((seg, asset.model_copy() if id(asset) in used else asset))
+                used.add(id(asset))
 
-            print(f"\n[{i}/{len(content_plan.segments)}] Phase 2: '{search_query}' 검색 중...")
-            print(f"[Phase 2] 사용 필드: {using_field}")
+        if self.dedup_enabled:
+            self._separate_adjacent_duplicates(picked, cancel, target_size)
 
-            # 캐시 확인
-            cached_asset = self._get_cached_video(search_query)
-            if cached_asset:
-                print(f"[Cache] 캐시에서 영상 가져옴: {cached_asset.id}")
-                all_assets.append(cached_asset)
+        return [asset for _, asset in picked]
+
+    def _separate_adjacent_duplicates(
+        self,
+        picked: List[Tuple[ScriptSegment, StockVideoAsset]],
+        cancel: Optional[threading.Event] = None,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> int:
+        """
+        이웃한 세그먼트가 같은(거의 같은) 영상이면 뒤 세그먼트를 다른 영상으로 교체
+
+        Args:
+            picked: (세그먼트, 영상) 리스트 (세그먼트 순서, 제자리에서 수정)
+            cancel: 취소 이벤트
+            target_size: 렌디션이 채워야 하는 최소 크기
+
+        Returns:
+            교체한 세그먼트 수 (대체 영상이 없으면 그대로 둠)
+        """
+        replaced = 0
+        for i in range(1, len(picked)):
+            seg, asset = picked[i]
+            previous = picked[i - 1][1]
+            if not self._near_duplicate(previous, asset):
                 continue
 
-            # 여러 제공자에서 검색
-            assets = self._search_from_providers(search_query)
+            # 다음 세그먼트와 새로 겹치지 않게 함께 피함
+            avoid = [previous] + ([picked[i + 1][1]] if i + 1 < len(picked) else [])
+            search_query = seg.image_search_query or seg.keyword
+            alternative = self._find_alternative_clip(search_query, avoid, cancel, target_size)
+            if alternative is None:
+                print(f"[Dedup] 세그먼트 {i + 1}: 이전 세그먼트와 같은 영상이지만 대체 영상 없음 ({asset.id})")
+                continue
 
-            # Phase 4: Fallback - image_search_query 실패 시 keyword로 재검색
-            if not assets and segment.image_search_query and segment.keyword:
-                print(f"[Phase 4] image_search_query 실패 - keyword로 재시도: '{segment.keyword}'")
-                search_query = segment.keyword
-                using_field = "keyword (fallback)"
-                assets = self._search_from_providers(search_query)
+            print(f"[Dedup] 세그먼트 {i + 1}: 이전 세그먼트와 같은 영상 {asset.id} → {alternative.id}")
+            picked[i] = (seg, alternative)
+            replaced += 1
+        return replaced
 
-            if assets:
-                # 첫 번째 영상 다운로드
-                asset = assets[0]
-                filepath = self._download_video(asset)
-
-                if filepath:
-                    asset.local_path = filepath
-                    asset.downloaded = True
-                    all_assets.append(asset)
-
-                    # 캐시 저장
-                    self._cache_video(search_query, asset)
-                else:
-                    print(f"[WARNING] '{search_query}' 다운로드 실패")
+    def _find_alternative_clip(
+        self,
+        search_query: str,
+        avoid: List[StockVideoAsset],
+        cancel: Optional[threading.Event] = None,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[StockVideoAsset]:
+        """
+        피해야 할 영상들과 다른 영상 찾기 (로컬 라이브러리 → 제공자 검색 결과의 다음 후보 다운로드)
+
+        Args:
+            search_query: 세그먼트 검색어
+            avoid: 같으면 안 되는 영상들
+            cancel: 취소 이벤트
+            target_size: 렌디션이 채워야 하는 최소 크기
+
+        Returns:
+            다운로드된 StockVideoAsset 또는 None
+        """
+        def distinct(candidate: StockVideoAsset) -> bool:
+            return not any(self._near_duplicate(candidate, other) for other in avoid)
+
+        library = self._get_clip_library()
+        if library is not None:
+            try:
+                matches = library.search(search_query, target_size=target_size, limit=self.SEARCH_PER_PAGE + 2)
+            except Exception as e:
+                print(f"[WARNING] 클립 라이브러리 검색 실패: {e}")
+                matches = []
+            for candidate, _ in matches:
+                if distinct(candidate):
+                    library.record_use(candidate)
+                    return candidate
+
+        self._check_cancelled(cancel)
+        avoid_ids = {(other.provider, other.id) for other in avoid}
+        for candidate in self._search_from_providers(search_query, target_size=target_size):
+            if (candidate.provider, candidate.id) in avoid_ids:
+                continue
+            self._check_cancelled(cancel)
+            filepath = self._download_video(candidate)
+            if not filepath:
+                continue
+            candidate.local_path = filepath
+            candidate.downloaded = True
+            # 세그먼트 검색어 캐시는 원래 영상을 유지 (라이브러리에만 색인)
+            self._store_downloaded(candidate, search_query, cache=False)
+            if distinct(candidate):
+                return candidate
+        return None
+
+    def _collect_segment_video(
+        self,
+        index: int,
+        total: int,
+        image_search_query: Optional[str],
+        keyword: str,
+        cancel: Optional[threading.Event] = None,
+        target_size: Optional[Tuple[int, int]] = None,
+        prefetched: Optional[Dict[str, List[StockVideoAsset]]] = None
+    ) -> Optional[StockVideoAsset]:
+        """
+        세그먼트 하나의 스톡 영상 검색 + 다운로드 (로컬 라이브러리 → Pexels → Pixabay → keyword 재검색)
+
+        Args:
+            index: 검색어 번호 (로그용, 1부터)
+            total: 전체 검색어 수
+            image_search_query: Phase 2 시각 묘사 검색어 (우선 사용)
+            keyword: 하위 호환 키워드 (fallback)
+            cancel: 취소 이벤트
+            target_size: 렌디션이 채워야 하는 최소 크기
+            prefetched: 검색 캐시에서 미리 조회한 결과
+
+        Returns:
+            다운로드된 StockVideoAsset 또는 None
+        """
+        self._check_cancelled(cancel)
+
+        # Phase 2: image_search_query 우선 사용, 없으면 keyword fallback
+        search_query = image_search_query or keyword
+        using_field = "image_search_query" if image_search_query else "keyword"
+
+        print(f"\n[{index}/{total}] Phase 2: '{search_query}' 검색 중... (사용 필드: {using_field})")
+
+        # 캐시 확인
+        cached_asset = self._get_cached_video(search_query, target_size)
+        if cached_asset:
+            print(f"[Cache] 캐시에서 영상 가져옴: {cached_asset.id}")
+            self._record_clip_use(cached_asset)
+            # 지문 없이 받은 이전 영상은 한 번 계산해 캐시에 남김
+            if self._ensure_fingerprint(cached_asset):
+                self._cache_video(search_query, cached_asset)
+            return cached_asset
+
+        # 로컬 클립 라이브러리: 비슷한 검색어로 받아 둔 영상이 있으면 네트워크 없이 재사용
+        local_asset = self._match_local_clip(search_query, target_size)
+        if local_asset:
+            self._ensure_fingerprint(local_asset)
+            self._cache_video(search_query, local_asset)
+            return local_asset
+
+        # 여러 제공자에서 검색
+        assets = self._search_from_providers(search_query, target_size=target_size, prefetched=prefetched)
+
+        # Phase 4: Fallback - image_search_query 실패 시 keyword로 재검색
+        if not assets and image_search_query and keyword:
+            self._check_cancelled(cancel)
+            print(f"[Phase 4] image_search_query 실패 - keyword로 재시도: '{keyword}'")
+            search_query = keyword
+            assets = self._search_from_providers(search_query, target_size=target_size, prefetched=prefetched)
+
+        if not assets:
+            print(f"[WARNING] '{search_query}' 검색 결과 없음 (모든 fallback 시도 완료)")
+            return None
+
+        # 첫 번째 영상 다운로드
+        self._check_cancelled(cancel)
+        asset = assets[0]
+        filepath = self._download_video(asset)
+        if not filepath:
+            print(f"[WARNING] '{search_query}' 다운로드 실패")
+            return None
+
+        asset.local_path = filepath
+        asset.downloaded = True
+
+        # 지문 + 중복 합치기 + 캐시 저장 + 라이브러리 색인
+        self._store_downloaded(asset, search_query)
+        return asset
+
+    def _store_downloaded(self, asset: StockVideoAsset, search_query: str, cache: bool = True) -> None:
+        """
+        다운로드한 영상 정리 (지문 계산 → 같은 영상이 있으면 파일 하나로 합침 → 검색어 캐시 / 라이브러리 색인)
+
+        Args:
+            asset: 다운로드된 StockVideoAsset (local_path가 바뀔 수 있음)
+            search_query: 이 영상을 찾은 검색어
+            cache: 검색어별 JSON 캐시에도 저장
+        """
+        self._ensure_fingerprint(asset)
+        with self._dedup_lock:
+            self._collapse_duplicate(asset)
+            if cache:
+                self._cache_video(search_query, asset)
+            self._index_clip(asset, search_query)
+
+    def _ensure_fingerprint(self, asset: StockVideoAsset) -> bool:
+        """
+        지문이 없는 영상의 지문 계산 (라이브러리에 있는 항목이면 색인도 갱신)
+
+        Args:
+            asset: local_path가 있는 StockVideoAsset
+
+        Returns:
+            새로 계산했으면 True
+        """
+        if not self.dedup_enabled or asset.fingerprint or not asset.local_path:
+            return False
+        try:
+            if os.path.getsize(asset.local_path) == 0:
+                return False
+        except OSError:
+            return False
+
+        asset.fingerprint = compute_fingerprint(asset.local_path, duration=asset.duration)
+        if not asset.fingerprint:
+            return False
+
+        library = self._get_clip_library()
+        if library is not None:
+            try:
+                library.set_fingerprint(asset)
+            except Exception as e:
+                print(f"[WARNING] 클립 지문 기록 실패: {e}")
+        return True
+
+    def _collapse_duplicate(self, asset: StockVideoAsset) -> None:
+        """
+        라이브러리에 같은 영상(다른 ID / 다른 인코딩)이 있으면 파일 하나로 합침
+
+        해상도가 큰 파일을 남기고 다른 경로는 그 파일의 하드링크로 바꿉니다 (두 항목의 경로는 그대로).
+        하드링크를 만들 수 없으면(다른 파일 시스템 등) 새 파일을 지우고 기존 파일을 참조합니다.
+
+        Args:
+            asset: 방금 다운로드한 StockVideoAsset (fingerprint 필요, local_path가 바뀔 수 있음)
+        """
+        library = self._get_clip_library()
+        if not self.dedup_enabled or library is None or not asset.fingerprint:
+            return
+        try:
+            match = library.find_duplicate(asset.fingerprint, STOCK_DEDUP_MAX_DISTANCE, exclude=[clip_id_of(asset)])
+            if match is None:
+                return
+            existing, distance = match
+            if os.path.samefile(existing.local_path, asset.local_path):
+                return
+            size = os.path.getsize(asset.local_path)
+        except Exception as e:
+            print(f"[WARNING] 중복 영상 확인 실패: {e}")
+            return
+
+        new_area = (asset.width or 0) * (asset.height or 0)
+        old_area = (existing.width or 0) * (existing.height or 0)
+        label = f"{asset.id} = {existing.id} (거리 {distance:.1f})"
+        if new_area > old_area:
+            # 새 렌디션이 더 크면 기존 경로를 새 파일로 연결
+            try:
+                size = os.path.getsize(existing.local_path)
+                self._replace_with_link(asset.local_path, existing.local_path)
+                print(f"[Dedup] 같은 영상 하드링크: {label}, {size / 1024 / 1024:.1f}MB 절약")
+            except OSError as e:
+                print(f"[WARNING] 같은 영상이지만 하드링크 실패, 두 파일 유지: {label} ({e})")
+            return
+
+        try:
+            self._replace_with_link(existing.local_path, asset.local_path)
+            print(f"[Dedup] 같은 영상 하드링크: {label}, {size / 1024 / 1024:.1f}MB 절약")
+        except OSError as e:
+            try:
+                os.remove(asset.local_path)
+            except OSError:
+                print(f"[WARNING] 같은 영상이지만 정리 실패, 두 파일 유지: {label} ({e})")
+                return
+            asset.local_path = existing.local_path
+            print(f"[Dedup] 같은 영상 참조 (하드링크 불가: {e}): {label}, {size / 1024 / 1024:.1f}MB 절약")
+
+    @staticmethod
+    def _replace_with_link(source: str, target: str) -> None:
+        """
+        target을 source의 하드링크로 원자적으로 교체 (읽고 있던 프로세스는 기존 파일을 계속 읽음)
+
+        Raises:
+            OSError: 하드링크 생성 실패
+        """
+        temp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.link"
+        try:
+            os.link(source, temp_path)
+            os.replace(temp_path, target)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _near_duplicate(self, a: StockVideoAsset, b: StockVideoAsset) -> bool:
+        """
+        두 영상이 같은(거의 같은) 영상인지 여부
+
+        같은 ID, 같은 파일(하드링크 포함), 지문 거리 STOCK_ADJACENT_MAX_DISTANCE 이하 중 하나면 True
+        """
+        if a.provider == b.provider and a.id == b.id:
+            return True
+        if a.local_path and b.local_path:
+            try:
+                if os.path.samefile(a.local_path, b.local_path):
+                    return True
+            except OSError:
+                pass
+        self._ensure_fingerprint(a)
+        self._ensure_fingerprint(b)
+        distance = fingerprint_distance(a.fingerprint, b.fingerprint)
+        return distance is not None and distance <= STOCK_ADJACENT_MAX_DISTANCE
+
+    def _get_clip_library(self) -> Optional[ClipLibrary]:
+        """
+        로컬 클립 라이브러리 (cache_enabled=False 또는 LOCAL_CLIP_LIBRARY_ENABLED=False면 None)
+
+        처음 연결할 때 라이브러리가 비어 있으면 기존 검색어별 JSON 캐시에 남은 영상을 색인합니다.
+        """
+        if not (self.cache_enabled and LOCAL_CLIP_LIBRARY_ENABLED):
+            return None
+        if self.clip_library is None:
+            self.clip_library = get_clip_library(str(self.video_dir))
+            if self.clip_library.stats()["clips"] == 0:
+                self.clip_library.import_asset_cache(str(self.cache_dir))
+        return self.clip_library
+
+    def _get_tts_cache(self) -> TTSCache:
+        """TTS 결과 캐시 (주입되지 않았으면 처음 사용할 때 <download_dir>/audio/tts_cache에 생성)"""
+        with self._tts_cache_lock:
+            if self.tts_cache is None:
+                self.tts_cache = TTSCache(cache_dir=str(self.audio_dir / "tts_cache"))
+            return self.tts_cache
+
+    def _match_local_clip(
+        self,
+        search_query: str,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[StockVideoAsset]:
+        """
+        로컬 클립 라이브러리에서 검색어와 비슷한 영상 찾기 (점수 LOCAL_CLIP_MIN_SCORE 이상)
+
+        Args:
+            search_query: 검색어
+            target_size: 렌디션이 채워야 하는 최소 크기
+
+        Returns:
+            StockVideoAsset (local_path 포함) 또는 None (miss → 네트워크 검색)
+        """
+        library = self._get_clip_library()
+        if library is None:
+            return None
+
+        try:
+            matches = library.search(search_query, target_size=target_size, limit=1)
+        except Exception as e:
+            print(f"[WARNING] 클립 라이브러리 검색 실패: {e}")
+            return None
+        if not matches:
+            return None
+
+        asset, score = matches[0]
+        print(f"[ClipLibrary] 로컬 영상 재사용: {asset.id} (점수 {score:.2f}, '{search_query}')")
+        library.record_use(asset)
+        return asset
+
+    def _index_clip(self, asset: StockVideoAsset, search_query: str) -> None:
+        """다운로드한 영상을 라이브러리에 색인 (실패해도 수집은 계속)"""
+        library = self._get_clip_library()
+        if library is None:
+            return
+        try:
+            library.add(asset, search_query)
+            library.record_use(asset)
+        except Exception as e:
+            print(f"[WARNING] 클립 라이브러리 색인 실패: {e}")
+
+    def _record_clip_use(self, asset: StockVideoAsset) -> None:
+        """검색어 캐시로 재사용한 영상의 사용 횟수 기록"""
+        library = self._get_clip_library()
+        if library is None:
+            return
+        try:
+            library.record_use(asset)
+        except Exception as e:
+            print(f"[WARNING] 클립 사용 기록 실패: {e}")
+
+    def _provider_searches(
+        self,
+        per_page: int = SEARCH_PER_PAGE,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        제공자 우선순위대로 검색 파라미터 구성 (검색 캐시 키와 실제 요청이 같은 값을 사용)
+
+        Args:
+            per_page: 제공자당 결과 개수
+            target_size: 렌디션이 채워야 하는 최소 크기 (검색 방향도 이 크기 기준, None이면 세로)
+
+        Returns:
+            [(제공자 이름, 방향 파라미터, 나머지 검색 파라미터)] (Pexels → Pixabay 순,
+            헤지 검색이면 Pixabay 자체 fallback 대신 제약 완화 검색을 별도 항목으로 추가)
+        """
+        orientation = orientation_of(target_size) if target_size else "portrait"
+        searches = []
+
+        # Phase 4: Pexels 우선 검색
+        if 'pexels' in self.providers:
+            searches.append(('pexels', orientation, {'per_page': per_page, 'target_size': target_size}))
+
+        # Phase 4: Pixabay fallback (고품질 파라미터)
+        if 'pixabay' in self.providers:
+            # Pixabay: vertical/horizontal + 방향에 맞는 최소 해상도 (Phase 4 기준 720x1280)
+            pixabay_orientation = {"portrait": "vertical", "landscape": "horizontal"}.get(orientation, "all")
+            min_width, min_height = {"portrait": (720, 1280), "landscape": (1280, 720)}.get(orientation, (720, 720))
+            filters = {
+                'per_page': per_page,
+                'video_type': 'film',  # 실사 영상만
+                'editors_choice': True,  # 에디터 추천
+                'safesearch': True,
+                'min_width': min_width,
+                'min_height': min_height,
+                'target_size': target_size
+            }
+            if not self.hedged_search:
+                searches.append(('pixabay', pixabay_orientation, filters))
             else:
-                print(f"[WARNING] '{search_query}' 검색 결과 없음 (모든 fallback 시도 완료)")
+                # 헤지 검색: 완화 검색(orientation=all, editors_choice 없음)을 순서를 기다리지 않고 따로 요청
+                searches.append(('pixabay', pixabay_orientation, {**filters, 'fallback': False}))
+                searches.append(('pixabay', 'all', {**filters, 'editors_choice': False}))
+
+        return searches
+
+    def _get_search_cache(self) -> Optional[StockSearchCache]:
+        """검색 결과 캐시 (cache_enabled=False면 None, 처음 사용할 때 전역 캐시 연결)"""
+        if not self.cache_enabled:
+            return None
+        if self.search_cache is None:
+            self.search_cache = get_stock_search_cache()
+        return self.search_cache
+
+    def _prefetch_searches(
+        self,
+        queries: List[Tuple[Optional[str], str]],
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Dict[str, List[StockVideoAsset]]:
+        """
+        기획의 모든 세그먼트 검색(검색어 × 제공자)을 검색 캐시에서 한 번에 조회
+
+        Args:
+            queries: (image_search_query, keyword) 목록
+            target_size: 렌디션이 채워야 하는 최소 크기
 
-        return all_assets
+        Returns:
+            {검색 캐시 키: StockVideoAsset 리스트} (hit만 포함)
+        """
+        cache = self._get_search_cache()
+        if cache is None:
+            return {}
+
+        searches = self._provider_searches(target_size=target_size)
+        specs = [
+            (name, query, orientation, filters)
+            for pair in queries
+            for query in dict.fromkeys(q for q in pair if q)
+            for name, orientation, filters in searches
+        ]
+        prefetched = cache.get_many(specs)
+        print(f"[SearchCache] 세그먼트 검색 {len(specs)}개 중 {len(prefetched)}개 캐시 hit")
+        return prefetched
+
+    def _search_provider(
+        self,
+        name: str,
+        query: str,
+        orientation: str,
+        filters: Dict[str, Any],
+        prefetched: Optional[Dict[str, List[StockVideoAsset]]] = None
+    ) -> List[StockVideoAsset]:
+        """
+        제공자 하나에서 검색 (검색 캐시 → API, API 결과는 빈 결과 포함 캐시에 저장)
+
+        Args:
+            name: 제공자 이름
+            query: 검색어
+            orientation: 방향 파라미터
+            filters: 나머지 검색 파라미터
+            prefetched: _prefetch_searches 결과
+
+        Returns:
+            StockVideoAsset 리스트
 
-    def _search_from_providers(self, keyword: str, per_page: int = 3) -> List[StockVideoAsset]:
+        Raises:
+            Exception: API 요청 실패 (실패는 캐시에 저장하지 않음)
+        """
+        cache = self._get_search_cache()
+        if cache is not None:
+            key = make_search_key(name, query, orientation, filters)
+            hit = prefetched[key] if prefetched and key in prefetched else cache.get(name, query, orientation, filters)
+            if hit is not None:
+                print(f"[SearchCache] {name} '{query}' 캐시 사용: {len(hit)}개" + ("" if hit else " (결과 없음)"))
+                # 같은 캐시 결과를 여러 세그먼트가 쓰므로 세그먼트마다 별도 객체
+                return [asset.model_copy() for asset in hit]
+
+        provider = self.providers[name]
+        with get_provider_limiter("stock"), get_provider_limiter(name):
+            assets = provider.search_videos(query, orientation=orientation, raise_on_error=True, **filters)
+
+        # API 키가 없어 검색하지 않은 빈 결과는 저장하지 않음
+        if cache is not None and getattr(provider, 'api_key', True):
+            cache.put(name, query, orientation, filters, assets)
+        return assets
+
+    def _search_from_providers(
+        self,
+        keyword: str,
+        per_page: int = SEARCH_PER_PAGE,
+        target_size: Optional[Tuple[int, int]] = None,
+        prefetched: Optional[Dict[str, List[StockVideoAsset]]] = None
+    ) -> List[StockVideoAsset]:
         """
         여러 제공자에서 영상 검색 (Phase 4: Smart Fallback)
 
@@ -207,49 +866,140 @@ class AssetManager:
         1. Pexels (빠르고 품질 좋음)
         2. Pixabay (고품질 파라미터 적용)
 
+        제공자별 결과는 검색 캐시(StockSearchCache)에 TTL 동안 저장되고,
+        결과가 없던 검색도 저장되어 다음 실행에서 같은 fallback 체인을 다시 호출하지 않습니다.
+
         Args:
             keyword: 검색 키워드
             per_page: 제공자당 결과 개수
+            target_size: 렌디션이 채워야 하는 최소 크기 (검색 방향도 이 크기 기준, None이면 세로)
+            prefetched: _prefetch_searches로 미리 조회한 캐시 결과
 
         Returns:
             StockVideoAsset 리스트
         """
-        all_assets = []
+        if self.hedged_search:
+            return self._search_hedged(keyword, per_page, target_size, prefetched)
 
-        # Phase 4: Pexels 우선 검색
-        if 'pexels' in self.providers:
+        for name, orientation, filters in self._provider_searches(per_page, target_size):
+            label = name.capitalize()
             try:
-                print(f"[AssetManager] Phase 4: Pexels 검색 시도 - '{keyword}'")
-                assets = self.providers['pexels'].search_videos(keyword, per_page=per_page)
-                if assets:
-                    print(f"[AssetManager] Pexels 성공: {len(assets)}개 발견")
-                    return assets  # Pexels에서 찾으면 바로 반환
-                else:
-                    print(f"[AssetManager] Pexels 결과 없음 - Pixabay로 fallback")
+                print(f"[AssetManager] Phase 4: {label} 검색 시도 - '{keyword}'")
+                assets = self._search_provider(name, keyword, orientation, filters, prefetched)
             except Exception as e:
-                print(f"[ERROR] Pexels 검색 실패: {e} - Pixabay로 fallback")
+                print(f"[ERROR] {label} 검색 실패: {e} - 다음 제공자로 fallback")
+                continue
 
-        # Phase 4: Pixabay fallback (고품질 파라미터)
-        if 'pixabay' in self.providers:
-            try:
-                print(f"[AssetManager] Phase 4: Pixabay 고품질 검색 시도 - '{keyword}'")
-                assets = self.providers['pixabay'].search_videos(
-                    query=keyword,
-                    per_page=per_page,
-                    video_type='film',  # 실사 영상만
-                    orientation='vertical',  # 세로 영상 우선
-                    editors_choice=True,  # 에디터 추천
-                    safesearch=True,
-                    min_width=720,
-                    min_height=1280
-                )
-                if assets:
-                    print(f"[AssetManager] Pixabay 성공: {len(assets)}개 발견")
-                    all_assets.extend(assets)
-            except Exception as e:
-                print(f"[ERROR] Pixabay 검색 실패: {e}")
+            if assets:
+                print(f"[AssetManager] {label} 성공: {len(assets)}개 발견")
+                return assets  # 앞선 제공자에서 찾으면 바로 반환
+            print(f"[AssetManager] {label} 결과 없음 - 다음 제공자로 fallback")
+
+        return []
 
-        return all_assets
+    def _search_hedged(
+        self,
+        keyword: str,
+        per_page: int = SEARCH_PER_PAGE,
+        target_size: Optional[Tuple[int, int]] = None,
+        prefetched: Optional[Dict[str, List[StockVideoAsset]]] = None
+    ) -> List[StockVideoAsset]:
+        """
+        헤지 검색: 제공자 검색을 겹쳐서 요청하고 우선순위대로 첫 결과 채택
+
+        Pexels → Pixabay → Pixabay(제약 완화) 순으로, 앞 요청이 결과 없이 끝나거나
+        헤지 대기 시간(HedgeTracker.delay, 최근 응답 시간의 95번째 백분위)을 넘기면 다음 요청을 시작합니다.
+        결과는 앞 순위 요청이 모두 결과 없이 끝났거나 대기 시간을 넘긴 경우에만 채택하므로
+        평소에는 직렬 fallback과 같은 결과를 내고, 느린 제공자 하나가 전체를 붙잡지 않습니다.
+        채택되지 않은 요청은 기다리지 않습니다 (끝나면 검색 캐시에만 저장).
+
+        Args:
+            keyword: 검색 키워드
+            per_page: 제공자당 결과 개수
+            target_size: 렌디션이 채워야 하는 최소 크기
+            prefetched: _prefetch_searches로 미리 조회한 캐시 결과
+
+        Returns:
+            StockVideoAsset 리스트
+        """
+        searches = self._provider_searches(per_page, target_size)
+        if not searches:
+            return []
+
+        tracker = self.hedge_tracker
+        executor = get_hedge_executor()
+        labels = [f"{name}:{orientation}" for name, orientation, _ in searches]
+        delays = [tracker.delay(label) for label in labels]
+        futures: List[Any] = [None] * len(searches)
+        started: List[float] = [0.0] * len(searches)
+
+        def run(index: int) -> List[StockVideoAsset]:
+            name, orientation, filters = searches[index]
+            begin = time.monotonic()
+            assets = self._search_provider(name, keyword, orientation, filters, prefetched)
+            tracker.record(labels[index], time.monotonic() - begin)
+            return assets
+
+        def launch(index: int) -> None:
+            print(f"[Hedge] {labels[index]} 검색 시작 - '{keyword}'")
+            started[index] = time.monotonic()
+            futures[index] = executor.submit(run, index)
+
+        def failed_or_empty(index: int) -> bool:
+            future = futures[index]
+            if future is None or not future.done():
+                return False
+            if future.exception() is not None:
+                return True
+            return not future.result()
+
+        def overdue(index: int, now: float) -> bool:
+            return futures[index] is not None and now - started[index] >= delays[index]
+
+        reported = set()
+        begin = time.monotonic()
+        launch(0)
+        while True:
+            now = time.monotonic()
+
+            # 끝난 요청 로그 (오류는 다음 순위로 넘어감)
+            for i, future in enumerate(futures):
+                if future is not None and future.done() and i not in reported:
+                    reported.add(i)
+                    if future.exception() is not None:
+                        print(f"[ERROR] {labels[i]} 검색 실패: {future.exception()}")
+
+            # 앞 요청이 결과 없이 끝났거나 대기 시간을 넘기면 다음 요청 시작
+            for i in range(1, len(searches)):
+                if futures[i] is None and (failed_or_empty(i - 1) or overdue(i - 1, now)):
+                    launch(i)
+
+            # 우선순위대로 채택: 앞 순위가 모두 결과 없이 끝났거나 대기 시간을 넘긴 경우에만
+            for i, future in enumerate(futures):
+                if future is not None and future.done() and not failed_or_empty(i):
+                    hedged = any(not futures[j].done() for j in range(i))
+                    tracker.record_win(labels[i], hedged=hedged)
+                    assets = future.result()
+                    print(
+                        f"[Hedge] '{keyword}' {labels[i]} 채택: {len(assets)}개 "
+                        f"({time.monotonic() - begin:.2f}초" + (", 앞 순위 응답 대기 안 함)" if hedged else ")")
+                    )
+                    return assets
+                if not (failed_or_empty(i) or overdue(i, now)):
+                    break
+
+            pending = [future for future in futures if future is not None and not future.done()]
+            if not pending and all(future is not None for future in futures):
+                print(f"[Hedge] '{keyword}' 모든 제공자 결과 없음")
+                return []
+
+            # 다음 요청이 끝나거나 다음 대기 시간이 지날 때까지 대기
+            deadlines = [
+                started[i] + delays[i] for i, future in enumerate(futures)
+                if future is not None and not future.done() and not overdue(i, now)
+            ]
+            timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
 
     def _download_video(self, asset: StockVideoAsset) -> Optional[str]:
         """
@@ -268,13 +1018,18 @@ class AssetManager:
             print(f"[ERROR] 제공자를 찾을 수 없음: {provider_name}")
             return None
 
-        return provider.download_video(asset, output_dir=str(self.video_dir))
+        # 다른 검색어가 같은 영상을 고르면 같은 파일에 동시에 쓰지 않도록 영상 ID별로 직렬화
+        with self._download_locks_guard:
+            lock = self._download_locks.setdefault(asset.id, threading.Lock())
+        with lock, get_provider_limiter("stock"):
+            return provider.download_video(asset, output_dir=str(self.video_dir))
 
     def _generate_tts(
         self,
         content_plan: ContentPlan,
         account_id: Optional[int] = None,
-        tts_settings_override: Optional[Dict[str, Any]] = None
+        tts_settings_override: Optional[Dict[str, Any]] = None,
+        cancel: Optional[threading.Event] = None
     ) -> tuple[Optional[AudioAsset], List[SegmentTiming]]:
         """
         TTS 음성 생성 (세그먼트별 개별 생성 → 실제 싱크 맞춤)
@@ -285,6 +1040,7 @@ class AssetManager:
             content_plan: ContentPlan 객체
             account_id: 계정 ID (DB 설정 조회용)
             tts_settings_override: TTS 설정 오버라이드 (프론트엔드 직접 설정용)
+            cancel: 취소 이벤트 (set되면 남은 TTS 요청 / 조립을 중단)
 
         Returns:
             (AudioAsset 객체 또는 None, SegmentTiming 리스트)
@@ -318,16 +1074,20 @@ class AssetManager:
         provider = settings.get("tts_provider", "gtts")
         segment_audio_files = []
 
+        # 세그먼트 + 무음을 샘플 단위로 이어 붙이는 마스터 타임라인 (각 파일 1회 디코딩)
+        master = AudioTimeline()
+
         # Phase 2: SegmentTiming 리스트 및 누적 시간 추적
         segment_timings: List[SegmentTiming] = []
         cumulative_time = 0.0
 
         print(f"[TTS] 세그먼트별 개별 TTS 생성 시작 ({len(content_plan.segments)}개)")
 
-        for i, segment in enumerate(content_plan.segments):
-            # 효과음 및 대기 시간 추출
-            import re
+        # 3-1. 세그먼트 파싱 (효과음/대기 표현 제거, 대기 시간 추출)
+        import re
 
+        parsed_segments = []
+        for i, segment in enumerate(content_plan.segments):
             # 대기 시간 추출 (예: "(3초 대기)" → 3.0)
             pause_duration = 0.0
             pause_match = re.search(r'\((\d+(?:\.\d+)?)\s*초\s*(?:대기|기다림|멈춤|정지)\)', segment.text)
@@ -340,95 +1100,91 @@ class AssetManager:
             if not text and pause_duration == 0:
                 continue
 
-            # 세그먼트별 TTS 생성 (텍스트가 있는 경우만)
-            seg_filepath = None
-            if text:
-                if provider == "elevenlabs":
-                    seg_filepath = self._generate_elevenlabs(
-                        text=text,
-                        voice_id=settings.get("tts_voice_id"),
-                        stability=settings.get("tts_stability"),
-                        similarity_boost=settings.get("tts_similarity_boost"),
-                        style=settings.get("tts_style")
-                    )
-                elif provider == "typecast":
-                    # Typecast v1 API는 tc_ prefix voice_id 사용
-                    # voice_id가 ElevenLabs 형식이면 무시하고 기본값 사용
-                    voice_id = settings.get("tts_voice_id", "tc_5c3c52ca5827e00008dd7f3a")  # Sujin (여성)
-
-                    # ElevenLabs voice ID 형식 감지 (길이가 20자 이상이면 ElevenLabs)
-                    if len(str(voice_id)) == 20 and not str(voice_id).startswith("tc_"):
-                        # ElevenLabs ID 형식 (20자, tc_ 없음)
-                        typecast_voice_id = "tc_5c3c52ca5827e00008dd7f3a"  # 기본: Sujin (여성)
-                        print(f"[WARNING] ElevenLabs voice_id가 감지되어 Typecast 기본 voice 'Sujin' 사용")
-                    else:
-                        # tc_ prefix 검증
-                        if not str(voice_id).startswith("tc_"):
-                            typecast_voice_id = "tc_5c3c52ca5827e00008dd7f3a"  # Sujin
-                            print(f"[WARNING] Typecast voice_id는 tc_로 시작해야 합니다. 기본값 사용: Sujin")
-                        else:
-                            typecast_voice_id = voice_id
-
-                    seg_filepath = self._generate_typecast(
-                        text=text,
-                        voice_id=typecast_voice_id,
-                        emotion=settings.get("tts_emotion", "normal")
-                    )
-                else:
-                    seg_filepath = self._generate_gtts(text)
+            parsed_segments.append((i, segment, text, pause_duration))
+
+        # 3-2. ✨ 세그먼트 TTS 동시 생성 (제공자별 동시 요청/속도 제한은 각 생성 함수에서 적용)
+        synthesize = self._get_tts_synthesizer(provider, settings)
+        unique_texts = list(dict.fromkeys(text for _, _, text, _ in parsed_segments if text))
+        tts_files = self._synthesize_concurrently(synthesize, unique_texts, cancel)
+
+        # 3-3. 세그먼트 순서대로 마스터 타임라인 조립
+        for i, segment, text, pause_duration in parsed_segments:
+            self._check_cancelled(cancel)
+            seg_filepath = tts_files.get(text) if text else None
+
+            if text and not seg_filepath:
+                print(f"[ERROR] 세그먼트 {i+1} TTS 생성 실패")
+                continue
 
-            # 대기 시간이 있는 경우 무음 추가
+            # ✨ 마스터 타임라인에 배치 (실제 디코딩된 샘플 수 = 정확한 길이)
+            samples = None
+            start_sample = master.cursor
+            try:
+                if seg_filepath:
+                    samples = master.load(seg_filepath)
+                    master.append(samples)
+                if pause_duration > 0:
+                    master.append_silence(pause_duration)
+            except Exception as e:
+                print(f"[ERROR] 세그먼트 {i+1} 오디오 디코딩 실패: {e}")
+                master.cursor = start_sample
+                continue
+
+            # 대기 시간이 있는 경우 세그먼트 단독 파일에도 무음 추가 (드래프트 세그먼트 재생용)
             if pause_duration > 0:
-                seg_filepath = self._add_pause_to_audio(seg_filepath, pause_duration, i)
+                seg_filepath = self._add_pause_to_audio(seg_filepath, pause_duration, i, samples)
 
             if seg_filepath:
-                # ✨ 실제 TTS 길이 측정
-                seg_duration = self._get_audio_duration(seg_filepath)
-
-                # ✨ None이면 예측값 사용 (fallback)
-                if seg_duration is None:
-                    import re
-                    text_clean = re.sub(r'\([^)]*\)', '', text).strip()
-                    char_count = len(text_clean)
-                    seg_duration = max(0.5, char_count * 0.17)
-                    print(f"[WARNING] 세그먼트 {i+1} 길이 측정 실패. 예측값 사용: {seg_duration:.2f}초")
+                seg_duration = (master.cursor - start_sample) / master.sample_rate
 
                 # ✨ content_plan의 segment.duration 업데이트 (핵심!)
                 content_plan.segments[i].duration = seg_duration
 
+                # ✨ 단어 타임스탬프: 실제 발화 길이(대기 무음 제외)를 음절/문장부호 비율로 분배
+                words = []
+                if samples is not None and text:
+                    words = get_word_timing_service().estimate_words(
+                        text,
+                        len(samples) / master.sample_rate,
+                        offset=start_sample / master.sample_rate,
+                        samples=samples,
+                        sample_rate=master.sample_rate
+                    )
+
                 # Phase 2: SegmentTiming 생성 (누적 시간 포함)
                 timing = SegmentTiming(
                     segment_index=i,
                     text=segment.text,
                     tts_duration=seg_duration,
-                    start_time=cumulative_time,
-                    end_time=cumulative_time + seg_duration,
-                    tts_local_path=seg_filepath  # Phase 3: 세그먼트별 TTS 경로 저장
+                    start_time=start_sample / master.sample_rate,
+                    end_time=master.cursor / master.sample_rate,
+                    tts_local_path=seg_filepath,  # Phase 3: 세그먼트별 TTS 경로 저장
+                    words=[WordTiming(**w) for w in words]
                 )
                 segment_timings.append(timing)
 
-                # 누적 시간 업데이트
-                cumulative_time += seg_duration
+                # 누적 시간 업데이트 (마스터 샘플 위치 기준)
+                cumulative_time = timing.end_time
 
                 segment_audio_files.append(seg_filepath)
                 print(f"[TTS {i+1}/{len(content_plan.segments)}] '{text[:30]}...' → {seg_duration:.2f}초 (시작: {timing.start_time:.2f}초)")
             else:
+                master.cursor = start_sample
                 print(f"[ERROR] 세그먼트 {i+1} TTS 생성 실패")
 
         if not segment_audio_files:
             print("[ERROR] TTS 생성 실패: 모든 세그먼트 실패")
             return None, []
 
-        # 4. ✨ 모든 TTS 파일을 하나로 합치기 (concatenate)
-        final_filepath = self._concatenate_audio_files(segment_audio_files)
+        # 4. ✨ 마스터 WAV 한 번만 기록 (재인코딩 없음)
+        final_filepath = self._write_audio_master(master, segment_audio_files)
 
         if final_filepath:
-            # 최종 길이 측정
-            duration = self._get_audio_duration(final_filepath)
+            duration = master.duration
             full_text = " ".join([seg.text for seg in content_plan.segments])
 
-            # 5. ✨ SHORTS_SPEC.md: Whisper로 정확한 타임스탬프 추출
-            if WHISPER_AVAILABLE:
+            # 5. ✨ SHORTS_SPEC.md: Whisper로 정확한 타임스탬프 추출 (ALIGNMENT_MODE="whisper"일 때만)
+            if self.alignment_mode == "whisper" and WHISPER_AVAILABLE:
                 print(f"[Whisper] 정확한 타임스탬프 추출 중...")
                 try:
                     alignment_service = get_alignment_service()
@@ -442,27 +1198,20 @@ class AssetManager:
                     # Whisper 정렬
                     aligned_segments = alignment_service.align_segments_to_audio(
                         segments_dict,
-                        final_filepath
+                        final_filepath,
+                        boundaries=[t.end_time for t in segment_timings[:-1]]  # 긴 오디오 청크 분할 지점
                     )
 
                     # content_plan.segments 및 segment_timings 업데이트 (Whisper 타임스탬프 적용)
-                    whisper_cumulative = 0.0
-                    for i, aligned in enumerate(aligned_segments):
-                        if i < len(content_plan.segments):
-                            content_plan.segments[i].duration = aligned['duration']
-
-                        # Phase 2: Whisper 기반으로 segment_timings도 업데이트
-                        if i < len(segment_timings):
-                            segment_timings[i].tts_duration = aligned['duration']
-                            segment_timings[i].start_time = whisper_cumulative
-                            segment_timings[i].end_time = whisper_cumulative + aligned['duration']
-                            whisper_cumulative += aligned['duration']
-
-                    print(f"[SUCCESS] Whisper 타임스탬프 적용 완료 → 자막 싱크 정확도 극대화")
+                    if self._apply_whisper_alignment(content_plan, segment_timings, aligned_segments):
+                        print(f"[SUCCESS] Whisper 타임스탬프 적용 완료 → 자막 싱크 정확도 극대화")
+                    else:
+                        print(f"[WARNING] Whisper 정렬 결과 없음, TTS 길이 분배 추정치 유지")
                 except Exception as e:
-                    print(f"[WARNING] Whisper 처리 실패, 기존 duration 유지: {e}")
+                    print(f"[WARNING] Whisper 처리 실패, TTS 길이 분배 추정치 유지: {e}")
             else:
-                print(f"[INFO] Whisper 미사용. 세그먼트별 duration으로 자막 생성")
+                word_count = sum(len(t.words) for t in segment_timings)
+                print(f"[INFO] Whisper 미사용. TTS 길이 분배로 단어 타임스탬프 추정 ({word_count}개 단어)")
 
             # Phase 2: 최종 타이밍 정보 출력
             print(f"[Phase 2] SegmentTiming 생성 완료: {len(segment_timings)}개, 총 {cumulative_time:.2f}초")
@@ -478,6 +1227,143 @@ class AssetManager:
 
         return None, []
 
+    @staticmethod
+    def _apply_whisper_alignment(
+        content_plan: ContentPlan,
+        segment_timings: List[SegmentTiming],
+        aligned_segments: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Whisper 정렬 결과를 세그먼트 길이 / 타이밍에 적용
+
+        정렬 결과가 세그먼트와 1:1로 맞지 않거나 길이가 없으면(타임스탬프 추출 실패 시
+        정렬 서비스는 입력 세그먼트를 그대로 돌려줌) 아무것도 바꾸지 않아
+        길이 분배로 추정한 단어 타임스탬프가 그대로 남습니다.
+
+        Args:
+            content_plan: 콘텐츠 기획안
+            segment_timings: 세그먼트 타이밍 (segment_index 순서)
+            aligned_segments: align_segments_to_audio 결과 (content_plan.segments 순서)
+
+        Returns:
+            적용 여부
+        """
+        if len(aligned_segments) != len(content_plan.segments):
+            return False
+        durations = [aligned.get("duration") for aligned in aligned_segments]
+        if any(not isinstance(d, (int, float)) or d <= 0 for d in durations):
+            return False
+
+        whisper_cumulative = 0.0
+        for timing in segment_timings:
+            duration = durations[timing.segment_index]
+            content_plan.segments[timing.segment_index].duration = duration
+
+            # Phase 2: Whisper 기반으로 segment_timings도 업데이트
+            timing.tts_duration = duration
+            timing.start_time = whisper_cumulative
+            timing.end_time = whisper_cumulative + duration
+            timing.words = []  # 길이 분배 추정치는 Whisper 타이밍과 맞지 않음
+            whisper_cumulative += duration
+        return True
+
+    def _get_tts_synthesizer(self, provider: str, settings: Dict[str, Any]):
+        """
+        제공자 설정을 묶은 세그먼트 TTS 생성 함수 반환
+
+        Args:
+            provider: TTS 제공자 (elevenlabs, typecast, gtts)
+            settings: TTS 설정 (계정 설정 + 오버라이드)
+
+        Returns:
+            text -> 파일 경로(또는 None) 함수
+        """
+        if provider == "elevenlabs":
+            def synthesize(text: str) -> Optional[str]:
+                return self._generate_elevenlabs(
+                    text=text,
+                    voice_id=settings.get("tts_voice_id"),
+                    stability=settings.get("tts_stability"),
+                    similarity_boost=settings.get("tts_similarity_boost"),
+                    style=settings.get("tts_style")
+                )
+            return synthesize
+
+        if provider == "typecast":
+            # Typecast v1 API는 tc_ prefix voice_id 사용
+            # voice_id가 ElevenLabs 형식이면 무시하고 기본값 사용
+            voice_id = settings.get("tts_voice_id", "tc_5c3c52ca5827e00008dd7f3a")  # Sujin (여성)
+
+            # ElevenLabs voice ID 형식 감지 (길이가 20자 이상이면 ElevenLabs)
+            if len(str(voice_id)) == 20 and not str(voice_id).startswith("tc_"):
+                # ElevenLabs ID 형식 (20자, tc_ 없음)
+                typecast_voice_id = "tc_5c3c52ca5827e00008dd7f3a"  # 기본: Sujin (여성)
+                print(f"[WARNING] ElevenLabs voice_id가 감지되어 Typecast 기본 voice 'Sujin' 사용")
+            elif not str(voice_id).startswith("tc_"):
+                # tc_ prefix 검증
+                typecast_voice_id = "tc_5c3c52ca5827e00008dd7f3a"  # Sujin
+                print(f"[WARNING] Typecast voice_id는 tc_로 시작해야 합니다. 기본값 사용: Sujin")
+            else:
+                typecast_voice_id = voice_id
+
+            def synthesize(text: str) -> Optional[str]:
+                return self._generate_typecast(
+                    text=text,
+                    voice_id=typecast_voice_id,
+                    emotion=settings.get("tts_emotion", "normal")
+                )
+            return synthesize
+
+        return self._generate_gtts
+
+    def _synthesize_concurrently(
+        self,
+        synthesize,
+        texts: List[str],
+        cancel: Optional[threading.Event] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        텍스트별 TTS를 워커 풀에서 동시에 생성
+
+        한 세그먼트가 실패하거나 예외가 나도 나머지는 계속 진행됩니다
+        (ElevenLabs/Typecast 실패 시 gTTS 폴백은 각 생성 함수에서 처리).
+
+        Args:
+            synthesize: text -> 파일 경로 함수
+            texts: 중복 없는 텍스트 리스트
+            cancel: 취소 이벤트 (set되면 아직 시작하지 않은 요청은 건너뜀)
+
+        Returns:
+            {텍스트: 파일 경로 또는 None}
+
+        Raises:
+            AssetCollectionCancelled: 생성 중 취소됨
+        """
+        if not texts:
+            return {}
+
+        results: Dict[str, Optional[str]] = {}
+        workers = max(1, min(self.tts_workers, len(texts)))
+
+        def run(text: str) -> Optional[str]:
+            self._check_cancelled(cancel)
+            return synthesize(text)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts") as executor:
+            futures = {executor.submit(run, text): text for text in texts}
+            for future in as_completed(futures):
+                text = futures[future]
+                try:
+                    results[text] = future.result()
+                except AssetCollectionCancelled:
+                    results[text] = None
+                except Exception as e:
+                    print(f"[ERROR] TTS 생성 중 예외 ('{text[:20]}...'): {e}")
+                    results[text] = None
+
+        self._check_cancelled(cancel)
+        return results
+
     def _get_account_tts_settings(self, account_id: int) -> dict:
         """
         AccountSettings에서 TTS 설정 가져오기
@@ -522,22 +1408,15 @@ class AssetManager:
         try:
             from gtts import gTTS
 
-            # 파일명 생성 (텍스트 해시)
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:10]
-            filename = f"tts_{text_hash}.mp3"
-            filepath = self.audio_dir / filename
-
-            # 이미 생성된 경우
-            if filepath.exists():
-                print(f"[TTS] 이미 생성됨: {filename}")
-                return str(filepath)
+            def synthesize(temp_path: str) -> None:
+                with get_provider_limiter("gtts"):
+                    gTTS(text=text, lang='ko').save(temp_path)
 
-            # TTS 생성
-            tts = gTTS(text=text, lang='ko')
-            tts.save(str(filepath))
-
-            print(f"[SUCCESS] TTS 생성 완료: {filepath}")
-            return str(filepath)
+            key = make_cache_key("gtts", text, language="ko")
+            filepath, hit = self._get_tts_cache().get_or_create(key, synthesize, provider="gtts")
+            if filepath:
+                print(f"[TTS] {'캐시에서 로드' if hit else 'TTS 생성 완료'}: {Path(filepath).name}")
+            return filepath
 
         except ImportError:
             print("[ERROR] gTTS 패키지가 설치되지 않았습니다. pip install gtts")
@@ -579,53 +1458,52 @@ class AssetManager:
                 print("[ERROR] ELEVENLABS_API_KEY 환경변수가 설정되지 않았습니다.")
                 return self._generate_gtts(text)
 
-            # ✨ 파일명 생성 (설정값 포함 해시)
-            # 같은 텍스트라도 파라미터가 다르면 다른 파일로 저장
-            settings_str = f"{voice_id}_{stability}_{similarity_boost}_{style}"
-            combined_hash = hashlib.md5(
-                f"{text}_{settings_str}".encode()
-            ).hexdigest()[:10]
-
-            filename = f"tts_elevenlabs_{combined_hash}.mp3"
-            filepath = self.audio_dir / filename
-
-            # 이미 생성된 경우 (스마트 캐싱)
-            if filepath.exists():
-                print(f"[TTS] 캐시에서 로드: {filename}")
-                return str(filepath)
-
-            # ElevenLabs 클라이언트 생성
-            client = ElevenLabs(api_key=api_key)
-
-            # ✨ 상세 설정으로 TTS 생성
-            print(f"[ElevenLabs] 음성 생성 중...")
-            print(f"  - Voice: {voice_id}")
-            print(f"  - Stability: {stability}")
-            print(f"  - Similarity Boost: {similarity_boost}")
-            print(f"  - Style: {style}")
-
-            audio_generator = client.text_to_speech.convert(
-                text=text,
-                voice_id=voice_id,
-                model_id="eleven_multilingual_v2",
-                output_format="mp3_44100_128",
-                # ✨ Voice Settings 추가
-                voice_settings={
-                    "stability": stability,
-                    "similarity_boost": similarity_boost,
-                    "style": style,
-                    "use_speaker_boost": use_speaker_boost
-                }
-            )
+            # ✨ 캐시 키 (설정값 포함 전체 해시, 미리듣기 API와 공유)
+            # 같은 텍스트라도 파라미터가 다르면 다른 항목으로 저장
+            key = elevenlabs_cache_key(text, voice_id, stability, similarity_boost, style, use_speaker_boost)
+
+            def synthesize(temp_path: str) -> None:
+                # ElevenLabs 클라이언트 생성
+                client = ElevenLabs(api_key=api_key)
 
-            # 오디오 저장
-            with open(filepath, 'wb') as f:
-                for chunk in audio_generator:
-                    if isinstance(chunk, bytes):
-                        f.write(chunk)
+                # ✨ 상세 설정으로 TTS 생성
+                print(f"[ElevenLabs] 음성 생성 중...")
+                print(f"  - Voice: {voice_id}")
+                print(f"  - Stability: {stability}")
+                print(f"  - Similarity Boost: {similarity_boost}")
+                print(f"  - Style: {style}")
 
-            print(f"[SUCCESS] ElevenLabs TTS 생성 완료: {filepath}")
-            return str(filepath)
+                with get_provider_limiter("elevenlabs"):
+                    audio_generator = client.text_to_speech.convert(
+                        text=text,
+                        voice_id=voice_id,
+                        model_id=ELEVENLABS_MODEL,
+                        output_format=ELEVENLABS_OUTPUT_FORMAT,
+                        # ✨ Voice Settings 추가
+                        voice_settings={
+                            "stability": stability,
+                            "similarity_boost": similarity_boost,
+                            "style": style,
+                            "use_speaker_boost": use_speaker_boost
+                        }
+                    )
+
+                    # 오디오 저장 (스트리밍 응답이므로 제한 슬롯 안에서 수신)
+                    with open(temp_path, 'wb') as f:
+                        for chunk in audio_generator:
+                            if isinstance(chunk, bytes):
+                                f.write(chunk)
+
+            filepath, hit = self._get_tts_cache().get_or_create(key, synthesize, provider="elevenlabs")
+            if not filepath:
+                print("[ERROR] ElevenLabs 응답이 비어 있습니다.")
+                return self._generate_gtts(text)
+
+            if hit:
+                print(f"[TTS] 캐시에서 로드: {Path(filepath).name}")
+            else:
+                print(f"[SUCCESS] ElevenLabs TTS 생성 완료: {filepath}")
+            return filepath
 
         except ImportError:
             print("[ERROR] elevenlabs 패키지가 설치되지 않았습니다.")
@@ -675,25 +1553,6 @@ class AssetManager:
                 print(f"[WARNING] 기본 voice_id 사용: Sujin (tc_5c3c52ca5827e00008dd7f3a)")
                 voice_id = "tc_5c3c52ca5827e00008dd7f3a"
 
-            # 파일명 생성 (해시 기반 캐싱)
-            combined_hash = hashlib.md5(
-                f"{text}_{voice_id}_{emotion}".encode()
-            ).hexdigest()[:10]
-
-            filename = f"tts_typecast_{combined_hash}.mp3"
-            filepath = self.audio_dir / filename
-
-            # 이미 생성된 경우 (스마트 캐싱)
-            if filepath.exists():
-                print(f"[TTS] 캐시에서 로드: {filename}")
-                return str(filepath)
-
-            # Typecast API v1 호출
-            print(f"[Typecast] 음성 생성 중...")
-            print(f"  - Voice ID: {voice_id}")
-            print(f"  - Emotion: {emotion}")
-            print(f"  - Text length: {len(text)} chars")
-
             url = "https://api.typecast.ai/v1/text-to-speech"
             headers = {
                 "X-API-KEY": api_key,  # v1 API는 X-API-KEY 헤더 사용
@@ -714,29 +1573,55 @@ class AssetManager:
                 }
             }
 
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
+            # 캐시 키 (텍스트 외 요청 설정 전체 해시)
+            key = make_cache_key(
+                "typecast", text, voice=voice_id, model=payload["model"],
+                settings={"prompt": payload["prompt"], "output": payload["output"]}
+            )
 
-            if response.status_code == 200:
-                # 오디오 파일 저장
-                with open(filepath, 'wb') as f:
+            def synthesize(temp_path: str) -> bool:
+                # Typecast API v1 호출
+                print(f"[Typecast] 음성 생성 중...")
+                print(f"  - Voice ID: {voice_id}")
+                print(f"  - Emotion: {emotion}")
+                print(f"  - Text length: {len(text)} chars")
+
+                with get_provider_limiter("typecast"):
+                    response = requests.post(url, headers=headers, json=payload, timeout=60)
+
+                if response.status_code != 200:
+                    print(f"[ERROR] Typecast API 오류: {response.status_code} - {response.text}")
+                    return False
+
+                with open(temp_path, 'wb') as f:
                     f.write(response.content)
+                return True
 
-                print(f"[SUCCESS] Typecast TTS 생성 완료: {filepath}")
-                return str(filepath)
-            else:
-                print(f"[ERROR] Typecast API 오류: {response.status_code} - {response.text}")
+            filepath, hit = self._get_tts_cache().get_or_create(key, synthesize, provider="typecast")
+            if not filepath:
                 return self._generate_gtts(text)
 
+            if hit:
+                print(f"[TTS] 캐시에서 로드: {Path(filepath).name}")
+            else:
+                print(f"[SUCCESS] Typecast TTS 생성 완료: {filepath}")
+            return filepath
+
         except Exception as e:
             print(f"[ERROR] Typecast TTS 생성 실패: {e}")
             return self._generate_gtts(text)
 
-    def _get_cached_video(self, keyword: str) -> Optional[StockVideoAsset]:
+    def _get_cached_video(
+        self,
+        keyword: str,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[StockVideoAsset]:
         """
         캐시에서 영상 가져오기
 
         Args:
             keyword: 검색 키워드
+            target_size: 렌디션이 채워야 하는 최소 크기 (더 작은 렌디션이 캐시돼 있으면 다시 검색)
 
         Returns:
             StockVideoAsset 또는 None
@@ -755,6 +1640,10 @@ class AssetManager:
                 data = json.load(f)
                 asset = StockVideoAsset(**data)
 
+                # 프리뷰용 작은 렌디션은 본 렌더링에 재사용하지 않음 (크기를 모르는 이전 캐시는 그대로 사용)
+                if target_size and asset.width and asset.height and not covers(asset.width, asset.height, target_size):
+                    return None
+
                 # 파일이 실제로 존재하는지 확인
                 if asset.local_path and os.path.exists(asset.local_path):
                     return asset
@@ -786,12 +1675,18 @@ class AssetManager:
             print(f"[WARNING] 캐시 저장 실패: {e}")
 
     def clear_cache(self):
-        """캐시 디렉토리 비우기"""
+        """캐시 디렉토리 + 스톡 검색 결과 캐시 + 클립 라이브러리 색인 비우기"""
         import shutil
         if self.cache_dir.exists():
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir()
             print("[Cache] 캐시 삭제 완료")
+        if self.search_cache is not None:
+            removed = self.search_cache.clear()
+            print(f"[SearchCache] 검색 캐시 {removed}개 삭제")
+        if self.clip_library is not None:
+            removed = self.clip_library.clear()
+            print(f"[ClipLibrary] 라이브러리 색인 {removed}개 삭제 (영상 파일은 유지)")
 
     def _validate_bgm_file(self, bgm_asset: BGMAsset) -> bool:
         """
@@ -933,7 +1828,7 @@ class AssetManager:
 
     def _get_audio_duration(self, audio_path: str) -> Optional[float]:
         """
-        실제 오디오 파일 길이 측정 (MoviePy 사용 - Python 3.14 호환)
+        실제 오디오 파일 길이 측정 (헤더만 읽음, 미디어 색인 캐시)
 
         Args:
             audio_path: 오디오 파일 경로
@@ -941,63 +1836,35 @@ class AssetManager:
         Returns:
             오디오 길이 (초) 또는 None
         """
-        try:
-            # MoviePy 사용 (이미 의존성에 있음)
-            from moviepy import AudioFileClip
-
-            audio_clip = AudioFileClip(audio_path)
-            duration_seconds = audio_clip.duration
-            audio_clip.close()  # 리소스 해제
+        duration = get_media_probe_service().duration(audio_path)
+        if duration is None:
+            print(f"[ERROR] 오디오 길이 측정 실패: {audio_path}")
+        return duration
 
-            return duration_seconds
-
-        except Exception as e:
-            print(f"[ERROR] 오디오 길이 측정 실패: {e}")
-            return None
-
-    def _concatenate_audio_files(self, audio_files: List[str]) -> Optional[str]:
+    def _write_audio_master(self, master: AudioTimeline, audio_files: List[str]) -> Optional[str]:
         """
-        여러 TTS 오디오 파일을 하나로 합치기 (MoviePy 사용 - Python 3.14 호환)
+        TTS 마스터 타임라인을 WAV 파일 하나로 기록
+
+        세그먼트는 이미 샘플 단위로 배치되어 있으므로 디코딩/재인코딩 없이 한 번만 기록합니다.
 
         Args:
-            audio_files: 오디오 파일 경로 리스트
+            master: 세그먼트와 무음이 배치된 AudioTimeline
+            audio_files: 세그먼트 오디오 파일 경로 리스트 (파일명 해시용)
 
         Returns:
-            합쳐진 파일 경로 또는 None
+            마스터 파일 경로 또는 None
         """
         try:
-            from moviepy import AudioFileClip, concatenate_audioclips
-
-            print(f"[TTS] {len(audio_files)}개의 오디오 파일 합치기...")
-
-            # 모든 파일 로드
-            audio_clips = []
-            for i, audio_file in enumerate(audio_files, start=1):
-                clip = AudioFileClip(audio_file)
-                audio_clips.append(clip)
-                print(f"[TTS] {i}/{len(audio_files)} 로드...")
-
-            # 모든 오디오 합치기
-            combined = concatenate_audioclips(audio_clips)
-
-            # 합쳐진 파일 저장
-            import hashlib
             files_hash = hashlib.md5("".join(audio_files).encode()).hexdigest()[:10]
-            output_filename = f"tts_combined_{files_hash}.mp3"
-            output_path = self.audio_dir / output_filename
+            output_path = self.audio_dir / f"tts_combined_{files_hash}.wav"
 
-            combined.write_audiofile(str(output_path), codec='mp3', logger=None)
+            master.write(str(output_path))
 
-            # 리소스 해제
-            for clip in audio_clips:
-                clip.close()
-            combined.close()
-
-            print(f"[SUCCESS] TTS 파일 합치기 완료: {output_path} ({combined.duration:.2f}초)")
+            print(f"[SUCCESS] TTS 마스터 기록 완료: {output_path} ({master.duration:.2f}초, 세그먼트 {len(audio_files)}개)")
             return str(output_path)
 
         except Exception as e:
-            print(f"[ERROR] 오디오 파일 합치기 실패: {e}")
+            print(f"[ERROR] TTS 마스터 기록 실패: {e}")
             import traceback
             traceback.print_exc()
             return None
@@ -1006,60 +1873,41 @@ class AssetManager:
         self,
         audio_filepath: Optional[str],
         pause_duration: float,
-        segment_index: int
+        segment_index: int,
+        samples=None
     ) -> Optional[str]:
         """
-        오디오 파일에 무음 추가 (대기 시간 구현)
+        오디오 파일에 무음 추가 (대기 시간 구현, 세그먼트 단독 WAV)
 
         Args:
             audio_filepath: 기존 오디오 파일 경로 (None이면 순수 무음만 생성)
             pause_duration: 추가할 무음 길이 (초)
             segment_index: 세그먼트 인덱스
+            samples: 이미 디코딩된 PCM (있으면 다시 디코딩하지 않음)
 
         Returns:
             무음이 추가된 오디오 파일 경로 또는 None
         """
         try:
-            from moviepy import AudioFileClip, AudioClip, concatenate_audioclips
-            import numpy as np
-
-            audio_clips = []
+            segment = AudioTimeline()
 
-            # 1. 기존 TTS 오디오 로드 (있는 경우)
+            # 1. 기존 TTS 오디오 배치 (있는 경우)
             if audio_filepath:
-                tts_clip = AudioFileClip(audio_filepath)
-                audio_clips.append(tts_clip)
-                print(f"[TTS] 세그먼트 {segment_index+1}: TTS {tts_clip.duration:.1f}초 + 무음 {pause_duration:.1f}초")
+                segment.append(samples if samples is not None else audio_filepath)
+                print(f"[TTS] 세그먼트 {segment_index+1}: TTS {segment.duration:.1f}초 + 무음 {pause_duration:.1f}초")
             else:
                 print(f"[TTS] 세그먼트 {segment_index+1}: 순수 무음 {pause_duration:.1f}초")
 
-            # 2. 무음 생성 (44100Hz, 스테레오)
-            silence = AudioClip(
-                make_frame=lambda t: np.array([0, 0]),  # 스테레오 무음
-                duration=pause_duration,
-                fps=44100
-            )
-            audio_clips.append(silence)
-
-            # 3. 오디오 연결
-            combined = concatenate_audioclips(audio_clips)
+            # 2. 무음 추가 (커서만 이동)
+            segment.append_silence(pause_duration)
 
-            # 4. 파일 저장
-            import hashlib
+            # 3. 파일 저장
             hash_str = f"{audio_filepath}_{pause_duration}_{segment_index}"
             file_hash = hashlib.md5(hash_str.encode()).hexdigest()[:10]
-            output_filename = f"tts_pause_{file_hash}.mp3"
-            output_path = self.audio_dir / output_filename
-
-            total_duration = combined.duration  # duration 저장 (close 전에)
-            combined.write_audiofile(str(output_path), codec='mp3', logger=None)
-
-            # 5. 리소스 해제
-            for clip in audio_clips:
-                clip.close()
-            combined.close()
+            output_path = self.audio_dir / f"tts_pause_{file_hash}.wav"
+            segment.write(str(output_path))
 
-            print(f"[SUCCESS] 대기 시간 추가 완료: {output_path} (총 {total_duration:.1f}초)")
+            print(f"[SUCCESS] 대기 시간 추가 완료: {output_path} (총 {segment.duration:.1f}초)")
             return str(output_path)
 
         except Exception as e:
@@ -15,27 +15,16 @@ import subprocess
 import shutil
 
 from core.models import BGMAsset, MoodType
+from core.services.media_probe import get_media_probe_service
 
 
 def _get_audio_duration(file_path: str) -> float:
-    """오디오 파일의 길이를 ffprobe를 이용해 초 단위로 반환"""
-    ffprobe_cmd = shutil.which("ffprobe")
-    if not ffprobe_cmd:
-        raise FileNotFoundError("ffprobe를 찾을 수 없습니다. ffmpeg이 설치되어 있고 PATH에 추가되었는지 확인하세요.")
-
-    command = [
-        ffprobe_cmd,
-        "-v", "error",
-        "-show_entries", "format=duration",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(file_path)
-    ]
-    try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        return float(result.stdout.strip())
-    except (subprocess.CalledProcessError, ValueError) as e:
-        print(f"[BGMManager] 오디오 길이 측정 실패: {file_path} - {e}")
+    """오디오 파일의 길이를 초 단위로 반환 (헤더만 읽음, 미디어 색인 캐시)"""
+    duration = get_media_probe_service().duration(file_path)
+    if duration is None:
+        print(f"[BGMManager] 오디오 길이 측정 실패: {file_path}")
         return 0.0
+    return duration
 
 
 class BGMManager:
@@ -203,7 +192,7 @@ class BGMManager:
         if not file_path.exists():
             raise FileNotFoundError(f"BGM 파일 없음: {file_path}")
 
-        # 오디오 길이 측정 (ffprobe 사용)
+        # 오디오 길이 측정 (미디어 색인)
         duration = _get_audio_duration(str(file_path))
 
         # BGMAsset 생성
@@ -367,8 +356,10 @@ class BGMManager:
         # 최소 길이 필터링
         if min_duration:
             valid_files = []
+            infos = get_media_probe_service().probe_many(str(f) for f in default_files)
             for file_path in default_files:
-                duration = _get_audio_duration(str(file_path))
+                info = infos[str(file_path)]
+                duration = info.duration if info else 0.0
                 if duration >= min_duration:
                     valid_files.append((file_path, duration))
 
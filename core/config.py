@@ -97,6 +97,14 @@ LAYOUT_MIDDLE_HEIGHT = CANVAS_HEIGHT // 2  # 960px
 LAYOUT_BOTTOM_HEIGHT = CANVAS_HEIGHT // 4  # 480px
 
 
+# ==================== 타임스탬프 정렬 설정 ====================
+# 정렬 방식
+#   "whisper": Whisper로 전사해 타임스탬프 추출 + 세그먼트 길이 보정 (기본, Whisper 사용 가능할 때)
+#   "duration": 세그먼트별 실제 TTS 길이를 음절/문장부호 비율로 단어에 분배 (ASR 없음, 빠름)
+# 미설정(None)이면 AssetManager가 Whisper 사용 가능 여부로 결정 (가능하면 "whisper", 아니면 "duration")
+ALIGNMENT_MODE = os.getenv("ALIGNMENT_MODE") or None
+
+
 # ==================== Whisper 설정 ====================
 # Whisper 모델 크기 (tiny, base, small, medium, large)
 WHISPER_MODEL = "base"  # 속도와 정확도 균형
@@ -107,6 +115,58 @@ WHISPER_WORD_TIMESTAMPS = True
 # 언어 설정
 WHISPER_LANGUAGE = "ko"  # 한국어
 
+# 모델 상주 워커 프로세스 사용 (False면 호출한 프로세스에서 직접 로드)
+WHISPER_USE_WORKER = os.getenv("WHISPER_USE_WORKER", "true").lower() != "false"
+
+# 워커 프로세스 수 (워커마다 모델 1개를 메모리에 올림, 긴 오디오는 청크를 워커 수만큼 병렬 전사)
+WHISPER_WORKERS = int(os.getenv("WHISPER_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) // 2)))))
+
+# 청크 분할 전사: 이 길이(초) 이상인 오디오만 세그먼트 경계 / 무음에서 나눠 전사
+WHISPER_CHUNK_MIN_DURATION = float(os.getenv("WHISPER_CHUNK_MIN_DURATION", "120"))
+
+# 청크 목표 길이 (초, 경계가 없으면 더 길어질 수 있음)
+WHISPER_CHUNK_SECONDS = float(os.getenv("WHISPER_CHUNK_SECONDS", "60"))
+
+
+# ==================== 스톡 검색 캐시 설정 ====================
+# 제공자별 검색 결과 유지 시간 (시간). Pixabay API 약관은 24시간 캐시를 요구
+STOCK_SEARCH_TTL_HOURS = {
+    "pexels": float(os.getenv("PEXELS_SEARCH_TTL_HOURS", "72")),
+    "pixabay": float(os.getenv("PIXABAY_SEARCH_TTL_HOURS", "24")),
+}
+
+# 결과가 없었던 검색(negative entry) 유지 시간 (시간, 새 영상이 올라올 수 있으므로 짧게)
+STOCK_SEARCH_NEGATIVE_TTL_HOURS = float(os.getenv("STOCK_SEARCH_NEGATIVE_TTL_HOURS", "6"))
+
+# 헤지 검색: Pexels → Pixabay → Pixabay(제약 완화)를 직렬 fallback 대신 겹쳐서 요청
+# (앞 요청이 지연 시간 기록의 상위 백분위를 넘기면 다음 요청 시작, 응답 우선순위는 그대로)
+STOCK_HEDGED_SEARCH = os.getenv("STOCK_HEDGED_SEARCH", "false").lower() == "true"
+
+# 지연 기록이 부족할 때 다음 요청까지 기다리는 시간 (초)와 학습된 대기 시간의 범위
+STOCK_HEDGE_DELAY_SECONDS = float(os.getenv("STOCK_HEDGE_DELAY_SECONDS", "1.0"))
+STOCK_HEDGE_MIN_DELAY_SECONDS = float(os.getenv("STOCK_HEDGE_MIN_DELAY_SECONDS", "0.2"))
+STOCK_HEDGE_MAX_DELAY_SECONDS = float(os.getenv("STOCK_HEDGE_MAX_DELAY_SECONDS", "5.0"))
+
+# ==================== 로컬 클립 라이브러리 설정 ====================
+# 다운로드한 스톡 영상(downloads/stock_videos)을 검색어/태그로 색인해 네트워크 검색 전에 재사용
+LOCAL_CLIP_LIBRARY_ENABLED = os.getenv("LOCAL_CLIP_LIBRARY_ENABLED", "true").lower() == "true"
+
+# 재사용 최소 점수 (0~1, 검색어 토큰 중 클립 색인에 있는 비율을 idf로 가중한 값, 후보 순위는 BM25)
+LOCAL_CLIP_MIN_SCORE = float(os.getenv("LOCAL_CLIP_MIN_SCORE", "0.75"))
+
+# 지각 해시 중복 제거: 다운로드한 영상마다 프레임 dHash 지문을 계산해 같은 영상은 하드링크로 합치고
+# 인접 세그먼트에 거의 같은 영상이 연달아 나오지 않게 함
+STOCK_DEDUP_ENABLED = os.getenv("STOCK_DEDUP_ENABLED", "true").lower() == "true"
+
+# 지문에 쓰는 샘플 프레임 수 (영상 길이에 고르게 배치, 프레임당 64bit)
+STOCK_FINGERPRINT_FRAMES = int(os.getenv("STOCK_FINGERPRINT_FRAMES", "4"))
+
+# 프레임당 평균 해밍 거리 (bit, 0~64) 기준
+# - 이하면 같은 영상 (다른 ID / 다른 인코딩) → 파일 하나로 합침
+STOCK_DEDUP_MAX_DISTANCE = float(os.getenv("STOCK_DEDUP_MAX_DISTANCE", "4"))
+# - 이하면 거의 같은 장면 → 인접 세그먼트에 연달아 쓰지 않음
+STOCK_ADJACENT_MAX_DISTANCE = float(os.getenv("STOCK_ADJACENT_MAX_DISTANCE", "10"))
+
 
 # ==================== 경로 설정 ====================
 # 프로젝트 루트 경로
@@ -121,6 +181,51 @@ VIDEO_DIR = DOWNLOADS_DIR / "stock_videos"
 MUSIC_DIR = PROJECT_ROOT / "music"
 
 
+# ==================== 저장 공간 GC 설정 ====================
+# 디렉토리별 용량 상한(bytes) / 최대 보관 기간(일). 참조 중인 파일(Draft, 진행 중인 작업/프리뷰)은 삭제하지 않음
+_GB = 1024 ** 3
+STORAGE_GC_POLICIES = {
+    "stock_videos": {
+        "path": str(VIDEO_DIR),
+        "max_bytes": int(float(os.getenv("STORAGE_GC_STOCK_VIDEOS_GB", "20")) * _GB),
+        "max_age_days": float(os.getenv("STORAGE_GC_STOCK_VIDEOS_DAYS", "30")),
+        "patterns": ["*.mp4"],  # library.db(클립 라이브러리 색인) 제외
+    },
+    "audio": {
+        "path": str(AUDIO_DIR),
+        "max_bytes": int(float(os.getenv("STORAGE_GC_AUDIO_GB", "5")) * _GB),
+        "max_age_days": float(os.getenv("STORAGE_GC_AUDIO_DAYS", "14")),
+        "exclude": ["tts_cache"],  # TTS 캐시는 자체 용량 상한(LRU, 같은 참조 소스로 보호)으로 관리
+    },
+    "cache": {
+        "path": str(DOWNLOADS_DIR / "cache"),
+        "max_bytes": int(float(os.getenv("STORAGE_GC_CACHE_GB", "0.25")) * _GB),
+        "max_age_days": float(os.getenv("STORAGE_GC_CACHE_DAYS", "30")),
+        "patterns": ["*.json"],
+    },
+    "output": {
+        "path": str(OUTPUT_DIR),
+        "max_bytes": int(float(os.getenv("STORAGE_GC_OUTPUT_GB", "50")) * _GB),
+        "max_age_days": float(os.getenv("STORAGE_GC_OUTPUT_DAYS", "60")),
+        "exclude": ["preview"],  # 프리뷰는 별도 정책
+    },
+    "preview": {
+        "path": str(OUTPUT_DIR / "preview"),
+        "max_bytes": int(float(os.getenv("STORAGE_GC_PREVIEW_GB", "5")) * _GB),
+        "max_age_days": float(os.getenv("STORAGE_GC_PREVIEW_DAYS", "3")),
+    },
+}
+
+# 이보다 최근에 수정된 파일은 삭제하지 않음 (수집 / 렌더링 중이라 아직 참조로 기록되지 않은 파일 보호)
+STORAGE_GC_GRACE_MINUTES = float(os.getenv("STORAGE_GC_GRACE_MINUTES", "60"))
+
+# 디스크 여유 공간이 이보다 적으면 디렉토리 상한 안이어도 오래 쓰지 않은 파일부터 추가 삭제
+STORAGE_GC_MIN_FREE_GB = float(os.getenv("STORAGE_GC_MIN_FREE_GB", "10"))
+
+# AutomationScheduler 정기 실행 (0이면 등록하지 않음)
+STORAGE_GC_INTERVAL_MINUTES = int(os.getenv("STORAGE_GC_INTERVAL_MINUTES", "360"))
+
+
 # ==================== 유틸리티 함수 ====================
 def clamp_y_to_safe_zone(y: int, text_height: int) -> int:
     """
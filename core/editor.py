@@ -13,7 +13,8 @@ from core.models import (
     EditConfig,
     SubtitleSegment,
     VideoFormat,
-    TemplateConfig
+    TemplateConfig,
+    LayoutGeometry
 )
 from core.bgm_manager import BGMManager
 
@@ -32,6 +33,31 @@ from core.services.subtitle_service import get_subtitle_service
 # Phase 1: TitleService 사용 (Pillow 기반 - 텍스트 잘림 방지)
 from core.services.title_service import get_title_service
 
+# 자막/제목 트랙 (구간 인덱스 기반 합성)
+from core.services.subtitle_track import SubtitleTrack, TrackSprite
+
+# 쇼츠 정적 레이어 평탄화 (검은 배경 + 제목)
+from core.services.static_layer import FlattenedLayout
+
+# Ken Burns 줌 (프레임별 크롭 창 사전 계산)
+from core.services.ken_burns import KenBurnsResampler
+
+# FFmpeg 렌더링 엔진 (EditConfig.render_backend == "ffmpeg")
+from core.services.ffmpeg_render_service import get_ffmpeg_render_service
+
+# x264 인코더 프로필 (draft / preview / standard / archive)
+from core.services.encoder_profiles import resolve_encoder_profile
+
+# 소스 영상 디코더 풀 (필요할 때만 열고 동시 개수 제한)
+from core.services.video_reader_pool import VideoReaderPool
+
+# 샘플 단위 오디오 타임라인 (TTS + BGM 사전 믹싱)
+from core.services.audio_timeline import AudioTimeline
+
+# 미디어 길이/메타데이터 색인 (헤더만 읽음)
+from core.services.media_probe import get_media_probe_service
+from core.services.rendition import plan_layout_geometry
+
 
 class VideoEditor:
     """MoviePy 기반 영상 편집기"""
@@ -55,6 +81,7 @@ class VideoEditor:
         # MoviePy import
         try:
             from moviepy import (
+                VideoClip,
                 VideoFileClip,
                 AudioFileClip,
                 ImageClip,
@@ -64,6 +91,7 @@ class VideoEditor:
                 CompositeAudioClip,
                 concatenate_videoclips
             )
+            self.VideoClip = VideoClip
             self.VideoFileClip = VideoFileClip
             self.AudioFileClip = AudioFileClip
             self.ImageClip = ImageClip
@@ -93,7 +121,8 @@ class VideoEditor:
         content_plan: ContentPlan,
         asset_bundle: AssetBundle,
         output_filename: Optional[str] = None,
-        template_name: Optional[str] = None  # ✨ NEW
+        template_name: Optional[str] = None,  # ✨ NEW
+        encoder_profile: Optional[str] = None
     ) -> Optional[str]:
         """
         ContentPlan과 AssetBundle로 최종 영상 생성
@@ -103,6 +132,7 @@ class VideoEditor:
             asset_bundle: AssetBundle 객체 (영상 + 음성)
             output_filename: 출력 파일명 (None이면 자동 생성)
             template_name: 사용할 템플릿 이름 (✨ NEW)
+            encoder_profile: 인코더 프로필 (None이면 EditConfig → 템플릿 → standard 순)
 
         Returns:
             저장된 영상 경로 또는 None
@@ -117,13 +147,101 @@ class VideoEditor:
         else:
             self.template = None
 
+        self._encoder_profile_override = encoder_profile
 
-        # 1. 비디오 클립 로드
-        video_clips = self._load_video_clips(asset_bundle)
-        if not video_clips:
-            print("[ERROR] 사용 가능한 비디오 클립이 없습니다")
+        # ✨ FFmpeg 렌더링 엔진: 단일 filter_complex 호출 (실패 시 MoviePy로 폴백)
+        if self.config.render_backend == "ffmpeg":
+            output_path = self._create_video_ffmpeg(content_plan, asset_bundle, output_filename)
+            if output_path:
+                return output_path
+            print("[Editor] FFmpeg 렌더링 실패 - MoviePy 엔진으로 폴백합니다")
+
+        self._template_name = template_name
+
+        # 출력 파일명 생성
+        output_filename = self._resolve_output_filename(output_filename)
+        output_path = os.path.join(self.config.output_dir, output_filename)
+
+        # ✨ 병렬 렌더링: 세그먼트 경계로 나눠 워커 프로세스에서 청크 인코딩 후 concat
+        # 부모는 오디오만 한 번 믹싱하고(길이 기준 + 최종 mux), 비디오 타임라인은 워커가 구성
+        audio_clip = None
+        target_duration = None
+        if self.config.render_workers > 1:
+            audio_clip, target_duration = self._prepare_audio(content_plan, asset_bundle)
+            print(f"\n[Editor] 렌더링 시작: {output_filename} ({target_duration:.2f}초, "
+                  f"인코더 프로필: {self._encoder_profile().name})")
+            try:
+                result = self._render_parallel(content_plan, asset_bundle, audio_clip, target_duration, output_path)
+            except Exception as e:
+                print(f"[ERROR] 병렬 렌더링 실패: {e}")
+                result = None
+            if result:
+                if audio_clip:
+                    audio_clip.close()
+                print(f"[SUCCESS] 영상 생성 완료: {output_path}")
+                return output_path
+            print("[Editor] 병렬 렌더링 실패 - 단일 프로세스 렌더링으로 폴백합니다")
+
+        # 1~6. 타임라인 구성 (클립 로드 → 오디오 → 합성 → 레이아웃 → 자막)
+        if target_duration is None:
+            timeline = self._build_timeline(content_plan, asset_bundle)
+        else:
+            # 병렬 렌더링에서 폴백: 이미 믹싱한 오디오를 다시 사용
+            timeline = self._build_timeline(content_plan, asset_bundle, with_audio=False, target_duration=target_duration)
+        if not timeline:
+            if audio_clip:
+                audio_clip.close()
+            return None
+
+        final_video, built_audio, video_clips, target_duration = timeline
+        if built_audio is None and audio_clip:
+            final_video = final_video.with_audio(audio_clip)
+        else:
+            audio_clip = built_audio
+
+        # 7~8. 영상 렌더링
+        try:
+            if self.config.render_workers <= 1:
+                print(f"\n[Editor] 렌더링 시작: {output_filename} ({target_duration:.2f}초, "
+                      f"인코더 프로필: {self._encoder_profile().name})")
+
+            final_video.write_videofile(
+                output_path,
+                fps=self.config.fps,
+                audio_codec='aac',
+                temp_audiofile='temp-audio.m4a',
+                remove_temp=True,
+                **self._video_write_kwargs()
+            )
+
+            print(f"[SUCCESS] 영상 생성 완료: {output_path}")
+            return output_path
+
+        except Exception as e:
+            print(f"[ERROR] 렌더링 실패: {e}")
+            import traceback
+            traceback.print_exc()
             return None
 
+        finally:
+            # 리소스 정리
+            final_video.close()
+            if audio_clip:
+                audio_clip.close()
+            for clip in video_clips:
+                clip.close()
+
+    def _prepare_audio(self, content_plan: ContentPlan, asset_bundle: AssetBundle):
+        """
+        최종 오디오(TTS + BGM 믹싱)와 영상 길이 결정
+
+        Args:
+            content_plan: ContentPlan 객체
+            asset_bundle: AssetBundle 객체
+
+        Returns:
+            (audio_clip 또는 None, target_duration)
+        """
         # 2. 오디오 로드 (Phase 2: BGM 믹싱 포함)
         audio_clip = self._load_audio_with_bgm(asset_bundle, content_plan.target_duration)
 
@@ -139,6 +257,44 @@ class VideoEditor:
             target_duration = content_plan.target_duration
             print(f"[Editor] 오디오 없음, 목표 길이 사용: {target_duration:.2f}초")
 
+        return audio_clip, target_duration
+
+    def _build_timeline(
+        self,
+        content_plan: ContentPlan,
+        asset_bundle: AssetBundle,
+        with_audio: bool = True,
+        target_duration: Optional[float] = None
+    ):
+        """
+        MoviePy 타임라인 구성 (렌더링 직전 단계까지)
+
+        단일 프로세스 렌더링과 병렬 렌더링 워커가 같은 타임라인을 만들도록 공용으로 사용합니다.
+        with_audio=False면 TTS / BGM 디코딩과 믹싱을 건너뛰고 부모가 정한 target_duration으로
+        비디오만 구성합니다 (청크 워커는 비디오 전용으로 인코딩, 오디오는 부모가 한 번만 mux).
+
+        Args:
+            content_plan: ContentPlan 객체
+            asset_bundle: AssetBundle 객체
+            with_audio: 오디오 로드 / 믹싱 후 타임라인에 연결
+            target_duration: with_audio=False일 때 영상 길이 (None이면 content_plan.target_duration)
+
+        Returns:
+            (final_video, audio_clip, video_clips, target_duration) 또는 None
+        """
+        # 1. 비디오 클립 로드
+        video_clips = self._load_video_clips(asset_bundle)
+        if not video_clips:
+            print("[ERROR] 사용 가능한 비디오 클립이 없습니다")
+            return None
+
+        # 2~3. 오디오 / 영상 길이
+        if with_audio:
+            audio_clip, target_duration = self._prepare_audio(content_plan, asset_bundle)
+        else:
+            audio_clip = None
+            target_duration = target_duration or content_plan.target_duration
+
         # 4. 영상 클립 조정 및 연결 (Phase 2: segment_timings 사용)
         final_video = self._compose_video_clips(
             video_clips,
@@ -149,6 +305,10 @@ class VideoEditor:
 
         if not final_video:
             print("[ERROR] 영상 합성 실패")
+            if audio_clip:
+                audio_clip.close()
+            for clip in video_clips:
+                clip.close()
             return None
 
         # 4-1. Phase 2: 쇼츠 레이아웃 적용 (SHORTS 포맷인 경우)
@@ -159,26 +319,15 @@ class VideoEditor:
                 target_duration
             )
 
-        # 5. 오디오 추가
-        if audio_clip:
-            final_video = final_video.with_audio(audio_clip)
-
         # 6. 자막 추가 (FIX: target_duration 강제)
         if content_plan.segments:
             final_video = self._add_subtitles(
                 final_video,
                 content_plan,
-                target_duration  # audio_clip.duration 대신 target_duration 사용
+                target_duration,  # audio_clip.duration 대신 target_duration 사용
+                segment_timings=asset_bundle.segment_timings
             )
 
-        # 7. 출력 파일명 생성
-        if not output_filename:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"video_{timestamp}.mp4"
-
-        output_path = os.path.join(self.config.output_dir, output_filename)
-
         # FIX: 최종 영상 길이 강제 조정
         actual_video_duration = final_video.duration
         print(f"[Editor] 렌더링 전 영상 길이: {actual_video_duration:.2f}초 (목표: {target_duration:.2f}초)")
@@ -193,46 +342,436 @@ class VideoEditor:
                 final_video = final_video.with_duration(target_duration)
             print(f"[Editor] 영상 길이 조정 완료: {final_video.duration:.2f}초")
 
-        # 8. 영상 렌더링
-        try:
-            print(f"\n[Editor] 렌더링 시작: {output_filename} ({target_duration:.2f}초)")
-            final_video.write_videofile(
-                output_path,
-                fps=self.config.fps,
-                codec='libx264',
-                audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
-                remove_temp=True
-            )
+        # 5. 오디오 추가 (길이를 맞춘 뒤 연결)
+        if audio_clip:
+            final_video = final_video.with_audio(audio_clip)
 
-            print(f"[SUCCESS] 영상 생성 완료: {output_path}")
-            return output_path
+        return final_video, audio_clip, video_clips, target_duration
 
-        except Exception as e:
-            print(f"[ERROR] 렌더링 실패: {e}")
-            import traceback
-            traceback.print_exc()
+    def _encoder_profile(self):
+        """
+        이번 작업의 인코더 프로필 (작업 지정 → EditConfig → 템플릿 → standard)
+
+        Returns:
+            EncoderProfile
+        """
+        return resolve_encoder_profile(
+            getattr(self, "_encoder_profile_override", None),
+            self.config.encoder_profile,
+            self.template.encoder_profile if self.template else None
+        )
+
+    def _video_write_kwargs(self) -> Dict[str, Any]:
+        """
+        비디오 인코더 설정 (단일 렌더링 / 병렬 청크 렌더링 공용)
+
+        청크를 재인코딩 없이 concat하려면 모든 청크가 같은 설정으로 인코딩되어야 합니다.
+
+        Returns:
+            write_videofile 키워드 인자
+        """
+        return self._encoder_profile().write_kwargs(self.config.fps)
+
+    def _plan_render_chunks(
+        self,
+        total_frames: int,
+        num_clips: int,
+        target_duration: float,
+        segment_timings: List = None
+    ) -> List[Tuple[int, int]]:
+        """
+        병렬 렌더링 청크 계획 (프레임 단위 [시작, 끝) 구간)
+
+        세그먼트 경계(SegmentTiming.end_time)를 후보 절단점으로 사용하고,
+        절단점이 크로스페이드 구간(두 클립이 겹치는 구간) 안에 있으면 크로스페이드가 끝난 뒤로 옮깁니다.
+        후보 중 균등 분할 지점에 가장 가까운 것을 render_workers개 청크가 되도록 고릅니다.
+
+        Args:
+            total_frames: 전체 프레임 수
+            num_clips: 타임라인 클립 수
+            target_duration: 목표 길이 (초)
+            segment_timings: Phase 2 SegmentTiming 리스트
+
+        Returns:
+            [(시작 프레임, 끝 프레임), ...] (청크가 1개면 병렬화 불필요)
+        """
+        fps = self.config.fps
+        workers = max(1, self.config.render_workers)
+
+        # 크로스페이드 구간 (다음 클립 시작 ~ 시작 + 크로스페이드)
+        crossfade_duration = self.CROSSFADE_DURATION if self.ENABLE_CROSSFADE else 0
+        crossfades = []
+        if crossfade_duration > 0 and num_clips > 1:
+            clip_durations = self._plan_clip_durations(num_clips, target_duration, segment_timings)
+            clip_start = 0.0
+            for duration in clip_durations[:-1]:
+                clip_start += duration - crossfade_duration
+                crossfades.append((clip_start, clip_start + crossfade_duration))
+
+        # 후보 절단점: 세그먼트 경계 (없으면 균등 분할 지점)
+        if segment_timings:
+            boundaries = [timing.end_time for timing in segment_timings[:-1]]
+        else:
+            boundaries = [target_duration * i / workers for i in range(1, workers)]
+
+        candidates = set()
+        for boundary in boundaries:
+            for fade_start, fade_end in crossfades:
+                if fade_start <= boundary < fade_end:
+                    boundary = fade_end
+                    break
+            frame = int(round(boundary * fps))
+            if 0 < frame < total_frames:
+                candidates.add(frame)
+
+        # 균등 분할 지점에 가장 가까운 후보 선택
+        cuts = set()
+        for i in range(1, workers):
+            if not candidates - cuts:
+                break
+            ideal = total_frames * i / workers
+            cuts.add(min(candidates - cuts, key=lambda frame: abs(frame - ideal)))
+
+        edges = [0] + sorted(cuts) + [total_frames]
+        return [(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+    def _render_parallel(
+        self,
+        content_plan: ContentPlan,
+        asset_bundle: AssetBundle,
+        audio_clip,
+        target_duration: float,
+        output_path: str
+    ) -> Optional[str]:
+        """
+        세그먼트 병렬 렌더링
+
+        1. 세그먼트 경계로 타임라인을 프레임 단위 청크로 분할 (크로스페이드 구간은 피함)
+        2. 워커 프로세스가 비디오 전용 타임라인(오디오 디코딩 / 믹싱 없음)을 구성해 자기 청크만 인코딩
+        3. ffmpeg concat demuxer로 재인코딩 없이 연결하고 부모가 믹싱한 오디오를 한 번만 mux
+
+        Args:
+            content_plan: ContentPlan 객체
+            asset_bundle: AssetBundle 객체
+            audio_clip: 부모가 믹싱한 오디오 클립 또는 None
+            target_duration: 영상 길이 (초, 워커 타임라인에 그대로 전달)
+            output_path: 출력 영상 경로
+
+        Returns:
+            출력 영상 경로 또는 None (실패 시 단일 프로세스로 폴백)
+        """
+        import subprocess
+        import tempfile
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        render_service = get_ffmpeg_render_service()
+        if not render_service.available:
+            print("[Editor] ffmpeg를 찾을 수 없어 병렬 렌더링을 건너뜁니다")
             return None
 
-        finally:
-            # 리소스 정리
-            final_video.close()
+        fps = self.config.fps
+        total_frames = int(target_duration * fps)
+        # 워커가 로드할 클립 수 (파일이 있는 에셋, 부모는 클립을 열지 않음)
+        num_clips = sum(1 for asset in asset_bundle.videos if asset.local_path and os.path.exists(asset.local_path))
+        chunks = self._plan_render_chunks(total_frames, num_clips, target_duration, asset_bundle.segment_timings)
+        if len(chunks) < 2:
+            print("[Editor] 분할 가능한 세그먼트 경계가 없어 병렬 렌더링을 건너뜁니다")
+            return None
+
+        # 워커별 인코더 스레드 (코어 과다 사용 방지)
+        threads = max(1, (os.cpu_count() or 1) // len(chunks))
+        write_kwargs = dict(self._video_write_kwargs(), threads=threads)
+
+        print(f"[Editor] 병렬 렌더링: 청크 {len(chunks)}개, 워커 {min(len(chunks), self.config.render_workers)}개 "
+              f"(경계 프레임: {[start for start, _ in chunks[1:]]})")
+
+        with tempfile.TemporaryDirectory(prefix="render_chunks_") as temp_dir:
+            jobs = []
+            for i, (start_frame, end_frame) in enumerate(chunks):
+                start = start_frame / fps
+                # 마지막 청크는 타임라인 끝까지, 나머지는 끝 프레임 직전까지 (프레임 수 정확히 일치)
+                end = None if i == len(chunks) - 1 else (end_frame + 0.5) / fps
+                chunk_path = os.path.join(temp_dir, f"chunk_{i:03d}.mp4")
+                jobs.append((
+                    self.config,
+                    getattr(self, "_template_name", None),
+                    content_plan,
+                    asset_bundle,
+                    target_duration,
+                    start,
+                    end,
+                    chunk_path,
+                    write_kwargs
+                ))
+
+            # spawn: 부모의 ffmpeg 리더 파이프를 상속하지 않도록 (Windows와 동일 동작)
+            context = multiprocessing.get_context("spawn")
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(len(chunks), self.config.render_workers),
+                    mp_context=context
+                ) as executor:
+                    chunk_paths = list(executor.map(_render_chunk_worker, jobs))
+            except Exception as e:
+                print(f"[ERROR] 청크 렌더링 실패: {e}")
+                return None
+
+            if not all(chunk_paths):
+                print("[ERROR] 일부 청크 렌더링 실패")
+                return None
+
+            # concat demuxer 목록
+            list_path = os.path.join(temp_dir, "chunks.txt")
+            with open(list_path, 'w', encoding='utf-8') as f:
+                for chunk_path in chunk_paths:
+                    escaped = chunk_path.replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+
+            command = [
+                render_service.ffmpeg_cmd, "-y", "-hide_banner", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", list_path
+            ]
+
+            # 오디오는 한 번만 인코딩해서 mux
             if audio_clip:
-                audio_clip.close()
-            for clip in video_clips:
-                clip.close()
+                audio_path = os.path.join(temp_dir, "audio.m4a")
+                audio_clip.write_audiofile(audio_path, fps=44100, codec='aac', logger=None)
+                command += ["-i", audio_path, "-map", "0:v:0", "-map", "1:a:0"]
+
+            command += ["-c", "copy"]
+            if self._encoder_profile().faststart:
+                command += ["-movflags", "+faststart"]
+            command.append(output_path)
+
+            try:
+                subprocess.run(command, check=True, capture_output=True, text=True)
+            except subprocess.CalledProcessError as e:
+                print(f"[ERROR] 청크 연결 실패: {(e.stderr or '')[-2000:]}")
+                return None
+
+        print(f"[Editor] 병렬 렌더링 완료: 청크 {len(chunks)}개 연결")
+        return output_path
+
+    def _resolve_output_filename(self, output_filename: Optional[str]) -> str:
+        """
+        출력 파일명 결정 (None이면 타임스탬프 기반 자동 생성)
+
+        Args:
+            output_filename: 출력 파일명 또는 None
+
+        Returns:
+            출력 파일명
+        """
+        if output_filename:
+            return output_filename
+
+        from datetime import datetime
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"video_{timestamp}.mp4"
+
+    def _create_video_ffmpeg(
+        self,
+        content_plan: ContentPlan,
+        asset_bundle: AssetBundle,
+        output_filename: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        FFmpeg 엔진으로 영상 생성 (단일 filter_complex 호출)
+
+        MoviePy 경로와 같은 타임라인(클립 길이, 크롭, 크로스페이드, 제목/자막, TTS+BGM)을
+        만들어 FFmpegRenderService에 전달합니다. 프레임이 Python을 거치지 않습니다.
+
+        Args:
+            content_plan: ContentPlan 객체
+            asset_bundle: AssetBundle 객체 (영상 + 음성)
+            output_filename: 출력 파일명 (None이면 자동 생성)
+
+        Returns:
+            저장된 영상 경로 또는 None (실패 시 MoviePy로 폴백)
+        """
+        render_service = get_ffmpeg_render_service()
+        if not render_service.available:
+            print("[Editor] ffmpeg를 찾을 수 없습니다")
+            return None
+
+        output_filename = self._resolve_output_filename(output_filename)
+        output_path = os.path.join(self.config.output_dir, output_filename)
+
+        import tempfile
+        with tempfile.TemporaryDirectory(prefix="render_overlays_") as overlay_dir:
+            try:
+                timeline = self._build_render_timeline(content_plan, asset_bundle, overlay_dir)
+            except Exception as e:
+                print(f"[ERROR] 렌더링 타임라인 생성 실패: {e}")
+                import traceback
+                traceback.print_exc()
+                return None
+
+            if not timeline:
+                return None
+
+            print(f"\n[Editor] FFmpeg 렌더링 시작: {output_filename} ({timeline['duration']:.2f}초)")
+            result = render_service.render(timeline, output_path)
+
+        if result:
+            print(f"[SUCCESS] 영상 생성 완료: {result}")
+        return result
+
+    def _get_tts_duration(self, asset_bundle: AssetBundle) -> Optional[float]:
+        """
+        TTS 오디오 길이 조회 (프레임 디코딩 없이 헤더만 읽음)
+
+        Args:
+            asset_bundle: AssetBundle 객체
+
+        Returns:
+            오디오 길이 (초) 또는 None
+        """
+        if not asset_bundle.audio or not asset_bundle.audio.local_path:
+            return None
+        return get_media_probe_service().duration(asset_bundle.audio.local_path)
+
+    def _build_render_timeline(
+        self,
+        content_plan: ContentPlan,
+        asset_bundle: AssetBundle,
+        overlay_dir: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        FFmpeg 엔진용 렌더링 타임라인 생성
+
+        제목/자막은 Pillow로 PNG를 만들어 overlay_dir에 저장합니다.
+
+        Args:
+            content_plan: ContentPlan 객체
+            asset_bundle: AssetBundle 객체
+            overlay_dir: 오버레이 PNG 저장 디렉토리
+
+        Returns:
+            FFmpegRenderService 타임라인 dict 또는 None
+        """
+        # 1. 클립 경로 (MoviePy 경로와 같은 검증)
+        clip_assets = []
+        for asset in asset_bundle.videos:
+            if not asset.local_path or not os.path.exists(asset.local_path):
+                print(f"[WARNING] 영상 파일을 찾을 수 없음: {asset.id}")
+                continue
+            clip_assets.append(asset)
+        clip_paths = [asset.local_path for asset in clip_assets]
+
+        if not clip_paths:
+            print("[ERROR] 사용 가능한 비디오 클립이 없습니다")
+            return None
+
+        # 2. 목표 길이 (Phase 1: TTS 오디오 길이가 절대 기준)
+        tts_duration = self._get_tts_duration(asset_bundle)
+        target_duration = tts_duration if tts_duration else content_plan.target_duration
+        print(f"[Editor] FFmpeg 타임라인 길이: {target_duration:.2f}초")
+
+        # 3. 클립 길이 (MoviePy 경로와 동일한 계산)
+        crossfade_duration = self.CROSSFADE_DURATION if self.ENABLE_CROSSFADE else 0
+        clip_durations = self._plan_clip_durations(
+            len(clip_paths),
+            target_duration,
+            asset_bundle.segment_timings
+        )
+
+        # 4. 레이아웃 (쇼츠: 상단 1/4 제목 + 중앙 1/2 영상 + 하단 1/4)
+        geometry = self._plan_layout_geometry(content_plan.format)
+        overlays = []
+
+        if content_plan.format == VideoFormat.SHORTS:
+            title_service = get_title_service()
+            title_image, _ = title_service.create_title_image(
+                content_plan.title,
+                canvas_width=CANVAS_WIDTH,
+                canvas_height=CANVAS_HEIGHT
+            )
+            title_path = os.path.join(overlay_dir, "title.png")
+            title_image.save(title_path)
+            overlays.append({"path": title_path, "x": 0, "y": 0, "start": 0.0, "end": None})
+
+        # 5. 자막 PNG
+        if content_plan.segments:
+            subtitle_service = get_subtitle_service()
+            segments_data = self._build_subtitle_segments(content_plan, asset_bundle.segment_timings)
+            subtitle_clip_data = subtitle_service.create_subtitle_clips(segments_data, fps=self.config.fps)
+
+            for i, data in enumerate(subtitle_clip_data):
+                subtitle_path = os.path.join(overlay_dir, f"subtitle_{i:04d}.png")
+                data["image"].save(subtitle_path)
+                overlays.append({
+                    "path": subtitle_path,
+                    "x": data["x_position"],
+                    "y": data["y_position"],
+                    "start": data["start"],
+                    "end": data["start"] + data["duration"]
+                })
+
+        # 6. 오디오 (TTS + BGM)
+        tts_path = None
+        if tts_duration:
+            tts_path = asset_bundle.audio.local_path
+
+        return {
+            "width": geometry.canvas_size[0],
+            "height": geometry.canvas_size[1],
+            "fps": self.config.fps,
+            "duration": target_duration,
+            "clip_size": geometry.band_size,
+            "clip_position": geometry.band_position,
+            "crop_ratios": geometry.crop_ratios,
+            "clips": [
+                {"path": asset.local_path, "duration": duration, "fit": self._fits_band(asset, geometry)}
+                for asset, duration in zip(clip_assets, clip_durations)
+            ],
+            "crossfade": crossfade_duration,
+            "ken_burns": {
+                "zoom_ratio": self.KEN_BURNS_ZOOM_RATIO,
+                "quality": self.config.ken_burns_quality
+            } if self.ENABLE_KEN_BURNS else None,
+            "overlays": overlays,
+            "encoder": self._encoder_profile().ffmpeg_args(self.config.fps),
+            "audio": {
+                "tts": tts_path,
+                "bgm": self._get_bgm_settings(asset_bundle)
+            }
+        }
+
+    @staticmethod
+    def _fits_band(asset, geometry: LayoutGeometry) -> bool:
+        """
+        스톡 렌디션이 이미 표시 영역 크기와 같아 crop / scale이 필요 없는지 여부
+
+        Args:
+            asset: StockVideoAsset (width / height는 렌디션 선택 시 기록)
+            geometry: LayoutGeometry
+
+        Returns:
+            True면 FFmpeg 필터 체인에서 crop + scale 생략
+        """
+        if not asset.width or not asset.height:
+            return False
+        size = (asset.width, asset.height)
+        return size == tuple(geometry.band_size) and geometry.crop_rect(*size) == (0, 0) + size
 
     def _load_video_clips(self, asset_bundle: AssetBundle) -> List:
         """
         AssetBundle에서 비디오 클립 로드
 
+        메타데이터만 읽고 디코더는 열지 않습니다. 디코더는 해당 클립 구간을 렌더링할 때
+        VideoReaderPool에서 열리고, 동시에 EditConfig.max_open_readers개까지만 유지됩니다.
+        같은 파일이 여러 번 나오면 디코더 하나를 공유합니다.
+
         Args:
             asset_bundle: AssetBundle 객체
 
         Returns:
-            VideoFileClip 리스트
+            PooledVideoClip 리스트 (close() 시 디코더 반납)
         """
         clips = []
+        pool = VideoReaderPool(max_open=self.config.max_open_readers)
 
         for asset in asset_bundle.videos:
             if not asset.local_path or not os.path.exists(asset.local_path):
@@ -240,7 +779,7 @@ class VideoEditor:
                 continue
 
             try:
-                clip = self.VideoFileClip(asset.local_path)
+                clip = pool.clip(asset.local_path)
                 clips.append(clip)
                 print(f"[Editor] 클립 로드: {asset.id} ({clip.duration:.2f}초)")
             except Exception as e:
@@ -276,113 +815,141 @@ class VideoEditor:
 
     def _load_audio_with_bgm(self, asset_bundle: AssetBundle, target_duration: float):
         """
-        Phase 2: TTS 오디오와 BGM 믹싱 (고도화 버전)
+        Phase 2: TTS 오디오와 BGM 믹싱 (AudioTimeline, 샘플 단위 사전 믹싱)
+
+        TTS와 BGM을 한 번씩만 PCM으로 디코딩해 BGM(반복, 페이드, 볼륨)과 합산하고,
+        결과를 메모리 AudioArrayClip으로 반환합니다 (렌더링 중 청크별 재믹싱 없음).
+        BGM 길이는 TTS가 있으면 TTS 길이, 없으면 target_duration입니다.
 
         Args:
             asset_bundle: AssetBundle 객체
-            target_duration: 목표 길이 (초)
+            target_duration: 목표 길이 (초, TTS가 없을 때 사용)
 
         Returns:
-            믹싱된 AudioFileClip 또는 TTS만, 또는 None
+            믹싱된 AudioArrayClip 또는 TTS만, 또는 None
         """
-        # MoviePy audio effects import
-        from moviepy.audio import fx as afx
+        bgm_settings = self._get_bgm_settings(asset_bundle)
 
-        # 1. TTS 오디오 로드
-        tts_audio = self._load_audio(asset_bundle)
+        # 1. BGM이 없으면 TTS만 반환
+        if not bgm_settings:
+            return self._load_audio(asset_bundle)
 
-        # 2. BGM이 없으면 TTS만 반환
-        if not asset_bundle.bgm or (self.template and not self.template.bgm_enabled):
-            return tts_audio
+        timeline = AudioTimeline()
 
-        # 3. BGM 처리
+        # 2. TTS 배치 (0초 시작)
+        tts_path = asset_bundle.audio.local_path if asset_bundle.audio else None
+        if tts_path and os.path.exists(tts_path):
+            try:
+                timeline.place(tts_path, 0.0)
+                print(f"[Editor] 오디오 로드: {timeline.duration:.2f}초")
+            except Exception as e:
+                print(f"[ERROR] 오디오 로드 실패: {e}")
+                return None
+        elif asset_bundle.audio:
+            print("[WARNING] 오디오 파일을 찾을 수 없음")
+
+        # 3. BGM 베드 (반복 + 페이드 인/아웃 + 볼륨) 후 믹싱
         try:
-            bgm_asset = asset_bundle.bgm
-
-            # ✨ BGM 파일 존재 및 유효성 검증
-            if not bgm_asset.local_path or not os.path.exists(bgm_asset.local_path):
-                print(f"[ERROR] BGM 파일이 존재하지 않습니다: {bgm_asset.local_path}")
-                return tts_audio
-
-            bgm_file_size = os.path.getsize(bgm_asset.local_path)
-            if bgm_file_size < 1024:  # 1KB 미만이면 유효하지 않음
-                print(f"[ERROR] BGM 파일 크기가 너무 작습니다: {bgm_file_size} bytes")
-                return tts_audio
-
-            print(f"[Editor] BGM 파일 검증 완료: {bgm_asset.name} ({bgm_file_size / 1024:.1f}KB)")
-
-            # BGM 볼륨 설정 (템플릿 우선, 없으면 AssetBundle 기본값)
-            # ✨ 볼륨 범위 조정: 0.15 ~ 0.3 (기존 0.1~0.2는 너무 낮음)
-            # ✨ getattr로 안전하게 접근 (템플릿에 bgm_volume이 없을 수 있음)
-            bgm_volume = getattr(self.template, 'bgm_volume', bgm_asset.volume) if self.template else bgm_asset.volume
-            bgm_volume = max(0.15, min(0.3, bgm_volume))  # 안전한 범위로 클램프
-
-            # ✨ MoviePy로 직접 BGM 로드 및 처리 (ffmpeg 의존성 제거)
-            bgm_audio = self.AudioFileClip(bgm_asset.local_path)
-            print(f"[Editor] BGM 원본 로드: {bgm_audio.duration:.2f}초")
-
-            # ✨ audio_loop: 영상 길이에 맞게 BGM 반복
-            if bgm_audio.duration < target_duration:
-                loops_needed = int(target_duration / bgm_audio.duration) + 1
-                print(f"[Editor] BGM 반복 필요: {loops_needed}회")
-                bgm_audio = afx.AudioLoop(bgm_audio, nloops=loops_needed)
-
-            # ✨ 정확한 길이로 자르기
-            bgm_audio = bgm_audio.subclipped(0, target_duration)
-
-            # ✨ 페이드 인/아웃 적용
-            bgm_audio = afx.AudioFadeIn(bgm_audio, 1.0)  # 1초 페이드 인
-            bgm_audio = afx.AudioFadeOut(bgm_audio, 2.0)  # 2초 페이드 아웃
-
-            # ✨ volumex로 볼륨 조절 (핵심!)
-            bgm_audio = bgm_audio.with_effects([afx.MultiplyVolume(bgm_volume)])
-            print(f"[Editor] BGM 처리 완료: {bgm_audio.duration:.2f}초, 볼륨: {bgm_volume}")
-
-            # 4. TTS가 있으면 믹싱, 없으면 BGM만
-            if tts_audio:
-                # ✨ CompositeAudioClip: BGM을 먼저 배치하고 TTS를 위에 올림
-                # TTS가 BGM에 묻히지 않도록 TTS 볼륨 유지
-                mixed_audio = self.CompositeAudioClip([bgm_audio, tts_audio])
-                print(f"[Editor] TTS + BGM 믹싱 완료 (BGM 볼륨: {bgm_volume})")
-                return mixed_audio
-            else:
-                return bgm_audio
+            bgm_volume = bgm_settings["volume"]
+            timeline.add_bed(
+                bgm_settings["path"],
+                gain=bgm_volume,
+                fade_in=bgm_settings["fade_in"],
+                fade_out=bgm_settings["fade_out"]
+            )
+
+            duration = timeline.duration if timeline.num_samples else target_duration
+            mixed_audio = timeline.to_audio_clip(duration)
+            print(f"[Editor] TTS + BGM 믹싱 완료: {duration:.2f}초 (BGM 볼륨: {bgm_volume})")
+            return mixed_audio
 
         except Exception as e:
             print(f"[ERROR] BGM 처리 실패: {e}")
             import traceback
             traceback.print_exc()
             # 폴백: TTS만 반환
-            return tts_audio
+            return self._load_audio(asset_bundle)
 
-    def _compose_video_clips(
+    def _get_bgm_settings(self, asset_bundle: AssetBundle) -> Optional[Dict[str, Any]]:
+        """
+        BGM 파일 검증 및 믹싱 설정 계산 (MoviePy / FFmpeg 엔진 공용)
+
+        Args:
+            asset_bundle: AssetBundle 객체
+
+        Returns:
+            {"path", "volume", "fade_in", "fade_out"} 또는 None (BGM 미사용/무효)
+        """
+        if not asset_bundle.bgm or (self.template and not self.template.bgm_enabled):
+            return None
+
+        bgm_asset = asset_bundle.bgm
+
+        # ✨ BGM 파일 존재 및 유효성 검증
+        if not bgm_asset.local_path or not os.path.exists(bgm_asset.local_path):
+            print(f"[ERROR] BGM 파일이 존재하지 않습니다: {bgm_asset.local_path}")
+            return None
+
+        bgm_file_size = os.path.getsize(bgm_asset.local_path)
+        if bgm_file_size < 1024:  # 1KB 미만이면 유효하지 않음
+            print(f"[ERROR] BGM 파일 크기가 너무 작습니다: {bgm_file_size} bytes")
+            return None
+
+        print(f"[Editor] BGM 파일 검증 완료: {bgm_asset.name} ({bgm_file_size / 1024:.1f}KB)")
+
+        # BGM 볼륨 설정 (템플릿 우선, 없으면 AssetBundle 기본값)
+        # ✨ 볼륨 범위 조정: 0.15 ~ 0.3 (기존 0.1~0.2는 너무 낮음)
+        # ✨ getattr로 안전하게 접근 (템플릿에 bgm_volume이 없을 수 있음)
+        bgm_volume = getattr(self.template, 'bgm_volume', bgm_asset.volume) if self.template else bgm_asset.volume
+        bgm_volume = max(0.15, min(0.3, bgm_volume))  # 안전한 범위로 클램프
+
+        return {
+            "path": bgm_asset.local_path,
+            "volume": bgm_volume,
+            "fade_in": 1.0,   # 1초 페이드 인
+            "fade_out": 2.0   # 2초 페이드 아웃
+        }
+
+    def _plan_layout_geometry(self, video_format: VideoFormat) -> LayoutGeometry:
+        """
+        포맷별 최종 화면 배치 계획 (MoviePy / FFmpeg 엔진 공용)
+
+        - SHORTS: 1080x1920 캔버스의 중앙 1/2 밴드 (상/하단 1/4은 제목/검은 배경)
+        - LANDSCAPE / SQUARE: config.resolution 전체
+
+        쇼츠 크롭 비율은 기존 화면 구성(출력 해상도 → 중앙 밴드 순서의 중앙 크롭)을 그대로 유지하되,
+        하나의 크롭 영역으로 합쳐 소스 프레임마다 crop + scale을 한 번만 수행합니다.
+        에셋 수집 단계도 같은 계획으로 스톡 영상 렌디션을 고릅니다 (rendition.render_target).
+
+        Args:
+            video_format: 영상 포맷
+
+        Returns:
+            LayoutGeometry
+        """
+        return plan_layout_geometry(self.config.resolution, video_format)
+
+    def _plan_clip_durations(
         self,
-        clips: List,
+        num_clips: int,
         target_duration: float,
-        video_format: VideoFormat,
-        segment_timings: List = None  # Phase 2: SegmentTiming 리스트
-    ):
+        segment_timings: List = None
+    ) -> List[float]:
         """
-        여러 클립을 조정하고 연결 (Phase 2: TTS-영상 동기화)
+        클립별 타임라인 길이 계산 (Phase 2: TTS-영상 동기화, 크로스페이드 오버랩 포함)
+
+        MoviePy / FFmpeg 엔진이 같은 타임라인을 만들도록 공용으로 사용합니다.
 
         Args:
-            clips: VideoFileClip 리스트
+            num_clips: 클립 수
             target_duration: 목표 길이 (초)
-            video_format: 영상 포맷
             segment_timings: Phase 2 SegmentTiming 리스트 (TTS 길이 기반 동기화)
 
         Returns:
-            CompositeVideoClip 또는 None
+            클립별 길이 리스트 (초)
         """
-        if not clips:
-            return None
-
-        # 해상도 설정
-        width, height = self.config.resolution
-
         # ✨ Task 3-2: 크로스페이드를 위해 각 클립 길이 조정
         crossfade_duration = self.CROSSFADE_DURATION if self.ENABLE_CROSSFADE else 0
-        num_clips = len(clips)
 
         # 크로스페이드로 인한 오버랩 시간 계산
         total_overlap = crossfade_duration * (num_clips - 1) if num_clips > 1 else 0
@@ -394,25 +961,23 @@ class VideoEditor:
             print(f"[Editor] Phase 2: TTS 길이 기반 동기화 활성화 ({len(segment_timings)}개 세그먼트)")
 
             # 클립 수와 세그먼트 수가 다를 경우 비례 분배
-            if len(clips) != len(segment_timings):
-                print(f"[Editor] 클립 수({len(clips)})와 세그먼트 수({len(segment_timings)}) 불일치 - 비례 분배")
+            if num_clips != len(segment_timings):
+                print(f"[Editor] 클립 수({num_clips})와 세그먼트 수({len(segment_timings)}) 불일치 - 비례 분배")
 
         # 각 클립의 목표 길이 계산
         clip_durations = []
         if use_segment_timings:
             # Phase 2: TTS 길이 기반 분배
-            total_tts_duration = sum(t.tts_duration for t in segment_timings)
-
-            if len(clips) == len(segment_timings):
+            if num_clips == len(segment_timings):
                 # 1:1 매핑 (이상적인 경우)
                 for timing in segment_timings:
                     clip_durations.append(timing.tts_duration)
             else:
                 # 비례 분배
-                for i in range(len(clips)):
+                for i in range(num_clips):
                     # 각 클립에 할당할 세그먼트 범위 계산
-                    seg_start = int(i * len(segment_timings) / len(clips))
-                    seg_end = int((i + 1) * len(segment_timings) / len(clips))
+                    seg_start = int(i * len(segment_timings) / num_clips)
+                    seg_end = int((i + 1) * len(segment_timings) / num_clips)
                     seg_end = max(seg_end, seg_start + 1)  # 최소 1개
 
                     # 해당 범위의 TTS 길이 합
@@ -428,20 +993,53 @@ class VideoEditor:
             print(f"[Editor] Phase 2: 클립별 TTS 동기화 길이: {[f'{d:.2f}s' for d in clip_durations]}")
         else:
             # 기존 방식: 균등 분배
-            base_clip_duration = effective_duration / len(clips)
-            clip_durations = [base_clip_duration] * len(clips)
+            base_clip_duration = effective_duration / num_clips
+            clip_durations = [base_clip_duration] * num_clips
+
+        # 마지막 클립은 남은 시간에 맞춤
+        elapsed_time = sum(clip_durations[:-1])
+        clip_durations[-1] = max(0.5, effective_duration - elapsed_time)
+        print(f"[Editor] 마지막 클립 길이 조정: {clip_durations[-1]:.2f}초 (남은 시간)")
+
+        return clip_durations
+
+    def _compose_video_clips(
+        self,
+        clips: List,
+        target_duration: float,
+        video_format: VideoFormat,
+        segment_timings: List = None  # Phase 2: SegmentTiming 리스트
+    ):
+        """
+        여러 클립을 조정하고 연결 (Phase 2: TTS-영상 동기화)
+
+        Args:
+            clips: VideoFileClip 리스트
+            target_duration: 목표 길이 (초)
+            video_format: 영상 포맷
+            segment_timings: Phase 2 SegmentTiming 리스트 (TTS 길이 기반 동기화)
+
+        Returns:
+            CompositeVideoClip 또는 None
+        """
+        if not clips:
+            return None
+
+        # 화면 배치 계획: 클립이 최종적으로 놓일 영역 크기로 바로 crop + scale
+        geometry = self._plan_layout_geometry(video_format)
+        width, height = geometry.band_size
+
+        # ✨ Task 3-2: 크로스페이드를 위해 각 클립 길이 조정
+        crossfade_duration = self.CROSSFADE_DURATION if self.ENABLE_CROSSFADE else 0
+        num_clips = len(clips)
+
+        # 각 클립의 목표 길이 계산 (Phase 2: segment_timings 기반)
+        clip_durations = self._plan_clip_durations(num_clips, target_duration, segment_timings)
 
         processed_clips = []
 
         for i, clip in enumerate(clips):
-            # Phase 2: 미리 계산된 길이 사용 또는 마지막 클립 조정
-            if i == len(clips) - 1:
-                # 마지막 클립은 남은 시간에 맞춤
-                elapsed_time = sum(c.duration for c in processed_clips)
-                clip_duration = max(0.5, effective_duration - elapsed_time)
-                print(f"[Editor] 마지막 클립 길이 조정: {clip_duration:.2f}초 (남은 시간)")
-            else:
-                clip_duration = clip_durations[i] if i < len(clip_durations) else clip_durations[-1]
+            clip_duration = clip_durations[i]
 
             # 1. 길이 조정
             if clip.duration > clip_duration:
@@ -454,8 +1052,8 @@ class VideoEditor:
                 clip = self.concatenate_videoclips(repeated_clips, method="compose")
                 clip = clip.subclipped(0, clip_duration)
 
-            # 2. 해상도 조정 (crop & resize)
-            clip = self._resize_and_crop(clip, width, height)
+            # 2. 해상도 조정 (crop & resize 1회, 최종 표시 영역 크기)
+            clip = self._crop_and_scale(clip, geometry)
 
             # ✨ Task 3-1: Ken Burns Effect 적용
             if self.ENABLE_KEN_BURNS:
@@ -502,6 +1100,30 @@ class VideoEditor:
             traceback.print_exc()
             return None
 
+    def _crop_and_scale(self, clip, geometry: LayoutGeometry):
+        """
+        배치 계획에 따라 클립을 한 번에 crop + scale
+
+        크롭 영역이 원본 전체이면 crop을, 크기가 이미 맞으면 resize를 생략합니다.
+
+        Args:
+            clip: VideoFileClip
+            geometry: LayoutGeometry
+
+        Returns:
+            표시 영역 크기로 조정된 클립
+        """
+        source_width, source_height = clip.size
+        x, y, crop_width, crop_height = geometry.crop_rect(source_width, source_height)
+
+        if (crop_width, crop_height) != (source_width, source_height):
+            clip = clip.cropped(x1=x, y1=y, width=crop_width, height=crop_height)
+
+        if (crop_width, crop_height) != tuple(geometry.band_size):
+            clip = clip.resized(tuple(geometry.band_size))
+
+        return clip
+
     def _resize_and_crop(self, clip, target_width: int, target_height: int):
         """
         클립을 목표 해상도에 맞게 조정 (crop & resize)
@@ -515,6 +1137,9 @@ class VideoEditor:
             조정된 클립
         """
         clip_width, clip_height = clip.size
+        if (clip_width, clip_height) == (target_width, target_height):
+            return clip
+
         target_ratio = target_width / target_height
         clip_ratio = clip_width / clip_height
 
@@ -553,42 +1178,19 @@ class VideoEditor:
             return clip
 
         try:
-            duration = clip.duration
-            width, height = clip.size
-
-            def zoom_effect(get_frame, t):
-                """시간에 따라 점진적으로 줌인"""
-                # t=0일 때 zoom=1.0, t=duration일 때 zoom=zoom_ratio
-                progress = t / duration if duration > 0 else 0
-                current_zoom = 1.0 + (zoom_ratio - 1.0) * progress
-
-                # 현재 프레임 가져오기
-                frame = get_frame(t)
-
-                # 줌 적용 (중앙 기준으로 크롭)
-                import numpy as np
-                from PIL import Image
-
-                # numpy array를 PIL Image로 변환
-                img = Image.fromarray(frame)
-
-                # 새로운 크기 계산
-                new_width = int(width * current_zoom)
-                new_height = int(height * current_zoom)
-
-                # 리사이즈
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-                # 중앙 크롭
-                left = (new_width - width) // 2
-                top = (new_height - height) // 2
-                img_cropped = img_resized.crop((left, top, left + width, top + height))
-
-                return np.array(img_cropped)
+            # 프레임별 크롭 창을 미리 계산하고, 프레임마다 해당 창만 한 번 리샘플링
+            resampler = KenBurnsResampler(
+                clip.w,
+                clip.h,
+                duration=clip.duration,
+                fps=clip.fps or self.config.fps,
+                zoom_ratio=zoom_ratio,
+                quality=self.config.ken_burns_quality
+            )
 
             # transform 적용
-            zoomed_clip = clip.transform(zoom_effect)
-            print(f"[Editor] Ken Burns Effect 적용: 줌 배율 {zoom_ratio}")
+            zoomed_clip = clip.transform(lambda get_frame, t: resampler(get_frame(t), t))
+            print(f"[Editor] Ken Burns Effect 적용: 줌 배율 {zoom_ratio} (품질: {self.config.ken_burns_quality})")
 
             return zoomed_clip
 
@@ -606,15 +1208,13 @@ class VideoEditor:
         - Safe Zone 정밀 적용
 
         Args:
-            video_clip: 원본 비디오 클립 (1080x1920)
+            video_clip: 비디오 클립 (중앙 밴드 1080x960, 다른 크기면 크롭 후 리사이즈)
             title: 영상 제목
             duration: 영상 길이
 
         Returns:
-            레이아웃이 적용된 CompositeVideoClip
+            레이아웃이 적용된 VideoClip (정적 배경 + 중앙 영상)
         """
-        import numpy as np
-
         width = CANVAS_WIDTH   # 1080
         height = CANVAS_HEIGHT  # 1920
 
@@ -624,13 +1224,7 @@ class VideoEditor:
         bottom_height = height // 4   # 480px
 
         try:
-            # 1. 상단 검은 배경 (480px)
-            top_bg = self.ColorClip(
-                size=(width, top_height),
-                color=(0, 0, 0)
-            ).with_duration(duration).with_position((0, 0))
-
-            # 2. ✨ Phase 1: TitleService로 제목 이미지 생성 (Pillow 기반)
+            # 1. ✨ Phase 1: TitleService로 제목 이미지 생성 (Pillow 기반)
             title_service = get_title_service()
 
             # TitleService가 모든 처리 수행:
@@ -646,41 +1240,26 @@ class VideoEditor:
                 canvas_height=height
             )
 
-            # numpy array를 ImageClip으로 변환
-            title_image_clip = self.ImageClip(title_array).with_duration(duration)
-
-            # 제목 이미지는 전체 캔버스 크기이므로 (0, 0)에 배치
-            # 단, 상단 섹션(top_height)만 표시되도록 크롭
-            # TitleService는 이미 Safe Zone을 적용했으므로 그대로 사용
-            title_image_clip = title_image_clip.with_position((0, 0))
-
             print(f"[Title] Pillow 기반 렌더링 완료: Y={title_metadata['y_position']}px, "
                   f"배경 {title_metadata['bg_width']}x{title_metadata['bg_height']}px, "
                   f"{title_metadata['line_count']}줄")
 
-            # 3. 중앙 비디오 (960px) - 원본 비디오를 중앙 섹션에 맞게 조정
-            middle_video = self._resize_and_crop(video_clip, width, middle_height)
-            middle_video = middle_video.with_position((0, top_height))
-
-            # 4. 하단 검은 배경 (480px)
-            bottom_bg = self.ColorClip(
-                size=(width, bottom_height),
-                color=(0, 0, 0)
-            ).with_duration(duration).with_position((0, top_height + middle_height))
-
-            # 5. 모든 레이어 합성
-            # 제목 이미지는 전체 캔버스 크기지만, 상단 영역에만 내용이 있음
-            # (나머지는 투명 - RGBA)
-            composite = self.CompositeVideoClip(
-                [
-                    top_bg,           # 상단 검은 배경
-                    middle_video,     # 중앙 비디오
-                    bottom_bg,        # 하단 검은 배경
-                    title_image_clip  # 제목 (투명 배경, 상단에만 내용)
-                ],
-                size=(width, height)
+            # 2. 정적 레이어 평탄화: 상/하단 검은 배경 + 제목을 배경 한 장으로 미리 합성
+            # (제목이 중앙 영상과 겹치는 부분만 프레임마다 다시 블렌딩)
+            layout = FlattenedLayout(
+                canvas_size=(width, height),
+                band_rect=(0, top_height, width, middle_height),
+                overlays=[title_array]
             )
 
+            # 3. 중앙 비디오 (960px) - _compose_video_clips가 이미 밴드 크기로 만든 경우 그대로 사용
+            middle_video = video_clip
+            if tuple(video_clip.size) != (width, middle_height):
+                middle_video = self._resize_and_crop(video_clip, width, middle_height)
+
+            # 4. 배경 복사 + 중앙 영상 붙여넣기 (프레임당 1회)
+            composite = layout.apply(middle_video, duration, self.VideoClip)
+
             print(f"[Editor] 쇼츠 레이아웃 적용 완료 (상단: {top_height}px, 중앙: {middle_height}px, 하단: {bottom_height}px)")
             print(f"[Editor] ✨ Phase 1: Pillow 기반 제목 렌더링 (텍스트 잘림 방지)")
             return composite
@@ -730,34 +1309,26 @@ class VideoEditor:
 
         return '\n'.join(lines)
 
-    def _add_subtitles(
+    def _build_subtitle_segments(
         self,
-        video_clip,
         content_plan: ContentPlan,
-        total_duration: float
-    ):
+        segment_timings: List = None
+    ) -> List[Dict[str, Any]]:
         """
-        자막 추가 (SHORTS_SPEC.md: SubtitleService + Safe Zone 적용)
+        ContentPlan 세그먼트를 SubtitleService 입력(dict 리스트)으로 변환
 
         Args:
-            video_clip: 베이스 비디오 클립
             content_plan: ContentPlan 객체
-            total_duration: 총 영상 길이
+            segment_timings: SegmentTiming 리스트 (단어 타임스탬프가 있으면 자막 청크 타이밍에 사용)
 
         Returns:
-            자막이 추가된 CompositeVideoClip
+            [{"text", "start", "end", "duration", "words"?}, ...]
         """
-        if not content_plan.segments:
-            return video_clip
-
-        # SHORTS_SPEC.md: SubtitleService 사용 (Pillow 기반 + Safe Zone)
-        subtitle_service = get_subtitle_service()
-
-        # 세그먼트를 dict 리스트로 변환 (SubtitleService 인터페이스 맞춤)
+        timings_by_index = {t.segment_index: t for t in (segment_timings or [])}
         segments_data = []
         current_time = 0.0
 
-        for seg in content_plan.segments:
+        for index, seg in enumerate(content_plan.segments):
             # Phase 1: 실제 TTS 길이 사용 (AssetManager가 업데이트한 값)
             duration = seg.duration if seg.duration else 3.0
 
@@ -769,41 +1340,78 @@ class VideoEditor:
                 start_time = current_time
                 end_time = current_time + duration
 
-            segments_data.append({
+            segment_data = {
                 "text": seg.text,
                 "start": start_time,
                 "end": end_time,
                 "duration": duration
-            })
+            }
+
+            # 단어 타임스탬프는 마스터 오디오 기준 → 자막 세그먼트 시작 기준으로 이동
+            timing = timings_by_index.get(index)
+            if timing and timing.words:
+                shift = start_time - timing.start_time
+                segment_data["words"] = [
+                    {"word": w.word, "start": w.start + shift, "end": w.end + shift}
+                    for w in timing.words
+                ]
+
+            segments_data.append(segment_data)
 
             current_time = end_time
 
         print(f"[Phase 1] 자막 생성: {len(segments_data)}개 세그먼트, 총 {current_time:.2f}초")
+        return segments_data
+
+    def _add_subtitles(
+        self,
+        video_clip,
+        content_plan: ContentPlan,
+        total_duration: float,
+        segment_timings: List = None
+    ):
+        """
+        자막 추가 (SHORTS_SPEC.md: SubtitleService + Safe Zone 적용)
+
+        Args:
+            video_clip: 베이스 비디오 클립
+            content_plan: ContentPlan 객체
+            total_duration: 총 영상 길이
+            segment_timings: SegmentTiming 리스트 (단어 타임스탬프 기반 자막 청크 타이밍)
+
+        Returns:
+            자막 트랙이 합성된 클립
+        """
+        if not content_plan.segments:
+            return video_clip
+
+        # SHORTS_SPEC.md: SubtitleService 사용 (Pillow 기반 + Safe Zone)
+        subtitle_service = get_subtitle_service()
+
+        # 세그먼트를 dict 리스트로 변환 (SubtitleService 인터페이스 맞춤)
+        segments_data = self._build_subtitle_segments(content_plan, segment_timings)
 
         # SubtitleService로 자막 클립 정보 생성 (PIL Image + Safe Zone 적용됨)
         subtitle_clip_data = subtitle_service.create_subtitle_clips(segments_data, fps=self.config.fps)
 
-        # PIL Image를 MoviePy ImageClip으로 변환
-        subtitle_clips = []
+        # 자막 스프라이트를 구간 인덱스 트랙으로 구성 (프레임마다 활성 자막만 합성)
+        import numpy as np
+        sprites = []
 
         for i, data in enumerate(subtitle_clip_data):
             try:
-                pil_image = data["image"]       # PIL.Image
                 start_time = data["start"]      # float
                 duration = data["duration"]     # float
+                x_position = data["x_position"] # int
                 y_position = data["y_position"] # int (Safe Zone 적용됨)
 
-                # PIL Image를 numpy array로 변환하여 ImageClip 생성
-                import numpy as np
-                img_array = np.array(pil_image)
-
-                # MoviePy ImageClip 생성
-                img_clip = self.ImageClip(img_array).with_duration(duration).with_start(start_time)
-
-                # 위치는 이미 PIL 이미지에 포함되어 있으므로 (0, 0)으로 배치
-                img_clip = img_clip.with_position((0, 0))
-
-                subtitle_clips.append(img_clip)
+                sprites.append(TrackSprite(
+                    np.asarray(data["image"]),  # PIL.Image (자막 영역 스프라이트)
+                    x_position,
+                    y_position,
+                    start=start_time,
+                    end=start_time + duration
+                ))
 
                 print(f"[Subtitle {i+1}] '{data['text'][:30]}...' at {start_time:.1f}s-{start_time+duration:.1f}s (Safe Zone Y={y_position}px)")
 
@@ -812,10 +1420,10 @@ class VideoEditor:
                 import traceback
                 traceback.print_exc()
 
-        if subtitle_clips:
-            # 비디오 + 자막 합성
-            video_clip = self.CompositeVideoClip([video_clip] + subtitle_clips)
-            print(f"[Editor] 자막 {len(subtitle_clips)}개 추가 완료 (SHORTS_SPEC.md Safe Zone 적용)")
+        if sprites:
+            # 비디오 + 자막 트랙 합성
+            video_clip = SubtitleTrack(sprites).apply(video_clip)
+            print(f"[Editor] 자막 {len(sprites)}개 추가 완료 (SHORTS_SPEC.md Safe Zone 적용)")
 
         return video_clip
 
@@ -845,3 +1453,49 @@ class VideoEditor:
 
     def __repr__(self):
         return f"VideoEditor(resolution={self.config.resolution}, fps={self.config.fps})"
+
+
+def _render_chunk_worker(job: tuple) -> Optional[str]:
+    """
+    병렬 렌더링 워커: 비디오 전용 타임라인을 구성하고 [start, end) 구간만 인코딩
+
+    MoviePy 클립은 프로세스 간에 전달할 수 없으므로 Pydantic 모델(ContentPlan, AssetBundle)을 받아
+    부모와 같은 비디오 타임라인을 재구성합니다. 오디오는 부모가 한 번만 믹싱해 mux하므로
+    워커는 TTS / BGM을 디코딩하지 않고 부모가 정한 target_duration을 그대로 사용합니다.
+    클립 메타데이터 조회와 자막 이미지 생성은 워커마다 반복됩니다.
+
+    Args:
+        job: (config, template_name, content_plan, asset_bundle, target_duration, start, end, chunk_path, write_kwargs)
+
+    Returns:
+        청크 파일 경로 또는 None
+    """
+    config, template_name, content_plan, asset_bundle, target_duration, start, end, chunk_path, write_kwargs = job
+
+    editor = VideoEditor(config=config)
+    editor.template = editor._load_template(template_name) if template_name else None
+
+    timeline = editor._build_timeline(content_plan, asset_bundle, with_audio=False, target_duration=target_duration)
+    if not timeline:
+        return None
+
+    final_video, audio_clip, video_clips, _ = timeline
+    try:
+        chunk = final_video.subclipped(start, end)
+        chunk.write_videofile(
+            chunk_path,
+            fps=config.fps,
+            audio=False,
+            logger=None,
+            **write_kwargs
+        )
+        return chunk_path
+    except Exception as e:
+        print(f"[ERROR] 청크 렌더링 실패 ({os.path.basename(chunk_path)}): {e}")
+        return None
+    finally:
+        final_video.close()
+        if audio_clip:
+            audio_clip.close()
+        for clip in video_clips:
+            clip.close()
@@ -118,6 +118,13 @@ class ContentPlan(BaseModel):
 # Phase 2: Segment Timing Models (TTS-영상 동기화)
 # ============================================================
 
+class WordTiming(BaseModel):
+    """단어별 타임스탬프 (전체 오디오 기준 절대 시각)"""
+    word: str = Field(..., description="단어")
+    start: float = Field(..., description="시작 시간 (초)")
+    end: float = Field(..., description="종료 시간 (초)")
+
+
 class SegmentTiming(BaseModel):
     """
     세그먼트별 타이밍 정보 (Phase 2)
@@ -130,6 +137,7 @@ class SegmentTiming(BaseModel):
     start_time: float = Field(..., description="누적 시작 시간 (초)")
     end_time: float = Field(..., description="누적 종료 시간 (초)")
     tts_local_path: Optional[str] = Field(None, description="세그먼트별 TTS 로컬 경로 (Phase 3)")
+    words: List[WordTiming] = Field(default_factory=list, description="단어별 타임스탬프 (자막 청크 타이밍용)")
 
     model_config = {
         "json_schema_extra": {
@@ -156,6 +164,12 @@ class StockVideoAsset(BaseModel):
     keyword: str = Field(..., description="검색 키워드")
     duration: float = Field(..., description="영상 길이(초)")
     resolution: str = Field("1080x1920", description="해상도")
+    width: Optional[int] = Field(None, description="선택한 렌디션 너비 (px)")
+    height: Optional[int] = Field(None, description="선택한 렌디션 높이 (px)")
+    fps: Optional[float] = Field(None, description="선택한 렌디션 프레임 레이트 (제공자가 알려준 경우)")
+    file_size: Optional[int] = Field(None, description="선택한 렌디션 파일 크기 (bytes, 제공자가 알려준 경우)")
+    tags: List[str] = Field(default_factory=list, description="제공자 태그 (Pixabay tags, Pexels 페이지 URL의 설명)")
+    fingerprint: Optional[str] = Field(None, description="지각 해시 지문 (샘플 프레임 dHash 16진수, 다운로드 후 계산)")
     local_path: Optional[str] = Field(None, description="로컬 저장 경로")
     downloaded: bool = Field(False, description="다운로드 여부")
 
@@ -180,6 +194,30 @@ class BGMAsset(BaseModel):
     license: Optional[str] = Field(None, description="라이선스")
 
 
+class MediaInfo(BaseModel):
+    """미디어 파일 메타데이터 (core.services.media_probe 색인 항목)"""
+    path: str = Field(..., description="절대 경로")
+    size: int = Field(..., description="파일 크기 (바이트)")
+    mtime_ns: int = Field(..., description="수정 시각 (ns)")
+    format: Optional[str] = Field(None, description="컨테이너 형식 (wav, mp3, mp4 등)")
+    duration: float = Field(0.0, description="길이 (초)")
+    audio_codec: Optional[str] = Field(None, description="오디오 코덱")
+    sample_rate: Optional[int] = Field(None, description="샘플레이트 (Hz)")
+    channels: Optional[int] = Field(None, description="채널 수")
+    video_codec: Optional[str] = Field(None, description="비디오 코덱")
+    width: Optional[int] = Field(None, description="가로 해상도 (회전 반영)")
+    height: Optional[int] = Field(None, description="세로 해상도 (회전 반영)")
+    fps: Optional[float] = Field(None, description="프레임 레이트")
+
+    @property
+    def has_audio(self) -> bool:
+        return self.sample_rate is not None or self.audio_codec is not None
+
+    @property
+    def has_video(self) -> bool:
+        return self.width is not None
+
+
 class TemplateConfig(BaseModel):
     """쇼츠 템플릿 설정"""
     name: str = Field(..., description="템플릿 이름")
@@ -206,6 +244,9 @@ class TemplateConfig(BaseModel):
     bgm_mood: Optional[MoodType] = Field(default=MoodType.ENERGETIC, description="BGM 분위기")
     bgm_volume: float = Field(default=0.25, description="BGM 볼륨 (0.0 ~ 1.0)")
 
+    # 인코딩 설정
+    encoder_profile: Optional[str] = Field(None, description="인코더 프로필 (draft, preview, standard, archive)")
+
 
 class AssetBundle(BaseModel):
     """에셋 번들"""
@@ -217,6 +258,9 @@ class AssetBundle(BaseModel):
     # Phase 2: 세그먼트별 타이밍 정보 (TTS-영상 동기화용)
     segment_timings: List["SegmentTiming"] = Field(default_factory=list, description="세그먼트별 타이밍")
 
+    # 수집 단계별 소요 시간 (초, stock / tts / bgm / total)
+    phase_timings: Dict[str, float] = Field(default_factory=dict, description="수집 단계별 소요 시간")
+
 
 # ============================================================
 # Editor Models
@@ -246,6 +290,153 @@ class EditConfig(BaseModel):
     enable_subtitle_animation: bool = Field(True, description="자막 애니메이션 사용")
     background_music_volume: float = Field(0.3, description="배경 음악 볼륨 (0.0-1.0)")
     output_dir: str = Field("./output", description="출력 디렉토리")
+    render_backend: str = Field(
+        "moviepy",
+        description="렌더링 엔진 (moviepy: 프레임 단위 Python 합성, ffmpeg: 단일 filter_complex 호출, 실패 시 moviepy로 폴백)"
+    )
+    ken_burns_quality: str = Field(
+        "balanced",
+        description="Ken Burns 줌 리샘플링 품질 (fast: 최근접, balanced: bilinear, high: LANCZOS)"
+    )
+    render_workers: int = Field(
+        1,
+        description="MoviePy 병렬 렌더링 워커 수 (1: 단일 프로세스, 2 이상: 세그먼트 경계로 나눠 청크 병렬 인코딩 후 concat)"
+    )
+    encoder_profile: Optional[str] = Field(
+        None,
+        description="인코더 프로필 (draft, preview, standard, archive / None이면 템플릿 설정 또는 standard)"
+    )
+    max_open_readers: int = Field(
+        4,
+        description="동시에 열어둘 소스 영상 디코더 수 (필요할 때 열고, 초과 시 가장 오래 쓰지 않은 디코더를 닫음)"
+    )
+
+
+class EncoderProfile(BaseModel):
+    """
+    x264 인코더 프로필 (core.services.encoder_profiles.ENCODER_PROFILES)
+
+    MoviePy write_videofile과 ffmpeg 렌더링 엔진이 같은 프로필로 인코딩하도록
+    두 형식의 인코더 인자를 모두 만들어 줍니다.
+    """
+    name: str = Field(..., description="프로필 이름")
+    description: str = Field("", description="설명")
+    preset: str = Field("medium", description="x264 preset (ultrafast ~ veryslow)")
+    crf: int = Field(23, ge=0, le=51, description="x264 CRF (낮을수록 고화질)")
+    tune: Optional[str] = Field(None, description="x264 tune (film, animation, fastdecode 등)")
+    threads: Optional[int] = Field(None, description="인코더 스레드 수 (None이면 x264 자동)")
+    gop_seconds: float = Field(2.0, gt=0, description="키프레임 간격 (초)")
+    faststart: bool = Field(True, description="moov atom을 파일 앞으로 이동 (+faststart)")
+
+    def gop_frames(self, fps: float) -> int:
+        """키프레임 간격 (프레임)"""
+        return max(1, int(round(self.gop_seconds * fps)))
+
+    def x264_args(self, fps: float) -> List[str]:
+        """
+        preset / threads를 제외한 ffmpeg 출력 인자 (-crf, -tune, -g, -movflags)
+
+        Args:
+            fps: 출력 프레임 레이트 (GOP 계산용)
+
+        Returns:
+            ffmpeg 인자 리스트
+        """
+        args = ["-crf", str(self.crf)]
+        if self.tune:
+            args += ["-tune", self.tune]
+        args += ["-g", str(self.gop_frames(fps))]
+        if self.faststart:
+            args += ["-movflags", "+faststart"]
+        return args
+
+    def ffmpeg_args(self, fps: float) -> List[str]:
+        """
+        ffmpeg 명령어용 비디오 인코더 인자 전체
+
+        Args:
+            fps: 출력 프레임 레이트
+
+        Returns:
+            ["-c:v", "libx264", "-preset", ...] 형태의 인자 리스트
+        """
+        args = ["-c:v", "libx264", "-preset", self.preset]
+        if self.threads:
+            args += ["-threads", str(self.threads)]
+        return args + self.x264_args(fps)
+
+    def write_kwargs(self, fps: float) -> Dict[str, Any]:
+        """
+        MoviePy write_videofile 키워드 인자
+
+        Args:
+            fps: 출력 프레임 레이트
+
+        Returns:
+            codec / preset / threads / ffmpeg_params dict
+        """
+        return {
+            "codec": "libx264",
+            "preset": self.preset,
+            "threads": self.threads,
+            "ffmpeg_params": self.x264_args(fps),
+        }
+
+
+class LayoutGeometry(BaseModel):
+    """
+    영상 배치 계획 (VideoEditor._plan_layout_geometry)
+
+    클립이 최종 화면에 놓이는 영역(band)과 원본에서 잘라낼 중앙 크롭 비율을 미리 계산해
+    소스 프레임마다 crop + scale을 정확히 한 번만 수행하도록 합니다.
+    """
+    canvas_size: tuple[int, int] = Field(..., description="최종 캔버스 크기 (width, height)")
+    band_size: tuple[int, int] = Field(..., description="클립이 표시되는 영역 크기 (width, height)")
+    band_position: tuple[int, int] = Field((0, 0), description="캔버스 내 클립 영역 좌상단 (x, y)")
+    crop_ratios: List[float] = Field(..., description="순차 중앙 크롭 비율 (width/height)")
+
+    def crop_rect(self, source_width: int, source_height: int) -> tuple[int, int, int, int]:
+        """
+        원본 크기에 대해 순차 중앙 크롭을 하나로 합친 영역 계산
+
+        Args:
+            source_width: 원본 너비
+            source_height: 원본 높이
+
+        Returns:
+            (x, y, width, height) 원본 좌표 크롭 영역
+        """
+        x, y = 0, 0
+        width, height = source_width, source_height
+
+        for ratio in self.crop_ratios:
+            if width / height > ratio:
+                # 더 넓음 → 좌우 크롭
+                new_width = max(1, int(height * ratio))
+                x += int(width / 2 - new_width / 2)
+                width = new_width
+            else:
+                # 더 높음 → 상하 크롭
+                new_height = max(1, int(width / ratio))
+                y += int(height / 2 - new_height / 2)
+                height = new_height
+
+        return (x, y, width, height)
+
+    def required_source_size(self) -> tuple[int, int]:
+        """
+        업스케일 없이 band를 채우기 위한 최소 원본 크기 (crop_rect의 역방향 계산)
+
+        쇼츠는 출력 해상도 비율로 먼저 자른 뒤 밴드 비율로 자르므로,
+        1080x960 밴드를 채우려면 원본이 1080x1920 이상이어야 합니다.
+
+        Returns:
+            (width, height) 최소 원본 크기
+        """
+        width, height = self.band_size
+        for ratio in reversed(self.crop_ratios):
+            width, height = max(width, round(height * ratio)), max(height, round(width / ratio))
+        return (width, height)
 
 
 # ============================================================
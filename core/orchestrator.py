@@ -23,6 +23,8 @@ from core.planner import ContentPlanner
 from core.asset_manager import AssetManager
 from core.editor import VideoEditor
 from core.uploader import YouTubeUploader
+from core.services.storage_gc import get_storage_gc, bundle_paths
+from core.services.tts_cache import get_tts_cache
 
 
 class ContentOrchestrator:
@@ -127,7 +129,8 @@ class ContentOrchestrator:
                 stock_providers=['pexels', 'pixabay'],
                 tts_provider=self.config.tts_provider.value,
                 cache_enabled=True,
-                bgm_enabled=True  # Phase 5: BGM 자동 선택 활성화
+                bgm_enabled=True,  # Phase 5: BGM 자동 선택 활성화
+                tts_cache=get_tts_cache()  # 미리듣기와 같은 캐시
             )
         return self._asset_manager
 
@@ -154,7 +157,8 @@ class ContentOrchestrator:
         job_id: Optional[str] = None,
         account_id: Optional[int] = None,
         template: Optional[str] = None,
-        tts_settings: Optional[Dict[str, Any]] = None
+        tts_settings: Optional[Dict[str, Any]] = None,
+        encoder_profile: Optional[str] = None
     ) -> DBJobHistory:
         """
         전체 콘텐츠 생성 파이프라인 실행 (DB 기반)
@@ -168,6 +172,7 @@ class ContentOrchestrator:
             account_id: 계정 ID (DB 설정 조회용)
             template: 사용할 템플릿 이름
             tts_settings: TTS 설정 오버라이드
+            encoder_profile: 인코더 프로필 (draft, preview, standard, archive)
 
         Returns:
             JobHistory ORM 객체
@@ -227,10 +232,13 @@ class ContentOrchestrator:
                 download_videos=True,
                 generate_tts=True,
                 account_id=account_id,
-                tts_settings_override=tts_settings
+                tts_settings_override=tts_settings,
+                edit_config=self._get_editor().config
             )
             if not asset_bundle:
                 raise Exception("에셋 수집 실패")
+            # 편집 / 업로드가 끝날 때까지 저장 공간 GC가 에셋을 지우지 않도록 고정
+            get_storage_gc().pin(job_id, bundle_paths(asset_bundle))
             self.logger.info(f"에셋 수집 완료: 영상 {len(asset_bundle.videos)}개")
 
             # 3. Editor: 영상 편집
@@ -241,11 +249,13 @@ class ContentOrchestrator:
                 content_plan=content_plan,
                 asset_bundle=asset_bundle,
                 output_filename=output_filename,
-                template_name=template
+                template_name=template,
+                encoder_profile=encoder_profile
             )
             if not video_path:
                 raise Exception("영상 편집 실패")
             db_job.output_video_path = str(video_path)
+            get_storage_gc().pin(job_id, [str(video_path)])
             self.logger.info(f"영상 편집 완료: {video_path}")
 
             # 4. Uploader: YouTube 업로드 (옵션)
@@ -287,6 +297,9 @@ class ContentOrchestrator:
             self.db.commit()
             return db_job
 
+        finally:
+            get_storage_gc().unpin(job_id)
+
     def create_content_from_plan(
         self,
         content_plan: ContentPlan,
@@ -295,7 +308,8 @@ class ContentOrchestrator:
         account_id: Optional[int] = None,
         template: Optional[str] = None,
         tts_settings: Optional[Dict[str, Any]] = None,
-        bgm_settings: Optional[Dict[str, Any]] = None
+        bgm_settings: Optional[Dict[str, Any]] = None,
+        encoder_profile: Optional[str] = None
     ) -> DBJobHistory:
         """
         Phase 3: 이미 생성된 ContentPlan으로부터 영상 생성 (Draft finalize용)
@@ -308,6 +322,7 @@ class ContentOrchestrator:
             template: 템플릿 이름
             tts_settings: TTS 설정 오버라이드
             bgm_settings: BGM 설정
+            encoder_profile: 인코더 프로필 (draft, preview, standard, archive)
 
         Returns:
             JobHistory ORM 객체
@@ -342,7 +357,8 @@ class ContentOrchestrator:
 
             asset_manager = AssetManager(
                 tts_provider="gtts",
-                bgm_enabled=bgm_enabled
+                bgm_enabled=bgm_enabled,
+                tts_cache=get_tts_cache()
             )
 
             asset_bundle = asset_manager.collect_assets(
@@ -350,10 +366,13 @@ class ContentOrchestrator:
                 download_videos=True,
                 generate_tts=True,
                 account_id=account_id,
-                tts_settings_override=tts_settings
+                tts_settings_override=tts_settings,
+                edit_config=self._get_editor().config
             )
             if not asset_bundle:
                 raise Exception("에셋 수집 실패")
+            # 편집 / 업로드가 끝날 때까지 저장 공간 GC가 에셋을 지우지 않도록 고정
+            get_storage_gc().pin(job_id, bundle_paths(asset_bundle))
 
             # BGM 설정 적용 (mood, volume)
             if bgm_settings and asset_bundle.bgm:
@@ -370,11 +389,13 @@ class ContentOrchestrator:
                 content_plan=content_plan,
                 asset_bundle=asset_bundle,
                 output_filename=output_filename,
-                template_name=template
+                template_name=template,
+                encoder_profile=encoder_profile
             )
             if not video_path:
                 raise Exception("영상 편집 실패")
             db_job.output_video_path = str(video_path)
+            get_storage_gc().pin(job_id, [str(video_path)])
             self.logger.info(f"영상 편집 완료: {video_path}")
 
             # 3. Uploader: YouTube 업로드 (옵션)
@@ -416,6 +437,9 @@ class ContentOrchestrator:
             self.db.commit()
             return db_job
 
+        finally:
+            get_storage_gc().unpin(job_id)
+
     def _update_job_status(self, db_job: DBJobHistory, status: JobStatus, message: str, progress: Optional[int] = None):
         """
         DB 기반 작업 상태 업데이트
@@ -1,14 +1,151 @@
 """
 Alignment Service (SHORTS_SPEC.md 기준)
 Whisper를 사용하여 오디오에서 정확한 단어별 타임스탬프 추출
+
+- 모델은 상주 워커 프로세스(core.services.whisper_worker)에서 한 번만 로드
+- 결과는 (오디오 바이트 해시, 모델, 언어) 키로 캐시 → TTS가 그대로인 재렌더링은 전사 생략
+- 긴 오디오(가로형 5~15분)는 세그먼트 경계 / 무음에서 청크로 나눠 워커 풀에서 병렬 전사,
+  청크 시작 시각만큼 옮겨 이어 붙이고 완료된 청크부터 호출자에게 전달
 """
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
 import sys
+import tempfile
+import threading
+import time
+import wave
+
+import numpy as np
 
 # config 불러오기
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from core.config import WHISPER_MODEL, WHISPER_WORD_TIMESTAMPS, WHISPER_LANGUAGE
+from core.config import (
+    WHISPER_MODEL, WHISPER_WORD_TIMESTAMPS, WHISPER_LANGUAGE, WHISPER_USE_WORKER, WHISPER_WORKERS,
+    WHISPER_CHUNK_MIN_DURATION, WHISPER_CHUNK_SECONDS
+)
+from core.services.whisper_worker import get_whisper_worker, words_from_result
+from core.services.audio_timeline import decode_audio
+from core.services.media_probe import get_media_probe_service
+from core.services.word_timing import detect_silences
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "alignment_cache.db"
+
+# Whisper 입력 샘플레이트 (모델이 내부적으로 16kHz 모노로 변환하므로 청크도 그대로 기록)
+CHUNK_SAMPLE_RATE = 16000
+
+
+def plan_chunks(
+    duration: float,
+    cut_points: List[float],
+    target_seconds: float
+) -> List[Tuple[float, float]]:
+    """
+    자를 수 있는 지점 중에서 청크 구간 선택
+
+    청크가 target_seconds 이상이 되는 첫 지점에서 자르고,
+    마지막 청크가 목표의 1/4보다 짧으면 앞 청크에 합칩니다.
+
+    Args:
+        duration: 전체 길이 (초)
+        cut_points: 자를 수 있는 시각 (세그먼트 경계 또는 무음 중앙)
+        target_seconds: 청크 목표 길이 (초)
+
+    Returns:
+        [(시작, 끝), ...]
+    """
+    chunks = []
+    start = 0.0
+    for cut in sorted(cut_points):
+        if cut <= start or cut >= duration:
+            continue
+        if cut - start >= target_seconds:
+            chunks.append((start, cut))
+            start = cut
+
+    if chunks and duration - start < target_seconds * 0.25:
+        chunks[-1] = (chunks[-1][0], duration)
+    else:
+        chunks.append((start, duration))
+    return chunks
+
+
+def silence_cut_points(samples: np.ndarray, sample_rate: int, min_gap: float = 0.3) -> List[float]:
+    """발화 중간 무음 구간의 중앙 시각 리스트 (세그먼트 경계를 모를 때 청크 분할 지점)"""
+    _, _, gaps = detect_silences(samples, sample_rate, min_gap=min_gap)
+    return [(gap_start + gap_end) / 2 for gap_start, gap_end in gaps]
+
+
+def _write_pcm16(path: str, samples: np.ndarray, sample_rate: int) -> None:
+    """모노 float32 PCM → 16-bit WAV"""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.tobytes())
+
+
+class AlignmentCache:
+    """
+    Whisper 결과 캐시 (SQLite)
+
+    키: sha256(오디오 바이트) + 모델 + 언어 + word_timestamps
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (None이면 data/alignment_cache.db, ":memory:" 가능)
+        """
+        self.path = str(path or DEFAULT_CACHE_PATH)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS alignment_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                language TEXT,
+                words TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(audio_path: str, model: str, language: Optional[str], word_timestamps: bool) -> str:
+        """오디오 파일 내용 + 설정 → 캐시 키"""
+        digest = hashlib.sha256()
+        with open(audio_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        digest.update(f"|{model}|{language}|{int(bool(word_timestamps))}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict[str, any]]]:
+        """캐시된 단어별 타임스탬프 또는 None"""
+        with self._lock:
+            row = self._conn.execute("SELECT words FROM alignment_cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, model: str, language: Optional[str], words: List[Dict[str, any]]) -> None:
+        """결과 저장"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO alignment_cache (key, model, language, words, created_at) VALUES (?, ?, ?, ?, ?)",
+                (key, model, language, json.dumps(words, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
 
 
 class AlignmentService:
@@ -20,13 +157,55 @@ class AlignmentService:
     - 추출된 타임스탬프로 자막 싱크 정확도 향상
     """
 
-    def __init__(self, model_size: str = WHISPER_MODEL):
+    def __init__(
+        self,
+        model_size: str = WHISPER_MODEL,
+        use_worker: bool = WHISPER_USE_WORKER,
+        cache: Optional[AlignmentCache] = None,
+        worker=None,
+        chunk_min_duration: float = WHISPER_CHUNK_MIN_DURATION,
+        chunk_seconds: float = WHISPER_CHUNK_SECONDS,
+        parallel_chunks: int = WHISPER_WORKERS
+    ):
         """
         Args:
             model_size: Whisper 모델 크기 (tiny, base, small, medium, large)
+            use_worker: 모델 상주 워커 프로세스 사용 (False면 이 프로세스에서 직접 로드)
+            cache: 결과 캐시 (None이면 data/alignment_cache.db)
+            worker: 워커 (None이면 get_whisper_worker() 싱글톤)
+            chunk_min_duration: 이 길이(초) 이상인 오디오만 청크로 나눠 전사
+            chunk_seconds: 청크 목표 길이 (초)
+            parallel_chunks: 동시에 전사할 청크 수 (워커 풀 크기에 맞춤, 직접 로드 시 1)
         """
         self.model_size = model_size
         self.model = None
+        self.use_worker = use_worker
+        self.cache = cache or AlignmentCache()
+        self._worker = worker
+        self.chunk_min_duration = chunk_min_duration
+        self.chunk_seconds = chunk_seconds
+        self.parallel_chunks = max(1, parallel_chunks) if use_worker else 1
+
+    def _transcribe(self, audio_path: str, language: str) -> List[Dict[str, any]]:
+        """Whisper 전사 (워커 프로세스 또는 현재 프로세스)"""
+        if self.use_worker:
+            worker = self._worker or get_whisper_worker(self.model_size, WHISPER_WORKERS)
+            words, pid = worker.transcribe(
+                audio_path,
+                language=language,
+                word_timestamps=WHISPER_WORD_TIMESTAMPS
+            )
+            print(f"[Whisper] 워커 {pid}에서 전사 완료")
+            return words
+
+        self._load_model()
+        result = self.model.transcribe(
+            audio_path,
+            language=language,
+            word_timestamps=WHISPER_WORD_TIMESTAMPS,
+            verbose=False
+        )
+        return words_from_result(result)
 
     def _load_model(self):
         """Whisper 모델 로드 (lazy loading)"""
@@ -41,10 +220,83 @@ class AlignmentService:
                 print("[INFO] 설치: pip install openai-whisper")
                 raise ImportError("openai-whisper is required")
 
+    def _transcribe_cached(self, audio_path: str, language: str) -> List[Dict[str, any]]:
+        """캐시 확인 후 전사 (청크 단위 캐시 → 세그먼트 하나만 바뀐 재렌더링은 해당 청크만 전사)"""
+        cache_key = AlignmentCache.make_key(audio_path, self.model_size, language, WHISPER_WORD_TIMESTAMPS)
+        words = self.cache.get(cache_key)
+        if words is None:
+            words = self._transcribe(audio_path, language)
+            if words:
+                self.cache.put(cache_key, self.model_size, language, words)
+        return words
+
+    def iter_chunk_timestamps(
+        self,
+        audio_path: str,
+        language: str = WHISPER_LANGUAGE,
+        boundaries: Optional[List[float]] = None
+    ) -> Iterator[Tuple[int, int, List[Dict[str, any]]]]:
+        """
+        오디오를 청크로 나눠 병렬 전사하고, 완료되는 순서대로 결과 전달
+
+        Args:
+            audio_path: TTS 오디오 파일 경로
+            language: 언어 코드
+            boundaries: 자를 수 있는 시각 (초, SegmentTiming 경계). None이면 무음 검출로 결정
+
+        Yields:
+            (청크 인덱스, 전체 청크 수, 단어별 타임스탬프) - 타임스탬프는 전체 오디오 기준
+
+        Raises:
+            RuntimeError: 청크 전사 실패
+        """
+        duration = get_media_probe_service().duration(audio_path, 0.0)
+        if duration < self.chunk_min_duration:
+            yield 0, 1, self._transcribe_cached(audio_path, language)
+            return
+
+        try:
+            samples = decode_audio(audio_path, CHUNK_SAMPLE_RATE, 1)[:, 0]
+        except RuntimeError as e:
+            print(f"[Whisper] 청크 분할 불가, 전체 전사: {e}")
+            yield 0, 1, self._transcribe_cached(audio_path, language)
+            return
+
+        duration = len(samples) / CHUNK_SAMPLE_RATE
+        cut_points = boundaries if boundaries else silence_cut_points(samples, CHUNK_SAMPLE_RATE)
+        chunks = plan_chunks(duration, cut_points, self.chunk_seconds)
+        print(f"[Whisper] {duration:.1f}초 오디오 → {len(chunks)}개 청크 (동시 {self.parallel_chunks}개)")
+
+        temp_dir = tempfile.mkdtemp(prefix="whisper_chunks_")
+        executor = ThreadPoolExecutor(max_workers=self.parallel_chunks)
+        try:
+            futures = {}
+            for index, (start, end) in enumerate(chunks):
+                chunk_path = os.path.join(temp_dir, f"chunk_{index:03d}.wav")
+                _write_pcm16(
+                    chunk_path,
+                    samples[int(round(start * CHUNK_SAMPLE_RATE)):int(round(end * CHUNK_SAMPLE_RATE))],
+                    CHUNK_SAMPLE_RATE
+                )
+                futures[executor.submit(self._transcribe_cached, chunk_path, language)] = (index, start)
+
+            for future in as_completed(futures):
+                index, start = futures[future]
+                words = [
+                    {**w, "start": round(w["start"] + start, 3), "end": round(w["end"] + start, 3)}
+                    for w in future.result()
+                ]
+                yield index, len(chunks), words
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
     def extract_word_timestamps(
         self,
         audio_path: str,
-        language: str = WHISPER_LANGUAGE
+        language: str = WHISPER_LANGUAGE,
+        boundaries: Optional[List[float]] = None,
+        on_chunk: Optional[Callable[[int, int, List[Dict[str, any]]], None]] = None
     ) -> List[Dict[str, any]]:
         """
         오디오 파일에서 단어별 타임스탬프 추출
@@ -52,6 +304,8 @@ class AlignmentService:
         Args:
             audio_path: TTS 오디오 파일 경로
             language: 언어 코드 (ko, en, etc.)
+            boundaries: 청크 분할 지점 후보 (초, SegmentTiming 경계)
+            on_chunk: 청크 완료 시 호출 (청크 인덱스, 전체 청크 수, 해당 청크 단어들)
 
         Returns:
             단어별 타임스탬프 리스트
@@ -61,41 +315,32 @@ class AlignmentService:
                 ...
             ]
         """
-        self._load_model()
-
         try:
+            # 같은 오디오 + 모델 + 언어면 전사 생략
+            cache_key = AlignmentCache.make_key(audio_path, self.model_size, language, WHISPER_WORD_TIMESTAMPS)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print(f"[Whisper] 캐시에서 로드: {len(cached)}개 단어")
+                return cached
+
             print(f"[Whisper] 타임스탬프 추출 중: {audio_path}")
 
-            # Whisper 실행 (word_timestamps=True)
-            result = self.model.transcribe(
-                audio_path,
-                language=language,
-                word_timestamps=WHISPER_WORD_TIMESTAMPS,
-                verbose=False
-            )
+            # Whisper 실행 (word_timestamps=True, 긴 오디오는 청크 병렬 전사)
+            chunk_words = {}
+            for index, total, words in self.iter_chunk_timestamps(audio_path, language, boundaries):
+                chunk_words[index] = words
+                if total > 1:
+                    print(f"[Whisper] 청크 {len(chunk_words)}/{total} 완료 (#{index}, {len(words)}개 단어)")
+                if on_chunk:
+                    on_chunk(index, total, words)
 
-            # 단어별 타임스탬프 추출
-            word_timestamps = []
-
-            for segment in result.get('segments', []):
-                # segment에 words가 있으면 word-level 타임스탬프 사용
-                if 'words' in segment:
-                    for word_info in segment['words']:
-                        word_timestamps.append({
-                            "word": word_info['word'].strip(),
-                            "start": word_info['start'],
-                            "end": word_info['end']
-                        })
-                else:
-                    # words가 없으면 segment-level 사용 (fallback)
-                    word_timestamps.append({
-                        "word": segment['text'].strip(),
-                        "start": segment['start'],
-                        "end": segment['end']
-                    })
+            word_timestamps = [w for index in sorted(chunk_words) for w in chunk_words[index]]
 
             print(f"[Whisper] 추출 완료: {len(word_timestamps)}개 단어")
 
+            if word_timestamps:
+                self.cache.put(cache_key, self.model_size, language, word_timestamps)
+
             return word_timestamps
 
         except Exception as e:
@@ -107,7 +352,8 @@ class AlignmentService:
     def align_segments_to_audio(
         self,
         segments: List[Dict[str, str]],
-        audio_path: str
+        audio_path: str,
+        boundaries: Optional[List[float]] = None
     ) -> List[Dict[str, any]]:
         """
         스크립트 세그먼트와 오디오를 정렬 (SHORTS_SPEC.md 요구사항)
@@ -116,6 +362,7 @@ class AlignmentService:
             segments: ContentPlan의 세그먼트 리스트
                 [{"text": "안녕하세요", ...}, {"text": "반갑습니다", ...}]
             audio_path: TTS 오디오 파일 경로
+            boundaries: 세그먼트 경계 시각 (초, 긴 오디오 청크 분할 지점)
 
         Returns:
             정렬된 세그먼트 (duration이 실제 TTS 길이로 업데이트됨)
@@ -126,7 +373,7 @@ class AlignmentService:
             ]
         """
         # Whisper로 단어별 타임스탬프 추출
-        word_timestamps = self.extract_word_timestamps(audio_path)
+        word_timestamps = self.extract_word_timestamps(audio_path, boundaries=boundaries)
 
         if not word_timestamps:
             print("[WARNING] Whisper 타임스탬프 추출 실패. 예측값 사용")
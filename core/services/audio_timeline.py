@@ -0,0 +1,326 @@
+"""
+Audio Timeline
+float32 PCM 기반 샘플 단위 오디오 타임라인 (TTS 세그먼트 + 무음 + BGM 베드)
+
+기존 오디오 조립은 MoviePy 재인코딩의 연속이었습니다.
+  세그먼트+무음 MP3 저장 → 전체 연결 MP3 저장 → 편집 시 다시 디코딩해 CompositeAudioClip 믹싱
+AudioTimeline은 각 소스를 한 번만 float32 PCM으로 디코딩(경로별 캐시)하고,
+미리 할당한 배열의 정확한 샘플 위치에 세그먼트 / 무음 / 반복 BGM(페이드, 게인)을 더한 뒤
+마스터 한 개(WAV 또는 AAC)만 기록합니다.
+
+사용 예:
+    timeline = AudioTimeline()
+    timeline.append("seg_01.mp3")
+    timeline.append_silence(1.5)
+    timeline.add_bed("bgm.mp3", gain=0.25, fade_in=1.0, fade_out=2.0)
+    timeline.write("master.wav")
+"""
+import math
+import subprocess
+import wave
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from core.services.ffmpeg_render_service import find_ffmpeg
+
+
+AudioSource = Union[str, np.ndarray]
+
+
+def decode_audio(
+    path: str,
+    sample_rate: int = 44100,
+    channels: int = 2,
+    ffmpeg_cmd: Optional[str] = None
+) -> np.ndarray:
+    """
+    오디오 파일을 float32 PCM으로 디코딩 (ffmpeg 1회 호출)
+
+    Args:
+        path: 오디오 파일 경로
+        sample_rate: 출력 샘플레이트
+        channels: 출력 채널 수
+        ffmpeg_cmd: ffmpeg 실행 파일 (None이면 자동 탐색)
+
+    Returns:
+        (samples, channels) float32 배열 (-1.0 ~ 1.0)
+
+    Raises:
+        RuntimeError: ffmpeg가 없거나 디코딩 실패
+    """
+    ffmpeg_cmd = ffmpeg_cmd or find_ffmpeg()
+    if not ffmpeg_cmd:
+        raise RuntimeError("ffmpeg를 찾을 수 없습니다")
+
+    result = subprocess.run(
+        [ffmpeg_cmd, "-hide_banner", "-loglevel", "error", "-i", str(path),
+         "-vn", "-f", "f32le", "-acodec", "pcm_f32le",
+         "-ac", str(channels), "-ar", str(sample_rate), "-"],
+        capture_output=True
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")[-500:]
+        raise RuntimeError(f"오디오 디코딩 실패 ({path}): {stderr}")
+
+    return np.frombuffer(result.stdout, dtype=np.float32).reshape(-1, channels)
+
+
+class AudioTimeline:
+    """
+    샘플 단위 오디오 타임라인
+
+    - place / append: 소스를 정확한 샘플 위치에 배치 (겹치면 합산)
+    - append_silence: 커서만 이동 (무음 배열을 만들지 않음)
+    - add_bed: 전체 길이에 깔리는 BGM (반복, 페이드 인/아웃, 게인)
+    """
+
+    def __init__(self, sample_rate: int = 44100, channels: int = 2, ffmpeg_cmd: Optional[str] = None):
+        """
+        Args:
+            sample_rate: 샘플레이트
+            channels: 채널 수
+            ffmpeg_cmd: ffmpeg 실행 파일 (None이면 자동 탐색)
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.ffmpeg_cmd = ffmpeg_cmd
+
+        self.cursor = 0  # append 위치 (샘플)
+        self._clips: List[Tuple[int, np.ndarray, float]] = []  # (시작 샘플, PCM, 게인)
+        self._beds: List[Dict] = []
+        self._decoded: Dict[str, np.ndarray] = {}
+
+    def to_samples(self, seconds: float) -> int:
+        """초 → 샘플 수 (반올림)"""
+        return int(round(seconds * self.sample_rate))
+
+    @property
+    def num_samples(self) -> int:
+        """배치된 클립과 커서 중 가장 늦은 끝 (샘플)"""
+        clip_end = max((start + len(pcm) for start, pcm, _ in self._clips), default=0)
+        return max(self.cursor, clip_end)
+
+    @property
+    def duration(self) -> float:
+        """타임라인 길이 (초, BGM 베드 제외)"""
+        return self.num_samples / self.sample_rate
+
+    def load(self, source: AudioSource) -> np.ndarray:
+        """
+        소스를 float32 PCM으로 변환 (파일은 경로별로 한 번만 디코딩)
+
+        Args:
+            source: 파일 경로 또는 (samples, channels) 배열
+
+        Returns:
+            (samples, channels) float32 배열
+        """
+        if isinstance(source, np.ndarray):
+            pcm = source.astype(np.float32, copy=False)
+            if pcm.ndim == 1:
+                pcm = pcm[:, None]
+            if pcm.shape[1] != self.channels:
+                pcm = np.repeat(pcm[:, :1], self.channels, axis=1)
+            return pcm
+
+        path = str(source)
+        if path not in self._decoded:
+            self._decoded[path] = decode_audio(path, self.sample_rate, self.channels, self.ffmpeg_cmd)
+        return self._decoded[path]
+
+    def place(self, source: AudioSource, start: float, gain: float = 1.0) -> Tuple[int, int]:
+        """
+        소스를 start초 위치에 배치
+
+        Args:
+            source: 파일 경로 또는 PCM 배열
+            start: 시작 시각 (초)
+            gain: 선형 게인
+
+        Returns:
+            (시작 샘플, 끝 샘플)
+        """
+        return self.place_at(source, self.to_samples(start), gain)
+
+    def place_at(self, source: AudioSource, start_sample: int, gain: float = 1.0) -> Tuple[int, int]:
+        """
+        소스를 정확한 샘플 위치에 배치
+
+        Args:
+            source: 파일 경로 또는 PCM 배열
+            start_sample: 시작 샘플
+            gain: 선형 게인
+
+        Returns:
+            (시작 샘플, 끝 샘플)
+        """
+        pcm = self.load(source)
+        self._clips.append((start_sample, pcm, gain))
+        return start_sample, start_sample + len(pcm)
+
+    def append(self, source: AudioSource, gain: float = 1.0) -> Tuple[int, int]:
+        """
+        커서 위치에 소스를 이어 붙이고 커서 이동
+
+        Args:
+            source: 파일 경로 또는 PCM 배열
+            gain: 선형 게인
+
+        Returns:
+            (시작 샘플, 끝 샘플)
+        """
+        start, end = self.place_at(source, self.cursor, gain)
+        self.cursor = end
+        return start, end
+
+    def append_silence(self, seconds: float) -> Tuple[int, int]:
+        """
+        커서 위치에 무음 추가 (커서만 이동)
+
+        Args:
+            seconds: 무음 길이 (초)
+
+        Returns:
+            (시작 샘플, 끝 샘플)
+        """
+        start = self.cursor
+        self.cursor += max(0, self.to_samples(seconds))
+        return start, self.cursor
+
+    def add_bed(
+        self,
+        source: AudioSource,
+        gain: float = 1.0,
+        fade_in: float = 0.0,
+        fade_out: float = 0.0,
+        loop: bool = True
+    ) -> None:
+        """
+        타임라인 전체 길이에 깔리는 배경 트랙 추가 (렌더링 시 길이에 맞춰 반복/자르기)
+
+        Args:
+            source: 파일 경로 또는 PCM 배열
+            gain: 선형 게인
+            fade_in: 시작 페이드 인 (초, 선형)
+            fade_out: 끝 페이드 아웃 (초, 선형)
+            loop: 소스가 짧으면 반복
+        """
+        self._beds.append({
+            "pcm": self.load(source),
+            "gain": gain,
+            "fade_in": fade_in,
+            "fade_out": fade_out,
+            "loop": loop,
+        })
+
+    def _render_bed(self, out: np.ndarray, bed: Dict) -> None:
+        """배경 트랙을 출력 배열에 합산 (반복 → 페이드 → 게인)"""
+        total = len(out)
+        pcm = bed["pcm"]
+        if total == 0 or len(pcm) == 0:
+            return
+
+        if bed["loop"] and len(pcm) < total:
+            reps = math.ceil(total / len(pcm))
+            pcm = np.tile(pcm, (reps, 1))
+        pcm = pcm[:total]
+        length = len(pcm)
+
+        envelope = np.full(length, bed["gain"], dtype=np.float32)
+
+        fade_in = min(self.to_samples(bed["fade_in"]), length)
+        if fade_in > 0:
+            envelope[:fade_in] *= np.arange(fade_in, dtype=np.float32) / fade_in
+
+        # 페이드 아웃은 타임라인 끝 기준 (MoviePy AudioFadeOut과 동일)
+        fade_out = self.to_samples(bed["fade_out"])
+        if fade_out > 0:
+            fade_start = max(0, total - fade_out)
+            if fade_start < length:
+                remaining = total - np.arange(fade_start, length, dtype=np.float32)
+                envelope[fade_start:length] *= np.minimum(remaining / fade_out, 1.0)
+
+        out[:length] += pcm * envelope[:, None]
+
+    def render(self, duration: Optional[float] = None) -> np.ndarray:
+        """
+        타임라인을 하나의 PCM 배열로 믹싱
+
+        Args:
+            duration: 출력 길이 (초, None이면 타임라인 길이)
+
+        Returns:
+            (samples, channels) float32 배열 (-1.0 ~ 1.0로 클리핑)
+        """
+        total = self.to_samples(duration) if duration is not None else self.num_samples
+        out = np.zeros((total, self.channels), dtype=np.float32)
+
+        for bed in self._beds:
+            self._render_bed(out, bed)
+
+        for start, pcm, gain in self._clips:
+            if start >= total:
+                continue
+            end = min(start + len(pcm), total)
+            segment = pcm[:end - start]
+            if gain == 1.0:
+                out[start:end] += segment
+            else:
+                out[start:end] += segment * gain
+
+        np.clip(out, -1.0, 1.0, out=out)
+        return out
+
+    def write(self, path: str, duration: Optional[float] = None, bitrate: str = "192k") -> str:
+        """
+        마스터 파일 기록 (.wav는 16bit PCM 직접 기록, 그 외 확장자는 ffmpeg로 1회 인코딩)
+
+        Args:
+            path: 출력 경로 (.wav / .m4a / .aac / .mp3)
+            duration: 출력 길이 (초, None이면 타임라인 길이)
+            bitrate: 손실 압축 비트레이트
+
+        Returns:
+            출력 경로
+        """
+        pcm = self.render(duration)
+        path = str(path)
+
+        if path.lower().endswith(".wav"):
+            samples = (pcm * 32767.0).round().astype("<i2")
+            with wave.open(path, "wb") as f:
+                f.setnchannels(self.channels)
+                f.setsampwidth(2)
+                f.setframerate(self.sample_rate)
+                f.writeframes(samples.tobytes())
+            return path
+
+        ffmpeg_cmd = self.ffmpeg_cmd or find_ffmpeg()
+        if not ffmpeg_cmd:
+            raise RuntimeError("ffmpeg를 찾을 수 없습니다")
+
+        codec = "libmp3lame" if path.lower().endswith(".mp3") else "aac"
+        subprocess.run(
+            [ffmpeg_cmd, "-y", "-hide_banner", "-loglevel", "error",
+             "-f", "f32le", "-ar", str(self.sample_rate), "-ac", str(self.channels), "-i", "-",
+             "-c:a", codec, "-b:a", bitrate, path],
+            input=pcm.tobytes(),
+            check=True,
+            capture_output=True
+        )
+        return path
+
+    def to_audio_clip(self, duration: Optional[float] = None):
+        """
+        믹싱 결과를 MoviePy AudioArrayClip으로 변환 (렌더링 시 추가 디코딩/믹싱 없음)
+
+        Args:
+            duration: 출력 길이 (초, None이면 타임라인 길이)
+
+        Returns:
+            AudioArrayClip
+        """
+        from moviepy import AudioArrayClip
+
+        return AudioArrayClip(self.render(duration), fps=self.sample_rate)
@@ -0,0 +1,617 @@
+"""
+Clip Library
+다운로드한 스톡 영상의 로컬 라이브러리 (SQLite 역색인 + BM25 순위)
+
+채널들이 비슷한 주제를 반복해서 기획하므로 "happy dog park" 같은 검색어가 자주 다시 나오고,
+그때마다 검색 API를 호출해 거의 같은 영상을 다시 내려받았습니다.
+ClipLibrary는 downloads/stock_videos에 받은 영상마다 제공자 태그 / 검색어 / 길이 / 해상도 /
+사용 횟수를 <라이브러리 디렉토리>/library.db에 기록하고 토큰 역색인(clip_terms)을 유지합니다.
+
+검색:
+  1. 검색어 토큰의 posting만 조회 (clip_terms는 (token, clip_id) 클러스터 색인이라 전체 스캔 없음)
+  2. 일치 점수 = 검색어 토큰 중 클립에 있는 비율 (idf 가중, 0~1) → LOCAL_CLIP_MIN_SCORE 이상만 후보
+  3. 후보 순위는 BM25 (같으면 덜 사용한 클립 우선)
+10만 개 클립에서도 검색어 토큰의 posting 수만큼만 읽으므로 수 ms 안에 응답합니다.
+
+지각 해시 지문(core.services.video_fingerprint)이 있는 항목은 밴드 색인(clip_fingerprints)에도 기록해
+find_duplicate로 다른 ID / 다른 검색어로 받은 같은 영상을 찾습니다.
+
+사용 예:
+    library = get_clip_library("downloads/stock_videos")
+    matches = library.search("happy dog park", target_size=(1080, 1920))
+    if matches:
+        asset, score = matches[0]
+        library.record_use(asset)
+"""
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.config import LOCAL_CLIP_MIN_SCORE
+from core.models import StockVideoAsset
+from core.services.rendition import covers, rendition_filename
+from core.services.video_fingerprint import fingerprint_bands, fingerprint_distance
+
+
+# BM25 파라미터 (Robertson / Lucene 기본값)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 검색어에 흔히 붙지만 영상 내용을 구분하지 못하는 단어
+STOPWORDS = frozenset({
+    "a", "an", "and", "at", "by", "for", "from", "in", "into", "is", "of", "on", "or",
+    "the", "to", "with", "video", "videos", "footage", "clip", "stock", "shot",
+})
+
+# SQLite 변수 개수 제한(기본 999) 안에서 나눠 조회
+_BATCH = 500
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    색인 / 검색용 토큰 분리 (NFC + 소문자 + 불용어 제거 + 간단한 복수형 정리)
+
+    Args:
+        text: 검색어 또는 태그
+
+    Returns:
+        토큰 리스트 (중복 유지, tf 계산용)
+    """
+    if not text:
+        return []
+    tokens = []
+    for token in re.findall(r"[^\W_]+", unicodedata.normalize("NFC", text).lower()):
+        if token in STOPWORDS or token.isdigit():
+            continue
+        # dogs → dog, beaches → beach (ss / us / is로 끝나는 단어는 그대로)
+        if len(token) > 4 and token.endswith(("ches", "shes", "sses", "xes")):
+            token = token[:-2]
+        elif len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def clip_id_of(asset: StockVideoAsset) -> str:
+    """라이브러리 항목 ID (렌디션별 파일명 기준, 같은 영상의 다른 크기는 별도 항목)"""
+    return Path(rendition_filename(asset)).stem
+
+
+class ClipLibrary:
+    """
+    로컬 스톡 영상 라이브러리
+
+    - add / add_many: 다운로드한 영상 색인 (이미 있으면 검색어를 누적)
+    - search: 검색어와 비슷한 로컬 영상 (점수 순)
+    - record_use: 사용 횟수 기록
+    - find_duplicate / set_fingerprint: 지각 해시 지문으로 같은 영상 찾기 / 지문 갱신
+    - import_asset_cache: 기존 검색어별 JSON 캐시(downloads/cache)에서 색인 채우기
+    - prune_missing / remove / stats / clear
+    """
+
+    def __init__(self, library_dir: str, index_path: Optional[str] = None):
+        """
+        Args:
+            library_dir: 영상 파일 디렉토리 (상대 경로로 저장된 항목의 기준)
+            index_path: SQLite 파일 경로 (None이면 <library_dir>/library.db, ":memory:" 가능)
+        """
+        self.library_dir = Path(library_dir)
+        self.library_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = str(index_path or self.library_dir / "library.db")
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.index_path, timeout=30, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS clips (
+                clip_id TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                path TEXT NOT NULL,
+                queries TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                duration REAL NOT NULL,
+                width INTEGER,
+                height INTEGER,
+                asset TEXT NOT NULL,
+                doc_len INTEGER NOT NULL,
+                usage_count INTEGER NOT NULL DEFAULT 0,
+                added_at REAL NOT NULL,
+                last_used_at REAL,
+                fingerprint TEXT
+            );
+            CREATE TABLE IF NOT EXISTS clip_terms (
+                token TEXT NOT NULL,
+                clip_id TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (token, clip_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_clip_terms_clip ON clip_terms (clip_id);
+            CREATE TABLE IF NOT EXISTS clip_fingerprints (
+                band TEXT NOT NULL,
+                clip_id TEXT NOT NULL,
+                PRIMARY KEY (band, clip_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_clip_fingerprints_clip ON clip_fingerprints (clip_id);
+            -- BM25용 문서 수 / 전체 길이 (색인 변경과 같은 트랜잭션에서 갱신, 검색 시 전체 집계 없음)
+            CREATE TABLE IF NOT EXISTS library_meta (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                clip_count INTEGER NOT NULL,
+                total_len INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO library_meta (id, clip_count, total_len)
+                SELECT 1, COUNT(*), COALESCE(SUM(doc_len), 0) FROM clips;
+            """
+        )
+        # 지문 컬럼이 없던 이전 색인
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(clips)")}
+        if "fingerprint" not in columns:
+            self._conn.execute("ALTER TABLE clips ADD COLUMN fingerprint TEXT")
+        self._conn.commit()
+
+    # ---------- 색인 ----------
+
+    def add(self, asset: StockVideoAsset, query: Optional[str] = None) -> str:
+        """
+        다운로드한 영상 색인
+
+        Args:
+            asset: local_path가 있는 StockVideoAsset
+            query: 이 영상을 찾은 검색어 (이미 있는 영상이면 검색어 목록에 추가)
+
+        Returns:
+            라이브러리 항목 ID
+
+        Raises:
+            ValueError: local_path가 없음
+        """
+        return self.add_many([(asset, query)])[0]
+
+    def add_many(self, items: Iterable[Tuple[StockVideoAsset, Optional[str]]]) -> List[str]:
+        """
+        여러 영상을 트랜잭션 하나로 색인
+
+        Args:
+            items: (StockVideoAsset, 검색어) 목록
+
+        Returns:
+            라이브러리 항목 ID 리스트
+
+        Raises:
+            ValueError: local_path가 없는 에셋
+        """
+        items = list(items)
+        for asset, _ in items:
+            if not asset.local_path:
+                raise ValueError(f"local_path가 없는 에셋은 색인할 수 없음: {asset.id}")
+
+        clip_ids = [clip_id_of(asset) for asset, _ in items]
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                # 이미 있는 항목은 검색어 / 사용 기록을 이어받음
+                existing: Dict[str, Tuple[Any, ...]] = {}
+                unique_ids = list(dict.fromkeys(clip_ids))
+                for start in range(0, len(unique_ids), _BATCH):
+                    batch = unique_ids[start:start + _BATCH]
+                    placeholders = ",".join("?" * len(batch))
+                    for row in self._conn.execute(
+                        f"""
+                        SELECT clip_id, queries, doc_len, usage_count, added_at, last_used_at
+                        FROM clips WHERE clip_id IN ({placeholders})
+                        """,
+                        batch
+                    ):
+                        existing[row[0]] = (json.loads(row[1]),) + row[2:]
+
+                queries_by_id = {clip_id: row[0] for clip_id, row in existing.items()}
+                clip_rows: Dict[str, Tuple[Any, ...]] = {}
+                term_rows: Dict[str, List[Tuple[str, str, int]]] = {}
+                for clip_id, (asset, query) in zip(clip_ids, items):
+                    queries = queries_by_id.setdefault(clip_id, [])
+                    for text in (query, asset.keyword):
+                        if text and text not in queries:
+                            queries.append(text)
+
+                    terms = Counter(token for text in queries + asset.tags for token in tokenize(text))
+                    old = existing.get(clip_id)
+                    record = asset.model_dump(exclude={"local_path", "downloaded"})
+                    clip_rows[clip_id] = (
+                        clip_id, asset.provider, self._relative(asset.local_path),
+                        json.dumps(queries, ensure_ascii=False), json.dumps(asset.tags, ensure_ascii=False),
+                        asset.duration, asset.width, asset.height, json.dumps(record, ensure_ascii=False),
+                        sum(terms.values()),
+                        old[2] if old else 0, old[3] if old else now, old[4] if old else None,
+                        asset.fingerprint,
+                    )
+                    term_rows[clip_id] = [(token, clip_id, tf) for token, tf in terms.items()]
+
+                replaced = [clip_id for clip_id in clip_rows if clip_id in existing]
+                for start in range(0, len(replaced), _BATCH):
+                    batch = replaced[start:start + _BATCH]
+                    placeholders = ",".join("?" * len(batch))
+                    self._conn.execute(f"DELETE FROM clip_terms WHERE clip_id IN ({placeholders})", batch)
+                    self._conn.execute(f"DELETE FROM clip_fingerprints WHERE clip_id IN ({placeholders})", batch)
+                self._conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO clips
+                        (clip_id, provider, path, queries, tags, duration, width, height, asset,
+                         doc_len, usage_count, added_at, last_used_at, fingerprint)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    clip_rows.values()
+                )
+                self._conn.executemany(
+                    "INSERT INTO clip_terms (token, clip_id, tf) VALUES (?, ?, ?)",
+                    (row for rows in term_rows.values() for row in rows)
+                )
+                self._conn.executemany(
+                    "INSERT INTO clip_fingerprints (band, clip_id) VALUES (?, ?)",
+                    ((band, clip_id) for clip_id, row in clip_rows.items() for band in fingerprint_bands(row[13]))
+                )
+                self._conn.execute(
+                    "UPDATE library_meta SET clip_count = clip_count + ?, total_len = total_len + ? WHERE id = 1",
+                    (
+                        len(clip_rows) - len(replaced),
+                        sum(row[9] for row in clip_rows.values()) - sum(existing[c][1] for c in replaced),
+                    )
+                )
+
+        return clip_ids
+
+    def import_asset_cache(self, cache_dir: str) -> int:
+        """
+        기존 검색어별 JSON 캐시(AssetManager._cache_video)에서 파일이 남아 있는 영상 색인
+
+        Args:
+            cache_dir: 캐시 디렉토리 (downloads/cache)
+
+        Returns:
+            색인한 영상 수
+        """
+        items = []
+        for cache_file in Path(cache_dir).glob("*.json"):
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    asset = StockVideoAsset(**json.load(f))
+            except Exception as e:
+                print(f"[ClipLibrary] 캐시 파일 건너뜀 ({cache_file.name}): {e}")
+                continue
+            if asset.local_path and os.path.exists(asset.local_path):
+                items.append((asset, asset.keyword))
+
+        if items:
+            self.add_many(items)
+            print(f"[ClipLibrary] 기존 캐시에서 영상 {len(items)}개 색인")
+        return len(items)
+
+    # ---------- 검색 ----------
+
+    def search(
+        self,
+        query: str,
+        target_size: Optional[Tuple[int, int]] = None,
+        limit: int = 5,
+        min_score: Optional[float] = None,
+        min_duration: float = 0.0
+    ) -> List[Tuple[StockVideoAsset, float]]:
+        """
+        검색어와 비슷한 로컬 영상 검색
+
+        Args:
+            query: 검색어
+            target_size: 렌디션이 채워야 하는 최소 크기 (크기를 모르는 항목은 통과)
+            limit: 최대 결과 수
+            min_score: 최소 일치 점수 (0~1, None이면 config.LOCAL_CLIP_MIN_SCORE)
+            min_duration: 최소 영상 길이 (초)
+
+        Returns:
+            [(StockVideoAsset, 일치 점수)] (BM25 순, 파일이 없어진 항목은 색인에서 삭제 후 제외)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        min_score = LOCAL_CLIP_MIN_SCORE if min_score is None else min_score
+
+        with self._lock:
+            total, avg_len = self._corpus_stats()
+            if not total:
+                return []
+
+            postings: Dict[str, List[Tuple[str, int]]] = {}
+            placeholders = ",".join("?" * len(tokens))
+            for token, clip_id, tf in self._conn.execute(
+                f"SELECT token, clip_id, tf FROM clip_terms WHERE token IN ({placeholders})", tokens
+            ):
+                postings.setdefault(token, []).append((clip_id, tf))
+
+            idf = {
+                token: math.log(1 + (total - len(postings.get(token, ())) + 0.5) / (len(postings.get(token, ())) + 0.5))
+                for token in tokens
+            }
+            idf_total = sum(idf.values())
+
+            # 일치 비율(idf 가중)로 먼저 거른 뒤 남은 후보만 BM25 계산
+            matched: Dict[str, List[Tuple[str, int]]] = {}
+            for token, rows in postings.items():
+                for clip_id, tf in rows:
+                    matched.setdefault(clip_id, []).append((token, tf))
+            coverage = {
+                clip_id: sum(idf[token] for token, _ in terms) / idf_total
+                for clip_id, terms in matched.items()
+            }
+            candidates = [clip_id for clip_id, score in coverage.items() if score >= min_score]
+            if not candidates:
+                return []
+
+            rows = {}
+            for start in range(0, len(candidates), _BATCH):
+                batch = candidates[start:start + _BATCH]
+                placeholders = ",".join("?" * len(batch))
+                for clip_id, path, doc_len, duration, width, height, usage_count, record in self._conn.execute(
+                    f"""
+                    SELECT clip_id, path, doc_len, duration, width, height, usage_count, asset
+                    FROM clips WHERE clip_id IN ({placeholders})
+                    """,
+                    batch
+                ):
+                    if duration < min_duration:
+                        continue
+                    if target_size and width and height and not covers(width, height, target_size):
+                        continue
+                    rows[clip_id] = (path, doc_len, usage_count, record)
+
+        ranked = []
+        for clip_id, (path, doc_len, usage_count, record) in rows.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len / avg_len)
+            bm25 = sum(idf[token] * tf * (BM25_K1 + 1) / (tf + norm) for token, tf in matched[clip_id])
+            ranked.append((-bm25, usage_count, clip_id, path, record))
+        ranked.sort()
+
+        results = []
+        missing = []
+        for _, _, clip_id, path, record in ranked:
+            local_path = self.library_dir / path
+            if not local_path.exists():
+                missing.append(clip_id)
+                continue
+            asset = StockVideoAsset(**json.loads(record), local_path=str(local_path), downloaded=True)
+            results.append((asset, round(coverage[clip_id], 4)))
+            if len(results) >= limit:
+                break
+
+        if missing:
+            self.remove(missing)
+            print(f"[ClipLibrary] 파일이 없는 항목 {len(missing)}개 색인에서 삭제")
+        return results
+
+    def record_use(self, asset: StockVideoAsset) -> None:
+        """
+        영상 사용 기록 (사용 횟수 + 마지막 사용 시각)
+
+        Args:
+            asset: 사용한 StockVideoAsset (라이브러리에 없으면 무시)
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE clips SET usage_count = usage_count + 1, last_used_at = ? WHERE clip_id = ?",
+                    (time.time(), clip_id_of(asset))
+                )
+
+    def set_fingerprint(self, asset: StockVideoAsset) -> None:
+        """
+        지문 없이 색인된 항목의 지문 기록 (밴드 색인 포함)
+
+        Args:
+            asset: fingerprint가 있는 StockVideoAsset (라이브러리에 없으면 무시)
+        """
+        clip_id = clip_id_of(asset)
+        with self._lock:
+            with self._conn:
+                row = self._conn.execute("SELECT asset FROM clips WHERE clip_id = ?", (clip_id,)).fetchone()
+                if row is None:
+                    return
+                record = json.loads(row[0])
+                record["fingerprint"] = asset.fingerprint
+                self._conn.execute(
+                    "UPDATE clips SET fingerprint = ?, asset = ? WHERE clip_id = ?",
+                    (asset.fingerprint, json.dumps(record, ensure_ascii=False), clip_id)
+                )
+                self._conn.execute("DELETE FROM clip_fingerprints WHERE clip_id = ?", (clip_id,))
+                self._conn.executemany(
+                    "INSERT INTO clip_fingerprints (band, clip_id) VALUES (?, ?)",
+                    ((band, clip_id) for band in fingerprint_bands(asset.fingerprint))
+                )
+
+    def find_duplicate(
+        self,
+        fingerprint: Optional[str],
+        max_distance: float,
+        exclude: Iterable[str] = ()
+    ) -> Optional[Tuple[StockVideoAsset, float]]:
+        """
+        지문이 가장 가까운 항목 (밴드가 하나라도 같은 후보만 비교)
+
+        Args:
+            fingerprint: 찾을 영상의 지문
+            max_distance: 프레임당 평균 해밍 거리 상한 (bit)
+            exclude: 제외할 항목 ID (자기 자신)
+
+        Returns:
+            (StockVideoAsset, 거리) 또는 None (파일이 없어진 항목은 제외)
+        """
+        bands = fingerprint_bands(fingerprint)
+        if not bands:
+            return None
+        exclude = set(exclude)
+
+        with self._lock:
+            candidates = set()
+            for start in range(0, len(bands), _BATCH):
+                batch = bands[start:start + _BATCH]
+                placeholders = ",".join("?" * len(batch))
+                candidates.update(
+                    clip_id for (clip_id,) in self._conn.execute(
+                        f"SELECT DISTINCT clip_id FROM clip_fingerprints WHERE band IN ({placeholders})", batch
+                    )
+                )
+            candidates -= exclude
+
+            matches = []
+            candidates = list(candidates)
+            for start in range(0, len(candidates), _BATCH):
+                batch = candidates[start:start + _BATCH]
+                placeholders = ",".join("?" * len(batch))
+                for clip_id, path, other, record in self._conn.execute(
+                    f"SELECT clip_id, path, fingerprint, asset FROM clips WHERE clip_id IN ({placeholders})", batch
+                ):
+                    distance = fingerprint_distance(fingerprint, other)
+                    if distance is not None and distance <= max_distance:
+                        matches.append((distance, clip_id, path, record))
+
+        for distance, _, path, record in sorted(matches):
+            local_path = self.library_dir / path
+            if local_path.exists():
+                return StockVideoAsset(**json.loads(record), local_path=str(local_path), downloaded=True), distance
+        return None
+
+    # ---------- 관리 ----------
+
+    def remove(self, clip_ids: Iterable[str]) -> int:
+        """
+        항목 삭제 (색인만, 파일은 그대로)
+
+        Args:
+            clip_ids: 라이브러리 항목 ID 목록
+
+        Returns:
+            삭제한 항목 수
+        """
+        clip_ids = list(clip_ids)
+        removed = 0
+        with self._lock:
+            with self._conn:
+                for start in range(0, len(clip_ids), _BATCH):
+                    batch = clip_ids[start:start + _BATCH]
+                    placeholders = ",".join("?" * len(batch))
+                    count, length = self._conn.execute(
+                        f"SELECT COUNT(*), COALESCE(SUM(doc_len), 0) FROM clips WHERE clip_id IN ({placeholders})",
+                        batch
+                    ).fetchone()
+                    self._conn.execute(f"DELETE FROM clip_terms WHERE clip_id IN ({placeholders})", batch)
+                    self._conn.execute(f"DELETE FROM clip_fingerprints WHERE clip_id IN ({placeholders})", batch)
+                    self._conn.execute(f"DELETE FROM clips WHERE clip_id IN ({placeholders})", batch)
+                    self._conn.execute(
+                        "UPDATE library_meta SET clip_count = clip_count - ?, total_len = total_len - ? WHERE id = 1",
+                        (count, length)
+                    )
+                    removed += count
+        return removed
+
+    def prune_missing(self) -> int:
+        """
+        파일이 없어진 항목을 색인에서 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT clip_id, path FROM clips").fetchall()
+        missing = [clip_id for clip_id, path in rows if not (self.library_dir / path).exists()]
+        return self.remove(missing) if missing else 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        라이브러리 통계
+
+        Returns:
+            {"clips", "terms", "postings", "total_uses", "fingerprinted", "by_provider"} dict
+        """
+        with self._lock:
+            clips, total_uses, fingerprinted = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(usage_count), 0), COUNT(fingerprint) FROM clips"
+            ).fetchone()
+            terms, postings = self._conn.execute(
+                "SELECT COUNT(DISTINCT token), COUNT(*) FROM clip_terms"
+            ).fetchone()
+            by_provider = {
+                provider: count
+                for provider, count in self._conn.execute(
+                    "SELECT provider, COUNT(*) FROM clips GROUP BY provider"
+                )
+            }
+        return {
+            "clips": clips,
+            "terms": terms,
+            "postings": postings,
+            "total_uses": total_uses,
+            "fingerprinted": fingerprinted,
+            "by_provider": by_provider,
+        }
+
+    def clear(self) -> int:
+        """
+        색인 전체 삭제 (파일은 그대로)
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM clip_terms")
+                self._conn.execute("DELETE FROM clip_fingerprints")
+                removed = self._conn.execute("DELETE FROM clips").rowcount
+                self._conn.execute("UPDATE library_meta SET clip_count = 0, total_len = 0 WHERE id = 1")
+        return removed
+
+    def close(self) -> None:
+        """색인 연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+    # ---------- 내부 ----------
+
+    def _corpus_stats(self) -> Tuple[int, float]:
+        """(문서 수, 평균 문서 길이) (lock 안에서 호출)"""
+        total, length = self._conn.execute(
+            "SELECT clip_count, total_len FROM library_meta WHERE id = 1"
+        ).fetchone()
+        return total, (length / total) if total else 0.0
+
+    def _relative(self, path: str) -> str:
+        """라이브러리 디렉토리 안의 파일은 상대 경로로 저장 (작업 디렉토리가 달라도 같은 항목)"""
+        absolute = os.path.abspath(path)
+        root = os.path.abspath(self.library_dir)
+        if absolute.startswith(root + os.sep):
+            return absolute[len(root) + 1:]
+        return absolute
+
+
+# 디렉토리별 인스턴스 (같은 라이브러리를 쓰는 AssetManager끼리 연결 공유)
+_clip_libraries: Dict[str, ClipLibrary] = {}
+_clip_libraries_lock = threading.Lock()
+
+
+def get_clip_library(library_dir: str) -> ClipLibrary:
+    """
+    디렉토리별 ClipLibrary 인스턴스 반환
+
+    Args:
+        library_dir: 영상 파일 디렉토리 (downloads/stock_videos)
+
+    Returns:
+        ClipLibrary
+    """
+    key = str(Path(library_dir).resolve())
+    with _clip_libraries_lock:
+        if key not in _clip_libraries:
+            _clip_libraries[key] = ClipLibrary(key)
+        return _clip_libraries[key]
@@ -0,0 +1,391 @@
+"""
+Media Downloader
+이어받기 / 병렬 구간 / 원자적 저장을 지원하는 공용 다운로더 (스톡 영상, BGM)
+
+기존 제공자별 download_video는 최종 경로에 8KB 단위로 바로 기록했기 때문에
+작업이 중간에 죽으면 잘린 .mp4가 남고, 다음 실행의 os.path.exists 검사가 이를 완료로 취급해
+렌더링이 실패했습니다.
+
+MediaDownloader는
+  - `{이름}.part{확장자}` 임시 파일에 기록하고 검증이 끝나면 os.replace로 최종 경로에 원자적으로 이동
+  - Content-Length(또는 Content-Range 전체 크기)와 실제 크기 비교
+  - MP4/MOV: 최상위 박스 구조 검사 (moov 존재, 마지막 박스가 파일 끝을 넘지 않음 → 잘린 파일 검출)
+  - 컨테이너 헤더 조회(core.services.media_probe)로 재생 가능한 파일인지 확인 (ffmpeg가 있을 때)
+  - 연결이 끊기면 남은 임시 파일 크기부터 HTTP Range로 이어받기 (다음 실행에서도 이어받음)
+  - 서버가 Range를 지원하고 파일이 크면 여러 구간을 동시에 받아 합침
+  - 1MB 버퍼
+를 수행합니다. 이미 최종 경로에 있는 파일도 검증에 실패하면(이전 버전이 남긴 잘린 파일) 다시 받습니다.
+
+사용 예:
+    path = get_media_downloader().download(url, "downloads/stock_videos/pexels_1.mp4", session=session)
+"""
+import math
+import os
+import shutil
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from core.services.ffmpeg_render_service import find_ffmpeg
+from core.services.http_session import get_http_session
+from core.services.media_probe import get_media_probe_service
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB
+PARALLEL_MIN_SIZE = 16 * 1024 * 1024  # 이 크기 이상이면 구간 병렬 다운로드
+MAX_PARTS = 4
+
+ISO_BMFF_SUFFIXES = (".mp4", ".mov", ".m4a", ".m4v")
+
+
+def check_mp4_boxes(path: Path) -> bool:
+    """
+    ISO BMFF(MP4/MOV) 최상위 박스 구조 검사
+
+    faststart 파일은 moov가 앞에 있어 잘려도 헤더 조회는 성공하므로,
+    박스 크기를 따라가며 마지막 박스가 파일 끝에서 정확히 끝나는지 확인합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        moov 박스가 있고 모든 박스가 파일 안에 있으면 True
+    """
+    size = path.stat().st_size
+    offset = 0
+    has_moov = False
+    with open(path, "rb") as f:
+        while offset < size:
+            f.seek(offset)
+            header = f.read(8)
+            if len(header) < 8:
+                return False
+            box_size, box_type = struct.unpack(">I4s", header)
+            if box_size == 1:
+                large = f.read(8)
+                if len(large) < 8:
+                    return False
+                box_size = struct.unpack(">Q", large)[0]
+            elif box_size == 0:
+                box_size = size - offset  # 파일 끝까지
+            if box_size < 8 or offset + box_size > size:
+                return False
+            has_moov = has_moov or box_type == b"moov"
+            offset += box_size
+    return has_moov
+
+
+class DownloadError(Exception):
+    """복구할 수 없는 다운로드 실패 (크기 불일치, 손상된 파일) → 임시 파일 삭제"""
+
+
+class RangeNotSupported(Exception):
+    """서버가 Range 요청을 무시함 → 단일 스트림으로 다시 받음"""
+
+
+class MediaDownloader:
+    """
+    원자적 저장 + 이어받기 + 병렬 구간 다운로더
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        parallel_min_size: int = PARALLEL_MIN_SIZE,
+        max_parts: int = MAX_PARTS,
+        retries: int = 3,
+        timeout: float = 60,
+        validate_container: bool = True
+    ):
+        """
+        Args:
+            chunk_size: 읽기/쓰기 버퍼 크기 (바이트)
+            parallel_min_size: 구간 병렬 다운로드를 시작할 최소 파일 크기 (바이트)
+            max_parts: 최대 동시 구간 수 (1이면 병렬 다운로드 안 함)
+            retries: 연결 끊김 시 이어받기 재시도 횟수
+            timeout: 요청 타임아웃 (초)
+            validate_container: 완료 후 컨테이너 헤더 검증 (ffmpeg가 없으면 생략)
+        """
+        self.chunk_size = chunk_size
+        self.parallel_min_size = parallel_min_size
+        self.max_parts = max(1, max_parts)
+        self.retries = retries
+        self.timeout = timeout
+        self.validate_container = validate_container
+
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._path_locks_guard = threading.Lock()
+
+    @staticmethod
+    def temp_path(dest: Path) -> Path:
+        """임시 파일 경로 (확장자를 유지해 형식별 헤더 검증이 가능하도록 `이름.part.mp4`)"""
+        return dest.with_name(f"{dest.stem}.part{dest.suffix}")
+
+    def _lock_for(self, dest: Path) -> threading.Lock:
+        """같은 경로를 동시에 받지 않도록 경로별 잠금"""
+        with self._path_locks_guard:
+            return self._path_locks.setdefault(str(dest.resolve()), threading.Lock())
+
+    def is_valid_file(self, path: Path, expected_size: Optional[int] = None) -> bool:
+        """
+        완전한 미디어 파일인지 확인
+
+        Args:
+            path: 파일 경로
+            expected_size: 기대 크기 (바이트, None이면 확인 안 함)
+
+        Returns:
+            크기가 맞고 컨테이너 헤더를 읽을 수 있으면 True (ffmpeg가 없어 확인할 수 없는 형식도 True)
+        """
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return False
+        if size == 0 or (expected_size is not None and size != expected_size):
+            return False
+        if not self.validate_container:
+            return True
+        if path.suffix.lower() in ISO_BMFF_SUFFIXES and not check_mp4_boxes(path):
+            return False
+
+        probe = get_media_probe_service()
+        info = probe.probe(str(path))
+        if info is None:
+            # 헤더 파서가 없는 형식(mp4 등)은 ffmpeg가 없으면 확인 불가 → 크기 검증만으로 통과
+            return find_ffmpeg() is None and path.suffix.lower() not in (".wav", ".mp3")
+        return info.duration > 0
+
+    def _head(
+        self,
+        session: requests.Session,
+        url: str,
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[Optional[int], bool]:
+        """HEAD 요청으로 (전체 크기, Range 지원 여부) 조회 (실패하면 (None, False))"""
+        try:
+            response = session.head(url, headers=headers, allow_redirects=True, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException:
+            return None, False
+
+        length = response.headers.get("Content-Length")
+        total = int(length) if length and length.isdigit() else None
+        ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return total, ranges
+
+    @staticmethod
+    def _total_from_response(response: requests.Response, offset: int) -> Optional[int]:
+        """응답 헤더로 전체 크기 계산 (206이면 Content-Range, 200이면 Content-Length)"""
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code == 206 and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            return int(total) if total.isdigit() else None
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit():
+            return int(length) + (offset if response.status_code == 206 else 0)
+        return None
+
+    def _fetch(
+        self,
+        session: requests.Session,
+        url: str,
+        path: Path,
+        start: int,
+        end: Optional[int],
+        headers: Optional[Dict[str, str]],
+        require_range: bool = False
+    ) -> Optional[int]:
+        """
+        [start, end] 구간을 path에 받음 (path에 이미 받은 만큼은 Range로 건너뜀, 끊기면 재시도)
+
+        Args:
+            session: HTTP 세션
+            url: 다운로드 URL
+            path: 기록할 파일 (이어받기 기준)
+            start: 구간 시작 바이트
+            end: 구간 끝 바이트 (포함, None이면 파일 끝까지)
+            headers: 추가 요청 헤더
+            require_range: True면 서버가 Range를 무시할 때 RangeNotSupported 발생 (병렬 구간용)
+
+        Returns:
+            응답에서 알아낸 전체 파일 크기 (모르면 None)
+        """
+        expected = None if end is None else end - start + 1
+        total = None
+
+        for attempt in range(self.retries + 1):
+            have = path.stat().st_size if path.exists() else 0
+            if expected is not None and have >= expected:
+                if have > expected:
+                    raise DownloadError(f"구간 크기 초과 ({have} > {expected}): {path.name}")
+                return total
+
+            request_headers = dict(headers or {})
+            offset = start + have
+            if offset > 0 or end is not None:
+                request_headers["Range"] = f"bytes={offset}-{'' if end is None else end}"
+
+            try:
+                with session.get(url, headers=request_headers, stream=True, timeout=self.timeout) as response:
+                    if response.status_code == 416 and have > 0 and end is None:
+                        return total  # 이미 끝까지 받은 임시 파일
+                    response.raise_for_status()
+
+                    if "Range" in request_headers and response.status_code != 206:
+                        if require_range:
+                            raise RangeNotSupported()
+                        if have:
+                            print(f"[Downloader] 서버가 이어받기를 지원하지 않아 처음부터 다시 받음: {path.name}")
+                        have = 0
+
+                    total = self._total_from_response(response, offset) or total
+                    if expected is None and total is not None:
+                        expected = total - start
+
+                    with open(path, "ab" if have else "wb") as f:
+                        for chunk in response.iter_content(chunk_size=self.chunk_size):
+                            if chunk:
+                                f.write(chunk)
+
+                size = path.stat().st_size
+                if expected is None or size >= expected:
+                    if expected is not None and size > expected:
+                        raise DownloadError(f"크기 초과 ({size} > {expected}): {path.name}")
+                    return total
+                print(f"[Downloader] 응답이 중간에 끝남 ({size}/{expected}바이트), 이어받기 재시도")
+
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                if attempt >= self.retries:
+                    raise
+                received = path.stat().st_size if path.exists() else 0
+                print(f"[Downloader] 연결 끊김 ({received}바이트 받음), 이어받기 재시도 {attempt + 1}/{self.retries}: {e}")
+                time.sleep(min(0.5 * 2 ** attempt, 4))
+
+        raise requests.ConnectionError(f"재시도 {self.retries}회 후에도 다운로드 미완료: {path.name}")
+
+    def _fetch_parts(
+        self,
+        session: requests.Session,
+        url: str,
+        temp: Path,
+        total: int,
+        headers: Optional[Dict[str, str]]
+    ) -> None:
+        """전체를 구간으로 나눠 동시에 받은 뒤 temp에 순서대로 합침 (구간 파일도 이어받기 가능)"""
+        count = min(self.max_parts, math.ceil(total / (self.parallel_min_size / 2)) or 1)
+        part_size = math.ceil(total / count)
+        ranges = [(i * part_size, min(total, (i + 1) * part_size) - 1) for i in range(count)]
+        parts = [temp.with_name(f"{temp.name}.{i}") for i in range(count)]
+        print(f"[Downloader] 구간 {count}개 동시 다운로드 ({total / 1024 / 1024:.1f}MB)")
+
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="download") as executor:
+            futures = [
+                executor.submit(self._fetch, session, url, part, start, end, headers, True)
+                for part, (start, end) in zip(parts, ranges)
+            ]
+            for future in futures:
+                future.result()
+
+        with open(temp, "wb") as out:
+            for part in parts:
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out, self.chunk_size)
+        for part in parts:
+            part.unlink()
+
+    @staticmethod
+    def _cleanup(temp: Path) -> None:
+        """임시 파일과 구간 파일 삭제"""
+        for path in [temp, *temp.parent.glob(f"{temp.name}.*")]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def download(
+        self,
+        url: str,
+        dest_path: str,
+        session: Optional[requests.Session] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        """
+        URL을 dest_path에 다운로드
+
+        Args:
+            url: 다운로드 URL
+            dest_path: 최종 저장 경로
+            session: HTTP 세션 (None이면 공용 "download" 세션)
+            headers: 추가 요청 헤더
+
+        Returns:
+            저장된 파일 경로 또는 None (실패, 이어받을 수 있는 임시 파일은 남김)
+        """
+        dest = Path(dest_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        session = session or get_http_session("download")
+        temp = self.temp_path(dest)
+
+        with self._lock_for(dest):
+            # 이미 다운로드된 경우 (이전 버전이 남긴 잘린 파일은 다시 받음)
+            if dest.exists():
+                if self.is_valid_file(dest):
+                    print(f"[Downloader] 이미 다운로드됨: {dest.name}")
+                    return str(dest)
+                print(f"[Downloader] 손상된 기존 파일 삭제 후 다시 받음: {dest.name}")
+                dest.unlink()
+                get_media_probe_service().forget(str(dest))
+
+            try:
+                total, ranges = self._head(session, url, headers)
+                parallel = (
+                    total is not None and ranges and self.max_parts > 1
+                    and total >= self.parallel_min_size and not temp.exists()
+                )
+
+                if parallel:
+                    try:
+                        self._fetch_parts(session, url, temp, total, headers)
+                    except RangeNotSupported:
+                        print("[Downloader] 서버가 구간 요청을 무시함 → 단일 스트림으로 다시 받음")
+                        self._cleanup(temp)
+                        total = self._fetch(session, url, temp, 0, None, headers) or total
+                else:
+                    total = self._fetch(session, url, temp, 0, None, headers) or total
+
+                if not self.is_valid_file(temp, total):
+                    size = temp.stat().st_size if temp.exists() else 0
+                    raise DownloadError(f"검증 실패 (크기 {size}/{total}바이트 또는 손상된 컨테이너)")
+
+                get_media_probe_service().forget(str(temp))
+                os.replace(temp, dest)
+                return str(dest)
+
+            except (DownloadError, RangeNotSupported) as e:
+                print(f"[ERROR] 다운로드 실패: {dest.name} - {e}")
+                get_media_probe_service().forget(str(temp))
+                self._cleanup(temp)
+                return None
+            except (requests.RequestException, OSError) as e:
+                # 임시 파일은 남겨 두고 다음 시도에서 이어받음
+                print(f"[ERROR] 다운로드 중단: {dest.name} - {e}")
+                return None
+
+
+# 싱글톤 인스턴스
+_media_downloader = None
+_media_downloader_lock = threading.Lock()
+
+
+def get_media_downloader() -> MediaDownloader:
+    """MediaDownloader 싱글톤 인스턴스 반환"""
+    global _media_downloader
+    with _media_downloader_lock:
+        if _media_downloader is None:
+            _media_downloader = MediaDownloader()
+    return _media_downloader
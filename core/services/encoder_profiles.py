@@ -0,0 +1,165 @@
+"""
+Encoder Profiles
+x264 인코더 프로필 (draft / preview / standard / archive) 및 호스트별 속도 측정
+
+렌더링 경로(MoviePy write_videofile, ffmpeg 렌더링 엔진, local_cli)가 모두
+같은 프로필 정의를 사용합니다.
+
+선택 우선순위 (VideoEditor):
+1. 작업별 지정 (create_video(encoder_profile=...) / EditConfig.encoder_profile)
+2. 템플릿 설정 (TemplateConfig.encoder_profile)
+3. 기본값 (standard)
+"""
+import os
+import subprocess
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from core.models import EncoderProfile
+
+
+DEFAULT_ENCODER_PROFILE = "standard"
+
+ENCODER_PROFILES: Dict[str, EncoderProfile] = {
+    "draft": EncoderProfile(
+        name="draft",
+        description="초안 확인용 (최고 속도, 저화질)",
+        preset="ultrafast",
+        crf=32,
+        tune="fastdecode",
+        gop_seconds=2.0,
+    ),
+    "preview": EncoderProfile(
+        name="preview",
+        description="프리뷰용 (빠른 인코딩, 웹 재생)",
+        preset="veryfast",
+        crf=27,
+        gop_seconds=2.0,
+    ),
+    "standard": EncoderProfile(
+        name="standard",
+        description="업로드용 기본값 (기존 medium / CRF 23 설정)",
+        preset="medium",
+        crf=23,
+        gop_seconds=2.0,
+    ),
+    "archive": EncoderProfile(
+        name="archive",
+        description="보관용 고화질 (느린 인코딩)",
+        preset="slow",
+        crf=18,
+        tune="film",
+        gop_seconds=4.0,
+    ),
+}
+
+
+def get_encoder_profile(name: Optional[str] = None) -> EncoderProfile:
+    """
+    이름으로 인코더 프로필 조회
+
+    Args:
+        name: 프로필 이름 (None이면 기본 프로필)
+
+    Returns:
+        EncoderProfile
+
+    Raises:
+        ValueError: 알 수 없는 프로필 이름
+    """
+    name = name or DEFAULT_ENCODER_PROFILE
+    if name not in ENCODER_PROFILES:
+        raise ValueError(
+            f"지원하지 않는 인코더 프로필: {name} ({', '.join(ENCODER_PROFILES)})"
+        )
+    return ENCODER_PROFILES[name]
+
+
+def resolve_encoder_profile(*names: Optional[str]) -> EncoderProfile:
+    """
+    우선순위 순서로 주어진 이름 중 처음 지정된 프로필 반환
+
+    알 수 없는 이름은 경고 후 건너뜁니다 (잘못된 템플릿 값 때문에 렌더링이 실패하지 않도록).
+
+    Args:
+        *names: 프로필 이름 후보 (앞쪽이 우선, None은 미지정)
+
+    Returns:
+        EncoderProfile (모두 미지정이면 기본 프로필)
+    """
+    for name in names:
+        if not name:
+            continue
+        if name in ENCODER_PROFILES:
+            return ENCODER_PROFILES[name]
+        print(f"[EncoderProfile] 알 수 없는 프로필 '{name}' 무시 ({', '.join(ENCODER_PROFILES)})")
+    return ENCODER_PROFILES[DEFAULT_ENCODER_PROFILE]
+
+
+def _run_timed(command: List[str]) -> float:
+    """명령 실행 후 경과 시간(초) 반환"""
+    start = time.perf_counter()
+    subprocess.run(command, check=True, capture_output=True, text=True)
+    return time.perf_counter() - start
+
+
+def calibrate_encoder_profiles(
+    duration: float = 5.0,
+    resolution: Tuple[int, int] = (1080, 1920),
+    fps: int = 30,
+    profiles: Optional[List[str]] = None,
+    ffmpeg_cmd: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    현재 호스트에서 프로필별 인코딩 속도 측정 (출력 1초당 소요 초)
+
+    움직임과 노이즈가 있는 합성 영상(testsrc2 + noise)을 각 프로필로 인코딩하고,
+    같은 소스를 인코딩 없이 디코딩만 한 시간을 빼서 순수 인코더 비용을 구합니다.
+
+    Args:
+        duration: 측정 영상 길이 (초)
+        resolution: 해상도 (width, height)
+        fps: 프레임 레이트
+        profiles: 측정할 프로필 이름 (None이면 전체)
+        ffmpeg_cmd: ffmpeg 실행 파일 (None이면 자동 탐색)
+
+    Returns:
+        {프로필: {"seconds_per_output_second", "encode_seconds", "file_size_mb"}}
+    """
+    from core.services.ffmpeg_render_service import find_ffmpeg
+
+    ffmpeg_cmd = ffmpeg_cmd or find_ffmpeg()
+    if not ffmpeg_cmd:
+        raise RuntimeError("ffmpeg를 찾을 수 없습니다")
+
+    width, height = resolution
+    source = [
+        "-f", "lavfi",
+        "-i", f"testsrc2=size={width}x{height}:rate={fps}:duration={duration},noise=alls=12:allf=t",
+    ]
+    base = [ffmpeg_cmd, "-y", "-hide_banner", "-loglevel", "error"] + source
+
+    # 소스 생성 비용 (인코딩 제외)
+    source_seconds = _run_timed(base + ["-f", "null", "-"])
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="encoder_calibration_") as temp_dir:
+        for name in profiles or list(ENCODER_PROFILES):
+            profile = get_encoder_profile(name)
+            output_path = os.path.join(temp_dir, f"{name}.mp4")
+
+            elapsed = _run_timed(
+                base + profile.ffmpeg_args(fps) + ["-pix_fmt", "yuv420p", output_path]
+            )
+            encode_seconds = max(elapsed - source_seconds, 0.0)
+
+            results[name] = {
+                "seconds_per_output_second": round(encode_seconds / duration, 3),
+                "encode_seconds": round(encode_seconds, 3),
+                "file_size_mb": round(os.path.getsize(output_path) / 1024 / 1024, 3),
+            }
+            print(f"[EncoderProfile] {name}: {results[name]['seconds_per_output_second']:.3f} s/s "
+                  f"({results[name]['file_size_mb']:.2f} MB)")
+
+    return results
@@ -0,0 +1,367 @@
+"""
+FFmpeg Render Service
+MoviePy 프레임 합성 대신 단일 ffmpeg -filter_complex 호출로 타임라인 렌더링
+
+VideoEditor가 만든 타임라인(dict)을 하나의 filter graph로 컴파일합니다.
+- 클립: -stream_loop(반복) / trim / 중앙 crop / scale / fps
+- Ken Burns: (선택적 업스케일) + zoompan 중앙 줌
+- 클립 연결: concat 또는 xfade (크로스페이드)
+- 쇼츠 레이아웃: 중앙 밴드 + pad (상/하단 검은 배경)
+- 제목/자막: PNG 입력 + overlay(enable='between(t,...)')
+- 오디오: TTS + BGM(aloop, atrim, afade, volume) amix
+
+모든 프레임이 ffmpeg 내부(C)에서 처리되므로 Python 단일 코어 병목이 사라집니다.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+
+def find_ffmpeg() -> Optional[str]:
+    """
+    ffmpeg 실행 파일 경로 찾기
+
+    PATH → Chocolatey 설치 경로 → imageio-ffmpeg 번들 순서로 확인합니다.
+
+    Returns:
+        ffmpeg 경로 또는 None
+    """
+    ffmpeg_cmd = shutil.which("ffmpeg")
+    if ffmpeg_cmd:
+        return ffmpeg_cmd
+
+    choco_ffmpeg = Path("C:/ProgramData/chocolatey/bin/ffmpeg.exe")
+    if choco_ffmpeg.exists():
+        return str(choco_ffmpeg)
+
+    try:
+        from imageio_ffmpeg import get_ffmpeg_exe
+        return get_ffmpeg_exe()
+    except Exception:
+        return None
+
+
+class FFmpegRenderService:
+    """
+    타임라인 → ffmpeg filter graph 컴파일러 및 실행기
+
+    타임라인 형식 (VideoEditor._build_render_timeline 참고):
+        {
+            "width": 1080, "height": 1920,        # 최종 캔버스 크기
+            "fps": 30,
+            "duration": 42.5,                     # 최종 길이 (초, TTS 기준)
+            "clip_size": (1080, 960),             # 클립 합성 크기 (쇼츠: 중앙 밴드)
+            "clip_position": (0, 480),            # 캔버스 내 클립 위치
+            "crop_ratios": [0.5625, 1.125],       # 순차 중앙 크롭 비율 (width/height)
+            "clips": [{"path": "a.mp4", "duration": 5.3, "fit": False}, ...],  # fit: 이미 밴드 크기 (crop/scale 생략)
+            "crossfade": 0.3,                     # 0이면 concat
+            "ken_burns": {"zoom_ratio": 1.15, "quality": "balanced"} 또는 None,
+            "overlays": [                         # 제목/자막 PNG
+                {"path": "title.png", "x": 0, "y": 0, "start": 0.0, "end": None},
+                ...
+            ],
+            "encoder": ["-c:v", "libx264", "-preset", "medium", ...] 또는 None,  # EncoderProfile.ffmpeg_args
+            "audio": {
+                "tts": "tts.mp3" 또는 None,
+                "bgm": {"path": "bgm.mp3", "volume": 0.25, "fade_in": 1.0, "fade_out": 2.0} 또는 None
+            }
+        }
+    """
+
+    AUDIO_SAMPLE_RATE = 44100
+
+    # Ken Burns 품질 → (zoompan 전 업스케일 배율, swscale 보간 방식) (EditConfig.ken_burns_quality)
+    # zoompan은 정수 좌표로 크롭하므로 업스케일할수록 줌 떨림이 줄어듭니다
+    KEN_BURNS_PRESCALE = {
+        "fast": (1, "fast_bilinear"),
+        "balanced": (2, "bilinear"),
+        "high": (2, "lanczos"),
+    }
+
+    def __init__(self, ffmpeg_path: Optional[str] = None):
+        """
+        Args:
+            ffmpeg_path: ffmpeg 실행 파일 경로 (None이면 자동 탐색)
+        """
+        self.ffmpeg_cmd = ffmpeg_path or find_ffmpeg()
+
+    @property
+    def available(self) -> bool:
+        """ffmpeg 사용 가능 여부"""
+        return self.ffmpeg_cmd is not None
+
+    # ==================== Filter Graph ====================
+
+    @staticmethod
+    def _crop_filter(ratio: float) -> str:
+        """
+        중앙 기준으로 지정 비율(width/height)에 맞게 자르는 crop 필터
+
+        VideoEditor._resize_and_crop과 동일한 화면 구성을 만듭니다.
+        """
+        return (
+            f"crop=w='min(iw,trunc(ih*{ratio:.6f}/2)*2)'"
+            f":h='min(ih,trunc(iw/{ratio:.6f}/2)*2)'"
+        )
+
+    def _ken_burns_filter(
+        self,
+        width: int,
+        height: int,
+        fps: int,
+        duration: float,
+        zoom_ratio: float,
+        quality: str = "balanced"
+    ) -> str:
+        """
+        Ken Burns 줌 필터 (VideoEditor._apply_ken_burns_effect와 동일한 화면)
+
+        입력 프레임마다 출력 프레임 1개(d=1)를 만들고, 프레임 번호(on)에 비례해
+        1.0 → zoom_ratio로 중앙 줌인합니다.
+        """
+        prescale, flags = self.KEN_BURNS_PRESCALE.get(quality, self.KEN_BURNS_PRESCALE["balanced"])
+        total_frames = max(1, round(duration * fps))
+
+        chain = ""
+        if prescale > 1:
+            chain = f"scale=iw*{prescale}:ih*{prescale}:flags={flags},"
+
+        return chain + (
+            f"zoompan=z='1+{zoom_ratio - 1.0:.6f}*min(on,{total_frames})/{total_frames}'"
+            f":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+            f":d=1:s={width}x{height}:fps={fps}"
+        )
+
+    def build_filter_graph(
+        self,
+        timeline: Dict[str, Any]
+    ) -> Tuple[List[str], str, str, Optional[str]]:
+        """
+        타임라인을 ffmpeg 입력 인자와 filter graph로 컴파일
+
+        Args:
+            timeline: 렌더링 타임라인 dict
+
+        Returns:
+            (입력 인자 리스트, filter graph 문자열, 비디오 출력 라벨, 오디오 출력 라벨 또는 None)
+        """
+        clips = timeline["clips"]
+        if not clips:
+            raise ValueError("타임라인에 클립이 없습니다")
+
+        fps = timeline["fps"]
+        duration = timeline["duration"]
+        canvas_w, canvas_h = timeline["width"], timeline["height"]
+        clip_w, clip_h = timeline.get("clip_size") or (canvas_w, canvas_h)
+        clip_x, clip_y = timeline.get("clip_position") or (0, 0)
+        crop_ratios = timeline.get("crop_ratios") or [clip_w / clip_h]
+        crossfade = timeline.get("crossfade", 0.0) if len(clips) > 1 else 0.0
+
+        inputs: List[str] = []
+        filters: List[str] = []
+        input_index = 0
+
+        ken_burns = timeline.get("ken_burns")
+
+        # 1. 클립별 체인: 반복 입력 → trim → fps → crop → scale (→ Ken Burns)
+        crop_chain = ",".join(self._crop_filter(r) for r in crop_ratios)
+        for i, clip in enumerate(clips):
+            inputs += ["-stream_loop", "-1", "-i", str(clip["path"])]
+            chain = (
+                f"[{input_index}:v]trim=duration={clip['duration']:.3f},setpts=PTS-STARTPTS,"
+                f"fps={fps}"
+            )
+            # 렌디션이 이미 표시 영역 크기면 crop / scale 생략
+            if not clip.get("fit"):
+                chain += f",{crop_chain},scale={clip_w}:{clip_h}"
+            if ken_burns:
+                chain += "," + self._ken_burns_filter(
+                    clip_w, clip_h, fps, clip["duration"],
+                    ken_burns["zoom_ratio"], ken_burns.get("quality", "balanced")
+                )
+            filters.append(f"{chain},setsar=1,format=yuv420p[c{i}]")
+            input_index += 1
+
+        # 2. 클립 연결 (크로스페이드면 xfade 체인, 아니면 concat)
+        if len(clips) == 1:
+            current = "c0"
+        elif crossfade > 0:
+            current = "c0"
+            stream_length = clips[0]["duration"]
+            for i in range(1, len(clips)):
+                offset = max(0.0, stream_length - crossfade)
+                label = f"x{i}"
+                filters.append(
+                    f"[{current}][c{i}]xfade=transition=fade:duration={crossfade:.3f}"
+                    f":offset={offset:.3f}[{label}]"
+                )
+                current = label
+                stream_length += clips[i]["duration"] - crossfade
+        else:
+            joined = "".join(f"[c{i}]" for i in range(len(clips)))
+            filters.append(f"{joined}concat=n={len(clips)}:v=1:a=0[vcat]")
+            current = "vcat"
+
+        # 3. 레이아웃: 클립이 캔버스보다 작으면 검은 배경으로 pad
+        if (clip_w, clip_h) != (canvas_w, canvas_h) or (clip_x, clip_y) != (0, 0):
+            filters.append(f"[{current}]pad={canvas_w}:{canvas_h}:{clip_x}:{clip_y}:black[base]")
+            current = "base"
+
+        # 4. 오버레이 (제목 / 자막 PNG)
+        for k, overlay in enumerate(timeline.get("overlays", [])):
+            inputs += ["-i", str(overlay["path"])]
+            enable = ""
+            if overlay.get("end") is not None:
+                enable = f":enable='between(t,{overlay.get('start', 0.0):.3f},{overlay['end']:.3f})'"
+            label = f"o{k}"
+            filters.append(
+                f"[{current}][{input_index}:v]overlay={overlay.get('x', 0)}:{overlay.get('y', 0)}{enable}[{label}]"
+            )
+            current = label
+            input_index += 1
+
+        # 마지막 프레임 유지 (반올림으로 인한 길이 부족 방지, 출력은 -t로 자름)
+        filters.append(f"[{current}]tpad=stop_mode=clone:stop_duration=1,format=yuv420p[vout]")
+
+        # 5. 오디오 (TTS + BGM)
+        audio = timeline.get("audio") or {}
+        audio_labels = []
+
+        if audio.get("tts"):
+            inputs += ["-i", str(audio["tts"])]
+            filters.append(f"[{input_index}:a]aresample={self.AUDIO_SAMPLE_RATE}[tts]")
+            audio_labels.append("tts")
+            input_index += 1
+
+        bgm = audio.get("bgm")
+        if bgm:
+            fade_in = bgm.get("fade_in", 1.0)
+            fade_out = bgm.get("fade_out", 2.0)
+            inputs += ["-stream_loop", "-1", "-i", str(bgm["path"])]
+            filters.append(
+                f"[{input_index}:a]atrim=0:{duration:.3f},asetpts=PTS-STARTPTS,"
+                f"aresample={self.AUDIO_SAMPLE_RATE},"
+                f"afade=t=in:st=0:d={fade_in},"
+                f"afade=t=out:st={max(0.0, duration - fade_out):.3f}:d={fade_out},"
+                f"volume={bgm.get('volume', 0.25)}[bgm]"
+            )
+            audio_labels.append("bgm")
+            input_index += 1
+
+        audio_label = None
+        if len(audio_labels) == 2:
+            # BGM을 깔고 TTS를 그대로 얹음 (CompositeAudioClip과 동일하게 단순 합산)
+            filters.append("[tts][bgm]amix=inputs=2:duration=longest:normalize=0[aout]")
+            audio_label = "aout"
+        elif audio_labels:
+            audio_label = audio_labels[0]
+
+        return inputs, ";\n".join(filters), "vout", audio_label
+
+    def build_command(
+        self,
+        timeline: Dict[str, Any],
+        output_path: str,
+        script_path: str
+    ) -> List[str]:
+        """
+        ffmpeg 실행 명령어 생성
+
+        filter graph는 명령줄 길이 제한(자막 수백 개)을 피하기 위해 파일로 전달합니다.
+
+        Args:
+            timeline: 렌더링 타임라인 dict
+            output_path: 출력 영상 경로
+            script_path: filter graph를 저장할 파일 경로
+
+        Returns:
+            ffmpeg 명령어 리스트
+        """
+        inputs, graph, video_label, audio_label = self.build_filter_graph(timeline)
+
+        with open(script_path, 'w', encoding='utf-8') as f:
+            f.write(graph)
+
+        command = [
+            self.ffmpeg_cmd or "ffmpeg",
+            "-y",
+            "-hide_banner",
+            "-loglevel", "error",
+            *inputs,
+            "-filter_complex_script", script_path,
+            "-map", f"[{video_label}]",
+        ]
+
+        if audio_label:
+            command += ["-map", f"[{audio_label}]", "-c:a", "aac", "-b:a", "192k"]
+        else:
+            command += ["-an"]
+
+        command += [
+            "-t", f"{timeline['duration']:.3f}",
+            "-r", str(timeline["fps"]),
+            *(timeline.get("encoder") or ["-c:v", "libx264"]),
+            "-pix_fmt", "yuv420p",
+            str(output_path)
+        ]
+
+        return command
+
+    def render(self, timeline: Dict[str, Any], output_path: str) -> Optional[str]:
+        """
+        타임라인을 단일 ffmpeg 호출로 렌더링
+
+        Args:
+            timeline: 렌더링 타임라인 dict
+            output_path: 출력 영상 경로
+
+        Returns:
+            출력 영상 경로 또는 None (실패 시)
+        """
+        if not self.available:
+            print("[FFmpegRender] ffmpeg를 찾을 수 없습니다")
+            return None
+
+        with tempfile.TemporaryDirectory(prefix="ffmpeg_graph_") as temp_dir:
+            script_path = os.path.join(temp_dir, "filter_graph.txt")
+
+            try:
+                command = self.build_command(timeline, output_path, script_path)
+            except Exception as e:
+                print(f"[FFmpegRender] filter graph 생성 실패: {e}")
+                return None
+
+            print(f"[FFmpegRender] 렌더링 시작: 클립 {len(timeline['clips'])}개, "
+                  f"오버레이 {len(timeline.get('overlays', []))}개, {timeline['duration']:.2f}초")
+
+            try:
+                subprocess.run(command, check=True, capture_output=True, text=True)
+            except subprocess.CalledProcessError as e:
+                print(f"[FFmpegRender] 렌더링 실패 (exit {e.returncode})")
+                print(f"  - FFMPEG STDERR: {(e.stderr or '')[-2000:]}")
+                return None
+            except OSError as e:
+                print(f"[FFmpegRender] ffmpeg 실행 실패: {e}")
+                return None
+
+        if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+            print(f"[FFmpegRender] 출력 파일이 생성되지 않았습니다: {output_path}")
+            return None
+
+        print(f"[FFmpegRender] 렌더링 완료: {output_path}")
+        return output_path
+
+
+# 싱글톤 인스턴스
+_ffmpeg_render_service = None
+
+
+def get_ffmpeg_render_service() -> FFmpegRenderService:
+    """FFmpegRenderService 싱글톤 인스턴스 반환"""
+    global _ffmpeg_render_service
+    if _ffmpeg_render_service is None:
+        _ffmpeg_render_service = FFmpegRenderService()
+    return _ffmpeg_render_service
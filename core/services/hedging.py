@@ -0,0 +1,162 @@
+"""
+Hedged Requests
+여러 제공자에 같은 검색을 겹쳐서 요청할 때의 대기 시간 학습 + 공용 실행기
+
+직렬 fallback(Pexels 응답을 최대 10초 기다린 뒤 Pixabay, 결과가 없으면 Pixabay 완화 검색)은
+한 제공자의 느린 응답이 에셋 수집 단계 전체 속도를 결정했습니다.
+헤지 검색은 앞 순위 요청이 평소 지연 시간(최근 기록의 상위 백분위)을 넘기면 다음 순위 요청을
+바로 시작하고, 응답은 기존 우선순위대로 채택합니다.
+
+HedgeTracker는 요청 종류(attempt)별 응답 시간과 채택(win) 횟수를 기록하고
+다음 헤지까지 기다릴 시간을 계산합니다.
+늦게 끝난 요청(straggler)은 취소할 수 없으므로(requests는 진행 중인 요청 중단 불가)
+공용 실행기에서 끝까지 실행되고 결과는 무시됩니다. 대신 검색 캐시에는 저장됩니다.
+
+사용 예:
+    tracker = get_hedge_tracker()
+    delay = tracker.delay("pexels:portrait")
+    ...
+    tracker.record("pexels:portrait", elapsed)
+    tracker.record_win("pixabay:vertical")
+"""
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional
+
+from core.config import (
+    STOCK_HEDGE_DELAY_SECONDS,
+    STOCK_HEDGE_MIN_DELAY_SECONDS,
+    STOCK_HEDGE_MAX_DELAY_SECONDS,
+)
+
+
+class HedgeTracker:
+    """
+    요청 종류별 지연 시간 / 채택 기록
+
+    - record: 끝난 요청의 응답 시간 (결과 유무와 관계없이, 오류 제외)
+    - record_win: 채택된 요청
+    - delay: 다음 순위 요청을 시작하기 전 기다릴 시간 (최근 응답 시간의 PERCENTILE 백분위)
+    """
+
+    # 대기 시간 기준 백분위 (The Tail at Scale: 95번째 백분위를 넘긴 요청만 헤지)
+    PERCENTILE = 0.95
+    # 이보다 기록이 적으면 기본 대기 시간 사용
+    MIN_SAMPLES = 20
+    # 요청 종류별 최근 기록 개수
+    WINDOW = 200
+
+    def __init__(
+        self,
+        default_delay: Optional[float] = None,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        """
+        Args:
+            default_delay: 기록이 부족할 때 대기 시간 (None이면 config.STOCK_HEDGE_DELAY_SECONDS)
+            min_delay: 대기 시간 하한 (None이면 config.STOCK_HEDGE_MIN_DELAY_SECONDS)
+            max_delay: 대기 시간 상한 (None이면 config.STOCK_HEDGE_MAX_DELAY_SECONDS)
+        """
+        self.default_delay = STOCK_HEDGE_DELAY_SECONDS if default_delay is None else default_delay
+        self.min_delay = STOCK_HEDGE_MIN_DELAY_SECONDS if min_delay is None else min_delay
+        self.max_delay = STOCK_HEDGE_MAX_DELAY_SECONDS if max_delay is None else max_delay
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._wins: Dict[str, int] = {}
+        self._hedged = 0
+
+    def record(self, attempt: str, elapsed: float) -> None:
+        """
+        끝난 요청의 응답 시간 기록
+
+        Args:
+            attempt: 요청 종류 (예: "pexels:portrait", "pixabay:all")
+            elapsed: 응답 시간 (초)
+        """
+        with self._lock:
+            self._latencies.setdefault(attempt, deque(maxlen=self.WINDOW)).append(elapsed)
+
+    def record_win(self, attempt: str, hedged: bool = False) -> None:
+        """
+        채택된 요청 기록
+
+        Args:
+            attempt: 요청 종류
+            hedged: 앞 순위 요청이 끝나기 전에 채택했는지 여부
+        """
+        with self._lock:
+            self._wins[attempt] = self._wins.get(attempt, 0) + 1
+            if hedged:
+                self._hedged += 1
+
+    def delay(self, attempt: str) -> float:
+        """
+        이 요청을 기다린 뒤 다음 순위 요청을 시작할 시간
+
+        Args:
+            attempt: 요청 종류
+
+        Returns:
+            대기 시간 (초, [min_delay, max_delay])
+        """
+        with self._lock:
+            samples = sorted(self._latencies.get(attempt, ()))
+        if len(samples) < self.MIN_SAMPLES:
+            value = self.default_delay
+        else:
+            value = samples[min(len(samples) - 1, math.ceil(self.PERCENTILE * len(samples)) - 1)]
+        return min(self.max_delay, max(self.min_delay, value))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        헤지 통계
+
+        Returns:
+            {"wins", "hedged_wins", "delays", "samples"} dict
+        """
+        with self._lock:
+            attempts = list(self._latencies)
+            wins = dict(self._wins)
+            hedged = self._hedged
+            samples = {attempt: len(latencies) for attempt, latencies in self._latencies.items()}
+        return {
+            "wins": wins,
+            "hedged_wins": hedged,
+            "delays": {attempt: round(self.delay(attempt), 3) for attempt in attempts},
+            "samples": samples,
+        }
+
+
+# 싱글톤 인스턴스
+_hedge_tracker = None
+_hedge_executor = None
+_hedge_lock = threading.Lock()
+
+# 헤지 요청 실행 스레드 수 (stock 리미터가 실제 동시 요청 수를 제한)
+HEDGE_WORKERS = 16
+
+
+def get_hedge_tracker() -> HedgeTracker:
+    """HedgeTracker 싱글톤 인스턴스 반환"""
+    global _hedge_tracker
+    with _hedge_lock:
+        if _hedge_tracker is None:
+            _hedge_tracker = HedgeTracker()
+    return _hedge_tracker
+
+
+def get_hedge_executor() -> ThreadPoolExecutor:
+    """
+    헤지 요청용 공용 실행기
+
+    작업마다 실행기를 만들면 with 블록이 늦게 끝난 요청까지 기다리므로 프로세스 전체에서 하나를 공유합니다.
+    """
+    global _hedge_executor
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="hedge")
+    return _hedge_executor
@@ -0,0 +1,67 @@
+"""
+HTTP Session Pool
+제공자별 keep-alive requests.Session (연결 풀 공유)
+
+requests.get()은 호출마다 새 연결(TLS 핸드셰이크 포함)을 엽니다.
+세그먼트별 스톡 검색을 동시에 보내면 같은 호스트로 수십 번 연결하게 되므로,
+제공자 이름별로 Session 하나를 만들어 모든 스레드가 연결 풀을 재사용합니다.
+
+사용 예:
+    session = get_http_session("pexels")
+    response = session.get(url, params=params, timeout=10)
+"""
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# 호스트별 유지할 keep-alive 연결 수 (동시 요청 수보다 작으면 초과분은 요청 후 닫힘)
+DEFAULT_POOL_SIZE = 16
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    연결 풀 크기를 지정한 requests.Session 생성
+
+    Args:
+        pool_size: 호스트별 keep-alive 연결 수
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session(provider: str, pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    제공자별 Session 싱글톤 반환
+
+    Args:
+        provider: 제공자 이름 (pexels, pixabay 등)
+        pool_size: 처음 생성할 때 사용할 호스트별 연결 수
+
+    Returns:
+        requests.Session (스레드 간 공유)
+    """
+    with _sessions_lock:
+        if provider not in _sessions:
+            _sessions[provider] = create_session(pool_size)
+        return _sessions[provider]
+
+
+def close_http_sessions() -> None:
+    """모든 Session 연결 종료 (프로세스 종료 / 테스트 정리용)"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
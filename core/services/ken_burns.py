@@ -0,0 +1,118 @@
+"""
+Ken Burns Resampler
+프레임마다 전체 프레임을 확대(LANCZOS)한 뒤 잘라내던 방식 대신
+미리 계산한 크롭 창만 한 번에 리샘플링하는 줌인 효과
+
+줌 배율 z에서의 Ken Burns 프레임은 "중앙 (w/z, h/z) 창을 (w, h)로 확대"와 같습니다.
+창은 시간에만 의존하므로 프레임 인덱스별 창(box)을 클립 생성 시 한 번 계산해 두고,
+프레임에는 Pillow resize(box=...) 한 번만 적용합니다.
+(버려질 가장자리까지 확대하지 않으므로 확대 면적이 z² 배 줄어듭니다)
+
+품질 (EditConfig.ken_burns_quality):
+- fast: 최근접 샘플링 (가장 빠름, 미세한 계단 현상)
+- balanced: bilinear
+- high: LANCZOS (기존 화질)
+"""
+import math
+from typing import List, Tuple
+
+import numpy as np
+from PIL import Image
+
+
+KEN_BURNS_FILTERS = {
+    "fast": Image.Resampling.NEAREST,
+    "balanced": Image.Resampling.BILINEAR,
+    "high": Image.Resampling.LANCZOS,
+}
+
+
+def ken_burns_zoom(t: float, duration: float, zoom_ratio: float) -> float:
+    """
+    시각 t의 줌 배율 (t=0: 1.0 → t=duration: zoom_ratio, 선형)
+
+    Args:
+        t: 시각 (초)
+        duration: 클립 길이 (초)
+        zoom_ratio: 최종 줌 배율
+
+    Returns:
+        줌 배율
+    """
+    progress = t / duration if duration > 0 else 0
+    return 1.0 + (zoom_ratio - 1.0) * progress
+
+
+def ken_burns_window(width: int, height: int, zoom: float) -> Tuple[float, float, float, float]:
+    """
+    줌 배율 zoom에서 원본 프레임의 중앙 크롭 창 (left, top, right, bottom)
+
+    Args:
+        width: 프레임 너비
+        height: 프레임 높이
+        zoom: 줌 배율 (1.0 이상)
+
+    Returns:
+        (left, top, right, bottom) 실수 좌표
+    """
+    window_w = width / zoom
+    window_h = height / zoom
+    left = (width - window_w) / 2
+    top = (height - window_h) / 2
+    return (left, top, left + window_w, top + window_h)
+
+
+class KenBurnsResampler:
+    """
+    프레임 인덱스별 크롭 창을 미리 계산한 Ken Burns 리샘플러
+
+    사용 예:
+        resampler = KenBurnsResampler(1080, 1920, duration=5.0, fps=30, zoom_ratio=1.15)
+        clip = clip.transform(lambda gf, t: resampler(gf(t), t))
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        duration: float,
+        fps: float,
+        zoom_ratio: float = 1.15,
+        quality: str = "balanced"
+    ):
+        """
+        Args:
+            width: 프레임 너비
+            height: 프레임 높이
+            duration: 클립 길이 (초)
+            fps: 프레임 레이트 (창 테이블 간격)
+            zoom_ratio: 최종 줌 배율
+            quality: fast / balanced / high
+        """
+        if quality not in KEN_BURNS_FILTERS:
+            raise ValueError(f"지원하지 않는 Ken Burns 품질: {quality} (fast/balanced/high)")
+
+        self.size = (width, height)
+        self.fps = fps
+        self.resample = KEN_BURNS_FILTERS[quality]
+
+        num_frames = max(1, int(math.ceil(duration * fps)) + 1)
+        self._windows: List[Tuple[float, float, float, float]] = [
+            ken_burns_window(width, height, ken_burns_zoom(min(n / fps, duration), duration, zoom_ratio))
+            for n in range(num_frames)
+        ]
+
+    def __call__(self, frame: np.ndarray, t: float) -> np.ndarray:
+        """
+        프레임에 Ken Burns 줌 적용
+
+        Args:
+            frame: (H, W, 3) 프레임 (생성 시 크기와 같아야 함)
+            t: 시각 (초)
+
+        Returns:
+            줌인된 프레임 (같은 크기)
+        """
+        n = min(max(int(round(t * self.fps)), 0), len(self._windows) - 1)
+        image = Image.fromarray(frame)
+        return np.asarray(image.resize(self.size, self.resample, box=self._windows[n]))
@@ -0,0 +1,444 @@
+"""
+Media Probe Service
+미디어 파일 길이 / 샘플레이트 / 채널 / 코덱 / 해상도 / fps 조회 + 영구 색인
+
+기존에는 길이를 재기 위해 파일을 통째로 열었습니다.
+  MoviePy AudioFileClip, `ffmpeg -i ... -f null -` 전체 디코딩, 파일마다 ffprobe, pydub 전체 디코딩
+MediaProbeService는
+  - WAV: RIFF 헤더 (fmt / data 청크)
+  - MP3: ID3 태그를 건너뛴 첫 프레임 헤더 + Xing/Info/VBRI 프레임 수 (없으면 CBR 계산)
+  - 그 외 (mp4, m4a, ogg 등): `ffmpeg -i` 1회 (디코딩 없이 컨테이너 헤더만 파싱)
+만 읽고, 결과를 (경로, 크기, 수정 시각)을 키로 SQLite 색인(data/media_probe.db, MEDIA_PROBE_DB 환경변수로 변경)에 저장합니다.
+파일이 바뀌면(크기 또는 수정 시각 변경) 다시 조회합니다.
+
+사용 예:
+    probe = get_media_probe_service()
+    info = probe.probe("music/CALM/track.mp3")
+    duration = probe.duration("output/tts.wav")
+"""
+import os
+import re
+import sqlite3
+import struct
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.models import MediaInfo
+from core.services.ffmpeg_render_service import find_ffmpeg
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_INDEX_PATH = PROJECT_ROOT / "data" / "media_probe.db"
+
+# MP3 비트레이트 테이블 (kbps, Layer III) - [MPEG-1, MPEG-2/2.5]
+_MP3_BITRATES = (
+    (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0),
+    (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0),
+)
+# 버전 비트 → 샘플레이트 (00: MPEG-2.5, 10: MPEG-2, 11: MPEG-1)
+_MP3_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+# WAV fmt 코드 → 코덱 이름 (PCM / float 제외)
+_WAV_CODECS = {2: "adpcm_ms", 6: "pcm_alaw", 7: "pcm_mulaw", 17: "adpcm_ima_wav"}
+
+_CHANNEL_LAYOUTS = {"mono": 1, "stereo": 2, "2.1": 3, "quad": 4, "4.0": 4, "5.0": 5, "5.1": 6, "6.1": 7, "7.1": 8}
+
+
+def _read_wav_header(path: str, file_size: int) -> Optional[Dict]:
+    """RIFF/WAVE 헤더에서 포맷과 길이 읽기 (PCM 데이터는 읽지 않음)"""
+    with open(path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            return None
+
+        fmt = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, chunk_size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+
+            if chunk_id == b"fmt ":
+                fmt = f.read(chunk_size)
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt is None or len(fmt) < 16:
+                    return None
+                data_start = f.tell()
+                break
+            else:
+                f.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
+
+    format_tag, channels, sample_rate, _, block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if format_tag == 0xFFFE and len(fmt) >= 26:  # WAVE_FORMAT_EXTENSIBLE → 서브포맷 GUID 앞 2바이트
+        format_tag = struct.unpack("<H", fmt[24:26])[0]
+    if not sample_rate or not block_align:
+        return None
+
+    # 스트리밍으로 기록된 WAV는 data 크기가 0 / 0xFFFFFFFF일 수 있음 → 파일 끝까지
+    data_size = chunk_size
+    if data_size == 0 or data_start + data_size > file_size:
+        data_size = file_size - data_start
+
+    if format_tag == 1:
+        codec = "pcm_u8" if bits == 8 else f"pcm_s{bits}le"
+    elif format_tag == 3:
+        codec = f"pcm_f{bits}le"
+    else:
+        codec = _WAV_CODECS.get(format_tag, f"wav_0x{format_tag:04x}")
+
+    return {
+        "format": "wav",
+        "duration": (data_size // block_align) / sample_rate,
+        "audio_codec": codec,
+        "sample_rate": sample_rate,
+        "channels": channels,
+    }
+
+
+def _parse_mp3_frame_header(header: bytes) -> Optional[Dict]:
+    """MPEG 오디오 Layer III 프레임 헤더 4바이트 파싱"""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = (header[2] >> 4) & 0x0F
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[0 if mpeg1 else 1][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+    mono = ((header[3] >> 6) & 0x03) == 3
+
+    return {
+        "mpeg1": mpeg1,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "channels": 1 if mono else 2,
+        "samples_per_frame": 1152 if mpeg1 else 576,
+        "frame_length": (144 if mpeg1 else 72) * bitrate // sample_rate + padding,
+    }
+
+
+def _read_mp3_header(path: str, file_size: int) -> Optional[Dict]:
+    """MP3 첫 프레임 헤더 + Xing/Info/VBRI 헤더로 길이 계산 (오디오 프레임은 디코딩하지 않음)"""
+    with open(path, "rb") as f:
+        head = f.read(10)
+        offset = 0
+
+        # ID3v2 태그 건너뛰기 (syncsafe 크기 + 푸터 플래그)
+        while head[:3] == b"ID3" and len(head) == 10:
+            tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            offset += 10 + tag_size + (10 if head[5] & 0x10 else 0)
+            f.seek(offset)
+            head = f.read(10)
+
+        f.seek(offset)
+        buffer = f.read(64 * 1024)
+
+        # 첫 프레임 동기 찾기 (다음 프레임 헤더까지 확인해 잘못된 동기 배제)
+        frame = None
+        position = 0
+        while position < len(buffer) - 4:
+            position = buffer.find(b"\xff", position)
+            if position < 0 or position >= len(buffer) - 4:
+                break
+            frame = _parse_mp3_frame_header(buffer[position:position + 4])
+            if frame:
+                following = position + frame["frame_length"]
+                if following + 4 > len(buffer) or _parse_mp3_frame_header(buffer[following:following + 4]):
+                    break
+            frame = None
+            position += 1
+
+        if frame is None:
+            return None
+
+        audio_start = offset + position
+        f.seek(audio_start)
+        first_frame = f.read(max(frame["frame_length"], 200))
+
+        f.seek(max(0, file_size - 128))
+        has_id3v1 = f.read(3) == b"TAG"
+
+    info = {
+        "format": "mp3",
+        "audio_codec": "mp3",
+        "sample_rate": frame["sample_rate"],
+        "channels": frame["channels"],
+    }
+
+    # Xing / Info (LAME) 헤더: 사이드 정보 뒤에 위치
+    side_info = (32 if frame["channels"] == 2 else 17) if frame["mpeg1"] else (17 if frame["channels"] == 2 else 9)
+    xing_offset = 4 + side_info
+    frame_count = None
+    if first_frame[xing_offset:xing_offset + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", first_frame[xing_offset + 4:xing_offset + 8])[0]
+        if flags & 0x01:
+            frame_count = struct.unpack(">I", first_frame[xing_offset + 8:xing_offset + 12])[0]
+    elif first_frame[36:40] == b"VBRI":
+        frame_count = struct.unpack(">I", first_frame[50:54])[0]
+
+    if frame_count:
+        info["duration"] = frame_count * frame["samples_per_frame"] / frame["sample_rate"]
+    else:
+        # CBR: 오디오 바이트 수 / 비트레이트 (ffmpeg 추정 방식과 동일)
+        audio_bytes = file_size - audio_start - (128 if has_id3v1 else 0)
+        info["duration"] = max(0, audio_bytes) * 8 / frame["bitrate"]
+
+    return info
+
+
+def _parse_ffmpeg_stderr(text: str) -> Optional[Dict]:
+    """`ffmpeg -i` 출력(컨테이너 헤더 정보)에서 메타데이터 파싱"""
+    input_match = re.search(r"Input #0, ([^,\s]+)", text)
+    if not input_match:
+        return None
+
+    info: Dict = {"format": input_match.group(1), "duration": 0.0}
+
+    duration_match = re.search(r"Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)", text)
+    if duration_match:
+        hours, minutes, seconds = duration_match.groups()
+        info["duration"] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    video_match = re.search(r"Stream #0:\d+.*?: Video: (\w+)(.*)", text)
+    if video_match:
+        info["video_codec"] = video_match.group(1)
+        details = video_match.group(2)
+        size_match = re.search(r", (\d{2,5})x(\d{2,5})", details)
+        if size_match:
+            width, height = int(size_match.group(1)), int(size_match.group(2))
+            rotation_match = re.search(r"rotat\w* (?:of |: ?)(-?\d+(?:\.\d+)?)", text)
+            if rotation_match and abs(round(float(rotation_match.group(1)))) % 180 == 90:
+                width, height = height, width
+            info["width"], info["height"] = width, height
+        fps_match = re.search(r", (\d+(?:\.\d+)?)(k?) (?:fps|tbr)", details)
+        if fps_match:
+            info["fps"] = float(fps_match.group(1)) * (1000 if fps_match.group(2) else 1)
+
+    audio_match = re.search(r"Stream #0:\d+.*?: Audio: (\w+)(.*)", text)
+    if audio_match:
+        info["audio_codec"] = audio_match.group(1)
+        details = audio_match.group(2)
+        rate_match = re.search(r"(\d+) Hz", details)
+        if rate_match:
+            info["sample_rate"] = int(rate_match.group(1))
+        layout_match = re.search(r"Hz, ([^,]+)", details)
+        if layout_match:
+            layout = layout_match.group(1).strip()
+            channels_match = re.match(r"(\d+) channels", layout)
+            if channels_match:
+                info["channels"] = int(channels_match.group(1))
+            else:
+                info["channels"] = _CHANNEL_LAYOUTS.get(layout.split("(")[0])
+
+    return info
+
+
+class MediaProbeService:
+    """
+    미디어 메타데이터 조회 + (경로, 크기, 수정 시각) 키 영구 색인
+
+    - probe: 색인 hit이면 파일을 열지 않고 반환, miss면 헤더만 읽고 색인에 기록
+    - probe_many: 여러 파일을 한 번의 색인 조회/기록으로 처리 (BGM 목록 등)
+    """
+
+    def __init__(self, index_path: Optional[str] = None, ffmpeg_cmd: Optional[str] = None):
+        """
+        Args:
+            index_path: SQLite 색인 파일 경로 (None이면 MEDIA_PROBE_DB 환경변수 또는 data/media_probe.db, ":memory:" 가능)
+            ffmpeg_cmd: ffmpeg 실행 파일 (None이면 자동 탐색, 헤더 파서가 없는 형식에만 사용)
+        """
+        self.index_path = str(index_path or os.getenv("MEDIA_PROBE_DB") or DEFAULT_INDEX_PATH)
+        self.ffmpeg_cmd = ffmpeg_cmd
+        self._lock = threading.Lock()
+
+        if self.index_path != ":memory:":
+            Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS media_probe (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                info TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        # 통계 (색인 hit / 실제 조회 수)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[str, int, int]]:
+        """(절대 경로, 크기, 수정 시각 ns) 또는 None (파일 없음)"""
+        try:
+            absolute = os.path.abspath(str(path))
+            stat = os.stat(absolute)
+        except OSError:
+            return None
+        return absolute, stat.st_size, stat.st_mtime_ns
+
+    def _read_headers(self, path: str, size: int) -> Optional[Dict]:
+        """형식별 헤더 파서 → 실패 시 ffmpeg -i 헤더 파싱"""
+        suffix = Path(path).suffix.lower()
+        try:
+            if suffix == ".wav":
+                info = _read_wav_header(path, size)
+                if info:
+                    return info
+            elif suffix == ".mp3":
+                info = _read_mp3_header(path, size)
+                if info:
+                    return info
+        except (OSError, struct.error) as e:
+            print(f"[MediaProbe] 헤더 파싱 실패, ffmpeg로 재시도: {path} - {e}")
+
+        return self._probe_with_ffmpeg(path)
+
+    def _probe_with_ffmpeg(self, path: str) -> Optional[Dict]:
+        """`ffmpeg -i` 1회 실행 (출력 없이 컨테이너 헤더만 읽음)"""
+        ffmpeg_cmd = self.ffmpeg_cmd or find_ffmpeg()
+        if not ffmpeg_cmd:
+            print(f"[MediaProbe] ffmpeg를 찾을 수 없어 조회 불가: {path}")
+            return None
+
+        try:
+            result = subprocess.run(
+                [ffmpeg_cmd, "-hide_banner", "-i", path],
+                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                timeout=30
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"[MediaProbe] ffmpeg 실행 실패: {path} - {e}")
+            return None
+
+        return _parse_ffmpeg_stderr(result.stderr.decode("utf-8", errors="ignore"))
+
+    def probe_many(self, paths: Iterable[str]) -> Dict[str, Optional[MediaInfo]]:
+        """
+        여러 파일 메타데이터 조회 (색인 조회 1회 + 누락 파일만 헤더 파싱 + 색인 기록 1회)
+
+        Args:
+            paths: 파일 경로 목록
+
+        Returns:
+            {입력 경로: MediaInfo 또는 None (파일 없음 / 조회 실패)}
+        """
+        paths = [str(p) for p in paths]
+        stats = {p: self._stat(p) for p in paths}
+        keys = [s[0] for s in stats.values() if s]
+
+        cached: Dict[str, MediaInfo] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT path, size, mtime_ns, info FROM media_probe WHERE path IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for path, size, mtime_ns, info in rows:
+                    cached[path] = (size, mtime_ns, info)
+
+        results: Dict[str, Optional[MediaInfo]] = {}
+        fresh: List[MediaInfo] = []
+        for original, stat in stats.items():
+            if stat is None:
+                results[original] = None
+                continue
+
+            absolute, size, mtime_ns = stat
+            row = cached.get(absolute)
+            if row and row[0] == size and row[1] == mtime_ns:
+                results[original] = MediaInfo.model_validate_json(row[2])
+                self.hits += 1
+                continue
+
+            self.misses += 1
+            headers = self._read_headers(absolute, size)
+            if headers is None:
+                results[original] = None
+                continue
+
+            info = MediaInfo(path=absolute, size=size, mtime_ns=mtime_ns, **headers)
+            results[original] = info
+            fresh.append(info)
+
+        if fresh:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO media_probe (path, size, mtime_ns, info) VALUES (?, ?, ?, ?)",
+                    [(i.path, i.size, i.mtime_ns, i.model_dump_json()) for i in fresh]
+                )
+                self._conn.commit()
+
+        return results
+
+    def probe(self, path: str) -> Optional[MediaInfo]:
+        """
+        파일 메타데이터 조회
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            MediaInfo 또는 None (파일 없음 / 조회 실패)
+        """
+        return self.probe_many([path])[str(path)]
+
+    def duration(self, path: str, default: Optional[float] = None) -> Optional[float]:
+        """
+        파일 길이 (초)
+
+        Args:
+            path: 파일 경로
+            default: 조회 실패 시 반환값
+
+        Returns:
+            길이 (초) 또는 default
+        """
+        info = self.probe(path)
+        return info.duration if info else default
+
+    def forget(self, path: str) -> None:
+        """색인에서 경로 제거 (파일 삭제 시)"""
+        stat = self._stat(path)
+        absolute = stat[0] if stat else os.path.abspath(str(path))
+        with self._lock:
+            self._conn.execute("DELETE FROM media_probe WHERE path = ?", (absolute,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """색인 연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+# 싱글톤 인스턴스
+_media_probe_service = None
+_media_probe_lock = threading.Lock()
+
+
+def get_media_probe_service() -> MediaProbeService:
+    """MediaProbeService 싱글톤 인스턴스 반환"""
+    global _media_probe_service
+    with _media_probe_lock:
+        if _media_probe_service is None:
+            _media_probe_service = MediaProbeService()
+    return _media_probe_service
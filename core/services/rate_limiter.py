@@ -0,0 +1,142 @@
+"""
+Rate Limiter
+외부 API 제공자별 동시 요청 수 제한 + 토큰 버킷 속도 제한
+
+여러 스레드(세그먼트별 TTS 동시 생성, 동시에 실행되는 작업)가 같은 제공자를 호출해도
+프로세스 전체에서 제공자별 한도를 지키도록 제공자 이름별 싱글톤 리미터를 사용합니다.
+
+사용 예:
+    with get_provider_limiter("elevenlabs"):
+        response = client.text_to_speech.convert(...)
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+
+# 제공자별 기본 한도 (max_concurrency: 동시 요청 수, rate: 초당 요청 수, burst: 순간 최대 요청 수)
+PROVIDER_LIMITS: Dict[str, Dict[str, float]] = {
+    "elevenlabs": {"max_concurrency": 3, "rate": 2.0, "burst": 3},
+    "typecast": {"max_concurrency": 2, "rate": 1.0, "burst": 2},
+    "gtts": {"max_concurrency": 4, "rate": 3.0, "burst": 4},
+    "pexels": {"max_concurrency": 4, "rate": 5.0, "burst": 8},
+    "pixabay": {"max_concurrency": 4, "rate": 1.5, "burst": 5},  # 60초당 100회
+    # 스톡 검색/다운로드 전체 동시 요청 상한 (제공자 구분 없음, 속도 제한 없음)
+    "stock": {"max_concurrency": 6, "rate": 0.0, "burst": 6},
+}
+
+DEFAULT_LIMIT = {"max_concurrency": 2, "rate": 1.0, "burst": 2}
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (초당 rate개 충전, 최대 capacity개 보관)
+
+    acquire()는 토큰이 생길 때까지 잠금 밖에서 대기하므로 다른 스레드를 막지 않습니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: 초당 충전 토큰 수 (0 이하면 제한 없음)
+            capacity: 최대 토큰 수 (순간 허용 요청 수)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰 충전"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 가져올 때까지 대기
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+class ProviderLimiter:
+    """
+    제공자별 동시 요청 수(세마포어) + 요청 속도(토큰 버킷) 제한
+
+    with 블록 동안 동시 요청 슬롯 하나를 점유합니다.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, rate: float, burst: float):
+        """
+        Args:
+            name: 제공자 이름
+            max_concurrency: 최대 동시 요청 수
+            rate: 초당 요청 수
+            burst: 순간 최대 요청 수
+        """
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self.bucket = TokenBucket(rate, burst)
+
+    def __enter__(self) -> "ProviderLimiter":
+        self._semaphore.acquire()
+        try:
+            waited = self.bucket.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        if waited > 0.05:
+            print(f"[RateLimiter] {self.name}: 속도 제한으로 {waited:.2f}초 대기")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._semaphore.release()
+
+
+# 제공자별 싱글톤 인스턴스
+_provider_limiters: Dict[str, ProviderLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_provider_limiter(provider: str, limits: Optional[Dict[str, float]] = None) -> ProviderLimiter:
+    """
+    제공자별 ProviderLimiter 싱글톤 인스턴스 반환
+
+    Args:
+        provider: 제공자 이름 (elevenlabs, typecast, gtts 등)
+        limits: 처음 생성할 때 사용할 한도 (None이면 PROVIDER_LIMITS 또는 기본값)
+
+    Returns:
+        ProviderLimiter
+    """
+    with _registry_lock:
+        if provider not in _provider_limiters:
+            config = limits or PROVIDER_LIMITS.get(provider, DEFAULT_LIMIT)
+            _provider_limiters[provider] = ProviderLimiter(
+                provider,
+                max_concurrency=config["max_concurrency"],
+                rate=config["rate"],
+                burst=config["burst"]
+            )
+        return _provider_limiters[provider]
@@ -0,0 +1,157 @@
+"""
+Stock Video Rendition Selection
+출력 화면을 업스케일 없이 채우는 가장 작은 스톡 영상 렌디션 선택
+
+Pexels / Pixabay는 같은 영상을 여러 해상도(렌디션)로 제공합니다.
+기존에는 Pexels는 quality에 "hd"가 들어간 첫 파일(4K/2560 폭인 경우가 많음),
+Pixabay는 large를 받아서 1080x960 밴드에 쓰기 위해 수백 MB를 내려받고 매 프레임 축소했습니다.
+
+렌디션 선택 기준:
+  1. 출력 배치(LayoutGeometry)의 크롭을 거친 뒤에도 밴드를 채우는 렌디션 중 픽셀 수(→ 파일 크기)가 가장 작은 것
+  2. 채우는 렌디션이 없으면 가장 큰 렌디션
+프리뷰 작업은 목표 크기를 PREVIEW_SCALE배로 줄여 더 작은 렌디션을 받습니다.
+
+사용 예:
+    target = render_target((1080, 1920), VideoFormat.SHORTS)   # (1080, 1920)
+    chosen = select_rendition([{"url": ..., "width": 3840, "height": 2160}, ...], target)
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config import CANVAS_WIDTH, CANVAS_HEIGHT
+from core.models import LayoutGeometry, StockVideoAsset, VideoFormat
+
+
+# 프리뷰 렌더링은 절반 크기 원본으로 충분 (결과물도 저해상도)
+PREVIEW_SCALE = 0.5
+
+# 렌디션 정보가 없을 때 목표 크기 (쇼츠 기본 출력)
+DEFAULT_TARGET = (CANVAS_WIDTH, CANVAS_HEIGHT)
+
+
+def plan_layout_geometry(resolution: Tuple[int, int], video_format: VideoFormat) -> LayoutGeometry:
+    """
+    포맷별 최종 화면 배치 계획 (편집기와 에셋 수집이 공유)
+
+    - SHORTS: 1080x1920 캔버스의 중앙 1/2 밴드 (상/하단 1/4은 제목/검은 배경)
+    - LANDSCAPE / SQUARE: resolution 전체
+
+    쇼츠 크롭 비율은 출력 해상도 → 중앙 밴드 순서의 중앙 크롭을 하나로 합친 것입니다.
+
+    Args:
+        resolution: 출력 해상도 (width, height)
+        video_format: 영상 포맷
+
+    Returns:
+        LayoutGeometry
+    """
+    width, height = resolution
+
+    if video_format == VideoFormat.SHORTS:
+        top_height = CANVAS_HEIGHT // 4
+        band_size = (CANVAS_WIDTH, CANVAS_HEIGHT // 2)
+        return LayoutGeometry(
+            canvas_size=(CANVAS_WIDTH, CANVAS_HEIGHT),
+            band_size=band_size,
+            band_position=(0, top_height),
+            crop_ratios=[width / height, band_size[0] / band_size[1]]
+        )
+
+    return LayoutGeometry(
+        canvas_size=(width, height),
+        band_size=(width, height),
+        band_position=(0, 0),
+        crop_ratios=[width / height]
+    )
+
+
+def render_target(
+    resolution: Tuple[int, int],
+    video_format: VideoFormat,
+    preview: bool = False
+) -> Tuple[int, int]:
+    """
+    스톡 영상 렌디션이 채워야 하는 최소 원본 크기
+
+    Args:
+        resolution: EditConfig.resolution (width, height)
+        video_format: 영상 포맷
+        preview: 프리뷰 작업 여부 (True면 PREVIEW_SCALE배)
+
+    Returns:
+        (width, height)
+    """
+    width, height = plan_layout_geometry(resolution, video_format).required_source_size()
+    if preview:
+        width, height = int(width * PREVIEW_SCALE), int(height * PREVIEW_SCALE)
+    return (width, height)
+
+
+def orientation_of(size: Tuple[int, int]) -> str:
+    """
+    크기의 방향 ("portrait" | "landscape" | "square", Pexels orientation 파라미터 값)
+
+    Args:
+        size: (width, height)
+
+    Returns:
+        방향 문자열
+    """
+    width, height = size
+    if width == height:
+        return "square"
+    return "portrait" if height > width else "landscape"
+
+
+def covers(width: int, height: int, target: Tuple[int, int]) -> bool:
+    """
+    렌디션이 목표 크기를 업스케일 없이 채우는지 여부
+
+    중앙 크롭은 한쪽 축만 줄이므로 양 축이 목표 이상이면 크롭 후에도 목표를 채웁니다.
+    """
+    return width >= target[0] and height >= target[1]
+
+
+def select_rendition(
+    candidates: List[Dict[str, Any]],
+    target: Optional[Tuple[int, int]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    목표 크기를 채우는 가장 작은 렌디션 선택
+
+    Args:
+        candidates: 렌디션 dict 리스트 (url, width, height 필수 / fps, size 선택)
+        target: 목표 원본 크기 (None이면 DEFAULT_TARGET)
+
+    Returns:
+        선택한 렌디션 dict 또는 None (사용 가능한 후보 없음)
+    """
+    target = target or DEFAULT_TARGET
+    usable = [c for c in candidates if c.get("url") and c.get("width") and c.get("height")]
+    if not usable:
+        return None
+
+    def weight(candidate: Dict[str, Any]) -> Tuple[int, int]:
+        return (candidate["width"] * candidate["height"], candidate.get("size") or 0)
+
+    covering = [c for c in usable if covers(c["width"], c["height"], target)]
+    if covering:
+        return min(covering, key=weight)
+    return max(usable, key=weight)
+
+
+def rendition_filename(asset: StockVideoAsset) -> str:
+    """
+    렌디션별 다운로드 파일명
+
+    같은 영상이라도 프리뷰(작은 렌디션)와 본 렌더링(큰 렌디션) 파일이 서로 덮어쓰지 않도록
+    크기를 알면 파일명에 포함합니다.
+
+    Args:
+        asset: StockVideoAsset
+
+    Returns:
+        파일명 (예: pexels_123_1080x1920.mp4, 크기를 모르면 pexels_123.mp4)
+    """
+    if asset.width and asset.height:
+        return f"{asset.id}_{asset.width}x{asset.height}.mp4"
+    return f"{asset.id}.mp4"
@@ -0,0 +1,112 @@
+"""
+Static Layer
+변하지 않는 레이어(검은 배경 바, 제목)를 한 장의 배경으로 미리 합성하는 레이아웃
+
+쇼츠 레이아웃은 상단 바 / 중앙 영상 / 하단 바 / 전체 캔버스 제목 4개 레이어를
+매 프레임 합성했지만, 영상을 제외한 3개는 처음부터 끝까지 같습니다.
+FlattenedLayout은 정적 레이어를 배경 한 장으로 래스터화해 두고, 프레임마다
+배경 복사 → 영상 밴드 붙여넣기 → (밴드와 겹치는 오버레이 부분만) 블렌딩을 수행합니다.
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from core.services.subtitle_track import TrackSprite
+
+
+class FlattenedLayout:
+    """
+    정적 배경 + 움직이는 영상 밴드 레이아웃
+
+    사용 예:
+        layout = FlattenedLayout((1080, 1920), (0, 480, 1080, 960), overlays=[title_rgba])
+        clip = layout.apply(middle_video, duration, VideoClip)
+    """
+
+    def __init__(
+        self,
+        canvas_size: Tuple[int, int],
+        band_rect: Tuple[int, int, int, int],
+        overlays: Optional[List[np.ndarray]] = None,
+        background_color: Tuple[int, int, int] = (0, 0, 0)
+    ):
+        """
+        Args:
+            canvas_size: 캔버스 크기 (width, height)
+            band_rect: 영상이 보이는 영역 (x, y, width, height)
+            overlays: 영상 위에 올라갈 정적 RGBA 이미지 (캔버스 크기, 좌상단 (0, 0) 기준)
+            background_color: 배경 색 (RGB)
+        """
+        canvas_w, canvas_h = canvas_size
+        self.canvas_size = canvas_size
+        self.band_rect = band_rect
+
+        # 1. 정적 배경: 배경 색 + 오버레이 전체를 한 번만 합성
+        self.background = np.empty((canvas_h, canvas_w, 3), dtype=np.uint8)
+        self.background[:] = background_color
+
+        band_x, band_y, band_w, band_h = band_rect
+        self.band_overlays: List[TrackSprite] = []
+
+        for overlay in overlays or []:
+            rgba = np.asarray(overlay)
+            sprite = TrackSprite.from_image(rgba)
+            if sprite is None:
+                continue
+            sprite.blend_into(self.background)
+
+            # 2. 영상 밴드와 겹치는 부분만 따로 보관 (영상 위에 다시 블렌딩)
+            band_part = TrackSprite.from_image(
+                rgba[band_y:band_y + band_h, band_x:band_x + band_w],
+                band_x,
+                band_y
+            )
+            if band_part is not None:
+                self.band_overlays.append(band_part)
+
+    def compose(self, band_frame: np.ndarray) -> np.ndarray:
+        """
+        영상 밴드 프레임을 배경에 합성
+
+        Args:
+            band_frame: (band_h, band_w, 3) 영상 프레임
+
+        Returns:
+            (canvas_h, canvas_w, 3) 캔버스 프레임
+        """
+        band_x, band_y, band_w, band_h = self.band_rect
+
+        frame = self.background.copy()
+        frame[band_y:band_y + band_h, band_x:band_x + band_w] = band_frame[:band_h, :band_w, :3]
+
+        for sprite in self.band_overlays:
+            sprite.blend_into(frame)
+
+        return frame
+
+    def apply(self, band_clip, duration: float, video_clip_class):
+        """
+        밴드 클립을 캔버스 크기 클립으로 변환 (프레임당 블렌딩 1회)
+
+        Args:
+            band_clip: 밴드 크기의 MoviePy 클립
+            duration: 결과 길이 (초)
+            video_clip_class: MoviePy VideoClip 클래스
+
+        Returns:
+            캔버스 크기 VideoClip
+        """
+        band_end = band_clip.duration
+
+        def frame_function(t):
+            # 밴드 영상이 더 짧으면 마지막 프레임 유지
+            if band_end is not None and t >= band_end:
+                t = max(0.0, band_end - 1e-3)
+            return self.compose(band_clip.get_frame(t))
+
+        composed = video_clip_class(frame_function, duration=duration)
+        if getattr(band_clip, "fps", None):
+            composed = composed.with_fps(band_clip.fps)
+        if getattr(band_clip, "audio", None) is not None:
+            composed = composed.with_audio(band_clip.audio)
+        return composed
@@ -0,0 +1,325 @@
+"""
+Stock Search Cache
+스톡 영상 검색 결과 캐시 (SQLite 색인 + 제공자별 TTL + negative entry)
+
+기존 캐시(downloads/cache/<md5>.json)는 검색어별로 다운로드한 영상 하나만 기억해서
+결과가 없던 검색어나 캐시 miss마다 Pexels → Pixabay(+ 자체 fallback 검색)를 다시 호출했습니다.
+StockSearchCache는 (제공자, 정규화된 검색어, 방향, 필터) 단위로 결과 목록 전체를
+data/stock_search.db 하나에 저장합니다.
+
+- 제공자별 TTL (config.STOCK_SEARCH_TTL_HOURS), 만료된 항목은 조회되지 않음
+- 결과가 0개인 검색도 저장 (negative entry, 더 짧은 TTL)
+- get_many: 기획의 모든 세그먼트 검색을 SQL 한 번으로 조회
+
+사용 예:
+    cache = get_stock_search_cache()
+    hit = cache.get("pexels", "happy dog", "portrait", {"per_page": 3})
+    if hit is None:
+        assets = provider.search_videos("happy dog", ...)
+        cache.put("pexels", "happy dog", "portrait", {"per_page": 3}, assets)
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.config import STOCK_SEARCH_TTL_HOURS, STOCK_SEARCH_NEGATIVE_TTL_HOURS
+from core.models import StockVideoAsset
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_INDEX_PATH = PROJECT_ROOT / "data" / "stock_search.db"
+
+# TTL 설정이 없는 제공자 기본값 (시간)
+DEFAULT_TTL_HOURS = 24.0
+
+# (제공자, 검색어, 방향, 필터)
+SearchSpec = Tuple[str, str, Optional[str], Optional[Dict[str, Any]]]
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (NFC + 소문자 + 연속 공백 하나로 + 앞뒤 공백 제거)"""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", query)).strip().lower()
+
+
+def make_search_key(
+    provider: str,
+    query: str,
+    orientation: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    검색 캐시 키 생성 (전체 sha256 hex)
+
+    Args:
+        provider: 제공자 이름 (pexels, pixabay)
+        query: 검색어 (정규화 후 사용)
+        orientation: 검색 방향 파라미터
+        filters: 결과에 영향을 주는 나머지 파라미터 (per_page, 최소 해상도, 렌디션 목표 크기 등)
+
+    Returns:
+        64자리 hex 키
+    """
+    payload = {
+        "provider": provider,
+        "query": normalize_query(query),
+        "orientation": orientation,
+        "filters": filters or {},
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class StockSearchCache:
+    """
+    스톡 검색 결과 캐시
+
+    - get / put: 검색 하나 조회 / 저장 (miss면 None, negative entry면 빈 리스트)
+    - get_many: 여러 검색을 한 번에 조회
+    - purge_expired / stats / clear
+    """
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        ttl_hours: Optional[Dict[str, float]] = None,
+        negative_ttl_hours: Optional[float] = None
+    ):
+        """
+        Args:
+            index_path: SQLite 파일 경로 (None이면 data/stock_search.db, ":memory:" 가능)
+            ttl_hours: 제공자별 유지 시간 (None이면 config.STOCK_SEARCH_TTL_HOURS)
+            negative_ttl_hours: 결과 없는 검색 유지 시간 (None이면 config.STOCK_SEARCH_NEGATIVE_TTL_HOURS)
+        """
+        self.index_path = str(index_path or DEFAULT_INDEX_PATH)
+        if self.index_path != ":memory:":
+            Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_hours = dict(STOCK_SEARCH_TTL_HOURS if ttl_hours is None else ttl_hours)
+        self.negative_ttl_hours = (
+            STOCK_SEARCH_NEGATIVE_TTL_HOURS if negative_ttl_hours is None else negative_ttl_hours
+        )
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.index_path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS stock_search (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                query TEXT NOT NULL,
+                orientation TEXT,
+                filters TEXT NOT NULL,
+                results TEXT NOT NULL,
+                result_count INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_stock_search_expires ON stock_search (expires_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_stock_search_query ON stock_search (provider, query)")
+        self._conn.commit()
+
+        # 프로세스 단위 통계
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def ttl_seconds(self, provider: str, negative: bool = False) -> float:
+        """제공자 / 결과 유무별 유지 시간 (초)"""
+        hours = self.negative_ttl_hours if negative else self.ttl_hours.get(provider, DEFAULT_TTL_HOURS)
+        return hours * 3600
+
+    def get(
+        self,
+        provider: str,
+        query: str,
+        orientation: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[StockVideoAsset]]:
+        """
+        검색 결과 조회
+
+        Args:
+            provider: 제공자 이름
+            query: 검색어
+            orientation: 검색 방향
+            filters: 나머지 검색 파라미터
+
+        Returns:
+            StockVideoAsset 리스트 (negative entry면 빈 리스트) 또는 None (miss / 만료)
+        """
+        key = make_search_key(provider, query, orientation, filters)
+        return self._lookup([key]).get(key)
+
+    def get_many(self, specs: Iterable[SearchSpec]) -> Dict[str, List[StockVideoAsset]]:
+        """
+        여러 검색을 한 번에 조회 (기획의 모든 세그먼트 × 제공자)
+
+        Args:
+            specs: (제공자, 검색어, 방향, 필터) 목록
+
+        Returns:
+            {make_search_key: StockVideoAsset 리스트} (hit만 포함, negative entry는 빈 리스트)
+        """
+        return self._lookup(list(dict.fromkeys(make_search_key(*spec) for spec in specs)))
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[StockVideoAsset]]:
+        """만료되지 않은 항목을 키 목록으로 조회 (통계 갱신)"""
+        if not keys:
+            return {}
+
+        found: Dict[str, List[StockVideoAsset]] = {}
+        now = time.time()
+        with self._lock:
+            # SQLite 변수 개수 제한(기본 999) 안에서 나눠 조회
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, results FROM stock_search WHERE key IN ({placeholders}) AND expires_at > ?",
+                    (*batch, now)
+                ).fetchall()
+                for key, results in rows:
+                    found[key] = [StockVideoAsset(**item) for item in json.loads(results)]
+
+            negative = sum(1 for assets in found.values() if not assets)
+            self.hits += len(found) - negative
+            self.negative_hits += negative
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def put(
+        self,
+        provider: str,
+        query: str,
+        orientation: Optional[str],
+        filters: Optional[Dict[str, Any]],
+        assets: List[StockVideoAsset]
+    ) -> None:
+        """
+        검색 결과 저장 (빈 결과는 negative entry로 짧게 유지)
+
+        다운로드 상태(local_path / downloaded)는 저장하지 않습니다.
+
+        Args:
+            provider: 제공자 이름
+            query: 검색어
+            orientation: 검색 방향
+            filters: 나머지 검색 파라미터
+            assets: 검색 결과
+        """
+        results = [
+            asset.model_dump(exclude={"local_path", "downloaded"})
+            for asset in assets
+        ]
+        now = time.time()
+        expires_at = now + self.ttl_seconds(provider, negative=not results)
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO stock_search
+                    (key, provider, query, orientation, filters, results, result_count, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    make_search_key(provider, query, orientation, filters),
+                    provider,
+                    normalize_query(query),
+                    orientation,
+                    json.dumps(filters or {}, sort_keys=True),
+                    json.dumps(results, ensure_ascii=False),
+                    len(results),
+                    now,
+                    expires_at,
+                )
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        만료된 항목 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM stock_search WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            {"entries", "negative_entries", "expired", "hits", "negative_hits", "misses", "hit_rate",
+             "by_provider"} dict
+        """
+        now = time.time()
+        with self._lock:
+            entries, negative_entries, expired = self._conn.execute(
+                """
+                SELECT COUNT(*),
+                       COALESCE(SUM(result_count = 0), 0),
+                       COALESCE(SUM(expires_at <= ?), 0)
+                FROM stock_search
+                """,
+                (now,)
+            ).fetchone()
+            by_provider = {
+                provider: count
+                for provider, count in self._conn.execute(
+                    "SELECT provider, COUNT(*) FROM stock_search GROUP BY provider"
+                )
+            }
+
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "entries": entries,
+            "negative_entries": negative_entries,
+            "expired": expired,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+            "by_provider": by_provider,
+        }
+
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM stock_search")
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """색인 연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+# 싱글톤 인스턴스
+_stock_search_cache = None
+_stock_search_cache_lock = threading.Lock()
+
+
+def get_stock_search_cache() -> StockSearchCache:
+    """StockSearchCache 싱글톤 인스턴스 반환"""
+    global _stock_search_cache
+    with _stock_search_cache_lock:
+        if _stock_search_cache is None:
+            _stock_search_cache = StockSearchCache()
+    return _stock_search_cache
@@ -0,0 +1,389 @@
+"""
+Storage GC
+다운로드 / 오디오 / 출력 디렉토리 용량 관리 (디렉토리별 용량 상한 + 보관 기간 + 디스크 여유 공간)
+
+downloads/stock_videos, downloads/audio, downloads/cache, output/, output/preview/는 계속 커지기만 했고
+정리 수단은 전부 지우는 AssetManager.clear_cache뿐이었습니다.
+StorageGC는 디렉토리별 정책(config.STORAGE_GC_POLICIES)에 따라
+
+  1. 보관 기간(max_age_days)이 지난 파일 삭제 (마지막 사용 = max(atime, mtime))
+  2. 남은 크기가 상한(max_bytes)을 넘으면 오래 쓰지 않은 파일부터 상한의 LOW_WATERMARK까지 삭제
+  3. 디스크 여유 공간이 STORAGE_GC_MIN_FREE_GB보다 적으면 같은 디스크의 모든 정책에서 LRU로 추가 삭제
+
+합니다. 다음 파일은 어떤 경우에도 삭제하지 않습니다.
+  - 참조 중인 파일: 참조 소스(Draft / DraftSegment, 진행 중인 작업, 프리뷰 작업 — backend가 등록)와
+    pin()으로 고정한 파일 (진행 중인 파이프라인의 에셋)
+  - 유예 시간(STORAGE_GC_GRACE_MINUTES) 안에 수정된 파일 (아직 참조로 기록되기 전인 다운로드 / 렌더링)
+
+사용 예:
+    gc = get_storage_gc()
+    with gc.pinned(job_id, bundle_paths(asset_bundle)):
+        editor.create_video(...)
+    report = gc.collect(dry_run=True)
+"""
+import fnmatch
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from core.config import (
+    PROJECT_ROOT,
+    STORAGE_GC_POLICIES,
+    STORAGE_GC_GRACE_MINUTES,
+    STORAGE_GC_MIN_FREE_GB,
+)
+from core.models import AssetBundle
+
+
+def bundle_paths(bundle: Optional[AssetBundle]) -> List[str]:
+    """
+    에셋 번들이 사용하는 로컬 파일 경로 (영상, 마스터 오디오, 세그먼트 TTS, BGM)
+
+    Args:
+        bundle: AssetBundle
+
+    Returns:
+        경로 리스트
+    """
+    if bundle is None:
+        return []
+    paths = [video.local_path for video in bundle.videos]
+    if bundle.audio:
+        paths.append(bundle.audio.local_path)
+    if bundle.bgm:
+        paths.append(bundle.bgm.local_path)
+    paths.append(bundle.background_music)
+    paths.extend(timing.tts_local_path for timing in bundle.segment_timings)
+    return [path for path in paths if path]
+
+
+def normalize_path(path: str) -> Set[str]:
+    """
+    참조 비교용 절대 경로 (상대 경로는 작업 디렉토리 / 프로젝트 루트 기준 둘 다)
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        정규화된 경로 집합
+    """
+    normalized = {os.path.realpath(path)}
+    if not os.path.isabs(path):
+        normalized.add(os.path.realpath(PROJECT_ROOT / path))
+    return normalized
+
+
+class StorageGC:
+    """
+    저장 공간 GC
+
+    - pin / unpin / pinned: 진행 중인 작업의 파일 고정
+    - add_reference_source: 참조 경로를 돌려주는 함수 등록 (DB의 Draft 등)
+    - collect: 정책에 따라 삭제 (dry_run이면 삭제 대상 보고만)
+    """
+
+    # 용량 상한을 넘으면 상한의 90%까지 줄임 (매 실행마다 조금씩 지우는 것 방지)
+    LOW_WATERMARK = 0.9
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, Dict[str, Any]]] = None,
+        grace_seconds: Optional[float] = None,
+        min_free_bytes: Optional[int] = None
+    ):
+        """
+        Args:
+            policies: {이름: {"path", "max_bytes", "max_age_days", "patterns"?, "exclude"?}}
+                      (None이면 config.STORAGE_GC_POLICIES)
+            grace_seconds: 최근 수정 파일 보호 시간 (None이면 config.STORAGE_GC_GRACE_MINUTES)
+            min_free_bytes: 디스크 최소 여유 공간 (None이면 config.STORAGE_GC_MIN_FREE_GB, 0이면 검사 안 함)
+        """
+        self.policies = dict(STORAGE_GC_POLICIES if policies is None else policies)
+        self.grace_seconds = STORAGE_GC_GRACE_MINUTES * 60 if grace_seconds is None else grace_seconds
+        self.min_free_bytes = (
+            int(STORAGE_GC_MIN_FREE_GB * 1024 ** 3) if min_free_bytes is None else min_free_bytes
+        )
+
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._pins: Dict[str, Set[str]] = {}
+        self._sources: Dict[str, Callable[[], Iterable[str]]] = {}
+
+    # ---------- 참조 ----------
+
+    def pin(self, owner: str, paths: Iterable[str]) -> None:
+        """
+        파일 고정 (같은 owner로 다시 호출하면 추가)
+
+        Args:
+            owner: 고정 주체 (작업 ID 등)
+            paths: 파일 경로 목록
+        """
+        normalized = set()
+        for path in paths:
+            if path:
+                normalized |= normalize_path(path)
+        with self._lock:
+            self._pins.setdefault(owner, set()).update(normalized)
+
+    def unpin(self, owner: str) -> None:
+        """owner가 고정한 파일 전부 해제"""
+        with self._lock:
+            self._pins.pop(owner, None)
+
+    @contextmanager
+    def pinned(self, owner: str, paths: Iterable[str]) -> Iterator[None]:
+        """블록 안에서만 파일 고정"""
+        self.pin(owner, paths)
+        try:
+            yield
+        finally:
+            self.unpin(owner)
+
+    def add_reference_source(self, name: str, source: Callable[[], Iterable[str]]) -> None:
+        """
+        참조 소스 등록 (GC 실행마다 호출, 같은 이름이면 교체)
+
+        Args:
+            name: 소스 이름 (보고서 / 로그용)
+            source: 참조 중인 파일 경로를 돌려주는 함수
+        """
+        with self._lock:
+            self._sources[name] = source
+
+    def references(self) -> Dict[str, Set[str]]:
+        """
+        현재 참조 중인 파일 (소스별)
+
+        Returns:
+            {소스 이름 또는 "pinned": 정규화된 경로 집합}
+
+        Raises:
+            Exception: 참조 소스 실패 (참조를 모르면 삭제하면 안 되므로 GC 전체를 중단)
+        """
+        with self._lock:
+            sources = dict(self._sources)
+            pinned = set().union(*self._pins.values()) if self._pins else set()
+
+        result = {"pinned": pinned}
+        for name, source in sources.items():
+            paths = set()
+            for path in source():
+                if path:
+                    paths |= normalize_path(path)
+            result[name] = paths
+        return result
+
+    def referenced_paths(self) -> Set[str]:
+        """
+        참조 중인 파일 전체 (모든 소스 + 고정 파일, 자체 LRU로 정리하는 TTS 캐시 등이 사용)
+
+        Returns:
+            정규화된 경로 집합
+
+        Raises:
+            Exception: 참조 소스 실패
+        """
+        return set().union(*self.references().values())
+
+    # ---------- 수집 ----------
+
+    def collect(self, dry_run: bool = True) -> Dict[str, Any]:
+        """
+        정책에 따라 파일 삭제
+
+        Args:
+            dry_run: True면 삭제하지 않고 삭제 대상만 보고
+
+        Returns:
+            보고서 dict
+            {"dry_run", "started_at", "elapsed", "references", "directories", "disk",
+             "deleted", "freed_bytes", "errors"}
+
+        Raises:
+            Exception: 참조 소스 실패 (아무것도 삭제하지 않음)
+        """
+        with self._run_lock:
+            started = time.time()
+            references = self.references()
+            referenced = set().union(*references.values())
+
+            directories: Dict[str, Dict[str, Any]] = {}
+            candidates: List[Dict[str, Any]] = []  # 삭제 가능한 파일 (참조 없음 + 유예 시간 지남)
+            victims: Dict[str, Dict[str, Any]] = {}
+
+            for name, policy in self.policies.items():
+                files = self._scan(name, policy)
+                summary = {
+                    "path": policy["path"],
+                    "files": len(files),
+                    "bytes": sum(f["bytes"] for f in files),
+                    "max_bytes": policy.get("max_bytes"),
+                    "max_age_days": policy.get("max_age_days"),
+                    "referenced_files": 0,
+                    "referenced_bytes": 0,
+                }
+                deletable = []
+                for f in files:
+                    if f["path"] in referenced:
+                        summary["referenced_files"] += 1
+                        summary["referenced_bytes"] += f["bytes"]
+                    elif started - f["mtime"] >= self.grace_seconds:
+                        deletable.append(f)
+                deletable.sort(key=lambda f: f["last_used"])
+                candidates.extend(deletable)
+
+                # 1. 보관 기간
+                max_age_days = policy.get("max_age_days")
+                if max_age_days:
+                    for f in deletable:
+                        if started - f["last_used"] > max_age_days * 86400:
+                            victims[f["path"]] = dict(f, reason="age")
+
+                # 2. 용량 상한 (LRU)
+                max_bytes = policy.get("max_bytes")
+                remaining = summary["bytes"] - sum(v["bytes"] for v in victims.values() if v["directory"] == name)
+                if max_bytes is not None and remaining > max_bytes:
+                    target = max_bytes * self.LOW_WATERMARK
+                    for f in deletable:
+                        if remaining <= target:
+                            break
+                        if f["path"] not in victims:
+                            victims[f["path"]] = dict(f, reason="budget")
+                            remaining -= f["bytes"]
+                summary["over_budget"] = max_bytes is not None and remaining > max_bytes
+                directories[name] = summary
+
+            # 3. 디스크 여유 공간 (디스크별, 모든 정책에서 LRU)
+            disk = self._disk_pressure(candidates, victims)
+
+            deleted, errors = [], []
+            for victim in sorted(victims.values(), key=lambda v: v["last_used"]):
+                if not dry_run:
+                    try:
+                        os.remove(victim["path"])
+                    except FileNotFoundError:
+                        continue
+                    except OSError as e:
+                        errors.append({"path": victim["path"], "error": str(e)})
+                        continue
+                deleted.append({
+                    "path": victim["path"],
+                    "directory": victim["directory"],
+                    "bytes": victim["bytes"],
+                    "reason": victim["reason"],
+                    "last_used": datetime.fromtimestamp(victim["last_used"]).isoformat(timespec="seconds"),
+                })
+
+            for name, summary in directories.items():
+                freed = sum(d["bytes"] for d in deleted if d["directory"] == name)
+                summary["deleted_files"] = sum(1 for d in deleted if d["directory"] == name)
+                summary["freed_bytes"] = freed
+                summary["bytes_after"] = summary["bytes"] - freed
+
+            freed_bytes = sum(d["bytes"] for d in deleted)
+            report = {
+                "dry_run": dry_run,
+                "started_at": datetime.fromtimestamp(started).isoformat(timespec="seconds"),
+                "elapsed": round(time.time() - started, 3),
+                "references": {name: len(paths) for name, paths in references.items()},
+                "directories": directories,
+                "disk": disk,
+                "deleted": deleted,
+                "freed_bytes": freed_bytes,
+                "errors": errors,
+            }
+
+        action = "삭제 예정" if dry_run else "삭제"
+        print(f"[StorageGC] {action}: 파일 {len(deleted)}개, {freed_bytes / 1024 ** 2:.1f}MB"
+              + (f" (오류 {len(errors)}개)" if errors else ""))
+        return report
+
+    def _scan(self, name: str, policy: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """정책 디렉토리의 파일 목록 (exclude 하위 디렉토리 / patterns 외 파일 제외, 심볼릭 링크 제외)"""
+        root = Path(policy["path"])
+        if not root.is_dir():
+            return []
+
+        patterns = policy.get("patterns")
+        exclude = set(policy.get("exclude", []))
+        files = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            if Path(dirpath) == root:
+                dirnames[:] = [d for d in dirnames if d not in exclude]
+            for filename in filenames:
+                if patterns and not any(fnmatch.fnmatch(filename, p) for p in patterns):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.lstat(path)
+                except OSError:
+                    continue
+                if not os.path.isfile(path) or os.path.islink(path):
+                    continue
+                files.append({
+                    "path": os.path.realpath(path),
+                    "directory": name,
+                    # 하드링크로 합친 중복 영상은 링크 수만큼 나눠 계산 (같은 데이터를 여러 번 세지 않음)
+                    "bytes": stat.st_size // max(1, stat.st_nlink),
+                    "mtime": stat.st_mtime,
+                    "last_used": max(stat.st_atime, stat.st_mtime),
+                    "device": stat.st_dev,
+                })
+        return files
+
+    def _disk_pressure(
+        self,
+        candidates: List[Dict[str, Any]],
+        victims: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """디스크 여유 공간이 부족하면 victims에 LRU로 추가 (디스크별 여유 공간 보고)"""
+        disk: Dict[str, Dict[str, Any]] = {}
+        seen_devices = set()
+        for policy in self.policies.values():
+            root = Path(policy["path"])
+            if not root.is_dir():
+                continue
+            device = os.stat(root).st_dev
+            if device in seen_devices:
+                continue
+            seen_devices.add(device)
+
+            usage = shutil.disk_usage(root)
+            planned = sum(v["bytes"] for v in victims.values() if v["device"] == device)
+            free_after = usage.free + planned
+            if self.min_free_bytes and free_after < self.min_free_bytes:
+                for f in sorted((c for c in candidates if c["device"] == device), key=lambda c: c["last_used"]):
+                    if free_after >= self.min_free_bytes:
+                        break
+                    if f["path"] not in victims:
+                        victims[f["path"]] = dict(f, reason="disk")
+                        free_after += f["bytes"]
+
+            disk[str(root)] = {
+                "total_bytes": usage.total,
+                "free_bytes": usage.free,
+                "free_bytes_after": free_after,
+                "min_free_bytes": self.min_free_bytes,
+                "low_space": free_after < self.min_free_bytes,
+            }
+        return disk
+
+
+# 싱글톤 인스턴스
+_storage_gc = None
+_storage_gc_lock = threading.Lock()
+
+
+def get_storage_gc() -> StorageGC:
+    """StorageGC 싱글톤 인스턴스 반환"""
+    global _storage_gc
+    with _storage_gc_lock:
+        if _storage_gc is None:
+            _storage_gc = StorageGC()
+    return _storage_gc
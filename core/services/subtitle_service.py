@@ -21,6 +21,7 @@ from core.config import (
     SUBTITLE_MAX_CHARS, SUBTITLE_MIN_DURATION, SUBTITLE_MAX_DURATION, SUBTITLE_CHAR_PER_SECOND,
     clamp_y_to_safe_zone
 )
+from core.services.word_timing import chunk_timestamps
 
 
 class SubtitleService:
@@ -101,20 +102,23 @@ class SubtitleService:
 
         return (width, height)
 
-    def create_subtitle_image(
+    def create_subtitle_sprite(
         self,
         text: str,
         y_position: Optional[int] = None
-    ) -> Tuple[Image.Image, int]:
+    ) -> Tuple[Image.Image, int, int]:
         """
-        자막 이미지 생성 (SHORTS_SPEC.md 스타일)
+        자막 스프라이트 생성 (SHORTS_SPEC.md 스타일)
+
+        전체 캔버스(1080x1920 RGBA, 약 8MB) 대신 배경 박스 + 외곽선 텍스트를 감싸는
+        최소 영역만 그립니다. 합성 시 (x, y) 위치에 배치하면 전체 캔버스 방식과 같은 화면이 됩니다.
 
         Args:
             text: 자막 텍스트
-            y_position: Y 좌표 (None이면 하단 기본값)
+            y_position: 배경 박스 Y 좌표 (None이면 하단 기본값)
 
         Returns:
-            (PIL.Image, y_position) 튜플
+            (PIL.Image, x, y) 튜플 - 스프라이트와 캔버스 내 좌상단 좌표
         """
         # 이모지 및 특수문자 제거 (Pillow 렌더링 오류 방지)
         import re
@@ -151,30 +155,41 @@ class SubtitleService:
         # Safe Zone 강제 적용
         y_position = clamp_y_to_safe_zone(y_position, bg_height)
 
-        # 투명 캔버스 생성
-        img = Image.new('RGBA', (CANVAS_WIDTH, CANVAS_HEIGHT), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # X 좌표 (중앙 정렬)
+        # 캔버스 좌표 (중앙 정렬)
         bg_x = (CANVAS_WIDTH - bg_width) // 2
+        text_x = (CANVAS_WIDTH - text_width) // 2
+        text_y = y_position + SUBTITLE_BG_PADDING_Y
+
+        # 스프라이트 영역: 배경 박스 + 외곽선 포함 텍스트 실제 bbox (캔버스 밖은 잘라냄)
+        measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        glyph_bbox = measure.textbbox((text_x, text_y), wrapped_text, font=font, align='center')
+
+        left = min(glyph_bbox[0] - STROKE_WIDTH, bg_x if SUBTITLE_BG_ENABLED else CANVAS_WIDTH)
+        top = min(glyph_bbox[1] - STROKE_WIDTH, y_position if SUBTITLE_BG_ENABLED else CANVAS_HEIGHT)
+        right = max(glyph_bbox[2] + STROKE_WIDTH, bg_x + bg_width + 1 if SUBTITLE_BG_ENABLED else 0)
+        bottom = max(glyph_bbox[3] + STROKE_WIDTH, y_position + bg_height + 1 if SUBTITLE_BG_ENABLED else 0)
+
+        left, top = max(0, left), max(0, top)
+        right, bottom = min(CANVAS_WIDTH, right), min(CANVAS_HEIGHT, bottom)
+
+        # 투명 스프라이트 생성 (캔버스 좌표에서 (left, top)만큼 이동해 그림)
+        img = Image.new('RGBA', (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
 
         # 1. 반투명 검은 배경 박스 그리기 (SHORTS_SPEC.md Type B)
         # ✨ Task 3-3: SUBTITLE_BG_ENABLED 옵션에 따라 배경 표시/숨김
         if SUBTITLE_BG_ENABLED:
             bg_color = COLOR_BG_TRANSPARENT_BLACK  # (0, 0, 0, 150)
             draw.rectangle(
-                [bg_x, y_position, bg_x + bg_width, y_position + bg_height],
+                [bg_x - left, y_position - top, bg_x + bg_width - left, y_position + bg_height - top],
                 fill=bg_color
             )
 
         # 2. 텍스트 그리기 (중앙 정렬)
-        text_x = (CANVAS_WIDTH - text_width) // 2
-        text_y = y_position + SUBTITLE_BG_PADDING_Y
-
         # 외곽선 (검은색)
         for dx, dy in [(-STROKE_WIDTH, 0), (STROKE_WIDTH, 0), (0, -STROKE_WIDTH), (0, STROKE_WIDTH)]:
             draw.text(
-                (text_x + dx, text_y + dy),
+                (text_x + dx - left, text_y + dy - top),
                 wrapped_text,
                 font=font,
                 fill=(0, 0, 0, 255),  # 검은색 외곽선
@@ -183,14 +198,36 @@ class SubtitleService:
 
         # 텍스트 본체 (흰색)
         draw.text(
-            (text_x, text_y),
+            (text_x - left, text_y - top),
             wrapped_text,
             font=font,
             fill=COLOR_TEXT_PRIMARY + (255,),  # (255, 255, 255, 255)
             align='center'
         )
 
-        return (img, y_position)
+        return (img, left, top)
+
+    def create_subtitle_image(
+        self,
+        text: str,
+        y_position: Optional[int] = None
+    ) -> Tuple[Image.Image, int]:
+        """
+        자막 이미지 생성 (전체 캔버스 크기, 하위 호환)
+
+        Args:
+            text: 자막 텍스트
+            y_position: Y 좌표 (None이면 하단 기본값)
+
+        Returns:
+            (PIL.Image, y_position) 튜플
+        """
+        sprite, x, y = self.create_subtitle_sprite(text, y_position)
+
+        img = Image.new('RGBA', (CANVAS_WIDTH, CANVAS_HEIGHT), (0, 0, 0, 0))
+        img.paste(sprite, (x, y))
+
+        return (img, y)
 
     def _split_long_text(self, text: str, max_chars: int = SUBTITLE_MAX_CHARS) -> List[str]:
         """
@@ -261,16 +298,18 @@ class SubtitleService:
         Args:
             segments: 정렬된 세그먼트 리스트
                 [{"text": "...", "start": 0.0, "end": 1.0, "duration": 1.0}, ...]
+                "words"([{"word", "start", "end"}, ...])가 있으면 청크를 첫 단어 시작 시각에 맞춤
             fps: 프레임 레이트
 
         Returns:
             자막 클립 정보 리스트
             [
                 {
-                    "image": PIL.Image,
+                    "image": PIL.Image,   # 자막 영역만 담은 스프라이트
                     "start": 0.0,
                     "duration": 1.0,
-                    "y_position": 1200
+                    "x_position": 90,     # 캔버스 내 스프라이트 좌상단 X
+                    "y_position": 1200    # 캔버스 내 스프라이트 좌상단 Y
                 },
                 ...
             ]
@@ -293,6 +332,9 @@ class SubtitleService:
             # 긴 텍스트 자동 분할 (SUBTITLE_MAX_CHARS 초과 시)
             text_chunks = self._split_long_text(text, SUBTITLE_MAX_CHARS)
 
+            # 단어 타임스탬프가 있으면 청크별 구간을 단어 시작 시각으로 결정
+            word_spans = chunk_timestamps(text_chunks, segment.get('words') or [], start, end)
+
             # 각 청크에 duration 비례 배분
             total_chars = sum(len(chunk) for chunk in text_chunks)
             current_start = start
@@ -314,16 +356,22 @@ class SubtitleService:
                     if current_start + chunk_duration > end:
                         chunk_duration = end - current_start
 
-                # duration이 너무 짧으면 최소값 보장
-                chunk_duration = max(0.5, chunk_duration)
+                if word_spans:
+                    # 다음 청크 시작까지 표시 (최소 길이를 강제하면 자막이 겹침)
+                    current_start = word_spans[j][0]
+                    chunk_duration = word_spans[j][1] - current_start
+                else:
+                    # duration이 너무 짧으면 최소값 보장
+                    chunk_duration = max(0.5, chunk_duration)
 
-                # 자막 이미지 생성
-                subtitle_img, y_pos = self.create_subtitle_image(chunk)
+                # 자막 스프라이트 생성 (전체 캔버스 대신 최소 영역)
+                subtitle_img, x_pos, y_pos = self.create_subtitle_sprite(chunk)
 
                 subtitle_clips.append({
                     "image": subtitle_img,
                     "start": current_start,
                     "duration": chunk_duration,
+                    "x_position": x_pos,
                     "y_position": y_pos,
                     "text": chunk
                 })
@@ -0,0 +1,215 @@
+"""
+Subtitle Track
+시간 구간 인덱스 기반 자막/오버레이 트랙
+
+자막 ImageClip 수백 개를 CompositeVideoClip에 넣으면 MoviePy가 매 프레임마다
+모든 레이어를 검사합니다 (자막 수에 비례하는 비용).
+SubtitleTrack은 (start, end, sprite)를 시작 시간으로 정렬해 두고
+bisect로 현재 시간에 활성화된 스프라이트만 찾아 해당 영역에만 알파 블렌딩합니다.
+
+- IntervalIndex: 정렬된 시작 시간 + 누적 최대 종료 시간으로 O(log n) 구간 조회
+- TrackSprite: RGBA 스프라이트 + 캔버스 좌표 + 표시 구간
+- SubtitleTrack: 비디오 클립에 단일 transform으로 활성 스프라이트 합성
+"""
+from bisect import bisect_left, bisect_right
+from typing import List, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class IntervalIndex:
+    """
+    정렬된 시간 구간 인덱스
+
+    구간을 시작 시간으로 정렬하고, 정렬 순서 기준 누적 최대 종료 시간을 함께 저장합니다.
+    시각 t의 활성 구간은
+      1) bisect_right(starts, t)로 start <= t인 후보의 끝을 찾고
+      2) bisect로 누적 최대 종료 시간이 t를 넘는 첫 위치를 찾은 뒤
+    그 사이만 검사하므로, 자막처럼 거의 겹치지 않는 구간은 O(log n)에 조회됩니다.
+    """
+
+    def __init__(
+        self,
+        intervals: Sequence[Tuple[float, float, Any]],
+        inclusive_end: bool = False
+    ):
+        """
+        Args:
+            intervals: (start, end, item) 튜플 리스트
+            inclusive_end: True면 start <= t <= end, False면 start <= t < end
+        """
+        self.inclusive_end = inclusive_end
+        self._intervals = sorted(intervals, key=lambda iv: (iv[0], iv[1]))
+        self._starts = [iv[0] for iv in self._intervals]
+
+        self._max_ends: List[float] = []
+        running_max = float("-inf")
+        for _, end, _ in self._intervals:
+            running_max = max(running_max, end)
+            self._max_ends.append(running_max)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def query(self, t: float) -> List[Any]:
+        """
+        시각 t에 활성화된 항목 조회 (시작 시간 순서)
+
+        Args:
+            t: 시각 (초)
+
+        Returns:
+            활성 항목 리스트
+        """
+        hi = bisect_right(self._starts, t)
+        if self.inclusive_end:
+            lo = bisect_left(self._max_ends, t, 0, hi)
+            return [item for start, end, item in self._intervals[lo:hi] if t <= end]
+
+        lo = bisect_right(self._max_ends, t, 0, hi)
+        return [item for start, end, item in self._intervals[lo:hi] if t < end]
+
+
+class TrackSprite:
+    """
+    트랙에 배치되는 RGBA 스프라이트
+
+    알파 블렌딩에 필요한 값(미리 곱한 RGB, 1 - alpha)을 생성 시 한 번만 계산합니다.
+    """
+
+    def __init__(self, rgba: np.ndarray, x: int, y: int, start: float, end: float):
+        """
+        Args:
+            rgba: (h, w, 4) uint8 배열
+            x: 캔버스 내 좌상단 X
+            y: 캔버스 내 좌상단 Y
+            start: 표시 시작 시간 (초)
+            end: 표시 종료 시간 (초)
+        """
+        alpha = rgba[..., 3:4].astype(np.float32) / 255.0
+        self.x = int(x)
+        self.y = int(y)
+        self.start = start
+        self.end = end
+        self.height, self.width = rgba.shape[:2]
+        self.premultiplied = rgba[..., :3].astype(np.float32) * alpha
+        self.inverse_alpha = 1.0 - alpha
+
+    def blend_into(self, frame: np.ndarray) -> None:
+        """
+        프레임에 스프라이트를 제자리(in-place) 알파 블렌딩 (스프라이트 영역만)
+
+        프레임 밖으로 나가는 부분은 잘라냅니다.
+
+        Args:
+            frame: (H, W, 3) 쓰기 가능한 uint8 프레임
+        """
+        frame_h, frame_w = frame.shape[:2]
+
+        x0, y0 = max(self.x, 0), max(self.y, 0)
+        x1 = min(self.x + self.width, frame_w)
+        y1 = min(self.y + self.height, frame_h)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        sx0, sy0 = x0 - self.x, y0 - self.y
+        sx1, sy1 = sx0 + (x1 - x0), sy0 + (y1 - y0)
+
+        region = frame[y0:y1, x0:x1].astype(np.float32)
+        region *= self.inverse_alpha[sy0:sy1, sx0:sx1]
+        region += self.premultiplied[sy0:sy1, sx0:sx1]
+        frame[y0:y1, x0:x1] = np.clip(region + 0.5, 0, 255).astype(np.uint8)
+
+    @classmethod
+    def from_image(cls, image, x: int = 0, y: int = 0, start: float = 0.0,
+                   end: float = float("inf")) -> Optional["TrackSprite"]:
+        """
+        PIL 이미지 / numpy RGBA 배열에서 스프라이트 생성 (투명 여백 자동 제거)
+
+        전체 캔버스 크기의 제목 이미지도 실제 내용 영역만 잘라서 사용합니다.
+
+        Args:
+            image: PIL.Image 또는 (h, w, 4) numpy 배열
+            x: 이미지 좌상단의 캔버스 X
+            y: 이미지 좌상단의 캔버스 Y
+            start: 표시 시작 시간 (초)
+            end: 표시 종료 시간 (초, 기본값은 끝까지)
+
+        Returns:
+            TrackSprite 또는 None (완전히 투명한 이미지)
+        """
+        rgba = np.asarray(image)
+        if rgba.ndim != 3 or rgba.shape[2] != 4:
+            from PIL import Image
+            rgba = np.asarray(Image.fromarray(rgba).convert('RGBA'))
+
+        rows = np.flatnonzero(rgba[..., 3].any(axis=1))
+        cols = np.flatnonzero(rgba[..., 3].any(axis=0))
+        if rows.size == 0:
+            return None
+
+        top, bottom = rows[0], rows[-1] + 1
+        left, right = cols[0], cols[-1] + 1
+        return cls(rgba[top:bottom, left:right], x + left, y + top, start, end)
+
+
+class SubtitleTrack:
+    """
+    자막/오버레이 트랙 (단일 transform으로 합성)
+
+    사용 예:
+        track = SubtitleTrack([TrackSprite(...), ...])
+        video = track.apply(video)
+    """
+
+    def __init__(self, sprites: List[TrackSprite]):
+        """
+        Args:
+            sprites: TrackSprite 리스트 (None 항목은 무시)
+        """
+        sprites = [s for s in sprites if s is not None]
+        self.sprites = sprites
+        self.index = IntervalIndex([(s.start, s.end, s) for s in sprites])
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def active(self, t: float) -> List[TrackSprite]:
+        """시각 t에 표시할 스프라이트 (배치 순서 = 시작 시간 순서)"""
+        return self.index.query(t)
+
+    def blit(self, frame: np.ndarray, t: float) -> np.ndarray:
+        """
+        프레임에 활성 스프라이트 합성 (스프라이트 영역만 블렌딩)
+
+        Args:
+            frame: (H, W, 3) 프레임
+            t: 시각 (초)
+
+        Returns:
+            합성된 프레임 (활성 스프라이트가 없으면 원본 그대로)
+        """
+        active = self.active(t)
+        if not active:
+            return frame
+
+        frame = np.array(frame, dtype=np.uint8, copy=True)
+        for sprite in active:
+            sprite.blend_into(frame)
+
+        return frame
+
+    def apply(self, clip):
+        """
+        비디오 클립에 트랙 합성 (MoviePy 2.x transform)
+
+        Args:
+            clip: MoviePy VideoClip
+
+        Returns:
+            트랙이 합성된 클립 (스프라이트가 없으면 원본)
+        """
+        if not self.sprites:
+            return clip
+
+        return clip.transform(lambda get_frame, t: self.blit(get_frame(t), t))
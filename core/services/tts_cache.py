@@ -0,0 +1,409 @@
+"""
+TTS Cache
+콘텐츠 주소 기반 TTS 결과 캐시 (SQLite 색인 + 용량 상한 LRU 삭제)
+
+키는 (제공자, 음성, 모델, 설정, 언어, 정규화된 텍스트) 전체의 sha256입니다.
+파일은 <캐시 디렉토리>/<키 앞 2자리>/<키>.<확장자>에 저장되고,
+색인(index.db)에 크기 / 마지막 사용 시각 / hit 수를 기록합니다.
+전체 크기가 상한을 넘으면 가장 오래 쓰지 않은 항목부터 삭제합니다.
+
+백엔드 미리듣기(backend/routers/tts.py), AssetManager, local_cli TTSService가
+같은 캐시를 쓰므로 미리듣기한 문장은 실제 렌더링에서 바로 hit 됩니다.
+
+사용 예:
+    cache = get_tts_cache()
+    key = elevenlabs_cache_key(text, voice_id, 0.5, 0.75, 0.0)
+    path, hit = cache.get_or_create(key, lambda tmp: synthesize_to(tmp), provider="elevenlabs")
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "downloads" / "audio" / "tts_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+
+# ElevenLabs 요청 형식 (미리듣기와 렌더링이 같은 키를 만들도록 공유)
+ELEVENLABS_MODEL = "eleven_multilingual_v2"
+ELEVENLABS_OUTPUT_FORMAT = "mp3_44100_128"
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC + 연속 공백 하나로 + 앞뒤 공백 제거)"""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_cache_key(
+    provider: str,
+    text: str,
+    voice: Optional[str] = None,
+    model: Optional[str] = None,
+    language: Optional[str] = None,
+    settings: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    TTS 캐시 키 생성 (전체 sha256 hex)
+
+    Args:
+        provider: TTS 제공자 (gtts, elevenlabs, typecast 등)
+        text: 텍스트 (정규화 후 사용)
+        voice: 음성 ID
+        model: 모델 ID
+        language: 언어 코드
+        settings: 출력에 영향을 주는 나머지 설정 (속도, 감정, 안정성 등)
+
+    Returns:
+        64자리 hex 키
+    """
+    payload = {
+        "provider": provider,
+        "voice": voice,
+        "model": model,
+        "language": language,
+        "settings": settings or {},
+        "text": normalize_text(text),
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def elevenlabs_cache_key(
+    text: str,
+    voice_id: str,
+    stability: float,
+    similarity_boost: float,
+    style: float,
+    use_speaker_boost: bool = True
+) -> str:
+    """ElevenLabs 요청 캐시 키 (미리듣기 API / AssetManager / local_cli 공용)"""
+    return make_cache_key(
+        "elevenlabs",
+        text,
+        voice=voice_id,
+        model=ELEVENLABS_MODEL,
+        settings={
+            "output_format": ELEVENLABS_OUTPUT_FORMAT,
+            "stability": round(float(stability), 4),
+            "similarity_boost": round(float(similarity_boost), 4),
+            "style": round(float(style), 4),
+            "use_speaker_boost": bool(use_speaker_boost),
+        }
+    )
+
+
+class TTSCache:
+    """
+    TTS 결과 파일 캐시
+
+    - get / put: 키로 조회 / 파일 등록 (등록 후 용량 상한 초과 시 LRU 삭제)
+    - get_or_create: 조회 후 없으면 생성 함수로 만들어 등록 (같은 키 동시 생성은 한 번만)
+    - stats: 항목 수, 전체 크기, hit/miss 통계
+
+    LRU 삭제는 참조 중인 파일(Draft 세그먼트 TTS, 진행 중인 작업 / 프리뷰가 고정한 에셋)을 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        protect_seconds: float = 600.0,
+        references: Optional[Callable[[], Iterable[str]]] = None
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 TTS_CACHE_DIR 환경변수 또는 downloads/audio/tts_cache)
+            max_bytes: 전체 용량 상한 (None이면 TTS_CACHE_MAX_MB 환경변수 또는 512MB)
+            protect_seconds: 최근 이 시간 안에 사용된 항목은 삭제하지 않음 (조립 중인 작업 보호)
+            references: 삭제하면 안 되는 파일 경로를 돌려주는 함수
+                        (None이면 StorageGC의 참조 소스 + 고정 파일)
+        """
+        self.cache_dir = Path(cache_dir or os.getenv("TTS_CACHE_DIR", str(DEFAULT_CACHE_DIR)))
+        if max_bytes is None:
+            max_mb = os.getenv("TTS_CACHE_MAX_MB")
+            max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        self.max_bytes = max_bytes
+        self.protect_seconds = protect_seconds
+        self.references = references
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 키별 생성 잠금과 그 잠금을 기다리거나 잡고 있는 스레드 수 (0이 되면 정리)
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_waiters: Dict[str, int] = {}
+
+        self._conn = sqlite3.connect(str(self.cache_dir / "index.db"), timeout=30, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tts_cache (
+                key TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                provider TEXT,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tts_cache_last_access ON tts_cache (last_access)")
+        self._conn.commit()
+
+        # 프로세스 단위 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path_for(self, key: str, ext: str) -> Path:
+        """키 → 캐시 파일 경로"""
+        return self.cache_dir / key[:2] / f"{key}{ext}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회 (hit이면 마지막 사용 시각 / hit 수 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시 파일 경로 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT filename FROM tts_cache WHERE key = ?", (key,)).fetchone()
+            if row:
+                path = self.cache_dir / row[0]
+                if path.exists():
+                    self._conn.execute(
+                        "UPDATE tts_cache SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                        (time.time(), key)
+                    )
+                    self._conn.commit()
+                    self.hits += 1
+                    return str(path)
+
+                # 파일이 외부에서 삭제됨 → 색인 정리
+                self._conn.execute("DELETE FROM tts_cache WHERE key = ?", (key,))
+                self._conn.commit()
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, source_path: str, provider: Optional[str] = None, copy: bool = False) -> str:
+        """
+        파일을 캐시에 등록 (같은 파일시스템이면 이동, copy=True면 복사)
+
+        Args:
+            key: 캐시 키
+            source_path: 생성된 오디오 파일
+            provider: TTS 제공자 (통계용)
+            copy: 원본 파일을 남길지 여부
+
+        Returns:
+            캐시 파일 경로
+        """
+        ext = Path(source_path).suffix or ".mp3"
+        target = self._path_for(key, ext)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일로 옮긴 뒤 교체 (다른 프로세스가 미완성 파일을 보지 않도록)
+        temp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        if copy:
+            shutil.copyfile(source_path, temp_path)
+        else:
+            shutil.move(source_path, temp_path)
+        os.replace(temp_path, target)
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO tts_cache (key, filename, provider, size, created_at, last_access, hits)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, str(target.relative_to(self.cache_dir)), provider, target.stat().st_size, now, now)
+            )
+            self._conn.commit()
+
+        self.evict()
+        return str(target)
+
+    def get_or_create(
+        self,
+        key: str,
+        create: Callable[[str], Any],
+        provider: Optional[str] = None,
+        ext: str = ".mp3"
+    ) -> Tuple[Optional[str], bool]:
+        """
+        캐시 조회 후 없으면 생성해 등록 (같은 키를 여러 스레드가 요청하면 한 번만 생성)
+
+        Args:
+            key: 캐시 키
+            create: 임시 경로를 받아 그 경로에 오디오를 기록하는 함수 (False 반환 시 실패로 처리)
+            provider: TTS 제공자 (통계용)
+            ext: 파일 확장자
+
+        Returns:
+            (캐시 파일 경로 또는 None, hit 여부)
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+            self._key_waiters[key] = self._key_waiters.get(key, 0) + 1
+
+        try:
+            with key_lock:
+                cached = self.get(key)
+                if cached:
+                    return cached, True
+
+                target = self._path_for(key, ext)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = target.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.new{ext}")
+                try:
+                    result = create(str(temp_path))
+                    if result is False or not temp_path.exists() or temp_path.stat().st_size == 0:
+                        return None, False
+                    return self.put(key, str(temp_path), provider=provider), False
+                finally:
+                    if temp_path.exists():
+                        temp_path.unlink()
+        finally:
+            # 기다리는 스레드가 남아 있으면 같은 잠금을 유지 (새 잠금으로 동시 생성되지 않도록)
+            with self._lock:
+                self._key_waiters[key] -= 1
+                if self._key_waiters[key] == 0:
+                    del self._key_waiters[key]
+                    del self._key_locks[key]
+
+    def evict(self) -> int:
+        """
+        전체 크기가 상한을 넘으면 가장 오래 쓰지 않은 항목부터 삭제 (참조 중인 파일은 건너뜀)
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM tts_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        # 참조 소스(DB 등)는 캐시 잠금 밖에서 조회, 참조를 모르면 삭제하지 않음
+        try:
+            referenced = self._referenced_paths()
+        except Exception as e:
+            print(f"[TTSCache] 참조 확인 실패, 삭제 건너뜀: {e}")
+            return 0
+
+        removed = 0
+        with self._lock:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM tts_cache").fetchone()[0]
+            cutoff = time.time() - self.protect_seconds
+            rows = self._conn.execute(
+                "SELECT key, filename, size FROM tts_cache WHERE last_access < ? ORDER BY last_access",
+                (cutoff,)
+            ).fetchall()
+
+            for key, filename, size in rows:
+                if total <= self.max_bytes:
+                    break
+                path = self.cache_dir / filename
+                if os.path.realpath(path) in referenced:
+                    continue
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                self._conn.execute("DELETE FROM tts_cache WHERE key = ?", (key,))
+                total -= size
+                removed += 1
+
+            self._conn.commit()
+            self.evictions += removed
+
+        if removed:
+            print(f"[TTSCache] 용량 상한 초과로 {removed}개 항목 삭제")
+        return removed
+
+    def _referenced_paths(self) -> Set[str]:
+        """삭제하면 안 되는 파일의 절대 경로"""
+        if self.references is None:
+            from core.services.storage_gc import get_storage_gc
+            return get_storage_gc().referenced_paths()
+        return {os.path.realpath(path) for path in self.references() if path}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            {"entries", "total_bytes", "max_bytes", "hits", "misses", "hit_rate",
+             "evictions", "lifetime_hits", "by_provider"} dict
+        """
+        with self._lock:
+            entries, total_bytes, lifetime_hits = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM tts_cache"
+            ).fetchone()
+            by_provider = {
+                provider or "unknown": {"entries": count, "bytes": size}
+                for provider, count, size in self._conn.execute(
+                    "SELECT provider, COUNT(*), SUM(size) FROM tts_cache GROUP BY provider"
+                )
+            }
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "total_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "lifetime_hits": lifetime_hits,
+            "by_provider": by_provider,
+        }
+
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT filename FROM tts_cache").fetchall()
+            for (filename,) in rows:
+                try:
+                    (self.cache_dir / filename).unlink()
+                except FileNotFoundError:
+                    pass
+            self._conn.execute("DELETE FROM tts_cache")
+            self._conn.commit()
+        return len(rows)
+
+    def close(self) -> None:
+        """색인 연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+# 싱글톤 인스턴스
+_tts_cache = None
+_tts_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSCache:
+    """TTSCache 싱글톤 인스턴스 반환"""
+    global _tts_cache
+    with _tts_cache_lock:
+        if _tts_cache is None:
+            _tts_cache = TTSCache()
+    return _tts_cache
@@ -0,0 +1,181 @@
+"""
+Video Fingerprint
+스톡 영상의 지각 해시(dHash) 지문
+
+Pexels와 Pixabay는 같은 영상을 다른 ID로 제공하고, 다른 검색어가 같은 영상을 돌려주기도 해서
+downloads/stock_videos에 같은 영상이 여러 파일로 쌓이고 한 영상 안에 같은 장면이 연달아 나왔습니다.
+파일 해시는 인코딩 / 해상도가 다르면 달라지므로 화면 내용 기준 지문을 씁니다.
+
+지문:
+  1. 영상 길이에 고르게 배치한 STOCK_FINGERPRINT_FRAMES개 시점에서 프레임 1장씩 추출
+     (ffmpeg 입력 탐색 → 9x8 흑백으로 축소, 프레임당 72바이트만 읽음)
+  2. 프레임마다 dHash (가로로 이웃한 픽셀 밝기 비교 64bit)
+  3. 16진수로 이어 붙인 문자열 (프레임당 16자)
+같은 영상은 렌디션 / 인코딩이 달라도 프레임당 해밍 거리가 몇 bit 안에 들어옵니다.
+
+사용 예:
+    fingerprint = compute_fingerprint("downloads/stock_videos/pexels_1_1080x1920.mp4", duration=12.0)
+    distance = fingerprint_distance(fingerprint, other.fingerprint)
+"""
+import subprocess
+from typing import List, Optional
+
+from core.config import STOCK_FINGERPRINT_FRAMES
+from core.services.ffmpeg_render_service import find_ffmpeg
+
+
+# dHash 축소 크기 (가로 9 → 이웃 비교 8개 x 세로 8줄 = 64bit)
+HASH_WIDTH = 9
+HASH_HEIGHT = 8
+# 프레임당 16진수 자릿수
+FRAME_HEX = 16
+# 색인용 밴드 (프레임 해시를 8bit씩 나눔, 거리 7 이하인 프레임은 적어도 한 밴드가 같음)
+BAND_BITS = 8
+
+# 프레임 추출 제한 시간 (초)
+_FRAME_TIMEOUT = 30
+
+
+def dhash(pixels: bytes, width: int = HASH_WIDTH, height: int = HASH_HEIGHT) -> int:
+    """
+    흑백 픽셀(행 우선)의 dHash
+
+    Args:
+        pixels: width x height 흑백 바이트
+        width: 가로 픽셀 수
+        height: 세로 픽셀 수
+
+    Returns:
+        (width - 1) x height bit 정수 (왼쪽 픽셀이 더 밝으면 1)
+    """
+    value = 0
+    for y in range(height):
+        row = pixels[y * width:(y + 1) * width]
+        for x in range(width - 1):
+            value = (value << 1) | (row[x] > row[x + 1])
+    return value
+
+
+def compute_fingerprint(
+    path: str,
+    duration: Optional[float] = None,
+    frames: int = STOCK_FINGERPRINT_FRAMES,
+    ffmpeg_cmd: Optional[str] = None
+) -> Optional[str]:
+    """
+    영상 파일의 지문 계산
+
+    Args:
+        path: 영상 파일 경로
+        duration: 영상 길이 (초, None이면 media_probe로 조회)
+        frames: 샘플 프레임 수
+        ffmpeg_cmd: ffmpeg 실행 파일 (None이면 자동 탐색)
+
+    Returns:
+        16진수 지문 (프레임당 16자) 또는 None (ffmpeg 없음 / 프레임 추출 실패)
+    """
+    ffmpeg_cmd = ffmpeg_cmd or find_ffmpeg()
+    if not ffmpeg_cmd or frames < 1:
+        return None
+    if not duration or duration <= 0:
+        from core.services.media_probe import get_media_probe_service
+        duration = get_media_probe_service().duration(path) or 0.0
+
+    hashes = []
+    for i in range(frames):
+        # 시작 / 끝의 페이드를 피해 구간 가운데에서 추출
+        timestamp = duration * (i + 0.5) / frames if duration > 0 else 0.0
+        try:
+            result = subprocess.run(
+                [
+                    ffmpeg_cmd, "-v", "error", "-ss", f"{timestamp:.3f}", "-i", path,
+                    "-frames:v", "1", "-vf", f"scale={HASH_WIDTH}:{HASH_HEIGHT}:flags=area,format=gray",
+                    "-f", "rawvideo", "-",
+                ],
+                capture_output=True,
+                timeout=_FRAME_TIMEOUT
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"[Fingerprint] 프레임 추출 실패 ({path}): {e}")
+            return None
+        if result.returncode != 0 or len(result.stdout) < HASH_WIDTH * HASH_HEIGHT:
+            print(f"[Fingerprint] 프레임 추출 실패 ({path} @ {timestamp:.1f}s)")
+            return None
+        hashes.append(dhash(result.stdout[:HASH_WIDTH * HASH_HEIGHT]))
+
+    return "".join(f"{value:0{FRAME_HEX}x}" for value in hashes)
+
+
+def fingerprint_frames(fingerprint: Optional[str]) -> List[int]:
+    """
+    지문을 프레임별 64bit 해시로 분리
+
+    Args:
+        fingerprint: 16진수 지문
+
+    Returns:
+        프레임 해시 리스트 (형식이 맞지 않으면 빈 리스트)
+    """
+    if not fingerprint or len(fingerprint) % FRAME_HEX:
+        return []
+    try:
+        return [int(fingerprint[i:i + FRAME_HEX], 16) for i in range(0, len(fingerprint), FRAME_HEX)]
+    except ValueError:
+        return []
+
+
+def is_informative(fingerprint: Optional[str]) -> bool:
+    """
+    중복 판정에 쓸 수 있는 지문인지 여부
+
+    검은 화면 / 단색 프레임은 해시가 거의 0이라 서로 다른 영상도 같아 보이므로
+    절반 이상의 프레임이 이런 프레임이면 비교하지 않습니다.
+    """
+    frames = fingerprint_frames(fingerprint)
+    if not frames:
+        return False
+    flat = sum(1 for value in frames if bin(value).count("1") < 4 or bin(value).count("1") > 60)
+    return flat * 2 < len(frames)
+
+
+def fingerprint_distance(a: Optional[str], b: Optional[str]) -> Optional[float]:
+    """
+    두 지문의 프레임당 평균 해밍 거리
+
+    Args:
+        a: 지문
+        b: 지문
+
+    Returns:
+        평균 거리 (bit, 0~64) 또는 None (지문 없음 / 프레임 수 다름 / 단색 프레임 위주)
+    """
+    frames_a = fingerprint_frames(a)
+    frames_b = fingerprint_frames(b)
+    if not frames_a or len(frames_a) != len(frames_b):
+        return None
+    if not (is_informative(a) and is_informative(b)):
+        return None
+    return sum(bin(x ^ y).count("1") for x, y in zip(frames_a, frames_b)) / len(frames_a)
+
+
+def fingerprint_bands(fingerprint: Optional[str]) -> List[str]:
+    """
+    색인용 밴드 키 (프레임 번호 + 밴드 번호 + 값)
+
+    같은 영상의 지문은 프레임당 평균 거리가 작아 어느 프레임에선가 대부분의 밴드가 그대로이므로
+    밴드가 하나라도 같은 항목만 후보로 비교하면 전체 비교 없이 중복을 찾을 수 있습니다.
+
+    Args:
+        fingerprint: 16진수 지문
+
+    Returns:
+        밴드 키 리스트 (단색 프레임 위주 지문이면 빈 리스트)
+    """
+    if not is_informative(fingerprint):
+        return []
+    bands = []
+    mask = (1 << BAND_BITS) - 1
+    for frame, value in enumerate(fingerprint_frames(fingerprint)):
+        for band in range(64 // BAND_BITS):
+            bands.append(f"{frame}.{band}:{(value >> (band * BAND_BITS)) & mask:02x}")
+    return bands
@@ -0,0 +1,159 @@
+"""
+Video Reader Pool
+소스 영상 디코더(ffmpeg 프로세스)를 필요할 때만 열고 동시에 열린 개수를 제한하는 풀
+
+VideoFileClip은 생성 즉시 ffmpeg 디코더 프로세스(+ 오디오 리더)를 띄우고 버퍼를 잡기 때문에
+에셋 40개짜리 영상은 렌더링 내내 디코더 40개를 붙잡고 있었습니다.
+
+- VideoReaderPool: 파일 경로별 FFMPEG_VideoReader를 LRU로 관리 (최대 max_open개)
+  · 프레임 요청이 올 때 처음 열고, 한도를 넘으면 가장 오래 쓰지 않은 디코더를 닫음
+  · 같은 에셋이 타임라인 여러 곳에 나와도 디코더 하나를 재사용
+- PooledVideoClip: 메타데이터(길이/크기/fps)만 가진 MoviePy 클립, 프레임은 풀에서 읽음
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+from moviepy import VideoClip
+from moviepy.video.io.ffmpeg_reader import FFMPEG_VideoReader, ffmpeg_parse_infos
+
+
+class VideoReaderPool:
+    """
+    경로별 디코더 LRU 풀
+
+    사용 예:
+        pool = VideoReaderPool(max_open=4)
+        clip = pool.clip("stock_01.mp4")   # 디코더는 아직 열리지 않음
+        frame = clip.get_frame(1.5)        # 이때 열림 (한도 초과 시 LRU 디코더 닫힘)
+        pool.close()
+    """
+
+    def __init__(self, max_open: int = 4):
+        """
+        Args:
+            max_open: 동시에 열어둘 최대 디코더 수 (크로스페이드 구간은 2개가 동시에 필요)
+        """
+        self.max_open = max(1, max_open)
+        self._readers: "OrderedDict[str, FFMPEG_VideoReader]" = OrderedDict()
+        self._infos: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.opened_count = 0  # 지금까지 디코더를 연 횟수 (재사용 확인용)
+
+    @property
+    def open_count(self) -> int:
+        """현재 열려 있는 디코더 수"""
+        return len(self._readers)
+
+    def probe(self, path: str) -> Dict[str, Any]:
+        """
+        디코더 없이 영상 메타데이터 조회 (ffmpeg -i 파싱, 결과 캐시)
+
+        Args:
+            path: 영상 파일 경로
+
+        Returns:
+            {"duration", "size", "fps"} dict
+        """
+        if path not in self._infos:
+            infos = ffmpeg_parse_infos(path, check_duration=True, decode_file=False)
+            size = list(infos.get("video_size", (1, 1)))
+
+            # ffmpeg가 회전 정보를 적용해 디코딩하므로 가로/세로 교환 (FFMPEG_VideoReader와 동일)
+            if abs(infos.get("video_rotation", 0)) in (90, 270):
+                size = [size[1], size[0]]
+
+            self._infos[path] = {
+                "duration": infos.get("video_duration", 0.0),
+                "size": tuple(size),
+                "fps": infos.get("video_fps", 1.0),
+            }
+        return self._infos[path]
+
+    def get_frame(self, path: str, t: float):
+        """
+        경로의 t초 프레임 읽기 (필요 시 디코더를 열고, 한도 초과 시 LRU 디코더 닫기)
+
+        Args:
+            path: 영상 파일 경로
+            t: 시각 (초)
+
+        Returns:
+            (H, W, 3) numpy 프레임
+        """
+        with self._lock:
+            reader = self._readers.get(path)
+            if reader is None:
+                while len(self._readers) >= self.max_open:
+                    _, oldest = self._readers.popitem(last=False)
+                    oldest.close()
+
+                reader = FFMPEG_VideoReader(path, decode_file=False)
+                self._readers[path] = reader
+                self.opened_count += 1
+            else:
+                self._readers.move_to_end(path)
+
+            return reader.get_frame(t)
+
+    def release(self, path: str) -> None:
+        """
+        경로의 디코더 닫기 (다시 요청되면 새로 열림)
+
+        Args:
+            path: 영상 파일 경로
+        """
+        with self._lock:
+            reader = self._readers.pop(path, None)
+            if reader is not None:
+                reader.close()
+
+    def close(self) -> None:
+        """열린 디코더 전부 닫기"""
+        with self._lock:
+            while self._readers:
+                _, reader = self._readers.popitem(last=False)
+                reader.close()
+
+    def clip(self, path: str) -> "PooledVideoClip":
+        """
+        풀에서 프레임을 읽는 클립 생성 (디코더는 첫 프레임 요청 시 열림)
+
+        Args:
+            path: 영상 파일 경로
+
+        Returns:
+            PooledVideoClip
+        """
+        return PooledVideoClip(self, path)
+
+
+class PooledVideoClip(VideoClip):
+    """
+    VideoReaderPool에서 프레임을 읽는 VideoFileClip 대체 클립
+
+    subclipped / cropped / resized 등 MoviePy 변환은 그대로 사용할 수 있고,
+    close()는 이 경로의 디코더만 풀에 반납합니다.
+    """
+
+    def __init__(self, pool: VideoReaderPool, path: str):
+        """
+        Args:
+            pool: VideoReaderPool
+            path: 영상 파일 경로
+        """
+        # frame_function을 생성자에 넘기면 크기 확인을 위해 첫 프레임을 디코딩하므로 나중에 설정
+        super().__init__()
+        info = pool.probe(path)
+
+        self.pool = pool
+        self.filename = path
+        self.frame_function = lambda t: pool.get_frame(path, t)
+        self.size = info["size"]
+        self.fps = info["fps"]
+        self.duration = info["duration"]
+        self.end = info["duration"]
+
+    def close(self) -> None:
+        """디코더 반납"""
+        self.pool.release(self.filename)
@@ -0,0 +1,446 @@
+"""
+Whisper Worker
+Whisper 모델을 상주시키는 전용 워커 프로세스 풀
+
+모델 로드는 수 초 ~ 수십 초가 걸리므로 요청마다, 또는 get_alignment_service()를 처음 부른
+프로세스마다 로드하지 않고, 워커 프로세스가 한 번 로드한 모델로 요청을 계속 처리합니다.
+
+- WhisperWorkerPool: 현재 프로세스가 띄운 워커 프로세스 N개 (spawn, 파이프로 요청/응답)
+  여러 스레드(백엔드 요청, 동시 작업)의 요청은 유휴 워커 큐에서 워커를 빌려 처리됩니다.
+- serve(): 워커 풀을 로컬 소켓 서버로 띄움 (백엔드와 scripts/auto_create.py 실행이 모델 하나를 공유)
+    python -m core.services.whisper_worker --serve
+- RemoteWhisperWorker: WHISPER_WORKER_ADDRESS가 설정되면 위 서버로 요청
+
+서버는 받은 요청을 pickle로 복원하므로 인증 키를 아는 클라이언트만 연결할 수 있어야 합니다.
+기본 키는 없으며 서버 / 클라이언트 모두 WHISPER_WORKER_AUTHKEY(충분히 긴 무작위 문자열)가 필요합니다.
+"""
+import argparse
+import importlib
+import multiprocessing
+import os
+import threading
+import traceback
+from multiprocessing.connection import Client, Listener
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_LOADER = "whisper:load_model"
+DEFAULT_ADDRESS = ("127.0.0.1", 47321)
+
+
+def resolve_authkey(authkey: Optional[bytes] = None) -> bytes:
+    """
+    워커 서버 인증 키
+
+    Args:
+        authkey: 직접 지정한 키 (None이면 WHISPER_WORKER_AUTHKEY 환경변수)
+
+    Returns:
+        인증 키 bytes
+
+    Raises:
+        RuntimeError: 키가 지정되지 않음
+    """
+    if authkey:
+        return authkey
+    value = os.getenv("WHISPER_WORKER_AUTHKEY")
+    if not value:
+        raise RuntimeError(
+            "WHISPER_WORKER_AUTHKEY 환경변수가 필요합니다 "
+            "(워커 서버는 인증된 클라이언트의 요청만 복원, 예: python -c \"import secrets; print(secrets.token_hex(32))\")"
+        )
+    return value.encode()
+
+
+def words_from_result(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Whisper transcribe 결과 → 단어별 타임스탬프 리스트
+
+    Args:
+        result: model.transcribe 반환값
+
+    Returns:
+        [{"word", "start", "end"}, ...] (words가 없는 세그먼트는 세그먼트 단위)
+    """
+    word_timestamps = []
+
+    for segment in result.get('segments', []):
+        # segment에 words가 있으면 word-level 타임스탬프 사용
+        if 'words' in segment:
+            for word_info in segment['words']:
+                word_timestamps.append({
+                    "word": word_info['word'].strip(),
+                    "start": word_info['start'],
+                    "end": word_info['end']
+                })
+        else:
+            # words가 없으면 segment-level 사용 (fallback)
+            word_timestamps.append({
+                "word": segment['text'].strip(),
+                "start": segment['start'],
+                "end": segment['end']
+            })
+
+    return word_timestamps
+
+
+def _load(loader: str, model_size: str):
+    """'모듈:함수' 형식의 로더로 모델 로드"""
+    module_name, func_name = loader.split(":")
+    return getattr(importlib.import_module(module_name), func_name)(model_size)
+
+
+def _worker_loop(conn, model_size: str, loader: str) -> None:
+    """
+    워커 프로세스 본체: 모델을 한 번 로드한 뒤 요청을 계속 처리
+
+    요청: {"audio_path", "language", "word_timestamps", "options"} / None이면 종료
+    응답: {"words": [...], "pid"} 또는 {"error": 메시지}
+    """
+    model = None
+    load_error = None
+    try:
+        print(f"[Whisper] 워커 {os.getpid()}: 모델 로드 중 ({model_size})")
+        model = _load(loader, model_size)
+        print(f"[Whisper] 워커 {os.getpid()}: 모델 로드 완료")
+    except Exception as e:
+        load_error = f"모델 로드 실패: {e}"
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        if load_error:
+            conn.send({"error": load_error})
+            continue
+
+        try:
+            result = model.transcribe(
+                request["audio_path"],
+                language=request.get("language"),
+                word_timestamps=request.get("word_timestamps", True),
+                verbose=False,
+                **request.get("options", {})
+            )
+            conn.send({"words": words_from_result(result), "pid": os.getpid()})
+        except Exception as e:
+            conn.send({"error": f"{e}\n{traceback.format_exc(limit=3)}"})
+
+
+class _Worker:
+    """워커 프로세스 하나 + 부모 쪽 파이프"""
+
+    def __init__(self, model_size: str, loader: str):
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_loop,
+            args=(child_conn, model_size, loader),
+            name="whisper-worker",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def request(self, payload: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        """요청 전송 후 응답 대기"""
+        self.conn.send(payload)
+        if not self.conn.poll(timeout):
+            raise TimeoutError(f"Whisper 워커 응답 시간 초과 ({timeout}초)")
+        return self.conn.recv()
+
+    def close(self) -> None:
+        """워커 종료"""
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+class WhisperWorkerPool:
+    """
+    모델을 상주시키는 Whisper 워커 프로세스 풀
+
+    워커는 처음 요청될 때 띄우고, 요청이 끝나면 유휴 목록으로 돌아가 다음 요청을 처리합니다.
+    워커가 죽으면(시간 초과, 크래시) 목록에서 빼고 기다리던 요청을 깨워 새 워커를 띄웁니다.
+    """
+
+    def __init__(self, model_size: str, workers: int = 1, loader: str = DEFAULT_LOADER):
+        """
+        Args:
+            model_size: Whisper 모델 크기 (tiny, base, small, medium, large)
+            workers: 워커 프로세스 수 (워커마다 모델을 하나씩 메모리에 올림)
+            loader: 모델 로더 ('모듈:함수', 기본 whisper.load_model)
+        """
+        self.model_size = model_size
+        self.workers = max(1, workers)
+        self.loader = loader
+
+        self._idle: List[_Worker] = []
+        self._all: List[_Worker] = []
+        self._lock = threading.Lock()
+        # 유휴 워커가 생기거나 워커 수가 한도 아래로 내려가면 알림
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+
+    def _acquire(self) -> _Worker:
+        """
+        유휴 워커 빌리기 (없으면 한도 안에서 새로 띄우고, 한도면 반납 / 종료될 때까지 대기)
+
+        Raises:
+            RuntimeError: 풀이 닫힘
+        """
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WhisperWorkerPool이 닫혔습니다")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._all) < self.workers:
+                    worker = _Worker(self.model_size, self.loader)
+                    self._all.append(worker)
+                    return worker
+                self._available.wait()
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        """워커 반납 (문제가 있으면 종료하고 목록에서 제거, 어느 쪽이든 대기 중인 요청 하나를 깨움)"""
+        with self._available:
+            if healthy and not self._closed and worker.process.is_alive():
+                self._idle.append(worker)
+                self._available.notify()
+                return
+            if worker in self._all:
+                self._all.remove(worker)
+            self._available.notify()
+        worker.close()
+
+    def transcribe(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        word_timestamps: bool = True,
+        timeout: Optional[float] = None,
+        **options
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        워커에서 오디오 전사
+
+        Args:
+            audio_path: 오디오 파일 경로
+            language: 언어 코드
+            word_timestamps: 단어별 타임스탬프 추출
+            timeout: 응답 대기 시간 (초, None이면 무제한)
+            **options: model.transcribe에 전달할 추가 옵션
+
+        Returns:
+            (단어별 타임스탬프 리스트, 처리한 워커 pid)
+
+        Raises:
+            RuntimeError: 모델 로드 / 전사 실패, 워커 프로세스 종료(크래시 / 메모리 부족)
+            TimeoutError: timeout 안에 응답 없음
+        """
+        worker = self._acquire()
+        healthy = False
+        try:
+            response = worker.request({
+                "audio_path": os.path.abspath(audio_path),
+                "language": language,
+                "word_timestamps": word_timestamps,
+                "options": options,
+            }, timeout)
+            healthy = True
+        except TimeoutError:
+            raise
+        except (EOFError, OSError) as e:
+            worker.process.join(timeout=1)
+            raise RuntimeError(f"Whisper 워커 프로세스 종료 (exitcode={worker.process.exitcode}): {e!r}") from e
+        finally:
+            self._release(worker, healthy)
+
+        if "error" in response:
+            raise RuntimeError(f"Whisper 워커 오류: {response['error']}")
+        return response["words"], response["pid"]
+
+    @property
+    def started_workers(self) -> int:
+        """현재 살아 있는 워커 수"""
+        return len(self._all)
+
+    def close(self) -> None:
+        """모든 워커 종료"""
+        with self._available:
+            self._closed = True
+            workers, self._all, self._idle = self._all, [], []
+            self._available.notify_all()
+        for worker in workers:
+            worker.close()
+
+
+class RemoteWhisperWorker:
+    """serve()로 띄운 Whisper 워커 서버에 요청하는 클라이언트 (WhisperWorkerPool과 같은 인터페이스)"""
+
+    def __init__(self, address: Tuple[str, int] = DEFAULT_ADDRESS, authkey: Optional[bytes] = None):
+        """
+        Args:
+            address: 서버 주소 (host, port)
+            authkey: 인증 키 (None이면 WHISPER_WORKER_AUTHKEY 환경변수)
+
+        Raises:
+            RuntimeError: 인증 키가 없음
+        """
+        self.address = address
+        self.authkey = resolve_authkey(authkey)
+
+    def transcribe(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        word_timestamps: bool = True,
+        timeout: Optional[float] = None,
+        **options
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """WhisperWorkerPool.transcribe와 동일"""
+        with Client(self.address, authkey=self.authkey) as conn:
+            conn.send({
+                "audio_path": os.path.abspath(audio_path),
+                "language": language,
+                "word_timestamps": word_timestamps,
+                "options": options,
+            })
+            if not conn.poll(timeout):
+                raise TimeoutError(f"Whisper 워커 서버 응답 시간 초과 ({timeout}초)")
+            response = conn.recv()
+
+        if "error" in response:
+            raise RuntimeError(f"Whisper 워커 오류: {response['error']}")
+        return response["words"], response["pid"]
+
+    def close(self) -> None:
+        """연결 상태를 유지하지 않으므로 할 일 없음"""
+
+
+def serve(
+    address: Tuple[str, int] = DEFAULT_ADDRESS,
+    model_size: str = "base",
+    workers: int = 1,
+    authkey: Optional[bytes] = None,
+    loader: str = DEFAULT_LOADER,
+    ready: Optional[threading.Event] = None,
+    stop: Optional[threading.Event] = None
+) -> None:
+    """
+    Whisper 워커 풀을 로컬 소켓 서버로 실행 (연결마다 스레드 하나, 처리는 워커 풀에서)
+
+    Args:
+        address: 바인딩 주소 (host, port)
+        model_size: Whisper 모델 크기
+        workers: 워커 프로세스 수
+        authkey: 인증 키 (None이면 WHISPER_WORKER_AUTHKEY 환경변수)
+        loader: 모델 로더 ('모듈:함수')
+        ready: 리스닝 시작 시 set되는 이벤트
+        stop: set되면 서버 종료 (다음 연결 수락 시점에 확인)
+
+    Raises:
+        RuntimeError: 인증 키가 없음 (키 없이 서버를 띄우지 않음)
+    """
+    authkey = resolve_authkey(authkey)
+    pool = WhisperWorkerPool(model_size, workers, loader)
+
+    def handle(conn) -> None:
+        with conn:
+            try:
+                request = conn.recv()
+                words, pid = pool.transcribe(
+                    request["audio_path"],
+                    language=request.get("language"),
+                    word_timestamps=request.get("word_timestamps", True),
+                    **request.get("options", {})
+                )
+                conn.send({"words": words, "pid": pid})
+            except Exception as e:
+                try:
+                    conn.send({"error": str(e)})
+                except OSError:
+                    pass
+
+    with Listener(address, authkey=authkey) as listener:
+        print(f"[Whisper] 워커 서버 시작: {address[0]}:{address[1]} (모델 {model_size}, 워커 {workers}개)")
+        if ready:
+            ready.set()
+        try:
+            while not (stop and stop.is_set()):
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    print(f"[Whisper] 연결 수락 실패: {e}")
+                    continue
+                threading.Thread(target=handle, args=(conn,), daemon=True).start()
+        finally:
+            pool.close()
+
+
+def parse_address(value: str) -> Tuple[str, int]:
+    """'host:port' → (host, port)"""
+    host, _, port = value.rpartition(":")
+    return host or DEFAULT_ADDRESS[0], int(port)
+
+
+# 싱글톤 인스턴스
+_whisper_worker = None
+_whisper_worker_lock = threading.Lock()
+
+
+def get_whisper_worker(model_size: str, workers: int = 1):
+    """
+    Whisper 워커 싱글톤 반환
+
+    WHISPER_WORKER_ADDRESS 환경변수('host:port')가 있으면 서버 클라이언트,
+    없으면 현재 프로세스의 WhisperWorkerPool
+
+    Args:
+        model_size: Whisper 모델 크기
+        workers: 로컬 워커 프로세스 수
+
+    Returns:
+        WhisperWorkerPool 또는 RemoteWhisperWorker
+    """
+    global _whisper_worker
+    with _whisper_worker_lock:
+        if _whisper_worker is None:
+            address = os.getenv("WHISPER_WORKER_ADDRESS")
+            if address:
+                _whisper_worker = RemoteWhisperWorker(parse_address(address))
+            else:
+                _whisper_worker = WhisperWorkerPool(model_size, workers)
+    return _whisper_worker
+
+
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.config import WHISPER_MODEL, WHISPER_WORKERS
+
+    parser = argparse.ArgumentParser(description="Whisper 워커 서버 (모델 상주)")
+    parser.add_argument("--serve", action="store_true", help="워커 서버 실행")
+    parser.add_argument("--address", default=f"{DEFAULT_ADDRESS[0]}:{DEFAULT_ADDRESS[1]}", help="host:port")
+    parser.add_argument("--model", default=WHISPER_MODEL, help="Whisper 모델 크기")
+    parser.add_argument("--workers", type=int, default=WHISPER_WORKERS, help="워커 프로세스 수")
+    args = parser.parse_args()
+
+    if args.serve:
+        try:
+            serve(parse_address(args.address), args.model, args.workers)
+        except RuntimeError as e:
+            print(f"[Whisper] 워커 서버 시작 실패: {e}")
+            sys.exit(1)
+    else:
+        parser.print_help()
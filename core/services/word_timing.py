@@ -0,0 +1,271 @@
+"""
+Word Timing Service
+ASR 없이 세그먼트별 실제 TTS 길이로 단어 타임스탬프 추정
+
+AssetManager는 세그먼트마다 TTS 길이를 샘플 단위로 이미 알고 있으므로,
+그 길이를 단어별 음절(글자) 수와 문장부호 쉼 비율로 나눠 단어 시작/끝을 계산합니다.
+세그먼트 PCM이 있으면 에너지 기반 무음 검출로
+  - 앞뒤 무음을 잘라 실제 발화 구간만 나누고
+  - 발화 중간의 무음 구간을 가장 가까운 문장부호/단어 경계에 고정
+해서 정확도를 높입니다.
+
+Whisper(core.services.alignment_service)를 사용할 수 있으면 기본은 Whisper 정렬이고,
+이 추정은 Whisper가 없거나 ALIGNMENT_MODE="duration"(또는 AssetManager(alignment_mode="duration"))일 때 사용합니다.
+Whisper 정렬이 실패해도 이 추정치가 남습니다.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# 문장부호 뒤 쉼 (음절 단위)
+COMMA_PAUSE = 1.2
+SENTENCE_PAUSE = 2.0
+
+_SENTENCE_END = re.compile(r"[.!?…。！？]+[\"'”’)\]]*$")
+_CLAUSE_END = re.compile(r"[,;:、，]+[\"'”’)\]]*$")
+_LATIN_VOWELS = re.compile(r"[aeiouy]+", re.IGNORECASE)
+
+
+def syllable_weight(token: str) -> float:
+    """
+    단어 발화 길이 가중치 (대략적인 음절 수)
+
+    - 한글 / 가나 / 한자: 글자당 1
+    - 영문: 모음 묶음 수 (최소 1)
+    - 숫자: 자리당 1.2 (한국어로 읽으면 자리보다 음절이 조금 많음)
+    - 그 외 기호만 있는 토큰: 0.3
+    """
+    weight = 0.0
+    for part in re.findall(r"[가-힣぀-ヿ一-鿿]|[A-Za-z]+|\d", token):
+        if part.isdigit():
+            weight += 1.2
+        elif part.isascii():
+            weight += max(1, len(_LATIN_VOWELS.findall(part)))
+        else:
+            weight += 1.0
+    return weight or 0.3
+
+
+def pause_weight(token: str) -> float:
+    """단어 뒤 쉼 가중치 (문장 끝 > 쉼표 > 없음)"""
+    if _SENTENCE_END.search(token):
+        return SENTENCE_PAUSE
+    if _CLAUSE_END.search(token):
+        return COMMA_PAUSE
+    return 0.0
+
+
+def detect_silences(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_seconds: float = 0.02,
+    threshold_ratio: float = 0.05,
+    min_gap: float = 0.12
+) -> Tuple[float, float, List[Tuple[float, float]]]:
+    """
+    에너지(RMS) 기반 무음 검출
+
+    Args:
+        samples: (samples,) 또는 (samples, channels) PCM
+        sample_rate: 샘플레이트
+        frame_seconds: 분석 프레임 길이 (초)
+        threshold_ratio: 최대 프레임 RMS 대비 무음 기준 비율 (0.05 ≈ -26dB)
+        min_gap: 발화 중간 무음으로 인정할 최소 길이 (초)
+
+    Returns:
+        (발화 시작, 발화 끝, [(무음 시작, 무음 끝), ...]) - 초 단위, 세그먼트 시작 기준
+    """
+    mono = samples.mean(axis=1) if samples.ndim > 1 else samples
+    duration = len(mono) / sample_rate
+    frame = max(1, int(sample_rate * frame_seconds))
+    count = len(mono) // frame
+    if count == 0:
+        return 0.0, duration, []
+
+    rms = np.sqrt(np.mean(np.square(mono[:count * frame].reshape(count, frame), dtype=np.float64), axis=1))
+    threshold = max(rms.max() * threshold_ratio, 1e-4)
+    voiced = np.flatnonzero(rms >= threshold)
+    if len(voiced) == 0:
+        return 0.0, duration, []
+
+    first, last = voiced[0], voiced[-1]
+    speech_start = first * frame / sample_rate
+    speech_end = min(duration, (last + 1) * frame / sample_rate)
+
+    gaps = []
+    min_frames = max(1, int(round(min_gap / frame_seconds)))
+    steps = np.diff(voiced)
+    for index in np.flatnonzero(steps > min_frames):
+        gap_start = (voiced[index] + 1) * frame / sample_rate
+        gap_end = voiced[index + 1] * frame / sample_rate
+        gaps.append((gap_start, gap_end))
+
+    return speech_start, speech_end, gaps
+
+
+class WordTimingService:
+    """
+    세그먼트 길이 분배 기반 단어 타임스탬프 엔진 (Whisper 대체 모드)
+    """
+
+    def __init__(self, gap_tolerance: float = 0.35):
+        """
+        Args:
+            gap_tolerance: 검출된 무음을 단어 경계에 고정할 때 허용하는 예측 위치 오차 (초)
+        """
+        self.gap_tolerance = gap_tolerance
+
+    @staticmethod
+    def _distribute(
+        weights: List[float],
+        pauses: List[float],
+        start: float,
+        end: float
+    ) -> List[Tuple[float, float]]:
+        """구간 [start, end]를 단어 가중치 + 사이 쉼 가중치 비율로 나눔 (마지막 단어 뒤 쉼 제외)"""
+        inner_pauses = pauses[:-1] + [0.0]
+        total = sum(weights) + sum(inner_pauses)
+        unit = (end - start) / total if total > 0 else 0.0
+
+        spans = []
+        cursor = start
+        for weight, pause in zip(weights, inner_pauses):
+            spans.append((cursor, cursor + weight * unit))
+            cursor += (weight + pause) * unit
+        return spans
+
+    def _anchor_gaps(
+        self,
+        spans: List[Tuple[float, float]],
+        gaps: List[Tuple[float, float]]
+    ) -> Dict[int, Tuple[float, float]]:
+        """무음 구간을 가장 가까운 단어 경계(k번 단어 뒤)에 배정 → {k: (무음 시작, 무음 끝)}"""
+        anchors: Dict[int, Tuple[float, float]] = {}
+        for gap_start, gap_end in sorted(gaps, key=lambda g: g[0] - g[1]):  # 긴 무음 먼저
+            middle = (gap_start + gap_end) / 2
+            best, best_distance = None, None
+            for k in range(len(spans) - 1):
+                if k in anchors:
+                    continue
+                boundary = (spans[k][1] + spans[k + 1][0]) / 2
+                distance = abs(boundary - middle)
+                if best_distance is None or distance < best_distance:
+                    best, best_distance = k, distance
+            if best is not None and best_distance <= max(self.gap_tolerance, (gap_end - gap_start)):
+                anchors[best] = (gap_start, gap_end)
+
+        # 시간 순서가 뒤집힌 배정 제거
+        ordered = {}
+        last_end = float("-inf")
+        for k in sorted(anchors):
+            gap_start, gap_end = anchors[k]
+            if gap_start >= last_end:
+                ordered[k] = (gap_start, gap_end)
+                last_end = gap_end
+        return ordered
+
+    def estimate_words(
+        self,
+        text: str,
+        duration: float,
+        offset: float = 0.0,
+        samples: Optional[np.ndarray] = None,
+        sample_rate: int = 44100
+    ) -> List[Dict[str, float]]:
+        """
+        세그먼트 하나의 단어별 타임스탬프 추정
+
+        Args:
+            text: 세그먼트 텍스트 (효과음 표기 제거 후)
+            duration: 실제 발화 길이 (초, 뒤에 붙은 대기 무음 제외)
+            offset: 세그먼트 시작 시각 (초, 결과에 더함)
+            samples: 세그먼트 PCM (있으면 무음 검출로 보정)
+            sample_rate: PCM 샘플레이트
+
+        Returns:
+            [{"word", "start", "end"}, ...] (offset 기준 절대 시각)
+        """
+        tokens = text.split()
+        if not tokens or duration <= 0:
+            return []
+
+        weights = [syllable_weight(t) for t in tokens]
+        pauses = [pause_weight(t) for t in tokens]
+
+        speech_start, speech_end, gaps = 0.0, duration, []
+        if samples is not None and len(samples) > 0:
+            speech_start, speech_end, gaps = detect_silences(samples, sample_rate)
+            speech_end = min(speech_end, duration)
+            if speech_end - speech_start < duration * 0.2:  # 검출 결과가 비정상이면 무시
+                speech_start, speech_end, gaps = 0.0, duration, []
+
+        spans = self._distribute(weights, pauses, speech_start, speech_end)
+
+        # 발화 중간 무음을 단어 경계에 고정하고, 고정점 사이를 다시 분배
+        anchors = self._anchor_gaps(spans, gaps) if gaps and len(tokens) > 1 else {}
+        if anchors:
+            spans = []
+            first = 0
+            span_start = speech_start
+            for k in sorted(anchors) + [len(tokens) - 1]:
+                gap = anchors.get(k)
+                span_end = gap[0] if gap else speech_end
+                spans.extend(self._distribute(weights[first:k + 1], pauses[first:k + 1], span_start, span_end))
+                if gap:
+                    span_start = gap[1]
+                first = k + 1
+
+        return [
+            {"word": token, "start": round(offset + start, 4), "end": round(offset + end, 4)}
+            for token, (start, end) in zip(tokens, spans)
+        ]
+
+
+def chunk_timestamps(
+    chunks: List[str],
+    words: List[Dict[str, float]],
+    start: float,
+    end: float
+) -> Optional[List[Tuple[float, float]]]:
+    """
+    자막 청크(단어 묶음)별 표시 구간 계산
+
+    청크 i는 첫 단어 시작부터 다음 청크 첫 단어 시작까지 표시합니다 (마지막 청크는 세그먼트 끝까지).
+
+    Args:
+        chunks: 자막 청크 텍스트 리스트 (세그먼트 텍스트를 단어 경계로 나눈 것)
+        words: 세그먼트 단어 타임스탬프
+        start: 세그먼트 시작 (초)
+        end: 세그먼트 끝 (초)
+
+    Returns:
+        [(시작, 끝), ...] 또는 None (청크 단어 수와 타임스탬프 단어 수가 맞지 않음)
+    """
+    counts = [len(chunk.split()) for chunk in chunks]
+    if not words or sum(counts) != len(words):
+        return None
+
+    starts = []
+    index = 0
+    for count in counts:
+        starts.append(start if index == 0 else min(max(words[index]["start"], start), end))
+        index += count
+
+    return [
+        (chunk_start, starts[i + 1] if i + 1 < len(starts) else end)
+        for i, chunk_start in enumerate(starts)
+    ]
+
+
+# 싱글톤 인스턴스
+_word_timing_service = None
+
+
+def get_word_timing_service() -> WordTimingService:
+    """WordTimingService 싱글톤 인스턴스 반환"""
+    global _word_timing_service
+    if _word_timing_service is None:
+        _word_timing_service = WordTimingService()
+    return _word_timing_service
@@ -451,4 +451,7 @@ def batch_remix(region, category, max_videos, duration, min_views, target_lang):
 
 
 if __name__ == '__main__':
+    import sys
+    # 프로젝트 루트 (services가 사용하는 core 모듈)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     cli()
@@ -60,49 +60,21 @@ class AudioProcessor:
             os.remove(concat_file)
 
         # 오디오 길이 가져오기
-        duration_seconds = self._get_audio_duration(output_path, ffmpeg_path)
+        duration_seconds = self._get_audio_duration(output_path)
 
         print(f"✅ 오디오 병합 완료: {output_path} ({duration_seconds:.1f}초)")
         return output_path, duration_seconds
 
-    def _get_audio_duration(self, audio_path: str, ffmpeg_path: str = 'ffmpeg') -> float:
-        """FFmpeg로 오디오 길이 가져오기 (ffprobe 없이)"""
-        try:
-            # FFmpeg으로 직접 오디오 정보 가져오기
-            cmd = [
-                ffmpeg_path,
-                '-i', audio_path,
-                '-f', 'null',
-                '-'
-            ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore'
-            )
-
-            # stderr에서 Duration 파싱
-            match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})', result.stderr)
-            if match:
-                hours, minutes, seconds = match.groups()
-                duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-                return duration
-        except Exception as e:
-            print(f"⚠️ 오디오 길이 측정 실패: {e}")
-
-        # MoviePy fallback
-        try:
-            from moviepy import AudioFileClip
-            audio = AudioFileClip(audio_path)
-            duration = audio.duration
-            audio.close()
+    def _get_audio_duration(self, audio_path: str) -> float:
+        """오디오 길이 가져오기 (헤더만 읽음, 미디어 색인 캐시)"""
+        from core.services.media_probe import get_media_probe_service
+
+        duration = get_media_probe_service().duration(audio_path)
+        if duration is not None:
             return duration
-        except:
-            pass
 
         # 최종 기본값
+        print(f"⚠️ 오디오 길이 측정 실패: {audio_path}")
         return 30.0
 
     def _timestamp_to_ms(self, timestamp: str) -> int:
@@ -260,29 +260,41 @@ class HardcodedSubtitleProcessor:
         """
         print(f"\n[INFO] 하드코딩 자막 제거 시작")
 
+        from core.services.subtitle_track import IntervalIndex
+
         clip = VideoFileClip(video_path)
 
+        # 자막 구간 인덱스 (프레임마다 전체 자막 목록을 훑지 않도록)
+        subtitle_index = IntervalIndex(
+            [(sub['start_time'], sub['end_time'], sub) for sub in subtitles],
+            inclusive_end=True
+        )
+
         def mask_frame(get_frame, t):
             frame = get_frame(t)
 
             # 현재 시간에 해당하는 자막 찾기
-            for sub in subtitles:
-                if sub['start_time'] <= t <= sub['end_time']:
-                    x, y, w, h = sub['bbox']
-                    # 검은 박스로 가리기 (약간 여유 추가)
-                    padding = 5
-                    cv2.rectangle(
-                        frame,
-                        (x - padding, y - padding),
-                        (x + w + padding, y + h + padding),
-                        (0, 0, 0),
-                        -1
-                    )
+            active_subtitles = subtitle_index.query(t)
+            if not active_subtitles:
+                return frame
+
+            frame = frame.copy()
+            for sub in active_subtitles:
+                x, y, w, h = sub['bbox']
+                # 검은 박스로 가리기 (약간 여유 추가)
+                padding = 5
+                cv2.rectangle(
+                    frame,
+                    (x - padding, y - padding),
+                    (x + w + padding, y + h + padding),
+                    (0, 0, 0),
+                    -1
+                )
 
             return frame
 
-        # 프레임 처리 함수 적용
-        masked_clip = clip.fl(lambda gf, t: mask_frame(gf, t))
+        # 프레임 처리 함수 적용 (MoviePy 2.x)
+        masked_clip = clip.transform(mask_frame)
 
         print(f"[INFO] 영상 인코딩 중...")
         masked_clip.write_videofile(
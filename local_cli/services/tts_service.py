@@ -3,20 +3,25 @@ TTS Service - 텍스트를 음성으로 변환하는 서비스
 """
 import os
 import re
-from typing import Optional, List, Dict
+import shutil
+from typing import Optional, List, Dict, Tuple
 
 
 class TTSService:
     """TTS (Text-To-Speech) 서비스"""
 
-    def __init__(self, provider: str = 'gtts'):
+    def __init__(self, provider: str = 'gtts', cache_enabled: bool = True):
         """
         TTS 제공자 초기화
 
         Args:
             provider: 'local', 'gtts', 'google', 'elevenlabs', 'azure'
+            cache_enabled: 공유 TTS 캐시 사용 여부 (백엔드 미리듣기 / 영상 생성과 같은 캐시)
         """
+        from core.services.tts_cache import get_tts_cache
+
         self.provider = provider
+        self.cache = get_tts_cache() if cache_enabled else None
 
         if provider == 'local':
             self._init_local()
@@ -92,18 +97,56 @@ class TTSService:
     ) -> str:
         """대본을 음성으로 변환"""
 
+        # 공유 TTS 캐시 확인 (hit이면 복사만)
+        cache_key = self._cache_key(script_text, voice_id, speed, pitch) if self.cache else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached:
+                os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+                shutil.copyfile(cached, output_path)
+                print(f"♻️ 캐시된 음성 사용: {output_path}")
+                return output_path
+
         print(f"🎤 {self.provider}로 음성 생성 중...")
 
+        # 캐시 키의 설정이 실제로 적용된 결과만 저장
+        cacheable = True
         if self.provider == 'local':
-            return self._generate_local(script_text, output_path, speed)
+            result = self._generate_local(script_text, output_path, speed)
         elif self.provider == 'gtts':
-            return self._generate_gtts(script_text, output_path, speed)
+            result, cacheable = self._generate_gtts(script_text, output_path, speed)
         elif self.provider == 'google':
-            return self._generate_google(script_text, output_path, voice_id, speed, pitch)
+            result = self._generate_google(script_text, output_path, voice_id, speed, pitch)
         elif self.provider == 'elevenlabs':
-            return self._generate_elevenlabs(script_text, output_path, voice_id)
+            result = self._generate_elevenlabs(script_text, output_path, voice_id)
         elif self.provider == 'azure':
-            return self._generate_azure(script_text, output_path, voice_id, speed, pitch)
+            result = self._generate_azure(script_text, output_path, voice_id, speed, pitch)
+        else:
+            raise ValueError(f"지원하지 않는 TTS 제공자: {self.provider}")
+
+        if cache_key and cacheable and result and os.path.exists(result):
+            self.cache.put(cache_key, result, provider=self.provider, copy=True)
+        return result
+
+    @staticmethod
+    def _detect_language(text: str) -> str:
+        """한글이 포함되면 'ko', 아니면 'en'"""
+        return 'ko' if any(ord(c) >= 0xAC00 and ord(c) <= 0xD7A3 for c in text) else 'en'
+
+    def _cache_key(self, text: str, voice_id: Optional[str], speed: float, pitch: float) -> str:
+        """제공자별 출력에 영향을 주는 설정을 모두 포함한 캐시 키"""
+        from core.services.tts_cache import make_cache_key, elevenlabs_cache_key
+
+        if self.provider == 'elevenlabs':
+            # _generate_elevenlabs와 같은 설정 → 백엔드 미리듣기와 같은 키
+            return elevenlabs_cache_key(text, voice_id or "21m00Tcm4TlvDq8ikWAM", 0.5, 0.75, 0.0, True)
+        if self.provider == 'gtts':
+            # 로컬 CLI gTTS는 atempo로 속도를 바꾼 결과를 저장
+            return make_cache_key(
+                'gtts', text, language=self._detect_language(text),
+                settings={"atempo": max(0.5, min(2.0, speed * 1.2))}
+            )
+        return make_cache_key(self.provider, text, voice=voice_id, settings={"speed": speed, "pitch": pitch})
 
     def _generate_local(self, text: str, output_path: str, speed: float) -> str:
         """pyttsx3로 로컬 생성 (무료, 품질 낮음)"""
@@ -113,14 +156,18 @@ class TTSService:
         print(f"✅ 음성 생성 완료: {output_path}")
         return output_path
 
-    def _generate_gtts(self, text: str, output_path: str, speed: float) -> str:
-        """gTTS로 생성 (무료, 좋은 품질)"""
+    def _generate_gtts(self, text: str, output_path: str, speed: float) -> Tuple[str, bool]:
+        """gTTS로 생성 (무료, 좋은 품질)
+
+        Returns:
+            (출력 경로, 속도 조절 적용 여부) - 속도 조절에 실패하면 원본 속도 파일
+        """
         import os
         import subprocess
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
         # 한글 감지
-        lang = 'ko' if any(ord(c) >= 0xAC00 and ord(c) <= 0xD7A3 for c in text) else 'en'
+        lang = self._detect_language(text)
 
         # gTTS는 slow 파라미터만 지원 (True/False)
         # 기본 속도가 충분히 빠르므로 slow=False 사용
@@ -153,14 +200,15 @@ class TTSService:
                 os.remove(temp_path)
 
         except Exception as e:
-            print(f"⚠️ 속도 조절 실패, 원본 사용: {e}")
+            print(f"⚠️ 속도 조절 실패, 원본 사용 (캐시에 저장하지 않음): {e}")
             # 실패 시 원본 사용
             if os.path.exists(temp_path):
                 import shutil
                 shutil.move(temp_path, output_path)
+            return output_path, False
 
         print(f"✅ 음성 생성 완료: {output_path}")
-        return output_path
+        return output_path, True
 
     def _generate_gtts_with_lang(
         self,
@@ -411,51 +459,13 @@ class TTSService:
     def _get_audio_duration(self, audio_path: str) -> float:
         """오디오 길이 가져오기
 
-        MoviePy를 사용하여 안정적으로 오디오 길이를 측정합니다.
-        imageio-ffmpeg는 FFprobe를 포함하지 않으므로 MoviePy가 가장 안정적입니다.
+        파일을 디코딩하지 않고 헤더만 읽습니다 (MediaProbeService, 영구 색인 캐시).
         """
-        # 방법 1: MoviePy 사용 (가장 안정적)
-        try:
-            from moviepy import AudioFileClip
-            audio = AudioFileClip(audio_path)
-            duration = audio.duration
-            audio.close()
-            return duration
-        except Exception as e:
-            print(f"⚠️ MoviePy 오디오 길이 측정 실패: {e}")
-
-        # 방법 2: FFmpeg 직접 사용 (fallback)
-        try:
-            import subprocess
-            from imageio_ffmpeg import get_ffmpeg_exe
+        from core.services.media_probe import get_media_probe_service
 
-            ffmpeg_path = get_ffmpeg_exe()
-
-            # FFmpeg으로 오디오 정보 가져오기 (ffprobe 없이)
-            cmd = [
-                ffmpeg_path,
-                '-i', audio_path,
-                '-f', 'null',
-                '-'
-            ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore'
-            )
-
-            # stderr에서 Duration 파싱
-            import re
-            match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})', result.stderr)
-            if match:
-                hours, minutes, seconds = match.groups()
-                duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-                return duration
-        except Exception as e:
-            print(f"⚠️ FFmpeg 오디오 길이 측정 실패: {e}")
+        duration = get_media_probe_service().duration(audio_path)
+        if duration is not None:
+            return duration
 
-        # 방법 3: 기본값 사용
         print(f"⚠️ 오디오 길이 측정 실패, 기본값 5초 사용")
         return 5.0
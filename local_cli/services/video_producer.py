@@ -26,8 +26,12 @@ class VideoProducer:
         (100, 50, 100),  # 보라색
     ]
 
-    def __init__(self):
-        """VideoProducer 초기화"""
+    def __init__(self, encoder_profile: Optional[str] = None):
+        """VideoProducer 초기화
+
+        Args:
+            encoder_profile: 인코더 프로필 (draft, preview, standard, archive / None이면 ENCODER_PROFILE 환경 변수 또는 standard)
+        """
         # 무료 TTS 사용 (gTTS 또는 local)
         tts_provider = os.getenv('TTS_PROVIDER', 'gtts')
         self.tts_service = TTSService(provider=tts_provider)
@@ -39,6 +43,10 @@ class VideoProducer:
         image_provider = os.getenv('IMAGE_PROVIDER', 'pexels')
         self.image_generator = ImageGenerator(provider=image_provider)
 
+        # 인코더 프로필: draft, preview, standard (기본), archive
+        from core.services.encoder_profiles import get_encoder_profile
+        self.encoder_profile = get_encoder_profile(encoder_profile or os.getenv('ENCODER_PROFILE', 'standard'))
+
     def produce_video(
         self,
         script: Dict,
@@ -130,10 +138,8 @@ class VideoProducer:
         final_video.write_videofile(
             output_path,
             fps=30,
-            codec='libx264',
             audio_codec='aac',
-            threads=4,
-            preset='medium'
+            **self.encoder_profile.write_kwargs(30)
         )
 
         # 6. 썸네일 생성
@@ -11,8 +11,15 @@ from moviepy import VideoFileClip, TextClip, CompositeVideoClip
 class VideoRemixer:
     """원본 영상 + 번역 자막 합성"""
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, encoder_profile: Optional[str] = None):
+        """초기화
+
+        Args:
+            encoder_profile: 인코더 프로필 (draft, preview, standard, archive / None이면 ENCODER_PROFILE 환경 변수 또는 standard)
+        """
+        from core.services.encoder_profiles import get_encoder_profile
+        self.encoder_profile = get_encoder_profile(encoder_profile or os.getenv('ENCODER_PROFILE', 'standard'))
+
         # 기본 자막 스타일
         self.default_style = {
             'fontsize': 48,
@@ -137,12 +144,10 @@ class VideoRemixer:
             print("[INFO] 렌더링 시작...")
             final_video.write_videofile(
                 output_path,
-                codec='libx264',
                 audio_codec='aac',
                 fps=video.fps,
-                preset='medium',
-                threads=4,
-                logger=None  # 진행률 표시 비활성화
+                logger=None,  # 진행률 표시 비활성화
+                **self.encoder_profile.write_kwargs(video.fps)
             )
 
             # 리소스 정리
@@ -212,11 +217,9 @@ class VideoRemixer:
             # 렌더링
             final_video.write_videofile(
                 output_path,
-                codec='libx264',
                 audio_codec='aac',
                 fps=video.fps,
-                preset='medium',
-                threads=4
+                **self.encoder_profile.write_kwargs(video.fps)
             )
 
             # 리소스 정리
@@ -282,9 +285,9 @@ class VideoRemixer:
                 temp_path = output_path.replace('.mp4', '_temp.mp4')
                 clip.write_videofile(
                     temp_path,
-                    codec='libx264',
                     audio_codec='aac',
-                    fps=video.fps
+                    fps=video.fps,
+                    **self.encoder_profile.write_kwargs(video.fps)
                 )
 
                 # 자막 추가
@@ -305,9 +308,9 @@ class VideoRemixer:
                 # 자막 없이 저장
                 clip.write_videofile(
                     output_path,
-                    codec='libx264',
                     audio_codec='aac',
-                    fps=video.fps
+                    fps=video.fps,
+                    **self.encoder_profile.write_kwargs(video.fps)
                 )
 
                 video.close()
@@ -4,8 +4,11 @@ Pexels Stock Video Provider
 """
 import os
 import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from core.models import StockVideoAsset
+from core.services.rendition import select_rendition, rendition_filename
+from core.services.downloader import get_media_downloader
+from core.services.http_session import get_http_session
 
 
 class PexelsProvider:
@@ -21,6 +24,7 @@ class PexelsProvider:
             api_key: Pexels API 키 (None이면 환경변수에서 가져옴)
         """
         self.api_key = api_key or os.getenv('PEXELS_API_KEY')
+        self.session = get_http_session("pexels")  # keep-alive 연결 풀 (스레드 간 공유)
 
         # Phase 6: API 키 검증 (기본값 체크)
         if not self.api_key or self.api_key == 'your_pexels_api_key_here':
@@ -39,7 +43,9 @@ class PexelsProvider:
         query: str,
         per_page: int = 5,
         orientation: str = "portrait",
-        size: str = "medium"
+        size: str = "medium",
+        target_size: Optional[Tuple[int, int]] = None,
+        raise_on_error: bool = False
     ) -> List[StockVideoAsset]:
         """
         키워드로 영상 검색 (Phase 6: API 키 체크 추가)
@@ -49,9 +55,14 @@ class PexelsProvider:
             per_page: 결과 개수 (기본 5개)
             orientation: 영상 방향 (portrait/landscape/square)
             size: 영상 크기 (small/medium/large)
+            target_size: 렌디션이 채워야 하는 최소 크기 (None이면 1080x1920)
+            raise_on_error: True면 API 오류를 빈 결과로 바꾸지 않고 다시 발생 (검색 캐시가 오류를 "결과 없음"으로 저장하지 않도록)
 
         Returns:
             StockVideoAsset 리스트
+
+        Raises:
+            requests.exceptions.RequestException: raise_on_error=True이고 API 요청이 실패한 경우
         """
         # Phase 6: API 키가 없으면 빈 리스트 반환
         if not self.api_key:
@@ -65,7 +76,7 @@ class PexelsProvider:
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/search",
                 headers=self.headers,
                 params=params,
@@ -78,7 +89,7 @@ class PexelsProvider:
 
             assets = []
             for video in videos:
-                asset = self._parse_video(video, query)
+                asset = self._parse_video(video, query, target_size)
                 if asset:
                     assets.append(asset)
 
@@ -87,15 +98,47 @@ class PexelsProvider:
 
         except requests.exceptions.RequestException as e:
             print(f"[ERROR] Pexels API 오류: {e}")
+            if raise_on_error:
+                raise
             return []
 
-    def _parse_video(self, video_data: Dict[str, Any], keyword: str) -> Optional[StockVideoAsset]:
+    @staticmethod
+    def _parse_tags(video_data: Dict[str, Any]) -> List[str]:
+        """
+        Pexels 영상 설명 태그 추출
+
+        API 응답의 tags는 대부분 비어 있으므로 페이지 URL의 설명 부분도 사용합니다.
+        (https://www.pexels.com/video/brown-dog-running-on-grass-857195/ → brown dog running on grass)
+
+        Args:
+            video_data: Pexels API 응답 데이터
+
+        Returns:
+            태그 리스트
+        """
+        tags = [str(tag) for tag in video_data.get('tags') or [] if tag]
+        slug = (video_data.get('url') or '').rstrip('/').rsplit('/', 1)[-1]
+        words = [word for word in slug.split('-') if word and not word.isdigit()]
+        if words:
+            tags.append(' '.join(words))
+        return tags
+
+    def _parse_video(
+        self,
+        video_data: Dict[str, Any],
+        keyword: str,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[StockVideoAsset]:
         """
         Pexels API 응답을 StockVideoAsset으로 변환
 
+        video_files 중 target_size를 채우는 가장 작은 렌디션을 고릅니다.
+        (quality "hd" 첫 항목은 4K / 2560 폭인 경우가 많아 다운로드와 축소 비용이 큼)
+
         Args:
             video_data: Pexels API 응답 데이터
             keyword: 검색 키워드
+            target_size: 렌디션이 채워야 하는 최소 크기 (None이면 1080x1920)
 
         Returns:
             StockVideoAsset 또는 None
@@ -104,35 +147,37 @@ class PexelsProvider:
             video_id = str(video_data.get('id'))
             duration = video_data.get('duration', 0)
 
-            # 비디오 파일 선택 (HD 우선)
             video_files = video_data.get('video_files', [])
             if not video_files:
                 return None
 
-            # HD 또는 가장 높은 품질 선택
-            selected_file = None
-            for file in video_files:
-                quality = file.get('quality', '')
-                # Phase 6: NoneType 방지 (quality가 None일 수 있음)
-                if quality and 'hd' in quality.lower():
-                    selected_file = file
-                    break
-
-            if not selected_file:
-                selected_file = video_files[0]
-
-            download_url = selected_file.get('link')
-            width = selected_file.get('width', 1080)
-            height = selected_file.get('height', 1920)
-            resolution = f"{width}x{height}"
+            # Phase 6: NoneType 방지 (width/height/fps가 None일 수 있음)
+            candidates = [
+                {
+                    'url': file.get('link'),
+                    'width': file.get('width') or 0,
+                    'height': file.get('height') or 0,
+                    'fps': file.get('fps'),
+                    'size': file.get('size')
+                }
+                for file in video_files
+            ]
+            selected = select_rendition(candidates, target_size)
+            if not selected:
+                return None
 
             return StockVideoAsset(
                 id=f"pexels_{video_id}",
-                url=download_url,
+                url=selected['url'],
                 provider="pexels",
                 keyword=keyword,
                 duration=duration,
-                resolution=resolution,
+                resolution=f"{selected['width']}x{selected['height']}",
+                width=selected['width'],
+                height=selected['height'],
+                fps=selected['fps'],
+                file_size=selected['size'],
+                tags=self._parse_tags(video_data),
                 downloaded=False
             )
 
@@ -165,7 +210,7 @@ class PexelsProvider:
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/popular",
                 headers=self.headers,
                 params=params,
@@ -204,34 +249,15 @@ class PexelsProvider:
         Returns:
             저장된 파일 경로 또는 None
         """
-        os.makedirs(output_dir, exist_ok=True)
-
-        filename = f"{asset.id}.mp4"
+        filename = rendition_filename(asset)
         filepath = os.path.join(output_dir, filename)
 
-        # 이미 다운로드된 경우
-        if os.path.exists(filepath):
-            print(f"[Pexels] 이미 다운로드됨: {filename}")
-            return filepath
-
-        try:
-            print(f"[Pexels] 다운로드 시작: {filename}")
-            response = requests.get(asset.url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-
-            print(f"[SUCCESS] 다운로드 완료: {filepath}")
-            return filepath
-
-        except Exception as e:
-            print(f"[ERROR] 다운로드 실패: {e}")
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            return None
+        # 임시 파일 → 검증 → 원자적 이동 (잘린 파일이 완료로 취급되지 않음, 끊기면 이어받기)
+        print(f"[Pexels] 다운로드 시작: {filename}")
+        result = get_media_downloader().download(asset.url, filepath, session=self.session)
+        if result:
+            print(f"[SUCCESS] 다운로드 완료: {result}")
+        return result
 
     def __repr__(self):
         return "PexelsProvider()"
@@ -4,8 +4,11 @@ Pixabay Stock Video Provider
 """
 import os
 import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from core.models import StockVideoAsset
+from core.services.rendition import select_rendition, rendition_filename
+from core.services.downloader import get_media_downloader
+from core.services.http_session import get_http_session
 
 
 class PixabayProvider:
@@ -22,6 +25,7 @@ class PixabayProvider:
             api_key: Pixabay API 키 (None이면 환경변수에서 가져옴)
         """
         self.api_key = api_key or os.getenv('PIXABAY_API_KEY')
+        self.session = get_http_session("pixabay")  # keep-alive 연결 풀 (스레드 간 공유)
 
         # Phase 6: API 키 검증 (기본값 체크)
         if not self.api_key or self.api_key == 'your_pixabay_api_key_here':
@@ -40,7 +44,10 @@ class PixabayProvider:
         editors_choice: bool = True,  # Phase 4: 에디터 추천 영상 우선
         safesearch: bool = True,
         min_width: int = 720,  # Phase 4: 최소 해상도
-        min_height: int = 1280
+        min_height: int = 1280,
+        target_size: Optional[Tuple[int, int]] = None,
+        raise_on_error: bool = False,
+        fallback: bool = True
     ) -> List[StockVideoAsset]:
         """
         키워드로 영상 검색 (Phase 4: 고품질 파라미터 튜닝)
@@ -54,9 +61,15 @@ class PixabayProvider:
             safesearch: 안전 검색 (기본값 True)
             min_width: 최소 너비 (기본값 720)
             min_height: 최소 높이 (기본값 1280)
+            target_size: 렌디션이 채워야 하는 최소 크기 (None이면 1080x1920)
+            raise_on_error: True면 API 오류를 빈 결과로 바꾸지 않고 다시 발생 (검색 캐시가 오류를 "결과 없음"으로 저장하지 않도록)
+            fallback: 결과가 없으면 제약을 완화해 바로 재검색 (헤지 검색은 완화 검색을 따로 동시에 요청하므로 False)
 
         Returns:
             StockVideoAsset 리스트
+
+        Raises:
+            requests.exceptions.RequestException: raise_on_error=True이고 API 요청이 실패한 경우
         """
         # Phase 6: API 키가 없으면 빈 리스트 반환
         if not self.api_key:
@@ -83,7 +96,7 @@ class PixabayProvider:
             print(f"[Pixabay]   - video_type: {video_type}, orientation: {orientation}")
             print(f"[Pixabay]   - editors_choice: {editors_choice}, min_res: {min_width}x{min_height}")
 
-            response = requests.get(
+            response = self.session.get(
                 self.BASE_URL,
                 params=params,
                 timeout=10
@@ -95,21 +108,25 @@ class PixabayProvider:
 
             assets = []
             for video in hits:
-                asset = self._parse_video(video, query)
+                asset = self._parse_video(video, query, target_size)
                 if asset:
                     assets.append(asset)
 
             print(f"[Pixabay] '{query}' 검색 완료: {len(assets)}개 발견")
 
             # Phase 4: Fallback - 결과가 없으면 제약 완화
-            if len(assets) == 0 and (orientation != "all" or editors_choice):
+            if len(assets) == 0 and fallback and (orientation != "all" or editors_choice):
                 print(f"[Pixabay] Phase 4: 결과 없음 - Fallback 시도 (orientation=all, editors_choice=False)")
-                return self._search_with_fallback(query, per_page, video_type, safesearch, min_width, min_height)
+                return self._search_with_fallback(
+                    query, per_page, video_type, safesearch, min_width, min_height, target_size, raise_on_error
+                )
 
             return assets
 
         except requests.exceptions.RequestException as e:
             print(f"[ERROR] Pixabay API 오류: {e}")
+            if raise_on_error:
+                raise
             return []
 
     def _search_with_fallback(
@@ -119,7 +136,9 @@ class PixabayProvider:
         video_type: str,
         safesearch: bool,
         min_width: int,
-        min_height: int
+        min_height: int,
+        target_size: Optional[Tuple[int, int]] = None,
+        raise_on_error: bool = False
     ) -> List[StockVideoAsset]:
         """
         Phase 4: Fallback 검색 (제약 완화)
@@ -139,7 +158,7 @@ class PixabayProvider:
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.BASE_URL,
                 params=params,
                 timeout=10
@@ -151,7 +170,7 @@ class PixabayProvider:
 
             assets = []
             for video in hits:
-                asset = self._parse_video(video, query)
+                asset = self._parse_video(video, query, target_size)
                 if asset:
                     assets.append(asset)
 
@@ -160,15 +179,25 @@ class PixabayProvider:
 
         except requests.exceptions.RequestException as e:
             print(f"[ERROR] Pixabay Fallback API 오류: {e}")
+            if raise_on_error:
+                raise
             return []
 
-    def _parse_video(self, video_data: Dict[str, Any], keyword: str) -> Optional[StockVideoAsset]:
+    def _parse_video(
+        self,
+        video_data: Dict[str, Any],
+        keyword: str,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[StockVideoAsset]:
         """
         Pixabay API 응답을 StockVideoAsset으로 변환
 
+        large / medium / small / tiny 중 target_size를 채우는 가장 작은 렌디션을 고릅니다.
+
         Args:
             video_data: Pixabay API 응답 데이터
             keyword: 검색 키워드
+            target_size: 렌디션이 채워야 하는 최소 크기 (None이면 1080x1920)
 
         Returns:
             StockVideoAsset 또는 None
@@ -177,32 +206,34 @@ class PixabayProvider:
             video_id = str(video_data.get('id'))
             duration = video_data.get('duration', 0)
 
-            # 비디오 파일 선택 (가장 높은 품질)
             videos = video_data.get('videos', {})
-
-            # 우선순위: large > medium > small > tiny
-            download_url = None
-            resolution = "1080x1920"
-
-            for quality in ['large', 'medium', 'small', 'tiny']:
-                if quality in videos:
-                    video_info = videos[quality]
-                    download_url = video_info.get('url')
-                    width = video_info.get('width', 1080)
-                    height = video_info.get('height', 1920)
-                    resolution = f"{width}x{height}"
-                    break
-
-            if not download_url:
+            candidates = [
+                {
+                    'url': info.get('url'),
+                    'width': info.get('width') or 0,
+                    'height': info.get('height') or 0,
+                    'fps': None,  # Pixabay API는 fps를 제공하지 않음
+                    'size': info.get('size')
+                }
+                for quality, info in videos.items()
+                if quality in ('large', 'medium', 'small', 'tiny') and isinstance(info, dict)
+            ]
+            selected = select_rendition(candidates, target_size)
+            if not selected:
                 return None
 
             return StockVideoAsset(
                 id=f"pixabay_{video_id}",
-                url=download_url,
+                url=selected['url'],
                 provider="pixabay",
                 keyword=keyword,
                 duration=duration,
-                resolution=resolution,
+                resolution=f"{selected['width']}x{selected['height']}",
+                width=selected['width'],
+                height=selected['height'],
+                fps=selected['fps'],
+                file_size=selected['size'],
+                tags=[tag.strip() for tag in (video_data.get('tags') or '').split(',') if tag.strip()],
                 downloaded=False
             )
 
@@ -238,7 +269,7 @@ class PixabayProvider:
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.MUSIC_BASE_URL,
                 params=params,
                 timeout=10
@@ -309,34 +340,14 @@ class PixabayProvider:
         Returns:
             저장된 파일 경로 또는 None
         """
-        os.makedirs(output_dir, exist_ok=True)
-
         filename = f"{music_info['id']}.mp3"
         filepath = os.path.join(output_dir, filename)
 
-        # 이미 다운로드된 경우
-        if os.path.exists(filepath):
-            print(f"[Pixabay] 이미 다운로드됨: {filename}")
-            return filepath
-
-        try:
-            print(f"[Pixabay] 음악 다운로드 시작: {filename}")
-            response = requests.get(music_info['url'], stream=True, timeout=60)
-            response.raise_for_status()
-
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-
-            print(f"[SUCCESS] 음악 다운로드 완료: {filepath}")
-            return filepath
-
-        except Exception as e:
-            print(f"[ERROR] 음악 다운로드 실패: {e}")
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            return None
+        print(f"[Pixabay] 음악 다운로드 시작: {filename}")
+        result = get_media_downloader().download(music_info['url'], filepath, session=self.session)
+        if result:
+            print(f"[SUCCESS] 음악 다운로드 완료: {result}")
+        return result
 
     def download_video(
         self,
@@ -353,34 +364,15 @@ class PixabayProvider:
         Returns:
             저장된 파일 경로 또는 None
         """
-        os.makedirs(output_dir, exist_ok=True)
-
-        filename = f"{asset.id}.mp4"
+        filename = rendition_filename(asset)
         filepath = os.path.join(output_dir, filename)
 
-        # 이미 다운로드된 경우
-        if os.path.exists(filepath):
-            print(f"[Pixabay] 이미 다운로드됨: {filename}")
-            return filepath
-
-        try:
-            print(f"[Pixabay] 다운로드 시작: {filename}")
-            response = requests.get(asset.url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-
-            print(f"[SUCCESS] 다운로드 완료: {filepath}")
-            return filepath
-
-        except Exception as e:
-            print(f"[ERROR] 다운로드 실패: {e}")
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            return None
+        # 임시 파일 → 검증 → 원자적 이동 (잘린 파일이 완료로 취급되지 않음, 끊기면 이어받기)
+        print(f"[Pixabay] 다운로드 시작: {filename}")
+        result = get_media_downloader().download(asset.url, filepath, session=self.session)
+        if result:
+            print(f"[SUCCESS] 다운로드 완료: {result}")
+        return result
 
     def __repr__(self):
         return "PixabayProvider()"
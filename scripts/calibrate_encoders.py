@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+인코더 프로필 속도 측정 스크립트
+현재 호스트에서 프로필별 "출력 1초당 인코딩 소요 초"를 측정합니다.
+
+사용 예:
+    python scripts/calibrate_encoders.py
+    python scripts/calibrate_encoders.py --duration 10 --profiles draft,standard --output data/encoder_calibration.json
+"""
+import sys
+import json
+import platform
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.encoder_profiles import ENCODER_PROFILES, calibrate_encoder_profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="인코더 프로필 속도 측정 (출력 1초당 소요 초)"
+    )
+
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=5.0,
+        help='측정 영상 길이 (초, 기본: 5)'
+    )
+
+    parser.add_argument(
+        '--resolution',
+        type=str,
+        default='1080x1920',
+        help='해상도 WIDTHxHEIGHT (기본: 1080x1920)'
+    )
+
+    parser.add_argument(
+        '--fps',
+        type=int,
+        default=30,
+        help='프레임 레이트 (기본: 30)'
+    )
+
+    parser.add_argument(
+        '--profiles',
+        type=str,
+        default=','.join(ENCODER_PROFILES),
+        help=f"측정할 프로필 (쉼표 구분, 기본: {','.join(ENCODER_PROFILES)})"
+    )
+
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='결과 JSON 저장 경로 (선택)'
+    )
+
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.resolution.lower().split('x'))
+    profiles = [p.strip() for p in args.profiles.split(',') if p.strip()]
+
+    print("=" * 70)
+    print(f"  인코더 프로필 측정: {width}x{height} @ {args.fps}fps, {args.duration:.1f}초")
+    print("=" * 70)
+
+    results = calibrate_encoder_profiles(
+        duration=args.duration,
+        resolution=(width, height),
+        fps=args.fps,
+        profiles=profiles
+    )
+
+    print(f"\n{'프로필':<10} {'preset':<10} {'CRF':>4} {'s/s':>8} {'실시간 배수':>10} {'크기(MB)':>9}")
+    for name, result in results.items():
+        profile = ENCODER_PROFILES[name]
+        rate = result["seconds_per_output_second"]
+        realtime = f"{1 / rate:.1f}x" if rate > 0 else "-"
+        print(f"{name:<10} {profile.preset:<10} {profile.crf:>4} {rate:>8.3f} {realtime:>10} {result['file_size_mb']:>9.2f}")
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "measured_at": datetime.now().isoformat(),
+                "host": platform.node(),
+                "resolution": [width, height],
+                "fps": args.fps,
+                "duration": args.duration,
+                "profiles": results
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
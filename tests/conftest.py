@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+pytest 공통 설정
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pytest
+import requests
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.models import StockVideoAsset
+from core.services import media_probe, tts_cache
+from core.services.rendition import rendition_filename
+
+
+@pytest.fixture(scope="session", autouse=True)
+def media_probe_index(tmp_path_factory):
+    """미디어 정보 색인을 저장소의 data/media_probe.db 대신 임시 디렉토리에 (spawn 워커도 환경변수로 따라감)"""
+    index_path = tmp_path_factory.mktemp("media_probe") / "media_probe.db"
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("MEDIA_PROBE_DB", str(index_path))
+        patch.setattr(media_probe, "_media_probe_service", None)
+        yield index_path
+        if media_probe._media_probe_service is not None:
+            media_probe._media_probe_service.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_tts_cache(tmp_path_factory):
+    """미리듣기 / 렌더링 공유 TTS 캐시(get_tts_cache)를 저장소의 downloads/audio/tts_cache 대신 임시 디렉토리에"""
+    cache_dir = tmp_path_factory.mktemp("tts_cache")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("TTS_CACHE_DIR", str(cache_dir))
+        patch.setattr(tts_cache, "_tts_cache", None)
+        yield cache_dir
+        if tts_cache._tts_cache is not None:
+            tts_cache._tts_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def refill_stock_limiters():
+    """가짜 제공자 검색이 전역 속도 제한 버킷을 비우므로 테스트 후 다시 채움 (다른 테스트의 시간 측정 보호)"""
+    yield
+    from core.services.rate_limiter import TokenBucket, get_provider_limiter
+
+    for name in ("pexels", "pixabay"):
+        limiter = get_provider_limiter(name)
+        limiter.bucket = TokenBucket(limiter.bucket.rate, limiter.bucket.capacity)
+
+
+# ==================== 가짜 스톡 제공자 ====================
+
+def stock_asset(provider: str, query: str, clip_id: Optional[str] = None, **fields) -> StockVideoAsset:
+    """검색 결과용 StockVideoAsset (id 기본값 <제공자>_<검색어>, 길이 5초)"""
+    fields.setdefault("duration", 5.0)
+    return StockVideoAsset(id=clip_id or f"{provider}_{query}", url="http://example.invalid/v.mp4",
+                           provider=provider, keyword=query, **fields)
+
+
+class FakeStockProvider:
+    """
+    검색 / 다운로드 호출을 기록하는 가짜 스톡 제공자
+
+    기본 검색 결과는 검색어마다 1개이고, 검색어에 'miss-<이름>'이 있으면 결과 없음,
+    'error'가 있으면 연결 오류입니다. 테스트별 결과는 results 함수로 바꿉니다.
+
+    calls (여러 제공자가 같은 리스트를 공유할 수 있음):
+        ("search", 이름, 검색어, 나머지 인자 dict) / ("download", 이름, 에셋 id)
+    """
+
+    def __init__(
+        self,
+        name: str = "pexels",
+        calls: Optional[list] = None,
+        results: Optional[Callable[["FakeStockProvider", str, dict], Any]] = None,
+        delay: float = 0.0,
+        size: Optional[Tuple[int, int]] = None,
+        download: Optional[Callable[[StockVideoAsset, str], str]] = None
+    ):
+        """
+        Args:
+            name: 제공자 이름 (결과의 provider / id 접두사)
+            calls: 호출 기록 리스트 (None이면 새 리스트)
+            results: (제공자, 검색어, 나머지 인자) → 결과 리스트 또는 예외 (None이면 기본 결과)
+            delay: 검색마다 지연 (초)
+            size: 결과 영상 크기 (width, height)
+            download: (에셋, 출력 디렉토리) → 경로 (None이면 파일을 만들지 않고 렌디션 파일명 경로만 반환)
+        """
+        self.name = name
+        self.calls = [] if calls is None else calls
+        self.results = results
+        self.delay = delay
+        self.size = size
+        self.download = download
+        self.api_key = "key"
+        self.searches = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def asset(self, query: str, clip_id: Optional[str] = None, **fields) -> StockVideoAsset:
+        """이 제공자의 결과 에셋"""
+        if self.size:
+            fields.setdefault("width", self.size[0])
+            fields.setdefault("height", self.size[1])
+        return stock_asset(self.name, query, clip_id, **fields)
+
+    def search_videos(self, query=None, per_page=3, **kwargs):
+        with self._lock:
+            self.calls.append(("search", self.name, query, kwargs))
+            self.searches += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if self.results:
+                outcome = self.results(self, query, kwargs)
+            elif "error" in query:
+                outcome = requests.exceptions.ConnectionError("connection reset")
+            elif f"miss-{self.name}" in query:
+                outcome = []
+            else:
+                outcome = [self.asset(query)]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def download_video(self, asset, output_dir):
+        with self._lock:
+            self.calls.append(("download", self.name, asset.id))
+        if self.download:
+            return self.download(asset, output_dir)
+        return str(Path(output_dir) / rendition_filename(asset))
+
+
+def make_manager(temp_dir: str, providers: Dict[str, FakeStockProvider], **kwargs):
+    """가짜 제공자를 쓰는 AssetManager (BGM 없음, 나머지 인자는 AssetManager로 전달)"""
+    from core.asset_manager import AssetManager
+
+    kwargs.setdefault("bgm_enabled", False)
+    manager = AssetManager(download_dir=temp_dir, **kwargs)
+    manager.providers = dict(providers)
+    return manager
@@ -4,6 +4,7 @@ Asset Manager 모듈 테스트 스크립트
 """
 import sys
 import os
+import tempfile
 from pathlib import Path
 
 # 프로젝트 루트를 sys.path에 추가
@@ -17,6 +18,7 @@ load_dotenv(project_root / ".env")
 from core.asset_manager import AssetManager
 from core.planner import ContentPlanner
 from core.models import VideoFormat
+from core.services.tts_cache import TTSCache
 
 
 def test_stock_providers():
@@ -89,18 +91,21 @@ def test_tts_generation():
     print("="*60)
 
     try:
-        manager = AssetManager(tts_provider="gtts")
-
-        # 간단한 텍스트로 TTS 생성
-        text = "안녕하세요. 이것은 테스트 음성입니다."
-        filepath = manager._generate_gtts(text)
-
-        if filepath and os.path.exists(filepath):
-            file_size = os.path.getsize(filepath) / 1024  # KB
-            print(f"[SUCCESS] TTS 생성 완료: {filepath}")
-            print(f"[INFO] 파일 크기: {file_size:.2f} KB")
-        else:
-            print("[ERROR] TTS 생성 실패")
+        # TTS 캐시는 임시 디렉토리에 (저장소의 downloads/audio/tts_cache에 남지 않도록)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = AssetManager(tts_provider="gtts", tts_cache=TTSCache(cache_dir=temp_dir))
+
+            # 간단한 텍스트로 TTS 생성
+            text = "안녕하세요. 이것은 테스트 음성입니다."
+            filepath = manager._generate_gtts(text)
+
+            if filepath and os.path.exists(filepath):
+                file_size = os.path.getsize(filepath) / 1024  # KB
+                print(f"[SUCCESS] TTS 생성 완료: {filepath}")
+                print(f"[INFO] 파일 크기: {file_size:.2f} KB")
+            else:
+                print("[ERROR] TTS 생성 실패")
+            manager.tts_cache.close()
 
     except Exception as e:
         print(f"[ERROR] TTS 생성 실패: {e}")
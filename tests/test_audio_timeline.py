@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+AudioTimeline (샘플 단위 오디오 타임라인) 테스트 스크립트
+"""
+import sys
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pytest
+
+from core.services.audio_timeline import AudioTimeline, decode_audio
+from core.services.ffmpeg_render_service import find_ffmpeg
+
+
+def test_sample_accurate_placement():
+    """세그먼트 / 무음 / 겹치는 배치가 정확한 샘플 위치에 합산"""
+    print("\n" + "="*60)
+    print("[TEST 1] 샘플 단위 배치")
+    print("="*60)
+
+    timeline = AudioTimeline(sample_rate=1000, channels=2)
+    a = np.full((250, 2), 0.1, dtype=np.float32)
+    b = np.full((100, 2), 0.2, dtype=np.float32)
+
+    assert timeline.append(a) == (0, 250)
+    assert timeline.append_silence(0.5) == (250, 750)
+    assert timeline.append(b, gain=2.0) == (750, 850)
+    timeline.place(b, 0.2)  # 200 ~ 300: a 끝부분 + 무음 앞부분과 겹침
+
+    assert timeline.num_samples == 850
+    assert timeline.duration == 0.85
+
+    out = timeline.render()
+    assert out.shape == (850, 2)
+    assert np.allclose(out[:200], 0.1)
+    assert np.allclose(out[200:250], 0.3)
+    assert np.allclose(out[250:300], 0.2)
+    assert np.allclose(out[300:750], 0.0)
+    assert np.allclose(out[750:], 0.4)
+
+    # 모노 입력은 채널 복제, 길이 지정 시 자르기/패딩
+    mono = AudioTimeline(sample_rate=1000, channels=2)
+    mono.append(np.ones(10, dtype=np.float32))
+    assert mono.render(0.02).shape == (20, 2)
+    assert np.allclose(mono.render(0.005), 1.0)
+
+
+def test_bed_loop_fade_and_clip():
+    """BGM 베드 반복 + 선형 페이드 + 게인, 합산 결과 클리핑"""
+    print("\n" + "="*60)
+    print("[TEST 2] BGM 베드")
+    print("="*60)
+
+    timeline = AudioTimeline(sample_rate=100, channels=1)
+    timeline.append_silence(10.0)  # 1000 샘플
+    bed = (np.arange(300, dtype=np.float32) / 300)[:, None]
+    timeline.add_bed(bed, gain=0.5, fade_in=1.0, fade_out=2.0)
+    out = timeline.render()[:, 0]
+
+    n = np.arange(1000)
+    expected = (n % 300) / 300 * 0.5
+    expected = expected * np.minimum(n / 100, 1.0)
+    expected = expected * np.minimum((1000 - n) / 200, 1.0)
+    assert np.allclose(out, expected, atol=1e-6)
+
+    loud = AudioTimeline(sample_rate=100, channels=1)
+    loud.append(np.full(50, 0.9, dtype=np.float32))
+    loud.append(np.full(50, -0.9, dtype=np.float32))
+    loud.add_bed(np.full((10, 1), 0.5, dtype=np.float32), gain=1.0)
+    out = loud.render()[:, 0]
+    assert out.max() == 1.0 and out.min() == pytest.approx(-0.4)
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_decode_once_and_write_master():
+    """파일은 한 번만 디코딩, WAV 마스터 기록 → 재디코딩 결과 일치"""
+    print("\n" + "="*60)
+    print("[TEST 3] 디코딩 캐시 + 마스터 기록")
+    print("="*60)
+
+    ffmpeg_cmd = find_ffmpeg()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tone = os.path.join(temp_dir, "tone.wav")
+        subprocess.run(
+            [ffmpeg_cmd, "-y", "-loglevel", "error",
+             "-f", "lavfi", "-i", "sine=frequency=440:duration=0.5:sample_rate=44100", tone],
+            check=True
+        )
+
+        timeline = AudioTimeline()
+        first = timeline.load(tone)
+        assert timeline.load(tone) is first  # 경로별 캐시
+        assert first.shape == (22050, 2)
+
+        timeline.append(tone)
+        timeline.append_silence(0.25)
+        timeline.append(tone, gain=0.5)
+
+        master = timeline.write(os.path.join(temp_dir, "master.wav"))
+        decoded = decode_audio(master)
+        assert decoded.shape == (22050 * 2 + 11025, 2)
+        assert np.abs(decoded - timeline.render()).max() < 1e-3
+
+        m4a = timeline.write(os.path.join(temp_dir, "master.m4a"))
+        assert os.path.getsize(m4a) > 0
+
+
+if __name__ == "__main__":
+    test_sample_accurate_placement()
+    test_bed_loop_fade_and_clip()
+    test_decode_once_and_write_master()
+    print("\n[OK] 모든 테스트 통과")
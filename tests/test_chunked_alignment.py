@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+긴 오디오 청크 분할 + 병렬 Whisper 전사 테스트 스크립트
+
+실제 Whisper 대신 청크 길이를 단어로 돌려주는 가짜 모델 모듈을 워커에 로드합니다.
+"""
+import sys
+import tempfile
+import textwrap
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.ffmpeg_render_service import find_ffmpeg
+from core.services.whisper_worker import WhisperWorkerPool
+from core.services.alignment_service import AlignmentService, AlignmentCache, plan_chunks
+
+
+FAKE_MODEL = textwrap.dedent('''
+    import os
+    import time
+    import wave
+
+
+    class FakeModel:
+        def transcribe(self, audio_path, language=None, word_timestamps=True, verbose=False):
+            with wave.open(audio_path, "rb") as f:
+                duration = f.getnframes() / f.getframerate()
+            time.sleep(0.3)
+            words = [{"word": "len=%g" % round(duration, 1), "start": 0.5, "end": duration - 0.5}]
+            return {"segments": [{"text": "", "start": 0.0, "end": duration, "words": words}]}
+
+
+    def load_model(model_size):
+        return FakeModel()
+''')
+
+SAMPLE_RATE = 16000
+
+
+def _write_wav(path: Path, parts):
+    """[(길이, 소리 여부), ...] → 16kHz 모노 WAV"""
+    chunks = []
+    for seconds, voiced in parts:
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        chunks.append(0.5 * np.sin(2 * np.pi * 220 * t) if voiced else np.zeros(len(t)))
+    pcm = (np.concatenate(chunks) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(pcm.tobytes())
+
+
+def test_plan_chunks():
+    """목표 길이를 넘는 첫 경계에서 자르고, 짧은 꼬리는 합침"""
+    print("\n" + "="*60)
+    print("[TEST 1] 청크 계획")
+    print("="*60)
+
+    assert plan_chunks(15.0, [4.0, 10.0], 3.0) == [(0.0, 4.0), (4.0, 10.0), (10.0, 15.0)]
+    assert plan_chunks(15.0, [2.0, 4.0, 10.0], 6.0) == [(0.0, 10.0), (10.0, 15.0)]
+    assert plan_chunks(15.0, [4.0, 14.5], 3.0) == [(0.0, 4.0), (4.0, 15.0)]
+    assert plan_chunks(15.0, [], 3.0) == [(0.0, 15.0)]
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_parallel_chunks_stitched_and_streamed():
+    """세그먼트 경계 / 무음에서 나눈 청크를 여러 워커에서 전사하고 오프셋을 더해 이어 붙임"""
+    print("\n" + "="*60)
+    print("[TEST 2] 청크 병렬 전사 + 스트리밍")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Path(temp_dir, "fake_chunk_model.py").write_text(FAKE_MODEL, encoding="utf-8")
+        sys.path.insert(0, temp_dir)
+        pool = WhisperWorkerPool("tiny", workers=2, loader="fake_chunk_model:load_model")
+
+        try:
+            audio = Path(temp_dir, "long.wav")
+            _write_wav(audio, [(4.0, True), (6.0, True), (5.0, True)])
+
+            service = AlignmentService(
+                model_size="tiny",
+                cache=AlignmentCache(":memory:"),
+                worker=pool,
+                chunk_min_duration=8.0,
+                chunk_seconds=3.0,
+                parallel_chunks=2
+            )
+
+            # 세그먼트 경계 사용
+            streamed = []
+            words = service.extract_word_timestamps(
+                str(audio), language="ko", boundaries=[4.0, 10.0],
+                on_chunk=lambda index, total, chunk_words: streamed.append((index, total, chunk_words))
+            )
+            assert [w["word"] for w in words] == ["len=4", "len=6", "len=5"]
+            assert [w["start"] for w in words] == [0.5, 4.5, 10.5]
+            assert [w["end"] for w in words] == [3.5, 9.5, 14.5]
+
+            # 청크마다 한 번씩, 완료 순서대로 전달
+            assert sorted(index for index, _, _ in streamed) == [0, 1, 2]
+            assert all(total == 3 for _, total, _ in streamed)
+            assert pool.started_workers == 2
+
+            # 경계가 없으면 무음 중앙에서 자름 (4초 발화 + 1초 무음 + 5초 발화)
+            gapped = Path(temp_dir, "gapped.wav")
+            _write_wav(gapped, [(4.0, True), (1.0, False), (5.0, True)])
+            words = service.extract_word_timestamps(str(gapped), language="ko")
+            assert [w["word"] for w in words] == ["len=4.5", "len=5.5"]
+            assert abs(words[0]["end"] - 4.0) < 0.05 and abs(words[1]["start"] - 5.0) < 0.05
+
+            # 짧은 오디오는 나누지 않음
+            short = Path(temp_dir, "short.wav")
+            _write_wav(short, [(3.0, True)])
+            assert [w["word"] for w in service.extract_word_timestamps(str(short))] == ["len=3"]
+        finally:
+            pool.close()
+            sys.path.remove(temp_dir)
+
+
+if __name__ == "__main__":
+    test_plan_chunks()
+    test_parallel_chunks_stitched_and_streamed()
+    print("\n[OK] 모든 테스트 통과")
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 클립 라이브러리 (역색인 + BM25 + 네트워크 없는 재사용) 테스트 스크립트
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import FakeStockProvider, make_manager
+from core.models import ContentPlan, ScriptSegment, StockVideoAsset
+from core.services.clip_library import ClipLibrary, tokenize
+from core.services.rendition import rendition_filename
+from core.services.stock_search_cache import StockSearchCache
+
+
+def _clip(library_dir: str, clip_id: str, keyword: str, tags=None, width=1080, height=1920, touch=True):
+    path = Path(library_dir) / f"{clip_id}_{width}x{height}.mp4"
+    if touch:
+        path.touch()
+    return StockVideoAsset(id=clip_id, url="http://example.invalid/v.mp4", provider=clip_id.split("_")[0],
+                           keyword=keyword, duration=8.0, width=width, height=height,
+                           tags=tags or [], local_path=str(path), downloaded=True)
+
+
+def test_tokenize_and_ranked_search():
+    """불용어/복수형 정리, 일치 점수 기준, BM25 순위, 크기 필터, 없어진 파일 정리"""
+    print("\n" + "="*60)
+    print("[TEST 1] 토큰화 / 순위 / 점수 기준")
+    print("="*60)
+
+    assert tokenize("Happy dogs in the Park, 4K footage") == ["happy", "dog", "park", "4k"]
+    assert tokenize("beaches glass bus") == ["beach", "glass", "bus"]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library = ClipLibrary(temp_dir)
+        library.add(_clip(temp_dir, "pexels_1", "happy dog park", ["dog", "park", "grass"]), "happy dog park")
+        library.add(_clip(temp_dir, "pixabay_2", "dog", ["dog", "animal", "pet", "cute", "fur"]), "dog on sofa")
+        library.add(_clip(temp_dir, "pexels_3", "city night", ["city", "night", "traffic"]), "city night")
+        library.add(_clip(temp_dir, "pexels_4", "happy dog park", width=540, height=960), "happy dog park")
+        library.add(_clip(temp_dir, "pexels_5", "happy dog park", touch=False), "happy dog park")
+
+        # 가장 잘 맞는 클립 먼저, 작은 렌디션은 목표 크기를 못 채워 제외, 파일 없는 항목은 색인에서 삭제
+        matches = library.search("Happy dogs at the park", target_size=(1080, 1920), min_score=0.7)
+        assert [asset.id for asset, _ in matches] == ["pexels_1"]
+        asset, score = matches[0]
+        assert score == 1.0 and asset.local_path.endswith("pexels_1_1080x1920.mp4") and asset.downloaded
+        assert asset.tags == ["dog", "park", "grass"]
+        assert library.stats()["clips"] == 4
+
+        # 검색어 일부만 맞으면 기준 미만 → miss
+        assert library.search("dog running on beach", min_score=0.7) == []
+        # 흔한 토큰(dog)만 맞은 클립은 점수가 낮음 (처음 보는 토큰의 idf가 큼)
+        loose = library.search("dog running on beach", min_score=0.0)
+        assert loose and all(score < 0.2 for _, score in loose)
+        assert library.search("the video of") == []
+
+        # 같은 영상을 다른 검색어로 다시 받으면 검색어가 누적됨 (사용 기록 유지)
+        library.record_use(asset)
+        library.add(_clip(temp_dir, "pexels_3", "city night"), "neon street")
+        assert [a.id for a, _ in library.search("neon street")] == ["pexels_3"]
+        assert library.stats()["total_uses"] == 1
+
+        # 사용 횟수가 적은 클립 우선 (점수가 같을 때)
+        library.add(_clip(temp_dir, "pexels_6", "happy dog park", ["dog", "park", "grass"]), "happy dog park")
+        library.record_use(asset)
+        assert library.search("happy dog park", target_size=(1080, 1920))[0][0].id == "pexels_6"
+
+
+def _numbered_result(provider, query, kwargs):
+    """검색마다 새 영상 (pexels_1, pexels_2, ...)"""
+    return [provider.asset(query, f"pexels_{provider.searches}", duration=6.0, tags=[query])]
+
+
+def _touch_download(asset, output_dir):
+    """다운로드하면 빈 파일 생성"""
+    path = Path(output_dir) / rendition_filename(asset)
+    path.touch()
+    return str(path)
+
+
+def _calls(calls: list) -> list:
+    """(종류, 검색어 또는 에셋 id)"""
+    return [(call[0], call[2]) for call in calls]
+
+
+def test_asset_manager_reuses_local_clips():
+    """비슷한 검색어는 네트워크 없이 로컬 라이브러리에서, 새 주제만 검색/다운로드"""
+    print("\n" + "="*60)
+    print("[TEST 2] AssetManager 로컬 재사용")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        calls = []
+        provider = FakeStockProvider("pexels", calls, results=_numbered_result, size=(1080, 1920),
+                                     download=_touch_download)
+        manager = make_manager(temp_dir, {"pexels": provider}, search_cache=StockSearchCache(":memory:"))
+
+        first = ContentPlan(title="t", description="d", segments=[
+            ScriptSegment(text="a", keyword="dog", image_search_query="happy dog park"),
+        ])
+        assert len(manager._collect_stock_videos(first)) == 1
+        assert _calls(calls) == [("search", "happy dog park"), ("download", "pexels_1")]
+
+        calls.clear()
+        second = ContentPlan(title="t", description="d", segments=[
+            ScriptSegment(text="a", keyword="dog", image_search_query="happy dogs in a park"),
+            ScriptSegment(text="b", keyword="sea", image_search_query="stormy sea waves"),
+        ])
+        assets = manager._collect_stock_videos(second)
+        assert [a.id for a in assets] == ["pexels_1", "pexels_2"]
+        assert assets[0].local_path.endswith("pexels_1_1080x1920.mp4")
+        # 첫 세그먼트는 네트워크 호출 없음
+        assert _calls(calls) == [("search", "stormy sea waves"), ("download", "pexels_2")]
+
+        library = manager._get_clip_library()
+        stats = library.stats()
+        assert stats["clips"] == 2 and stats["total_uses"] == 3
+
+        # cache_enabled=False면 라이브러리도 사용하지 않음
+        manager.cache_enabled = False
+        calls.clear()
+        manager._collect_stock_videos(first)
+        assert _calls(calls)[0] == ("search", "happy dog park")
+
+
+def test_import_existing_cache_and_search_speed():
+    """기존 검색어별 JSON 캐시 색인 + 큰 라이브러리에서도 ms 단위 검색"""
+    print("\n" + "="*60)
+    print("[TEST 3] 기존 캐시 가져오기 / 검색 속도")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_dir = Path(temp_dir) / "cache"
+        video_dir = Path(temp_dir) / "stock_videos"
+        cache_dir.mkdir()
+        video_dir.mkdir()
+        kept = _clip(str(video_dir), "pixabay_9", "sunset beach", ["sunset", "sea"])
+        gone = _clip(str(video_dir), "pixabay_10", "old", touch=False)
+        for name, asset in (("a", kept), ("b", gone)):
+            (cache_dir / f"{name}.json").write_text(json.dumps(asset.model_dump()), encoding="utf-8")
+
+        library = ClipLibrary(str(video_dir))
+        assert library.import_asset_cache(str(cache_dir)) == 1
+        assert library.search("beach at sunset")[0][0].id == "pixabay_9"
+
+        # 2만 개 (단어 3천 개에서 무작위 검색어/태그)
+        random.seed(7)
+        words = [f"w{i}" for i in range(3000)]
+        items = []
+        for i in range(20_000):
+            query = " ".join(random.choices(words, k=3))
+            asset = _clip(str(video_dir), f"pexels_{i}", query, [" ".join(random.choices(words, k=4))], touch=False)
+            items.append((asset, query))
+        library.add_many(items)
+        assert library.stats()["clips"] == 20_001
+
+        elapsed = []
+        for query in ["w1 w2 w3", "w10 w20", "unknown words here", "sunset beach"]:
+            start = time.perf_counter()
+            library.search(query, target_size=(1080, 1920), min_score=0.9)
+            elapsed.append(time.perf_counter() - start)
+        print(f"검색 시간: {[round(e * 1000, 2) for e in elapsed]} ms")
+        assert max(elapsed) < 0.05
+
+
+if __name__ == "__main__":
+    test_tokenize_and_ranked_search()
+    test_asset_manager_reuses_local_clips()
+    test_import_existing_cache_and_search_speed()
+    print("\n[OK] 모든 테스트 통과")
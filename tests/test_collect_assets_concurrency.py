@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+collect_assets 단계 동시 실행 (스톡 / TTS / BGM) 테스트 스크립트
+"""
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import FakeStockProvider, make_manager
+from core.asset_manager import AssetManager, AssetCollectionCancelled
+from core.services.rate_limiter import get_provider_limiter
+from core.models import ContentPlan, ScriptSegment, AudioAsset, BGMAsset, MoodType, TTSProvider
+
+
+def _plan(count: int) -> ContentPlan:
+    return ContentPlan(
+        title="동시 수집 테스트",
+        description="테스트",
+        segments=[ScriptSegment(text=f"문장 {i}", keyword=f"keyword {i}") for i in range(count)]
+    )
+
+
+def test_phases_overlap_and_report_timings():
+    """세 단계가 동시에 실행되어 전체 시간 ≈ 가장 긴 단계"""
+    print("\n" + "="*60)
+    print("[TEST 1] 단계 동시 실행 + 단계별 시간")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        provider = FakeStockProvider(delay=0.2)
+        manager = make_manager(temp_dir, {"pexels": provider}, cache_enabled=False)
+
+        def fake_tts(content_plan, account_id=None, tts_settings_override=None, cancel=None):
+            time.sleep(0.4)
+            return AudioAsset(text="x", provider=TTSProvider.GTTS, local_path="a.wav", duration=3.0), []
+
+        def fake_bgm(content_plan):
+            time.sleep(0.3)
+            return BGMAsset(name="b", local_path="b.mp3", mood=MoodType.CALM, duration=60.0)
+
+        manager._generate_tts = fake_tts
+        manager._select_bgm = fake_bgm
+        manager.bgm_enabled, manager.bgm_manager = True, object()
+
+        started = time.perf_counter()
+        bundle = manager.collect_assets(_plan(2))
+        elapsed = time.perf_counter() - started
+
+        assert len(bundle.videos) == 2 and bundle.audio and bundle.bgm
+        assert set(bundle.phase_timings) == {"stock", "tts", "bgm", "total"}
+        assert bundle.phase_timings["stock"] >= 0.2 and bundle.phase_timings["tts"] >= 0.4
+        # 순차 실행이면 0.9초 이상
+        assert elapsed < 0.9, f"단계가 순차 실행됨: {elapsed:.2f}초"
+        assert bundle.phase_timings["total"] < sum(bundle.phase_timings[k] for k in ("stock", "tts", "bgm"))
+
+
+def test_failure_cancels_other_phases():
+    """TTS 단계가 실패하면 스톡 단계는 다음 세그먼트 전에 멈추고 예외가 전달됨"""
+    print("\n" + "="*60)
+    print("[TEST 2] 한 단계 실패 → 나머지 취소")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        provider = FakeStockProvider(delay=0.3)
+        manager = make_manager(temp_dir, {"pexels": provider}, cache_enabled=False)
+
+        def failing_tts(content_plan, account_id=None, tts_settings_override=None, cancel=None):
+            time.sleep(0.1)
+            raise RuntimeError("TTS 제공자 인증 실패")
+
+        manager._generate_tts = failing_tts
+
+        started = time.perf_counter()
+        with pytest.raises(RuntimeError, match="인증 실패"):
+            manager.collect_assets(_plan(20))
+        elapsed = time.perf_counter() - started
+
+        # 실패 전에 시작된 검색(동시 요청 상한 이하)만 끝까지 진행
+        assert provider.searches <= get_provider_limiter("stock").max_concurrency
+        assert elapsed < 1.0
+
+
+def test_tts_synthesis_stops_on_cancel():
+    """취소되면 아직 시작하지 않은 TTS 요청은 보내지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 3] TTS 요청 취소")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = AssetManager(download_dir=temp_dir, bgm_enabled=False, tts_workers=1)
+        cancel = threading.Event()
+        calls = []
+
+        def synthesize(text):
+            calls.append(text)
+            if len(calls) == 2:
+                cancel.set()
+            return f"{text}.mp3"
+
+        with pytest.raises(AssetCollectionCancelled):
+            manager._synthesize_concurrently(synthesize, [f"문장 {i}" for i in range(8)], cancel)
+        assert len(calls) == 2
+
+        # 취소가 없으면 그대로 동작
+        assert len(manager._synthesize_concurrently(synthesize, ["a", "b"])) == 2
+
+
+if __name__ == "__main__":
+    test_phases_overlap_and_report_timings()
+    test_failure_cancels_other_phases()
+    test_tts_synthesis_stops_on_cancel()
+    print("\n[OK] 모든 테스트 통과")
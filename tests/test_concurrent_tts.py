@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+세그먼트 TTS 동시 생성 + 제공자별 속도 제한 테스트 스크립트
+"""
+import sys
+import time
+import random
+import threading
+import tempfile
+import wave
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pytest
+
+from core.services.rate_limiter import TokenBucket, ProviderLimiter
+from core.services.ffmpeg_render_service import find_ffmpeg
+
+
+def test_token_bucket_and_concurrency_cap():
+    """토큰 버킷 속도 + 세마포어 동시 요청 상한"""
+    print("\n" + "="*60)
+    print("[TEST 1] TokenBucket / ProviderLimiter")
+    print("="*60)
+
+    bucket = TokenBucket(rate=20.0, capacity=2)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    # 버스트 2개는 즉시, 나머지 4개는 초당 20개 → 약 0.2초
+    assert 0.15 <= elapsed < 0.6
+
+    limiter = ProviderLimiter("test", max_concurrency=2, rate=0, burst=1)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def call():
+        with limiter:
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max(peak) == 2
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_concurrent_segments_keep_order(monkeypatch):
+    """동시 생성 결과가 세그먼트 순서대로 조립되고, 실패 세그먼트는 다른 세그먼트를 막지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 2] 세그먼트 순서 / 실패 격리")
+    print("="*60)
+
+    import core.asset_manager as asset_manager_module
+    from core.asset_manager import AssetManager
+    from core.models import ContentPlan, ScriptSegment, VideoFormat
+
+    monkeypatch.setattr(asset_manager_module, "WHISPER_AVAILABLE", False)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = AssetManager(download_dir=temp_dir, bgm_enabled=False, tts_workers=4)
+        rng = random.Random(0)
+        calls = []
+
+        def fake_tts(text):
+            calls.append(text)
+            time.sleep(rng.uniform(0.0, 0.05))
+            if text == "실패":
+                raise RuntimeError("provider down")
+            seconds = 0.1 * int(text[-1])
+            path = Path(temp_dir) / f"{text}.wav"
+            with wave.open(str(path), "wb") as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(44100)
+                f.writeframes(np.zeros(int(44100 * seconds), dtype="<i2").tobytes())
+            return str(path)
+
+        manager._generate_gtts = fake_tts
+
+        texts = ["문장3", "문장1", "실패", "문장4 (1초 대기)", "문장2", "문장1"]
+        plan = ContentPlan(
+            title="t", description="d", tags=[], format=VideoFormat.SHORTS, target_duration=10,
+            segments=[ScriptSegment(text=t, keyword="k", duration=1.0) for t in texts]
+        )
+
+        audio, timings = manager._generate_tts(plan)
+
+        # 같은 텍스트는 한 번만 생성
+        assert sorted(calls) == sorted(set(calls)) and len(calls) == 5
+
+        assert [t.segment_index for t in timings] == [0, 1, 3, 4, 5]
+        expected = [0.3, 0.1, 1.4, 0.2, 0.1]
+        assert [round(t.tts_duration, 3) for t in timings] == expected
+        for prev, cur in zip(timings, timings[1:]):
+            assert cur.start_time == prev.end_time
+        assert abs(audio.duration - sum(expected)) < 1e-6
+
+
+if __name__ == "__main__":
+    test_token_bucket_and_concurrency_cap()
+    print("\n[OK] TEST 1 통과 (TEST 2는 pytest로 실행)")
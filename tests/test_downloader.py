@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+MediaDownloader (원자적 저장 / 이어받기 / 병렬 구간 / 검증) 테스트 스크립트
+
+로컬 HTTP 서버가 Range 요청, 연결 끊김, Range 미지원 서버를 흉내 냅니다.
+"""
+import sys
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.ffmpeg_render_service import find_ffmpeg
+from core.services.downloader import MediaDownloader
+from core.services.http_session import create_session
+
+
+class _MediaHandler(BaseHTTPRequestHandler):
+    """Range 지원 파일 서버 (클래스 속성으로 동작 제어)"""
+    protocol_version = "HTTP/1.1"
+    data = b""
+    support_ranges = True
+    drop_after = None  # 첫 GET에서 이만큼 보내고 연결 끊기
+    requests_log = []
+
+    def _headers(self, status, length, content_range=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(length))
+        if self.support_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers(200, len(self.data))
+
+    def do_GET(self):
+        cls = type(self)
+        range_header = self.headers.get("Range")
+        cls.requests_log.append(range_header)
+
+        start, end = 0, len(self.data) - 1
+        if range_header and self.support_ranges:
+            first, _, last = range_header.replace("bytes=", "").partition("-")
+            start = int(first)
+            end = int(last) if last else end
+            self._headers(206, end - start + 1, f"bytes {start}-{end}/{len(self.data)}")
+        else:
+            self._headers(200, len(self.data))
+
+        body = self.data[start:end + 1]
+        if cls.drop_after is not None:
+            body = body[:cls.drop_after]
+            cls.drop_after = None
+            self.wfile.write(body)
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def media_server():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video = Path(temp_dir, "source.mp4")
+        subprocess.run(
+            [find_ffmpeg(), "-hide_banner", "-loglevel", "error", "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10",
+             "-t", "2", "-pix_fmt", "yuv420p", "-movflags", "+faststart", str(video)],
+            check=True
+        )
+        _MediaHandler.data = video.read_bytes()
+        _MediaHandler.support_ranges = True
+        _MediaHandler.drop_after = None
+        _MediaHandler.requests_log = []
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _MediaHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            yield f"http://127.0.0.1:{server.server_address[1]}/video.mp4", Path(temp_dir)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_resume_after_drop_and_atomic_rename(media_server):
+    """연결이 끊기면 Range로 이어받고, 완료 전에는 최종 경로에 파일이 없음"""
+    print("\n" + "="*60)
+    print("[TEST 1] 이어받기 + 원자적 저장")
+    print("="*60)
+
+    url, temp_dir = media_server
+    dest = temp_dir / "out" / "pexels_1.mp4"
+    downloader = MediaDownloader(chunk_size=512, max_parts=1)
+
+    _MediaHandler.drop_after = 2560
+    assert downloader.download(url, str(dest), session=create_session()) == str(dest)
+    assert dest.read_bytes() == _MediaHandler.data
+    assert not downloader.temp_path(dest).exists()
+    assert _MediaHandler.requests_log == [None, "bytes=2560-"]
+
+    # 이전 실행이 남긴 임시 파일도 이어받음
+    dest2 = temp_dir / "out" / "pexels_2.mp4"
+    downloader.temp_path(dest2).write_bytes(_MediaHandler.data[:1000])
+    _MediaHandler.requests_log = []
+    assert downloader.download(url, str(dest2), session=create_session()) == str(dest2)
+    assert dest2.read_bytes() == _MediaHandler.data
+    assert _MediaHandler.requests_log == ["bytes=1000-"]
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_truncated_file_is_redownloaded(media_server):
+    """이전 버전이 남긴 잘린 .mp4는 완료로 취급하지 않고 다시 받음"""
+    print("\n" + "="*60)
+    print("[TEST 2] 잘린 파일 검증")
+    print("="*60)
+
+    url, temp_dir = media_server
+    dest = temp_dir / "pexels_3.mp4"
+    dest.write_bytes(_MediaHandler.data[:len(_MediaHandler.data) // 2])
+
+    downloader = MediaDownloader(max_parts=1)
+    assert not downloader.is_valid_file(dest)
+    assert downloader.download(url, str(dest), session=create_session()) == str(dest)
+    assert dest.read_bytes() == _MediaHandler.data
+
+    # 완전한 파일은 요청 없이 재사용
+    _MediaHandler.requests_log = []
+    assert downloader.download(url, str(dest), session=create_session()) == str(dest)
+    assert _MediaHandler.requests_log == []
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_parallel_parts_and_range_fallback(media_server):
+    """큰 파일은 구간을 동시에 받아 합치고, Range 미지원 서버는 단일 스트림으로 받음"""
+    print("\n" + "="*60)
+    print("[TEST 3] 병렬 구간 다운로드")
+    print("="*60)
+
+    url, temp_dir = media_server
+    total = len(_MediaHandler.data)
+    downloader = MediaDownloader(parallel_min_size=1, max_parts=3)
+
+    dest = temp_dir / "pixabay_1.mp4"
+    assert downloader.download(url, str(dest), session=create_session()) == str(dest)
+    assert dest.read_bytes() == _MediaHandler.data
+    assert len(_MediaHandler.requests_log) == 3
+    assert all(r and r.startswith("bytes=") for r in _MediaHandler.requests_log)
+    assert sorted(int(r[6:].split("-")[0]) for r in _MediaHandler.requests_log)[0] == 0
+    assert not list(temp_dir.glob("pixabay_1.part*"))
+
+    # Range 미지원 → 전체 다운로드
+    _MediaHandler.support_ranges = False
+    _MediaHandler.requests_log = []
+    dest2 = temp_dir / "pixabay_2.mp4"
+    assert downloader.download(url, str(dest2), session=create_session()) == str(dest2)
+    assert dest2.stat().st_size == total and dest2.read_bytes() == _MediaHandler.data
+    assert _MediaHandler.requests_log == [None]
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_size_mismatch_is_rejected(media_server):
+    """받은 파일이 재생할 수 없으면 최종 경로에 남기지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 4] 손상된 응답 거부")
+    print("="*60)
+
+    url, temp_dir = media_server
+    _MediaHandler.data = b"<html>not a video</html>"
+    dest = temp_dir / "pexels_bad.mp4"
+
+    assert MediaDownloader(max_parts=1).download(url, str(dest), session=create_session()) is None
+    assert not dest.exists()
+    assert not MediaDownloader.temp_path(dest).exists()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
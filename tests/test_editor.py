@@ -63,10 +63,138 @@ def test_editor_config():
         print(f"[ERROR] 설정 테스트 실패: {e}")
 
 
+def test_layout_geometry():
+    """포맷별 배치 계획 / 합성 크롭 영역"""
+    print("\n" + "="*60)
+    print("[TEST 3] 레이아웃 배치 계획")
+    print("="*60)
+
+    editor = VideoEditor()
+
+    # 쇼츠: 중앙 밴드 1080x960, 9:16 → 9:8 순차 크롭을 하나로 합침
+    shorts = editor._plan_layout_geometry(VideoFormat.SHORTS)
+    print(f"[INFO] 쇼츠: {shorts}")
+    assert shorts.canvas_size == (1080, 1920)
+    assert shorts.band_size == (1080, 960)
+    assert shorts.band_position == (0, 480)
+    # 1920x1080 원본 → 607x1080 (9:16) → 607x539 (9:8)
+    assert shorts.crop_rect(1920, 1080) == (656, 270, 607, 539)
+
+    # 가로형: 전체 해상도, 같은 비율이면 크롭 없음
+    landscape = VideoEditor(config=EditConfig(resolution=(1920, 1080)))._plan_layout_geometry(VideoFormat.LANDSCAPE)
+    assert landscape.band_size == (1920, 1080)
+    assert landscape.band_position == (0, 0)
+    assert landscape.crop_rect(3840, 2160) == (0, 0, 3840, 2160)
+
+    # 정사각형
+    square = VideoEditor(config=EditConfig(resolution=(1080, 1080)))._plan_layout_geometry(VideoFormat.SQUARE)
+    assert square.crop_rect(1920, 1080) == (420, 0, 1080, 1080)
+    print("[SUCCESS] 배치 계획 확인 완료")
+
+
+def test_render_chunk_plan():
+    """병렬 렌더링 청크 계획: 세그먼트 경계 기준, 크로스페이드 구간 회피, 프레임 정렬"""
+    print("\n" + "="*60)
+    print("[TEST 4] 병렬 렌더링 청크 계획")
+    print("="*60)
+
+    from core.models import SegmentTiming
+
+    timings = [
+        SegmentTiming(segment_index=i, text="", tts_duration=2.0, start_time=2.0 * i, end_time=2.0 * (i + 1))
+        for i in range(3)
+    ]
+
+    editor = VideoEditor(config=EditConfig(render_workers=3))
+    chunks = editor._plan_render_chunks(180, 3, 6.0, timings)
+    print(f"[INFO] 청크: {chunks}")
+
+    # 세그먼트 경계 2.0s / 4.0s는 크로스페이드(0.3s) 시작점 → 크로스페이드 끝(2.3s / 4.3s)으로 이동
+    assert chunks == [(0, 69), (69, 129), (129, 180)]
+
+    # 워커 2개: 균등 분할 지점(90)에 가장 가까운 경계 하나만 사용
+    editor = VideoEditor(config=EditConfig(render_workers=2))
+    assert editor._plan_render_chunks(180, 3, 6.0, timings) == [(0, 69), (69, 180)]
+
+    # 워커 1개: 분할 없음
+    editor = VideoEditor(config=EditConfig(render_workers=1))
+    assert editor._plan_render_chunks(180, 3, 6.0, timings) == [(0, 180)]
+
+
+def test_parallel_render_mixes_audio_once():
+    """병렬 렌더링: 부모는 오디오만 한 번 믹싱하고, 워커 타임라인은 오디오를 디코딩하지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 5] 병렬 렌더링 오디오 1회 믹싱")
+    print("="*60)
+
+    import subprocess
+    import tempfile
+    from core.models import AssetBundle, ContentPlan, StockVideoAsset
+    from core.services.ffmpeg_render_service import find_ffmpeg
+
+    class FakeAudio:
+        duration = 6.0
+
+        def close(self):
+            pass
+
+    class RecordingEditor(VideoEditor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.audio_loads = 0
+            self.timelines = 0
+            self.parallel_calls = []
+
+        def _load_audio_with_bgm(self, asset_bundle, target_duration):
+            self.audio_loads += 1
+            return FakeAudio()
+
+        def _build_timeline(self, *args, **kwargs):
+            self.timelines += 1
+            return super()._build_timeline(*args, **kwargs)
+
+        def _render_parallel(self, content_plan, asset_bundle, audio_clip, target_duration, output_path):
+            self.parallel_calls.append((audio_clip, target_duration))
+            return output_path
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plan = ContentPlan(title="t", description="d", format=VideoFormat.LANDSCAPE, target_duration=10, segments=[])
+        bundle = AssetBundle(videos=[])
+
+        # 부모: 타임라인(클립 로드 / 합성 / 자막)을 만들지 않고 오디오 길이만 워커에 전달
+        editor = RecordingEditor(config=EditConfig(render_workers=2, resolution=(160, 90), output_dir=temp_dir))
+        assert editor.create_video(plan, bundle, output_filename="out.mp4") == os.path.join(temp_dir, "out.mp4")
+        assert editor.audio_loads == 1 and editor.timelines == 0
+        assert editor.parallel_calls[0][1] == 6.0
+
+        ffmpeg = find_ffmpeg()
+        if not ffmpeg:
+            print("[SKIP] ffmpeg 없음 - 워커 타임라인 확인 생략")
+            return
+        clip_path = os.path.join(temp_dir, "clip.mp4")
+        subprocess.run([ffmpeg, "-v", "error", "-f", "lavfi", "-i", "testsrc2=size=160x90:rate=30:duration=8",
+                        "-pix_fmt", "yuv420p", clip_path], check=True)
+        bundle = AssetBundle(videos=[StockVideoAsset(id="v", url="u", provider="pexels", keyword="k",
+                                                     duration=8.0, local_path=clip_path)])
+
+        # 워커: 오디오 디코딩 / 믹싱 없이 부모가 정한 길이로 비디오만 구성
+        final_video, audio_clip, video_clips, target_duration = editor._build_timeline(
+            plan, bundle, with_audio=False, target_duration=6.0
+        )
+        try:
+            assert editor.audio_loads == 1
+            assert audio_clip is None and final_video.audio is None
+            assert target_duration == 6.0 and abs(final_video.duration - 6.0) < 0.5
+        finally:
+            final_video.close()
+            for clip in video_clips:
+                clip.close()
+
+
 def test_full_pipeline():
     """전체 파이프라인 테스트 (Planner + AssetManager + Editor)"""
     print("\n" + "="*60)
-    print("[TEST 3] 전체 파이프라인 (통합 테스트)")
+    print("[TEST 6] 전체 파이프라인 (통합 테스트)")
     print("="*60)
 
     # API 키 확인
@@ -199,7 +327,16 @@ def main():
         # 2. EditConfig 테스트
         test_editor_config()
 
-        # 3. 전체 파이프라인 테스트
+        # 3. 레이아웃 배치 계획 테스트
+        test_layout_geometry()
+
+        # 4. 병렬 렌더링 청크 계획 테스트
+        test_render_chunk_plan()
+
+        # 5. 병렬 렌더링 오디오 1회 믹싱 테스트
+        test_parallel_render_mixes_audio_once()
+
+        # 6. 전체 파이프라인 테스트
         test_full_pipeline()
 
         print("\n" + "="*60)
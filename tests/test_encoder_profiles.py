@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+인코더 프로필 테스트 스크립트
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.models import EditConfig, TemplateConfig
+from core.services.encoder_profiles import ENCODER_PROFILES, get_encoder_profile, resolve_encoder_profile
+from core.services.ffmpeg_render_service import FFmpegRenderService
+
+
+def test_profile_arguments():
+    """프로필 → MoviePy / ffmpeg 인코더 인자"""
+    print("\n" + "="*60)
+    print("[TEST 1] 프로필 인코더 인자")
+    print("="*60)
+
+    assert set(ENCODER_PROFILES) == {"draft", "preview", "standard", "archive"}
+
+    archive = get_encoder_profile("archive")
+    kwargs = archive.write_kwargs(30)
+    assert kwargs["codec"] == "libx264"
+    assert kwargs["preset"] == "slow"
+    assert kwargs["ffmpeg_params"] == ["-crf", "18", "-tune", "film", "-g", "120", "-movflags", "+faststart"]
+
+    args = get_encoder_profile("draft").ffmpeg_args(24)
+    assert args[:4] == ["-c:v", "libx264", "-preset", "ultrafast"]
+    assert args[args.index("-g") + 1] == "48"
+
+    try:
+        get_encoder_profile("lossless")
+        assert False, "알 수 없는 프로필은 ValueError"
+    except ValueError:
+        pass
+
+
+def test_profile_resolution_order():
+    """작업 지정 → EditConfig → 템플릿 → standard"""
+    print("\n" + "="*60)
+    print("[TEST 2] 프로필 선택 우선순위")
+    print("="*60)
+
+    from core.editor import VideoEditor
+
+    template = TemplateConfig(name="t", description="t", encoder_profile="archive")
+
+    editor = VideoEditor(EditConfig())
+    assert editor._encoder_profile().name == "standard"
+
+    editor.template = template
+    assert editor._encoder_profile().name == "archive"
+
+    editor.config = EditConfig(encoder_profile="preview")
+    assert editor._encoder_profile().name == "preview"
+
+    editor._encoder_profile_override = "draft"
+    assert editor._encoder_profile().name == "draft"
+    assert editor._video_write_kwargs()["preset"] == "ultrafast"
+
+    # 잘못된 이름은 건너뛰고 다음 후보 사용
+    assert resolve_encoder_profile("bogus", None, "archive").name == "archive"
+
+
+def test_ffmpeg_command_uses_profile():
+    """ffmpeg 렌더링 엔진 명령어에 프로필 인자 포함"""
+    print("\n" + "="*60)
+    print("[TEST 3] ffmpeg 명령어 프로필 적용")
+    print("="*60)
+
+    timeline = {
+        "width": 320, "height": 240, "fps": 30, "duration": 1.0,
+        "clip_size": (320, 240), "clip_position": (0, 0), "crop_ratios": [320 / 240],
+        "clips": [{"path": "a.mp4", "duration": 1.0}],
+        "crossfade": 0, "ken_burns": None, "overlays": [],
+        "encoder": get_encoder_profile("preview").ffmpeg_args(30),
+        "audio": {"tts": None, "bgm": None}
+    }
+
+    service = FFmpegRenderService()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        command = service.build_command(timeline, "out.mp4", os.path.join(temp_dir, "graph.txt"))
+
+    assert command[command.index("-preset") + 1] == "veryfast"
+    assert command[command.index("-crf") + 1] == "27"
+    assert command[command.index("-movflags") + 1] == "+faststart"
+    assert command[-1] == "out.mp4"
+
+
+if __name__ == "__main__":
+    test_profile_arguments()
+    test_profile_resolution_order()
+    test_ffmpeg_command_uses_profile()
+    print("\n[OK] 모든 테스트 통과")
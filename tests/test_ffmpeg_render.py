@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+FFmpeg 렌더링 엔진 테스트 스크립트
+"""
+import sys
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# 환경변수 로드
+from dotenv import load_dotenv
+load_dotenv(project_root / ".env")
+
+import pytest
+
+from core.editor import VideoEditor
+from core.models import (
+    EditConfig,
+    VideoFormat,
+    ContentPlan,
+    ScriptSegment,
+    AssetBundle,
+    StockVideoAsset,
+    AudioAsset,
+    TTSProvider
+)
+from core.services.ffmpeg_render_service import FFmpegRenderService, find_ffmpeg
+
+
+def _make_test_clip(ffmpeg_cmd: str, path: str, duration: float, size: str = "640x360"):
+    """lavfi 테스트 패턴으로 짧은 클립 생성"""
+    subprocess.run(
+        [ffmpeg_cmd, "-y", "-loglevel", "error",
+         "-f", "lavfi", "-i", f"testsrc=size={size}:rate=30:duration={duration}",
+         "-pix_fmt", "yuv420p", path],
+        check=True
+    )
+
+
+def _make_test_audio(ffmpeg_cmd: str, path: str, duration: float):
+    """사인파로 TTS 대용 오디오 생성"""
+    subprocess.run(
+        [ffmpeg_cmd, "-y", "-loglevel", "error",
+         "-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}",
+         path],
+        check=True
+    )
+
+
+def test_filter_graph_crossfade():
+    """xfade 체인 / 쇼츠 pad / 자막 overlay 그래프 생성"""
+    print("\n" + "="*60)
+    print("[TEST 1] filter graph 생성 (크로스페이드 + 쇼츠 레이아웃)")
+    print("="*60)
+
+    service = FFmpegRenderService(ffmpeg_path="ffmpeg")
+    timeline = {
+        "width": 1080, "height": 1920, "fps": 30, "duration": 9.4,
+        "clip_size": (1080, 960), "clip_position": (0, 480),
+        "crop_ratios": [1080 / 1920, 1080 / 960],
+        "clips": [{"path": "a.mp4", "duration": 5.3}, {"path": "b.mp4", "duration": 4.4}],
+        "crossfade": 0.3,
+        "ken_burns": {"zoom_ratio": 1.15, "quality": "high"},
+        "overlays": [
+            {"path": "title.png", "x": 0, "y": 0, "start": 0.0, "end": None},
+            {"path": "sub.png", "x": 0, "y": 0, "start": 1.0, "end": 2.5},
+        ],
+        "audio": {"tts": "tts.mp3", "bgm": {"path": "bgm.mp3", "volume": 0.2, "fade_in": 1.0, "fade_out": 2.0}},
+    }
+
+    inputs, graph, video_label, audio_label = service.build_filter_graph(timeline)
+    print(graph)
+
+    # 클립 2 + 오버레이 2 + TTS + BGM
+    assert inputs.count("-i") == 6
+    assert "xfade=transition=fade:duration=0.300:offset=5.000" in graph
+    assert "pad=1080:1920:0:480:black" in graph
+    assert graph.count("flags=lanczos,zoompan=z='1+0.150000*min(on,159)/159'") == 1
+    assert graph.count(":d=1:s=1080x960:fps=30") == 2
+    assert "enable='between(t,1.000,2.500)'" in graph
+    assert "amix=inputs=2" in graph
+    assert video_label == "vout"
+    assert audio_label == "aout"
+
+
+def test_filter_graph_concat_no_audio():
+    """크로스페이드 없음 → concat, 오디오 없음 → 라벨 None"""
+    print("\n" + "="*60)
+    print("[TEST 2] filter graph 생성 (concat, 오디오 없음)")
+    print("="*60)
+
+    service = FFmpegRenderService(ffmpeg_path="ffmpeg")
+    timeline = {
+        "width": 1920, "height": 1080, "fps": 30, "duration": 4.0,
+        "clips": [{"path": "a.mp4", "duration": 2.0}, {"path": "b.mp4", "duration": 2.0}],
+        "crossfade": 0.0,
+        "overlays": [],
+        "audio": {"tts": None, "bgm": None},
+    }
+
+    _, graph, _, audio_label = service.build_filter_graph(timeline)
+
+    assert "concat=n=2:v=1:a=0" in graph
+    assert "]pad=" not in graph
+    assert audio_label is None
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_editor_ffmpeg_backend_render():
+    """VideoEditor(render_backend='ffmpeg')로 실제 쇼츠 렌더링"""
+    print("\n" + "="*60)
+    print("[TEST 3] FFmpeg 엔진 실제 렌더링 (쇼츠)")
+    print("="*60)
+
+    ffmpeg_cmd = find_ffmpeg()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        clip_a = os.path.join(temp_dir, "a.mp4")
+        clip_b = os.path.join(temp_dir, "b.mp4")
+        tts_path = os.path.join(temp_dir, "tts.wav")
+        _make_test_clip(ffmpeg_cmd, clip_a, 1.0)
+        _make_test_clip(ffmpeg_cmd, clip_b, 2.0, size="360x640")
+        _make_test_audio(ffmpeg_cmd, tts_path, 3.0)
+
+        content_plan = ContentPlan(
+            title="FFmpeg 렌더링 테스트",
+            description="테스트",
+            format=VideoFormat.SHORTS,
+            target_duration=3,
+            segments=[
+                ScriptSegment(text="첫 번째 자막입니다", keyword="test", duration=1.5),
+                ScriptSegment(text="두 번째 자막입니다", keyword="test", duration=1.5),
+            ]
+        )
+        bundle = AssetBundle(
+            videos=[
+                StockVideoAsset(id="a", url="", provider="test", keyword="test", duration=1.0, local_path=clip_a),
+                StockVideoAsset(id="b", url="", provider="test", keyword="test", duration=2.0, local_path=clip_b),
+            ],
+            audio=AudioAsset(text="test", provider=TTSProvider.GTTS, local_path=tts_path, duration=3.0)
+        )
+
+        config = EditConfig(render_backend="ffmpeg", output_dir=temp_dir)
+        editor = VideoEditor(config=config)
+        output_path = editor.create_video(content_plan, bundle, output_filename="ffmpeg_test.mp4")
+
+        assert output_path == os.path.join(temp_dir, "ffmpeg_test.mp4")
+
+        from moviepy import VideoFileClip
+        with VideoFileClip(output_path) as result:
+            print(f"[INFO] 결과: {result.size}, {result.duration:.2f}초, 오디오: {result.audio is not None}")
+            assert tuple(result.size) == (1080, 1920)
+            assert abs(result.duration - 3.0) < 0.2
+            assert result.audio is not None
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+헤지 검색 (Pexels / Pixabay / Pixabay 완화 검색 겹쳐서 요청 + 우선순위 채택) 테스트 스크립트
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import FakeStockProvider, make_manager
+from core.services.hedging import HedgeTracker
+
+
+def _scripted(provider, query, kwargs):
+    """provider.script에 방향 파라미터별로 정해 둔 (지연, 결과 개수 | 예외)"""
+    orientation = kwargs.get("orientation")
+    delay, outcome = provider.script[orientation]
+    time.sleep(delay)
+    if isinstance(outcome, Exception):
+        return outcome
+    return [provider.asset(query, clip_id=f"{provider.name}_{orientation}_{i}") for i in range(outcome)]
+
+
+def _manager(temp_dir: str, pexels: dict, pixabay: dict, calls: list, tracker: HedgeTracker):
+    providers = {}
+    for name, script in (("pexels", pexels), ("pixabay", pixabay)):
+        providers[name] = FakeStockProvider(name, calls, results=_scripted)
+        providers[name].script = script
+    return make_manager(temp_dir, providers, cache_enabled=False, hedged_search=True, hedge_tracker=tracker)
+
+
+def _searches(calls: list) -> list:
+    """(제공자, 방향, 자체 fallback 여부) 검색 기록"""
+    return [(name, kwargs.get("orientation"), kwargs.get("fallback", True))
+            for kind, name, _, kwargs in calls if kind == "search"]
+
+
+def test_slow_pexels_is_hedged():
+    """Pexels가 대기 시간을 넘기면 Pixabay를 시작하고, 먼저 온 Pixabay 결과를 채택 (Pexels는 기다리지 않음)"""
+    print("\n" + "="*60)
+    print("[TEST 1] 느린 Pexels → Pixabay 채택")
+    print("="*60)
+
+    tracker = HedgeTracker(default_delay=0.1, min_delay=0.05, max_delay=1.0)
+    calls = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _manager(
+            temp_dir,
+            pexels={"portrait": (1.5, 2)},
+            pixabay={"vertical": (0.05, 1), "all": (0.05, 3)},
+            calls=calls, tracker=tracker
+        )
+        start = time.perf_counter()
+        assets = manager._search_from_providers("slow sea")
+        elapsed = time.perf_counter() - start
+
+    assert [a.id for a in assets] == ["pixabay_vertical_0"]
+    assert elapsed < 0.6, elapsed
+    # 헤지 검색의 Pixabay 기본 요청은 자체 fallback을 하지 않음
+    assert ("pixabay", "vertical", False) in _searches(calls)
+    stats = tracker.stats()
+    assert stats["wins"] == {"pixabay:vertical": 1} and stats["hedged_wins"] == 1
+
+
+def test_priority_is_kept_within_hedge_delay():
+    """Pexels가 대기 시간 안에 응답하면 더 빨리 끝난 Pixabay가 있어도 Pexels 채택, 빠르면 Pixabay는 요청 안 함"""
+    print("\n" + "="*60)
+    print("[TEST 2] 대기 시간 안에서는 기존 우선순위 유지")
+    print("="*60)
+
+    tracker = HedgeTracker(default_delay=0.3, min_delay=0.05, max_delay=1.0)
+    calls = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _manager(
+            temp_dir,
+            pexels={"portrait": (0.02, 2)},
+            pixabay={"vertical": (0.0, 1), "all": (0.0, 1)},
+            calls=calls, tracker=tracker
+        )
+        assert [a.id for a in manager._search_from_providers("fast city")] == ["pexels_portrait_0", "pexels_portrait_1"]
+        assert _searches(calls) == [("pexels", "portrait", True)]
+
+        # Pexels 0.25초 (대기 시간 0.3초 안) + Pixabay 즉시: Pixabay는 시작되지 않고 Pexels 채택
+        manager.providers["pexels"].script = {"portrait": (0.25, 1)}
+        assert [a.id for a in manager._search_from_providers("city")] == ["pexels_portrait_0"]
+        assert tracker.stats()["hedged_wins"] == 0
+
+
+def test_empty_and_failed_attempts_cascade():
+    """Pexels 결과 없음 → 즉시 Pixabay, Pixabay 오류 → 완화 검색 채택, 모두 실패하면 빈 결과"""
+    print("\n" + "="*60)
+    print("[TEST 3] 결과 없음 / 오류 → 다음 순위")
+    print("="*60)
+
+    tracker = HedgeTracker(default_delay=2.0, min_delay=0.05, max_delay=5.0)
+    calls = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _manager(
+            temp_dir,
+            pexels={"portrait": (0.0, 0)},
+            pixabay={"vertical": (0.0, requests.exceptions.ConnectionError("reset")), "all": (0.0, 2)},
+            calls=calls, tracker=tracker
+        )
+        start = time.perf_counter()
+        assets = manager._search_from_providers("rare bird")
+        assert [a.id for a in assets] == ["pixabay_all_0", "pixabay_all_1"]
+        # 대기 시간(2초)을 기다리지 않고 바로 다음 순위로 넘어감
+        assert time.perf_counter() - start < 1.0
+        assert [c[:2] for c in _searches(calls)] == [("pexels", "portrait"), ("pixabay", "vertical"), ("pixabay", "all")]
+        assert tracker.stats()["wins"] == {"pixabay:all": 1}
+
+        manager.providers["pixabay"].script["all"] = (0.0, 0)
+        assert manager._search_from_providers("nothing") == []
+
+
+def test_tracker_learns_delay_from_latency():
+    """기록이 충분하면 95번째 백분위, 범위로 제한"""
+    print("\n" + "="*60)
+    print("[TEST 4] 응답 시간으로 대기 시간 학습")
+    print("="*60)
+
+    tracker = HedgeTracker(default_delay=1.0, min_delay=0.2, max_delay=3.0)
+    assert tracker.delay("pexels:portrait") == 1.0
+    for i in range(100):
+        tracker.record("pexels:portrait", 0.3 + i * 0.01)  # 0.30 ~ 1.29초
+    assert tracker.delay("pexels:portrait") == pytest.approx(1.24)
+
+    for _ in range(50):
+        tracker.record("pixabay:vertical", 0.01)
+        tracker.record("pixabay:all", 9.0)
+    assert tracker.delay("pixabay:vertical") == 0.2
+    assert tracker.delay("pixabay:all") == 3.0
+    assert tracker.stats()["samples"]["pexels:portrait"] == 100
+
+
+if __name__ == "__main__":
+    test_slow_pexels_is_hedged()
+    test_priority_is_kept_within_hedge_delay()
+    test_empty_and_failed_attempts_cascade()
+    test_tracker_learns_delay_from_latency()
+    print("\n[OK] 모든 테스트 통과")
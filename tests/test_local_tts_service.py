@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+local_cli TTSService 공유 캐시 저장 조건 (속도 조절 실패 시 저장 안 함) 테스트 스크립트
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.ffmpeg_render_service import find_ffmpeg
+from core.services.tts_cache import TTSCache
+from local_cli.services.tts_service import TTSService
+
+FFMPEG = find_ffmpeg()
+pytestmark = pytest.mark.skipif(FFMPEG is None, reason="ffmpeg 없음")
+
+
+class FakeGTTS:
+    """네트워크 없이 1초짜리 mp3를 기록하는 gTTS 대역"""
+
+    def __init__(self, text, lang, slow):
+        self.text = text
+
+    def save(self, path):
+        subprocess.run([FFMPEG, "-v", "error", "-f", "lavfi", "-i", "sine=frequency=440:duration=1",
+                        "-y", path], check=True)
+
+
+def _service(cache_dir: str) -> TTSService:
+    service = TTSService(provider='gtts', cache_enabled=False)
+    service.gtts_class = FakeGTTS
+    service.cache = TTSCache(cache_dir=cache_dir)
+    return service
+
+
+def test_atempo_failure_is_not_cached(monkeypatch):
+    """속도 조절이 실패한 원본 속도 파일은 속도가 포함된 키로 저장하지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 1] 속도 조절 실패 시 캐시 저장 안 함")
+    print("="*60)
+
+    import imageio_ffmpeg
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        service = _service(os.path.join(temp_dir, "cache"))
+        key = service._cache_key("안녕하세요", None, 1.0, 0.0)
+
+        monkeypatch.setattr(imageio_ffmpeg, "get_ffmpeg_exe", lambda: os.path.join(temp_dir, "missing-ffmpeg"))
+        output = service.generate_speech("안녕하세요", os.path.join(temp_dir, "out", "a.mp3"))
+        assert os.path.getsize(output) > 0
+        assert service.cache.get(key) is None
+
+        # 속도 조절이 되면 저장
+        monkeypatch.setattr(imageio_ffmpeg, "get_ffmpeg_exe", lambda: FFMPEG)
+        service.generate_speech("안녕하세요", os.path.join(temp_dir, "out", "b.mp3"))
+        assert service.cache.get(key)
+        service.cache.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
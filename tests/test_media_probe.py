@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+MediaProbeService (헤더 파싱 + 영구 색인) 테스트 스크립트
+"""
+import sys
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from core.services.media_probe import MediaProbeService
+from core.services.ffmpeg_render_service import find_ffmpeg
+
+
+def _encode(ffmpeg_cmd: str, path: str, args: list, source: str = "sine=frequency=440:duration=3.3"):
+    """lavfi 소스로 테스트 파일 생성"""
+    subprocess.run(
+        [ffmpeg_cmd, "-y", "-loglevel", "error", "-f", "lavfi", "-i", source] + args + [path],
+        check=True
+    )
+    return path
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_header_parsers_match_ffmpeg():
+    """WAV / MP3 (CBR, VBR+Xing, ID3) 헤더 파싱 결과 == ffmpeg 헤더 정보"""
+    print("\n" + "="*60)
+    print("[TEST 1] 헤더 파싱 vs ffmpeg")
+    print("="*60)
+
+    ffmpeg_cmd = find_ffmpeg()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = {
+            "s16.wav": ["-ac", "2", "-ar", "44100"],
+            "f32.wav": ["-ac", "1", "-ar", "22050", "-c:a", "pcm_f32le"],
+            "cbr.mp3": ["-ac", "1", "-ar", "24000", "-b:a", "32k", "-write_xing", "0"],
+            "vbr.mp3": ["-ac", "2", "-q:a", "4"],
+            "tagged.mp3": ["-ac", "2", "-b:a", "128k", "-metadata", "title=테스트", "-id3v2_version", "3"],
+        }
+        service = MediaProbeService(index_path=":memory:")
+
+        for name, args in files.items():
+            path = _encode(ffmpeg_cmd, os.path.join(temp_dir, name), args)
+            info = service.probe(path)
+            reference = service._probe_with_ffmpeg(path)
+
+            print(f"  {name}: {info.duration:.3f}초 / ffmpeg {reference['duration']:.3f}초")
+            assert info.format == Path(name).suffix[1:]
+            assert abs(info.duration - reference["duration"]) < 0.03
+            assert info.sample_rate == reference["sample_rate"]
+            assert info.channels == reference["channels"]
+
+        assert service.probe(os.path.join(temp_dir, "f32.wav")).audio_codec == "pcm_f32le"
+
+        # 헤더 파서가 없는 형식은 ffmpeg -i 헤더 정보 사용
+        video = _encode(
+            ffmpeg_cmd, os.path.join(temp_dir, "clip.mp4"), ["-pix_fmt", "yuv420p"],
+            source="testsrc2=size=160x90:rate=30:duration=1.5"
+        )
+        info = service.probe(video)
+        assert (info.width, info.height, info.fps, info.video_codec) == (160, 90, 30.0, "h264")
+        assert abs(info.duration - 1.5) < 1e-6
+        assert info.has_video and not info.has_audio
+
+        assert service.probe(os.path.join(temp_dir, "missing.mp3")) is None
+        assert service.duration(os.path.join(temp_dir, "missing.mp3"), default=0.0) == 0.0
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_persistent_index_keyed_by_size_and_mtime(monkeypatch):
+    """색인 hit은 파일을 읽지 않음 (프로세스 재시작 후에도), 파일이 바뀌면 다시 조회"""
+    print("\n" + "="*60)
+    print("[TEST 2] (경로, 크기, 수정 시각) 영구 색인")
+    print("="*60)
+
+    ffmpeg_cmd = find_ffmpeg()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index_path = os.path.join(temp_dir, "index", "media_probe.db")
+        paths = [
+            _encode(ffmpeg_cmd, os.path.join(temp_dir, f"track_{i}.mp3"), ["-b:a", "64k"],
+                    source=f"sine=duration={1 + i}")
+            for i in range(3)
+        ]
+
+        first = MediaProbeService(index_path=index_path)
+        infos = first.probe_many(paths)
+        assert [round(infos[p].duration) for p in paths] == [1, 2, 3]
+        assert first.misses == 3
+        first.close()
+
+        # 새 인스턴스 (= 새 프로세스): 헤더도 읽지 않아야 함
+        second = MediaProbeService(index_path=index_path)
+        monkeypatch.setattr(second, "_read_headers", lambda *a: pytest.fail("색인 hit인데 파일을 읽음"))
+        assert second.probe_many(paths)[paths[1]].duration == infos[paths[1]].duration
+        assert second.hits == 3 and second.misses == 0
+        monkeypatch.undo()
+
+        # 파일 교체 (크기/수정 시각 변경) → 다시 조회
+        _encode(ffmpeg_cmd, paths[0], ["-b:a", "64k"], source="sine=duration=4")
+        assert round(second.duration(paths[0])) == 4
+        assert second.misses == 1
+
+        # 상대 경로도 같은 색인 항목 사용
+        cwd = os.getcwd()
+        try:
+            os.chdir(temp_dir)
+            assert second.duration("track_2.mp3") == infos[paths[2]].duration
+        finally:
+            os.chdir(cwd)
+        assert second.hits == 4
+        second.close()
+
+
+if __name__ == "__main__":
+    test_header_parsers_match_ffmpeg()
+    print("\n[OK] TEST 1 통과 (TEST 2는 pytest로 실행)")
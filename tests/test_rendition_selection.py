@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+스톡 영상 렌디션 선택 (출력 크기를 채우는 가장 작은 파일) 테스트 스크립트
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import FakeStockProvider, make_manager
+from core.models import ContentPlan, ScriptSegment, StockVideoAsset, VideoFormat, EditConfig
+from core.services.rendition import render_target, select_rendition, plan_layout_geometry, rendition_filename
+from core.services.ffmpeg_render_service import FFmpegRenderService
+from providers.stock import PexelsProvider, PixabayProvider
+
+
+PEXELS_VIDEO = {
+    "id": 42,
+    "duration": 12,
+    "video_files": [
+        {"quality": "hd", "width": 2160, "height": 3840, "fps": 29.97, "link": "https://v/4k.mp4"},
+        {"quality": "sd", "width": 540, "height": 960, "fps": 25, "link": "https://v/540.mp4"},
+        {"quality": "hd", "width": 1440, "height": 2560, "fps": 29.97, "link": "https://v/1440.mp4"},
+        {"quality": "hd", "width": 1080, "height": 1920, "fps": 29.97, "link": "https://v/1080.mp4"},
+        {"quality": None, "width": None, "height": None, "fps": None, "link": "https://v/hls.m3u8"},
+    ]
+}
+
+PIXABAY_VIDEO = {
+    "id": 7,
+    "duration": 9,
+    "videos": {
+        "large": {"url": "https://p/large.mp4", "width": 2160, "height": 3840, "size": 52_000_000},
+        "medium": {"url": "https://p/medium.mp4", "width": 1080, "height": 1920, "size": 9_000_000},
+        "small": {"url": "https://p/small.mp4", "width": 720, "height": 1280, "size": 4_000_000},
+        "tiny": {"url": "https://p/tiny.mp4", "width": 360, "height": 640, "size": 900_000},
+    }
+}
+
+
+def test_render_target_follows_layout():
+    """쇼츠는 출력 비율 크롭 후 밴드를 채워야 하므로 1080x1920, 프리뷰는 절반"""
+    print("\n" + "="*60)
+    print("[TEST 1] 포맷 / 프리뷰별 목표 크기")
+    print("="*60)
+
+    assert render_target((1080, 1920), VideoFormat.SHORTS) == (1080, 1920)
+    assert render_target((1080, 1920), VideoFormat.SHORTS, preview=True) == (540, 960)
+    assert render_target((1920, 1080), VideoFormat.LANDSCAPE) == (1920, 1080)
+    assert render_target((1080, 1080), VideoFormat.SQUARE) == (1080, 1080)
+
+    # 역방향 계산이 crop_rect와 일치: 목표 크기 원본은 크롭 후 밴드와 같은 크기
+    geometry = plan_layout_geometry((1080, 1920), VideoFormat.SHORTS)
+    _, _, crop_width, crop_height = geometry.crop_rect(*geometry.required_source_size())
+    assert (crop_width, crop_height) == tuple(geometry.band_size)
+
+
+def test_providers_pick_smallest_covering_rendition():
+    """Pexels / Pixabay 모두 목표를 채우는 가장 작은 렌디션 + 크기/fps/바이트 기록"""
+    print("\n" + "="*60)
+    print("[TEST 2] 제공자별 렌디션 선택")
+    print("="*60)
+
+    pexels = PexelsProvider(api_key="k")
+    asset = pexels._parse_video(PEXELS_VIDEO, "city", (1080, 1920))
+    assert asset.url == "https://v/1080.mp4"
+    assert (asset.width, asset.height, asset.fps) == (1080, 1920, 29.97)
+    assert asset.resolution == "1080x1920"
+    assert rendition_filename(asset) == "pexels_42_1080x1920.mp4"
+
+    # 프리뷰는 더 작은 렌디션으로 충분
+    assert pexels._parse_video(PEXELS_VIDEO, "city", (540, 960)).url == "https://v/540.mp4"
+    # 채우는 렌디션이 없으면 가장 큰 것
+    assert pexels._parse_video(PEXELS_VIDEO, "city", (4000, 4000)).url == "https://v/4k.mp4"
+
+    pixabay = PixabayProvider(api_key="k")
+    asset = pixabay._parse_video(PIXABAY_VIDEO, "sea", (1080, 1920))
+    assert asset.url == "https://p/medium.mp4" and asset.file_size == 9_000_000
+    assert asset.fps is None
+    assert pixabay._parse_video(PIXABAY_VIDEO, "sea", (540, 960)).url == "https://p/small.mp4"
+
+    # 가로 출력에는 세로 렌디션이 채우지 못함 → 가로 렌디션 선택
+    candidates = [
+        {"url": "portrait", "width": 1080, "height": 1920},
+        {"url": "landscape", "width": 1920, "height": 1080},
+        {"url": "landscape-4k", "width": 3840, "height": 2160},
+    ]
+    assert select_rendition(candidates, (1920, 1080))["url"] == "landscape"
+    assert select_rendition([], (1920, 1080)) is None
+
+
+def test_collect_assets_passes_target_and_rejects_small_cache():
+    """collect_assets가 포맷/해상도/프리뷰로 목표를 정하고, 작은 렌디션 캐시는 재사용하지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 3] 에셋 수집 → 제공자 목표 크기 전달")
+    print("="*60)
+
+    plan = ContentPlan(
+        title="t", description="d", format=VideoFormat.LANDSCAPE,
+        segments=[ScriptSegment(text="a", keyword="river")]
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        provider = FakeStockProvider("pexels", size=(1920, 1080))
+        manager = make_manager(temp_dir, {"pexels": provider}, cache_enabled=False)
+
+        bundle = manager.collect_assets(
+            plan, generate_tts=False, select_bgm=False,
+            edit_config=EditConfig(resolution=(1920, 1080))
+        )
+        assert provider.calls[0][3] == {"orientation": "landscape", "target_size": (1920, 1080), "raise_on_error": True}
+        assert bundle.videos[0].local_path.endswith("pexels_river_1920x1080.mp4")
+
+        # 프리뷰에서 캐시된 작은 렌디션은 본 렌더링 목표를 채우지 못함
+        manager.cache_enabled = True
+        small = bundle.videos[0].model_copy(update={"width": 960, "height": 540})
+        Path(small.local_path).touch()
+        manager._cache_video("river", small)
+        assert manager._get_cached_video("river", (960, 540)) is not None
+        assert manager._get_cached_video("river", (1920, 1080)) is None
+
+
+def test_fitting_clip_skips_crop_and_scale():
+    """렌디션이 이미 밴드 크기면 FFmpeg 체인에서 crop / scale 생략"""
+    print("\n" + "="*60)
+    print("[TEST 4] 크기가 맞는 클립은 scale 생략")
+    print("="*60)
+
+    from core.editor import VideoEditor
+
+    geometry = plan_layout_geometry((1920, 1080), VideoFormat.LANDSCAPE)
+    fitting = StockVideoAsset(id="a", url="u", provider="pexels", keyword="k", duration=3, width=1920, height=1080)
+    larger = fitting.model_copy(update={"width": 3840, "height": 2160})
+    assert VideoEditor._fits_band(fitting, geometry)
+    assert not VideoEditor._fits_band(larger, geometry)
+    # 쇼츠 밴드(1080x960)는 출력 비율 크롭을 먼저 거치므로 같은 크기여도 크롭 필요
+    shorts = plan_layout_geometry((1080, 1920), VideoFormat.SHORTS)
+    assert not VideoEditor._fits_band(fitting.model_copy(update={"width": 1080, "height": 960}), shorts)
+
+    timeline = {
+        "width": 1920, "height": 1080, "fps": 30, "duration": 4.0,
+        "clip_size": (1920, 1080), "crop_ratios": [1920 / 1080],
+        "clips": [{"path": "a.mp4", "duration": 2.0, "fit": True}, {"path": "b.mp4", "duration": 2.0, "fit": False}],
+        "overlays": [], "audio": {}
+    }
+    _, graph, _, _ = FFmpegRenderService(ffmpeg_path="ffmpeg").build_filter_graph(timeline)
+    first, second = graph.split(";")[:2]
+    assert "crop=" not in first and "scale=" not in first
+    assert "crop=" in second and "scale=1920:1080" in second
+
+
+if __name__ == "__main__":
+    test_render_target_follows_layout()
+    test_providers_pick_smallest_covering_rendition()
+    test_collect_assets_passes_target_and_rejects_small_cache()
+    test_fitting_clip_skips_crop_and_scale()
+    print("\n[OK] 모든 테스트 통과")
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+FlattenedLayout (정적 레이어 평탄화) 테스트 스크립트
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from PIL import Image
+
+from core.services.static_layer import FlattenedLayout
+
+
+def test_flattened_layout_matches_layer_composite():
+    """배경 평탄화 결과 == 검은 캔버스 + 밴드 영상 + 제목 레이어 순차 합성"""
+    print("\n" + "="*60)
+    print("[TEST 1] 정적 레이어 평탄화 합성 결과")
+    print("="*60)
+
+    canvas_w, canvas_h = 120, 200
+    band_rect = (0, 50, 120, 100)
+
+    # 제목: 상단 바와 영상 밴드에 걸쳐 있는 반투명 박스
+    title = np.zeros((canvas_h, canvas_w, 4), dtype=np.uint8)
+    title[20:70, 10:110] = (255, 200, 0, 160)
+    title[30:40, 20:100] = (255, 255, 255, 255)
+
+    rng = np.random.default_rng(1)
+    band_frame = rng.integers(0, 256, (100, 120, 3), dtype=np.uint8)
+
+    layout = FlattenedLayout((canvas_w, canvas_h), band_rect, overlays=[title])
+    result = layout.compose(band_frame)
+
+    expected = Image.new('RGBA', (canvas_w, canvas_h), (0, 0, 0, 255))
+    expected.paste(Image.fromarray(band_frame).convert('RGBA'), (0, 50))
+    expected = np.asarray(Image.alpha_composite(expected, Image.fromarray(title)).convert('RGB'))
+
+    assert result.shape == (canvas_h, canvas_w, 3)
+    assert np.abs(result.astype(int) - expected.astype(int)).max() <= 1
+
+    # 밴드와 겹치는 제목 부분만 프레임마다 블렌딩
+    assert len(layout.band_overlays) == 1
+    assert layout.band_overlays[0].y == 50
+
+
+def test_flattened_layout_without_overlay():
+    """오버레이 없음: 배경 + 밴드 붙여넣기만"""
+    print("\n" + "="*60)
+    print("[TEST 2] 오버레이 없는 레이아웃")
+    print("="*60)
+
+    layout = FlattenedLayout((40, 80), (0, 20, 40, 40))
+    band_frame = np.full((40, 40, 3), 200, dtype=np.uint8)
+    result = layout.compose(band_frame)
+
+    assert layout.band_overlays == []
+    assert result[20:60].min() == 200
+    assert result[:20].max() == 0 and result[60:].max() == 0
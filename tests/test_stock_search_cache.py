@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+스톡 검색 결과 캐시 (SQLite + 제공자별 TTL + negative entry + 일괄 조회) 테스트 스크립트
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import FakeStockProvider, make_manager, stock_asset
+from core.models import ContentPlan, ScriptSegment
+from core.services.stock_search_cache import StockSearchCache, make_search_key
+
+
+def test_cache_ttl_negative_entries_and_keys():
+    """정규화된 검색어로 hit, 필터가 다르면 miss, 빈 결과는 짧은 TTL로 저장"""
+    print("\n" + "="*60)
+    print("[TEST 1] TTL / negative entry / 키 정규화")
+    print("="*60)
+
+    cache = StockSearchCache(":memory:", ttl_hours={"pexels": 1.0}, negative_ttl_hours=0.5 / 3600)
+    filters = {"per_page": 3, "target_size": (1080, 1920)}
+
+    cache.put("pexels", "Happy Dog", "portrait", filters, [stock_asset("pexels", "happy dog", width=1080, height=1920)])
+    hit = cache.get("pexels", "  happy   DOG ", "portrait", filters)
+    assert [a.id for a in hit] == ["pexels_happy dog"]
+    assert hit[0].width == 1080 and hit[0].local_path is None
+
+    assert cache.get("pexels", "happy dog", "landscape", filters) is None
+    assert cache.get("pexels", "happy dog", "portrait", {"per_page": 5}) is None
+    assert cache.get("pixabay", "happy dog", "portrait", filters) is None
+
+    # negative entry: 빈 리스트로 hit, TTL(0.5초)이 지나면 miss
+    cache.put("pexels", "nothing here", "portrait", filters, [])
+    assert cache.get("pexels", "nothing here", "portrait", filters) == []
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["negative_entries"] == 1 and stats["negative_hits"] == 1
+
+    time.sleep(0.6)
+    assert cache.get("pexels", "nothing here", "portrait", filters) is None
+    assert cache.purge_expired() == 1
+    assert cache.get("pexels", "happy dog", "portrait", filters) is not None
+
+
+def _searches(calls: list) -> list:
+    """(제공자, 검색어) 검색 기록"""
+    return [(name, query) for kind, name, query, *_ in calls if kind == "search"]
+
+
+class SpyCache(StockSearchCache):
+    """조회 방식을 기록하는 캐시"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bulk_calls = []
+        self.single_calls = 0
+
+    def get_many(self, specs):
+        specs = list(specs)
+        self.bulk_calls.append(len(specs))
+        return super().get_many(specs)
+
+    def get(self, *args, **kwargs):
+        self.single_calls += 1
+        return super().get(*args, **kwargs)
+
+
+def test_second_run_hits_cache_in_one_lookup():
+    """두 번째 실행은 API를 호출하지 않고, 모든 세그먼트 검색을 한 번에 조회"""
+    print("\n" + "="*60)
+    print("[TEST 2] 재실행 시 API 호출 없음 + 일괄 조회")
+    print("="*60)
+
+    segments = [
+        ScriptSegment(text="a", keyword="dog", image_search_query="happy dog"),
+        ScriptSegment(text="b", keyword="cat", image_search_query="miss-pexels sleepy cat"),
+        ScriptSegment(text="c", keyword="tree", image_search_query="miss-pexels miss-pixabay tree"),
+        ScriptSegment(text="d", keyword="sea", image_search_query="error sea"),
+    ]
+    plan = ContentPlan(title="t", description="d", segments=segments)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = SpyCache(str(Path(temp_dir) / "stock_search.db"))
+        calls = []
+        manager = make_manager(temp_dir, {name: FakeStockProvider(name, calls, size=(1080, 1920))
+                                          for name in ("pexels", "pixabay")}, search_cache=cache)
+
+        first = manager._collect_stock_videos(plan)
+        assert [a.id for a in first] == [
+            "pexels_happy dog", "pixabay_miss-pexels sleepy cat", "pexels_tree", "pexels_sea"
+        ]
+        assert ("pexels", "error sea") in _searches(calls) and ("pixabay", "error sea") in _searches(calls)
+
+        # 실패한 요청은 저장하지 않음 (다음 실행에서 다시 시도)
+        filters = manager._provider_searches(target_size=None)[0][2]
+        assert cache.get("pexels", "error sea", "portrait", filters) is None
+        # 결과 없음은 negative entry로 저장
+        assert cache.get("pexels", "miss-pexels sleepy cat", "portrait", filters) == []
+
+        calls.clear()
+        cache.bulk_calls.clear()
+        cache.single_calls = 0
+        second = manager._collect_stock_videos(plan)
+
+        assert [a.id for a in second] == [a.id for a in first]
+        # 오류가 났던 검색만 다시 요청
+        assert sorted(_searches(calls)) == [("pexels", "error sea"), ("pixabay", "error sea")]
+        # 세그먼트 4개 × 검색어 2개 × 제공자 2개를 한 번에 조회, 개별 조회는 캐시에 없던 것만
+        assert cache.bulk_calls == [16]
+        assert cache.single_calls == 2
+        assert cache.stats()["negative_entries"] == 3
+
+
+def test_disabled_cache_and_keyless_provider_are_not_stored():
+    """cache_enabled=False면 캐시를 쓰지 않고, API 키 없는 제공자의 빈 결과는 저장하지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 3] 캐시 비활성화 / API 키 없는 제공자")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = StockSearchCache(str(Path(temp_dir) / "stock_search.db"))
+        calls = []
+        provider = FakeStockProvider("pexels", calls, size=(1080, 1920))
+
+        manager = make_manager(temp_dir, {"pexels": provider}, cache_enabled=False, search_cache=cache)
+        manager._search_from_providers("river")
+        manager._search_from_providers("river")
+        assert len(calls) == 2 and cache.stats()["entries"] == 0
+
+        manager.cache_enabled = True
+        provider.api_key = None
+        assert manager._search_from_providers("miss-pexels river") == []
+        assert cache.stats()["entries"] == 0
+
+        provider.api_key = "key"
+        manager._search_from_providers("river")
+        manager._search_from_providers("river")
+        assert len(calls) == 4
+        key = make_search_key("pexels", "river", *manager._provider_searches()[0][1:])
+        assert key in cache.get_many([("pexels", "river", *manager._provider_searches()[0][1:])])
+
+
+if __name__ == "__main__":
+    test_cache_ttl_negative_entries_and_keys()
+    test_second_run_hits_cache_in_one_lookup()
+    test_disabled_cache_and_keyless_provider_are_not_stored()
+    print("\n[OK] 모든 테스트 통과")
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+스톡 영상 동시 검색 + 제공자별 keep-alive Session 테스트 스크립트
+"""
+import sys
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import FakeStockProvider, make_manager
+from core.models import ContentPlan, ScriptSegment
+from core.services.http_session import get_http_session
+from core.services.rate_limiter import get_provider_limiter
+from providers.stock import PexelsProvider, PixabayProvider
+
+
+def test_concurrent_search_keeps_fallback_chain():
+    """세그먼트 검색이 동시에 진행되고, 세그먼트별 Pexels → Pixabay → keyword 순서와 결과 순서 유지"""
+    print("\n" + "="*60)
+    print("[TEST 1] 세그먼트 동시 검색 + fallback 체인")
+    print("="*60)
+
+    segments = [
+        ScriptSegment(text="a", keyword="dog", image_search_query="happy dog"),
+        ScriptSegment(text="b", keyword="cat", image_search_query="miss-pexels sleepy cat"),
+        ScriptSegment(text="c", keyword="tree", image_search_query="miss-pexels miss-pixabay tree"),
+        ScriptSegment(text="d", keyword="dog", image_search_query="happy dog"),  # 중복 검색어
+        ScriptSegment(text="e", keyword="sea"),
+        ScriptSegment(text="f", keyword="sky"),
+    ]
+    plan = ContentPlan(title="t", description="d", segments=segments)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        calls = []
+        pexels = FakeStockProvider("pexels", calls, delay=0.15)
+        pixabay = FakeStockProvider("pixabay", calls, delay=0.15)
+        manager = make_manager(temp_dir, {"pexels": pexels, "pixabay": pixabay}, cache_enabled=False)
+
+        started = time.perf_counter()
+        assets = manager._collect_stock_videos(plan)
+        elapsed = time.perf_counter() - started
+        searches = [(c[1], c[2]) for c in calls if c[0] == "search"]
+
+        # 순차라면 검색 8회 × 0.15초 = 1.2초
+        assert elapsed < 0.8, f"검색이 순차 실행됨: {elapsed:.2f}초"
+        assert 1 < pexels.max_in_flight <= get_provider_limiter("stock").max_concurrency
+
+        assert [a.id for a in assets] == [
+            "pexels_happy dog",
+            "pixabay_miss-pexels sleepy cat",
+            "pexels_tree",
+            "pexels_happy dog",
+            "pexels_sea",
+            "pexels_sky",
+        ]
+        assert assets[0] is not assets[3]
+
+        # 세그먼트 c: Pexels → Pixabay → keyword(Pexels) 순서
+        chain = [c for c in searches if "tree" in c[1]]
+        assert chain == [
+            ("pexels", "miss-pexels miss-pixabay tree"),
+            ("pixabay", "miss-pexels miss-pixabay tree"),
+            ("pexels", "tree"),
+        ]
+        # 중복 검색어는 한 번만 검색
+        assert searches.count(("pexels", "happy dog")) == 1
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports = []
+
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        body = json.dumps({"videos": [], "hits": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_provider_session_reuses_connection():
+    """같은 제공자의 요청은 Session 하나의 keep-alive 연결을 재사용"""
+    print("\n" + "="*60)
+    print("[TEST 2] 제공자별 keep-alive Session")
+    print("="*60)
+
+    assert PexelsProvider(api_key="k1").session is PexelsProvider(api_key="k2").session
+    assert PexelsProvider(api_key="k1").session is not PixabayProvider(api_key="k1").session
+    assert get_http_session("pexels") is PexelsProvider(api_key="k").session
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        provider = PexelsProvider(api_key="k")
+        provider.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/videos"
+        _CountingHandler.client_ports.clear()
+        for i in range(5):
+            assert provider.search_videos(f"query {i}") == []
+
+        assert len(_CountingHandler.client_ports) == 5
+        assert len(set(_CountingHandler.client_ports)) == 1, "요청마다 새 연결이 열림"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    test_concurrent_search_keeps_fallback_chain()
+    test_provider_session_reuses_connection()
+    print("\n[OK] 모든 테스트 통과")
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+저장 공간 GC (디렉토리별 용량 상한 / 보관 기간 / 참조 보호 / 디스크 여유 공간) 테스트 스크립트
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.models import AssetBundle, AudioAsset, SegmentTiming, StockVideoAsset, TTSProvider
+from core.services.storage_gc import StorageGC, bundle_paths
+
+DAY = 86400
+
+
+def _file(path: Path, size: int, age_days: float) -> str:
+    """크기 / 마지막 사용 시각(일 전)을 지정한 파일 생성"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\0" * size)
+    stamp = time.time() - age_days * DAY
+    os.utime(path, (stamp, stamp))
+    return str(path)
+
+
+def _policies(root: Path) -> dict:
+    return {
+        "stock_videos": {"path": str(root / "stock_videos"), "max_bytes": 2500, "max_age_days": 30,
+                         "patterns": ["*.mp4"]},
+        "audio": {"path": str(root / "audio"), "max_bytes": 10_000, "max_age_days": 7, "exclude": ["tts_cache"]},
+        "output": {"path": str(root / "output"), "max_bytes": 10_000, "max_age_days": 60, "exclude": ["preview"]},
+        "preview": {"path": str(root / "output" / "preview"), "max_bytes": 10_000, "max_age_days": 3},
+    }
+
+
+def test_age_budget_and_references():
+    """보관 기간 → 용량 상한(LRU) 순서, 참조/고정/최근 파일/제외 경로는 보호, dry-run은 삭제 안 함"""
+    print("\n" + "="*60)
+    print("[TEST 1] 보관 기간 / 용량 상한 / 참조 보호")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        stock = root / "stock_videos"
+        old_clip = _file(stock / "old.mp4", 500, 40)            # 보관 기간 초과
+        lru_1 = _file(stock / "a.mp4", 1000, 20)                # 상한 초과 → 가장 오래 쓰지 않은 것부터
+        lru_2 = _file(stock / "b.mp4", 1000, 10)
+        draft_clip = _file(stock / "draft.mp4", 1000, 50)       # Draft 참조
+        pinned_clip = _file(stock / "pinned.mp4", 1000, 25)     # 진행 중인 작업
+        fresh_clip = _file(stock / "fresh.mp4", 1000, 0)        # 유예 시간 안
+        index = _file(stock / "library.db", 5000, 90)           # patterns 외
+        tts_cached = _file(root / "audio" / "tts_cache" / "ab" / "x.mp3", 100, 90)  # exclude
+        old_audio = _file(root / "audio" / "tts_1.mp3", 100, 8)
+        old_preview = _file(root / "output" / "preview" / "preview_1.mp4", 100, 5)
+        live_preview = _file(root / "output" / "preview" / "preview_2.mp4", 100, 5)
+        output = _file(root / "output" / "job_1.mp4", 100, 5)
+
+        gc = StorageGC(policies=_policies(root), grace_seconds=3600, min_free_bytes=0)
+        gc.add_reference_source("drafts", lambda: [draft_clip, None])
+        gc.add_reference_source("previews", lambda: [os.path.relpath(live_preview)])
+        gc.pin("job_1", [pinned_clip])
+
+        report = gc.collect(dry_run=True)
+        deleted = {d["path"]: d["reason"] for d in report["deleted"]}
+        assert deleted == {
+            os.path.realpath(old_clip): "age",
+            os.path.realpath(lru_1): "budget",
+            os.path.realpath(lru_2): "budget",
+            os.path.realpath(old_audio): "age",
+            os.path.realpath(old_preview): "age",
+        }
+        # dry-run은 아무것도 지우지 않음
+        assert all(Path(p).exists() for p in (old_clip, lru_1, lru_2, old_audio, old_preview))
+
+        stock_report = report["directories"]["stock_videos"]
+        assert stock_report["files"] == 6 and stock_report["bytes"] == 5500
+        assert stock_report["referenced_files"] == 2 and stock_report["bytes_after"] == 3000
+        # 남은 파일이 모두 참조/최근 파일이라 상한을 넘어도 더 지우지 않음
+        assert stock_report["over_budget"]
+        assert report["references"]["drafts"] >= 1 and report["references"]["pinned"] >= 1
+
+        report = gc.collect(dry_run=False)
+        assert report["freed_bytes"] == 500 + 1000 + 1000 + 100 + 100
+        for path in (old_clip, lru_1, lru_2, old_audio, old_preview):
+            assert not Path(path).exists()
+        for path in (draft_clip, pinned_clip, fresh_clip, index, tts_cached, live_preview, output):
+            assert Path(path).exists()
+
+        # 작업이 끝나 고정이 풀리면 용량 상한에 따라 삭제 대상
+        gc.unpin("job_1")
+        assert [d["path"] for d in gc.collect(dry_run=True)["deleted"]] == [os.path.realpath(pinned_clip)]
+
+
+def test_disk_pressure_evicts_beyond_budgets():
+    """디스크 여유 공간이 부족하면 상한 안이어도 모든 정책에서 LRU로 추가 삭제 (참조는 보호)"""
+    print("\n" + "="*60)
+    print("[TEST 2] 디스크 여유 공간 부족")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        newer = _file(root / "stock_videos" / "newer.mp4", 100, 2)
+        older = _file(root / "output" / "job_old.mp4", 100, 6)
+        kept = _file(root / "audio" / "master.wav", 100, 9)
+
+        gc = StorageGC(policies=_policies(root), grace_seconds=3600, min_free_bytes=1 << 62)
+        gc.add_reference_source("jobs", lambda: [kept])
+        report = gc.collect(dry_run=True)
+
+        assert [(Path(d["path"]).name, d["reason"]) for d in report["deleted"]] == [
+            ("job_old.mp4", "disk"), ("newer.mp4", "disk")
+        ]
+        disk = next(iter(report["disk"].values()))
+        assert disk["low_space"] and disk["free_bytes_after"] == disk["free_bytes"] + 200
+
+
+def test_failing_reference_source_deletes_nothing():
+    """참조를 확인할 수 없으면 GC 전체 중단"""
+    print("\n" + "="*60)
+    print("[TEST 3] 참조 소스 실패")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        old = _file(root / "stock_videos" / "old.mp4", 100, 90)
+
+        def broken():
+            raise RuntimeError("database is locked")
+
+        gc = StorageGC(policies=_policies(root), grace_seconds=0, min_free_bytes=0)
+        gc.add_reference_source("drafts", broken)
+        with pytest.raises(RuntimeError):
+            gc.collect(dry_run=False)
+        assert Path(old).exists()
+
+
+def test_bundle_paths():
+    """에셋 번들의 영상 / 마스터 오디오 / 세그먼트 TTS 경로"""
+    print("\n" + "="*60)
+    print("[TEST 4] 에셋 번들 경로")
+    print("="*60)
+
+    bundle = AssetBundle(
+        videos=[StockVideoAsset(id="v", url="u", provider="pexels", keyword="k", duration=3, local_path="a.mp4"),
+                StockVideoAsset(id="w", url="u", provider="pexels", keyword="k", duration=3)],
+        audio=AudioAsset(text="t", provider=TTSProvider.GTTS, local_path="master.mp3"),
+        segment_timings=[SegmentTiming(segment_index=0, text="t", tts_duration=1, start_time=0, end_time=1,
+                                       tts_local_path="seg_0.mp3")],
+    )
+    assert bundle_paths(bundle) == ["a.mp4", "master.mp3", "seg_0.mp3"]
+    assert bundle_paths(None) == []
+
+
+def test_tts_cache_eviction_keeps_referenced_files(monkeypatch):
+    """TTS 캐시 LRU는 Draft가 참조하거나 작업이 고정한 캐시 파일을 지우지 않음 (StorageGC 참조 공유)"""
+    print("\n" + "="*60)
+    print("[TEST 5] TTS 캐시 LRU 참조 보호")
+    print("="*60)
+
+    from core.services import storage_gc
+    from core.services.tts_cache import TTSCache, make_cache_key
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        gc = StorageGC(policies={}, grace_seconds=0, min_free_bytes=0)
+        monkeypatch.setattr(storage_gc, "_storage_gc", gc)
+        cache = TTSCache(cache_dir=temp_dir, max_bytes=350, protect_seconds=0)
+
+        keys = [make_cache_key("gtts", f"문장 {i}") for i in range(4)]
+        paths = []
+        for key in keys[:3]:
+            path, _ = cache.get_or_create(key, lambda tmp: Path(tmp).write_bytes(b"x" * 100))
+            paths.append(path)
+            time.sleep(0.01)
+        # 가장 오래된 두 항목: Draft 세그먼트 TTS / 진행 중인 작업이 고정한 파일
+        gc.add_reference_source("drafts", lambda: [os.path.relpath(paths[0])])
+        gc.pin("job_1", [paths[1]])
+
+        # 상한 초과 → 참조 안 된 세 번째 항목이 삭제됨
+        cache.get_or_create(keys[3], lambda tmp: Path(tmp).write_bytes(b"x" * 100))
+        assert Path(paths[0]).exists() and cache.get(keys[0]) == paths[0]
+        assert Path(paths[1]).exists() and cache.get(keys[1]) == paths[1]
+        assert not Path(paths[2]).exists() and cache.get(keys[2]) is None
+        assert cache.stats()["evictions"] == 1
+
+        # 참조를 확인할 수 없으면 아무것도 지우지 않음
+        def broken():
+            raise RuntimeError("database is locked")
+
+        gc.add_reference_source("drafts", broken)
+        gc.unpin("job_1")
+        cache.max_bytes = 250
+        assert cache.evict() == 0 and Path(paths[0]).exists()
+
+        # 참조가 풀리면 다시 LRU 대상
+        gc.add_reference_source("drafts", lambda: [])
+        cache.max_bytes = 0
+        assert cache.evict() == 3 and not Path(paths[0]).exists()
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_age_budget_and_references()
+    test_disk_pressure_evicts_beyond_budgets()
+    test_failing_reference_source_deletes_nothing()
+    test_bundle_paths()
+    print("\n[OK] TEST 1~4 통과 (TEST 5는 pytest로 실행)")
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+SubtitleService 테스트 스크립트
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core.config import CANVAS_WIDTH, CANVAS_HEIGHT
+from core.services.subtitle_service import get_subtitle_service
+
+
+def test_subtitle_sprite_is_cropped():
+    """자막 스프라이트는 전체 캔버스보다 훨씬 작고 캔버스 안에 위치"""
+    print("\n" + "="*60)
+    print("[TEST 1] 자막 스프라이트 크기 / 위치")
+    print("="*60)
+
+    service = get_subtitle_service()
+    sprite, x, y = service.create_subtitle_sprite("자막 스프라이트 테스트입니다")
+
+    print(f"[INFO] 스프라이트: {sprite.size} at ({x}, {y})")
+    assert sprite.mode == 'RGBA'
+    assert sprite.width * sprite.height < CANVAS_WIDTH * CANVAS_HEIGHT // 10
+    assert 0 <= x and x + sprite.width <= CANVAS_WIDTH
+    assert 0 <= y and y + sprite.height <= CANVAS_HEIGHT
+
+
+def test_subtitle_sprite_matches_full_canvas():
+    """스프라이트를 (x, y)에 붙이면 전체 캔버스 이미지와 동일"""
+    print("\n" + "="*60)
+    print("[TEST 2] 스프라이트 합성 결과 == 전체 캔버스 이미지")
+    print("="*60)
+
+    service = get_subtitle_service()
+    text = "Long subtitle text that wraps across several lines for the layout check"
+
+    full_image, y_position = service.create_subtitle_image(text)
+    sprite, x, y = service.create_subtitle_sprite(text)
+
+    full = np.asarray(full_image)
+    assert y_position == y
+    assert np.array_equal(full[y:y + sprite.height, x:x + sprite.width], np.asarray(sprite))
+
+    # 스프라이트 밖은 완전 투명
+    outside = full.copy()
+    outside[y:y + sprite.height, x:x + sprite.width] = 0
+    assert outside[..., 3].max() == 0
+
+
+def test_subtitle_clips_positions():
+    """create_subtitle_clips 결과에 스프라이트 좌표 포함"""
+    print("\n" + "="*60)
+    print("[TEST 3] create_subtitle_clips 좌표")
+    print("="*60)
+
+    service = get_subtitle_service()
+    clips = service.create_subtitle_clips([
+        {"text": "첫 번째 자막", "start": 0.0, "end": 1.5, "duration": 1.5},
+        {"text": "두 번째 자막", "start": 1.5, "end": 3.0, "duration": 1.5},
+    ])
+
+    assert len(clips) == 2
+    for data in clips:
+        assert data["image"].size != (CANVAS_WIDTH, CANVAS_HEIGHT)
+        assert "x_position" in data and "y_position" in data
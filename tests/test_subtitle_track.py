@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+SubtitleTrack (구간 인덱스 자막 트랙) 테스트 스크립트
+"""
+import sys
+import random
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from PIL import Image
+
+from core.services.subtitle_track import IntervalIndex, TrackSprite, SubtitleTrack
+
+
+def test_interval_index_matches_linear_scan():
+    """bisect 조회 결과 == 전체 선형 검사 결과 (겹치는 구간 포함)"""
+    print("\n" + "="*60)
+    print("[TEST 1] IntervalIndex 조회 정확도")
+    print("="*60)
+
+    rng = random.Random(42)
+    intervals = []
+    for i in range(300):
+        start = rng.uniform(0, 180)
+        intervals.append((start, start + rng.uniform(0.2, 8.0), i))
+
+    for inclusive_end in (False, True):
+        index = IntervalIndex(intervals, inclusive_end=inclusive_end)
+        probes = [rng.uniform(-1, 190) for _ in range(500)] + [iv[0] for iv in intervals] + [iv[1] for iv in intervals]
+
+        for t in probes:
+            if inclusive_end:
+                expected = {item for start, end, item in intervals if start <= t <= end}
+            else:
+                expected = {item for start, end, item in intervals if start <= t < end}
+            assert set(index.query(t)) == expected
+
+
+def test_track_blit_matches_alpha_composite():
+    """스프라이트 합성 결과 == PIL alpha_composite (반올림 오차 1 이내)"""
+    print("\n" + "="*60)
+    print("[TEST 2] SubtitleTrack 블렌딩")
+    print("="*60)
+
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+    rgba = rng.integers(0, 256, (30, 50, 4), dtype=np.uint8)
+
+    track = SubtitleTrack([TrackSprite(rgba, 20, 40, start=1.0, end=2.0)])
+
+    # 구간 밖: 원본 그대로
+    assert track.blit(frame, 0.5) is frame
+    assert track.blit(frame, 2.0) is frame
+
+    result = track.blit(frame, 1.5)
+
+    expected = Image.fromarray(frame).convert('RGBA')
+    overlay = Image.new('RGBA', expected.size, (0, 0, 0, 0))
+    overlay.paste(Image.fromarray(rgba), (20, 40))
+    expected = np.asarray(Image.alpha_composite(expected, overlay).convert('RGB'))
+
+    assert np.abs(result.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_sprite_from_image_trims_and_clips():
+    """전체 캔버스 이미지 → 내용 영역만 잘라내기, 프레임 밖 영역은 무시"""
+    print("\n" + "="*60)
+    print("[TEST 3] TrackSprite.from_image 여백 제거")
+    print("="*60)
+
+    canvas = np.zeros((100, 80, 4), dtype=np.uint8)
+    canvas[10:20, 5:25] = (255, 255, 255, 255)
+
+    sprite = TrackSprite.from_image(canvas)
+    assert (sprite.x, sprite.y, sprite.width, sprite.height) == (5, 10, 20, 10)
+    assert TrackSprite.from_image(np.zeros((10, 10, 4), dtype=np.uint8)) is None
+
+    # 프레임 경계를 넘는 스프라이트
+    frame = np.zeros((50, 50, 3), dtype=np.uint8)
+    track = SubtitleTrack([TrackSprite(np.full((20, 20, 4), 255, dtype=np.uint8), 40, -10, 0.0, 1.0)])
+    result = track.blit(frame, 0.5)
+    assert result[:10, 40:].min() == 255
+    assert result[10:, :].max() == 0
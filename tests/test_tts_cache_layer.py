@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+TTSCache (콘텐츠 주소 기반 TTS 캐시 + LRU 용량 상한) 테스트 스크립트
+"""
+import sys
+import asyncio
+import threading
+import time
+import tempfile
+import types
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.tts_cache import TTSCache, make_cache_key, elevenlabs_cache_key
+
+
+def test_cache_keys():
+    """전체 sha256 키, 텍스트 정규화, 제공자/언어/설정별 분리"""
+    print("\n" + "="*60)
+    print("[TEST 1] 캐시 키")
+    print("="*60)
+
+    key = make_cache_key("gtts", "안녕하세요 테스트", language="ko")
+    assert len(key) == 64 and int(key, 16) >= 0
+
+    # 공백 / 유니코드 정규화(NFD → NFC)는 같은 키
+    assert make_cache_key("gtts", "  안녕하세요\n 테스트 ", language="ko") == key
+    import unicodedata
+    assert make_cache_key("gtts", unicodedata.normalize("NFD", "안녕하세요 테스트"), language="ko") == key
+
+    assert make_cache_key("gtts", "안녕하세요 테스트", language="en") != key
+    assert make_cache_key("typecast", "안녕하세요 테스트", language="ko") != key
+    assert elevenlabs_cache_key("a", "v1", 0.5, 0.75, 0.0) != elevenlabs_cache_key("a", "v1", 0.6, 0.75, 0.0)
+    assert elevenlabs_cache_key("a", "v1", 0.5, 0.75, 0) == elevenlabs_cache_key("a", "v1", 0.5, 0.75, 0.0)
+
+
+def test_lru_eviction_and_stats():
+    """용량 상한 초과 시 LRU 삭제, 조회 시 사용 시각 갱신, 동시 생성은 한 번만"""
+    print("\n" + "="*60)
+    print("[TEST 2] LRU 삭제 / 통계 / 동시 생성")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = TTSCache(cache_dir=temp_dir, max_bytes=250, protect_seconds=0)
+
+        def writer(size):
+            return lambda path: Path(path).write_bytes(b"x" * size)
+
+        keys = [make_cache_key("gtts", f"문장 {i}") for i in range(4)]
+        for key in keys[:2]:
+            path, hit = cache.get_or_create(key, writer(100), provider="gtts")
+            assert path and not hit
+            time.sleep(0.01)
+
+        # keys[0]을 다시 사용 → keys[1]이 가장 오래된 항목
+        assert cache.get(keys[0])
+        time.sleep(0.01)
+        cache.get_or_create(keys[2], writer(100), provider="typecast")
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) and cache.get(keys[2])
+
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["total_bytes"] == 200
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 3 and stats["misses"] == 4
+        assert stats["by_provider"] == {"gtts": {"entries": 1, "bytes": 100}, "typecast": {"entries": 1, "bytes": 100}}
+
+        # 실패한 생성은 등록하지 않음
+        assert cache.get_or_create(keys[3], lambda path: False) == (None, False)
+
+        # 같은 키 동시 요청 → 생성 1회
+        calls = []
+
+        def slow_create(path):
+            calls.append(1)
+            time.sleep(0.05)
+            Path(path).write_bytes(b"y" * 10)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_create(keys[3], slow_create)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert len({path for path, _ in results}) == 1
+        assert sorted(hit for _, hit in results) == [False, True, True, True]
+
+        # 새 인스턴스(다른 프로세스)에서도 색인 유지
+        cache.close()
+        reopened = TTSCache(cache_dir=temp_dir, max_bytes=250)
+        assert reopened.get(keys[3]) and reopened.stats()["lifetime_hits"] >= 5
+        assert reopened.clear() == 3
+        assert reopened.stats()["entries"] == 0
+
+
+def test_preview_is_warm_hit_for_render(monkeypatch):
+    """미리듣기 API로 생성한 음성은 AssetManager 렌더링에서 API 호출 없이 재사용"""
+    print("\n" + "="*60)
+    print("[TEST 3] 미리듣기 → 렌더링 캐시 공유")
+    print("="*60)
+
+    calls = []
+
+    class FakeTextToSpeech:
+        def convert(self, **kwargs):
+            calls.append(kwargs)
+            yield b"ID3fake-mp3-bytes"
+
+    class FakeElevenLabs:
+        def __init__(self, api_key):
+            self.text_to_speech = FakeTextToSpeech()
+
+    client_module = types.ModuleType("elevenlabs.client")
+    client_module.ElevenLabs = FakeElevenLabs
+    monkeypatch.setitem(sys.modules, "elevenlabs", types.ModuleType("elevenlabs"))
+    monkeypatch.setitem(sys.modules, "elevenlabs.client", client_module)
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "test-key")
+
+    import backend.routers.tts as tts_router
+    from core.asset_manager import AssetManager
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = TTSCache(cache_dir=str(Path(temp_dir) / "tts_cache"))
+        monkeypatch.setattr(tts_router, "get_tts_cache", lambda: cache)
+
+        request = tts_router.TTSPreviewRequest(text="미리 들어 보는 문장", voice_id="voice123", stability=0.4)
+        response = asyncio.run(tts_router.preview_tts(request))
+        assert response.headers["X-Cache"] == "MISS"
+        assert asyncio.run(tts_router.preview_tts(request)).headers["X-Cache"] == "HIT"
+        assert len(calls) == 1
+
+        manager = AssetManager(download_dir=temp_dir, bgm_enabled=False, tts_cache=cache)
+        path = manager._generate_elevenlabs(
+            text="미리 들어 보는  문장", voice_id="voice123", stability=0.4, similarity_boost=0.75, style=0.0
+        )
+        assert path == response.path
+        assert len(calls) == 1
+
+        # 설정이 다르면 새로 생성
+        manager._generate_elevenlabs(text="미리 들어 보는 문장", voice_id="voice123", stability=0.9)
+        assert len(calls) == 2
+
+
+def test_failed_create_keeps_single_generation():
+    """생성이 실패해 잠금이 풀려도 기다리던 스레드와 새로 온 스레드가 동시에 생성하지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 4] 생성 실패 후 동시 생성 방지")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = TTSCache(cache_dir=temp_dir, max_bytes=10_000, protect_seconds=0)
+        key = make_cache_key("gtts", "실패 후 재시도")
+        guard = threading.Lock()
+        state = {"active": 0, "max_active": 0, "calls": 0}
+
+        def flaky_create(path):
+            with guard:
+                state["calls"] += 1
+                first = state["calls"] == 1
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            time.sleep(0.05)
+            with guard:
+                state["active"] -= 1
+            if first:
+                return False
+            Path(path).write_bytes(b"z" * 10)
+
+        results = []
+
+        def request(delay):
+            time.sleep(delay)
+            results.append(cache.get_or_create(key, flaky_create))
+
+        # 첫 생성(실패) 중에 대기하는 스레드 + 실패 직후 도착하는 스레드
+        threads = [threading.Thread(target=request, args=(i * 0.01,)) for i in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert state["max_active"] == 1
+        assert state["calls"] == 2
+        assert sorted(hit for _, hit in results) == [False, False] + [True] * 10
+        # 모든 요청이 끝나면 키별 잠금 정리
+        assert cache._key_locks == {} and cache._key_waiters == {}
+        cache.close()
+
+
+def test_asset_manager_default_cache_under_download_dir():
+    """캐시를 주입하지 않은 AssetManager는 download_dir 아래에, 처음 사용할 때 캐시를 만듦"""
+    print("\n" + "="*60)
+    print("[TEST 5] AssetManager 기본 캐시 위치")
+    print("="*60)
+
+    from core.asset_manager import AssetManager
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = AssetManager(download_dir=temp_dir, bgm_enabled=False)
+        cache_dir = Path(temp_dir) / "audio" / "tts_cache"
+        assert manager.tts_cache is None and not cache_dir.exists()
+
+        cache = manager._get_tts_cache()
+        assert cache.cache_dir == cache_dir and (cache_dir / "index.db").exists()
+        assert manager._get_tts_cache() is cache
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_cache_keys()
+    test_lru_eviction_and_stats()
+    test_failed_create_keeps_single_generation()
+    test_asset_manager_default_cache_under_download_dir()
+    print("\n[OK] TEST 1~2, 4~5 통과 (TEST 3은 pytest로 실행)")
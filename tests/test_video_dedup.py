@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+스톡 영상 지각 해시 중복 제거 (dHash 지문 / 하드링크 합치기 / 인접 세그먼트 중복 피하기) 테스트 스크립트
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import FakeStockProvider, make_manager, stock_asset
+from core.models import ContentPlan, ScriptSegment, StockVideoAsset
+from core.services.clip_library import ClipLibrary
+from core.services.ffmpeg_render_service import find_ffmpeg
+from core.services.rendition import rendition_filename
+from core.services.stock_search_cache import StockSearchCache
+from core.services.video_fingerprint import (
+    compute_fingerprint, dhash, fingerprint_bands, fingerprint_distance, is_informative
+)
+
+FFMPEG = find_ffmpeg()
+pytestmark = pytest.mark.skipif(FFMPEG is None, reason="ffmpeg 없음")
+
+# 원본 영상: 같은 장면(x)의 두 렌디션, 다른 장면(y, z), 검은 화면(k)
+FOOTAGE = {
+    "x_big": ["-f", "lavfi", "-i", "testsrc2=size=360x640:rate=10:duration=4", "-crf", "20"],
+    "x_small": ["-f", "lavfi", "-i", "testsrc2=size=360x640:rate=10:duration=4", "-vf", "scale=180:320", "-crf", "35"],
+    "y": ["-f", "lavfi", "-i", "mandelbrot=size=360x640:rate=10", "-t", "4"],
+    "z": ["-f", "lavfi", "-i", "testsrc2=size=360x640:rate=10:duration=4", "-vf", "hflip,vflip"],
+    "k": ["-f", "lavfi", "-i", "color=c=black:size=360x640:rate=10:duration=4"],
+}
+
+
+@pytest.fixture(scope="module")
+def footage():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {}
+        for name, args in FOOTAGE.items():
+            path = os.path.join(temp_dir, f"{name}.mp4")
+            subprocess.run([FFMPEG, "-v", "error", *args, "-pix_fmt", "yuv420p", path], check=True)
+            paths[name] = path
+        yield paths
+
+
+def test_fingerprint_distance(footage):
+    """같은 장면은 렌디션 / 인코딩이 달라도 가깝고, 다른 장면은 멀고, 검은 화면은 비교하지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 1] dHash 지문")
+    print("="*60)
+
+    # 왼쪽이 더 밝으면 1
+    assert dhash(bytes([9, 8, 7, 6, 5, 4, 3, 2, 1] * 8)) == (1 << 64) - 1
+    assert dhash(bytes(range(9)) * 8) == 0
+
+    prints = {name: compute_fingerprint(path, duration=4.0, frames=4) for name, path in footage.items()}
+    assert all(len(fp) == 64 for fp in prints.values())
+
+    assert fingerprint_distance(prints["x_big"], prints["x_small"]) <= 4
+    assert fingerprint_distance(prints["x_big"], prints["y"]) > 10
+    assert fingerprint_distance(prints["x_big"], prints["z"]) > 10
+    assert not is_informative(prints["k"]) and fingerprint_bands(prints["k"]) == []
+    assert fingerprint_distance(prints["k"], prints["k"]) is None
+    assert fingerprint_distance(prints["x_big"], prints["x_big"][:32]) is None
+
+    # 파일이 없으면 None
+    assert compute_fingerprint(os.path.join(os.path.dirname(footage["x_big"]), "missing.mp4"), duration=4.0) is None
+
+
+def test_library_find_duplicate(footage):
+    """밴드 색인으로 지문이 가까운 항목만 찾음 (자기 자신 / 없어진 파일 제외)"""
+    print("\n" + "="*60)
+    print("[TEST 2] 라이브러리 중복 검색")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library = ClipLibrary(temp_dir, index_path=":memory:")
+        items = []
+        for clip_id, name in (("pexels_1", "x_big"), ("pexels_2", "y"), ("pixabay_3", "k")):
+            path = shutil.copy(footage[name], os.path.join(temp_dir, f"{clip_id}.mp4"))
+            items.append((StockVideoAsset(id=clip_id, url="u", provider=clip_id.split("_")[0], keyword=name,
+                                          duration=4.0, fingerprint=compute_fingerprint(path, 4.0), local_path=path),
+                          name))
+        library.add_many(items)
+        assert library.stats()["fingerprinted"] == 3
+
+        small = compute_fingerprint(footage["x_small"], 4.0)
+        asset, distance = library.find_duplicate(small, max_distance=4)
+        assert asset.id == "pexels_1" and distance <= 4 and asset.fingerprint == items[0][0].fingerprint
+        assert library.find_duplicate(small, max_distance=4, exclude=["pexels_1"]) is None
+        assert library.find_duplicate(compute_fingerprint(footage["z"], 4.0), max_distance=4) is None
+        # 검은 화면끼리는 같은 영상으로 보지 않음
+        assert library.find_duplicate(items[2][0].fingerprint, max_distance=64) is None
+
+        # 지문 없이 색인된 항목 갱신
+        late = items[1][0].model_copy(update={"fingerprint": None})
+        library.add(late, "y")
+        assert library.stats()["fingerprinted"] == 2
+        library.set_fingerprint(items[1][0])
+        assert library.find_duplicate(items[1][0].fingerprint, max_distance=0)[0].id == "pexels_2"
+
+        os.remove(items[0][0].local_path)
+        assert library.find_duplicate(small, max_distance=4) is None
+
+
+def _footage_provider(footage: dict, results: dict, calls: list) -> FakeStockProvider:
+    """검색어별 결과를 정해 두고, 다운로드하면 원본 영상을 복사하는 가짜 제공자"""
+    sources = {clip_id: source for clip_id, source, _, _ in sum(results.values(), [])}
+
+    def search(provider, query, kwargs):
+        return [stock_asset(clip_id.split("_")[0], query, clip_id, duration=4.0, width=width, height=height)
+                for clip_id, _, width, height in results.get(query, [])]
+
+    def download(asset, output_dir):
+        return shutil.copy(footage[sources[asset.id]], os.path.join(output_dir, rendition_filename(asset)))
+
+    return FakeStockProvider("pexels", calls, results=search, download=download)
+
+
+def _manager(temp_dir: str, provider: FakeStockProvider):
+    return make_manager(temp_dir, {"pexels": provider, "pixabay": provider},
+                        search_cache=StockSearchCache(":memory:"), dedup_enabled=True,
+                        clip_library=ClipLibrary(os.path.join(temp_dir, "stock_videos"), index_path=":memory:"))
+
+
+def test_duplicate_downloads_share_one_file(footage):
+    """다른 ID로 받은 같은 영상은 해상도가 큰 파일 하나로 합쳐짐 (하드링크)"""
+    print("\n" + "="*60)
+    print("[TEST 3] 같은 영상 하드링크")
+    print("="*60)
+
+    results = {
+        "ocean waves": [("pexels_1", "x_big", 360, 640)],
+        "city lights": [("pexels_2", "y", 360, 640)],
+        "sea surf": [("pixabay_3", "x_small", 180, 320)],
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _manager(temp_dir, _footage_provider(footage, results, []))
+        plan = ContentPlan(title="t", description="d", segments=[
+            ScriptSegment(text="a", keyword="sea", image_search_query="ocean waves"),
+            ScriptSegment(text="b", keyword="city", image_search_query="city lights"),
+            ScriptSegment(text="c", keyword="sea", image_search_query="sea surf"),
+        ])
+        assets = manager._collect_stock_videos(plan)
+        assert [a.id for a in assets] == ["pexels_1", "pexels_2", "pixabay_3"]
+        assert all(a.fingerprint for a in assets)
+
+        big, _, small = assets
+        assert os.path.samefile(big.local_path, small.local_path)
+        assert Path(small.local_path).name == "pixabay_3_180x320.mp4"
+        # 큰 렌디션이 남음
+        assert os.path.getsize(small.local_path) == os.path.getsize(footage["x_big"])
+        assert os.stat(big.local_path).st_nlink == 2
+        assert manager._get_clip_library().stats()["fingerprinted"] == 3
+
+        # 캐시에도 지문이 남아 다음 실행은 다시 계산하지 않음
+        cached = manager._get_cached_video("sea surf")
+        assert cached.fingerprint == small.fingerprint
+
+
+def test_adjacent_segments_avoid_duplicates(footage):
+    """이웃한 세그먼트가 같은 영상이면 뒤 세그먼트는 다음 후보로 교체, 대체 영상이 없으면 유지"""
+    print("\n" + "="*60)
+    print("[TEST 4] 인접 세그먼트 중복 피하기")
+    print("="*60)
+
+    results = {
+        "ocean waves": [("pexels_1", "x_big", 360, 640), ("pexels_5", "z", 360, 640)],
+        "sea surf": [("pixabay_3", "x_small", 180, 320), ("pixabay_4", "y", 360, 640)],
+        "rain": [("pexels_6", "x_big", 360, 640)],
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        calls = []
+        manager = _manager(temp_dir, _footage_provider(footage, results, calls))
+        plan = ContentPlan(title="t", description="d", segments=[
+            ScriptSegment(text="a", keyword="sea", image_search_query="ocean waves"),
+            ScriptSegment(text="b", keyword="sea", image_search_query="sea surf"),     # 다른 ID의 같은 영상
+            ScriptSegment(text="c", keyword="sea", image_search_query="ocean waves"),  # 같은 검색어
+            ScriptSegment(text="d", keyword="sea", image_search_query="ocean waves"),
+            ScriptSegment(text="e", keyword="rain", image_search_query="rain"),        # 대체 후보 없음
+        ])
+        assets = manager._collect_stock_videos(plan)
+        assert [a.id for a in assets] == ["pexels_1", "pixabay_4", "pexels_1", "pexels_5", "pexels_6"]
+        for previous, current in zip(assets, assets[1:-1]):
+            assert not manager._near_duplicate(previous, current)
+        # 교체 영상은 라이브러리에 색인되어 다음에는 네트워크 없이 재사용
+        assert ("download", "pexels", "pixabay_4") in calls and ("download", "pexels", "pexels_5") in calls
+
+        calls.clear()
+        again = manager._collect_stock_videos(plan)
+        assert [a.id for a in again] == [a.id for a in assets]
+        assert not any(call[0] == "download" for call in calls)
+
+        # 중복 제거를 끄면 기존 동작
+        manager.dedup_enabled = False
+        assert [a.id for a in manager._collect_stock_videos(plan)] == ["pexels_1", "pixabay_3", "pexels_1",
+                                                                       "pexels_1", "pexels_6"]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {}
+        for name, args in FOOTAGE.items():
+            paths[name] = os.path.join(temp_dir, f"{name}.mp4")
+            subprocess.run([FFMPEG, "-v", "error", *args, "-pix_fmt", "yuv420p", paths[name]], check=True)
+        test_fingerprint_distance(paths)
+        test_library_find_duplicate(paths)
+        test_duplicate_downloads_share_one_file(paths)
+        test_adjacent_segments_avoid_duplicates(paths)
+    print("\n[OK] 모든 테스트 통과")
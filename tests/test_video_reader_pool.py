@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+VideoReaderPool (소스 영상 디코더 풀) 테스트 스크립트
+"""
+import sys
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pytest
+from moviepy import VideoFileClip
+
+from core.services.ffmpeg_render_service import find_ffmpeg
+from core.services.video_reader_pool import VideoReaderPool
+
+
+def _make_clips(ffmpeg_cmd: str, temp_dir: str, count: int):
+    """서로 다른 패턴의 짧은 클립 생성"""
+    paths = []
+    for i in range(count):
+        path = os.path.join(temp_dir, f"clip_{i}.mp4")
+        subprocess.run(
+            [ffmpeg_cmd, "-y", "-loglevel", "error",
+             "-f", "lavfi", "-i", f"testsrc2=size=160x90:rate=30:duration={1 + i * 0.5}",
+             "-pix_fmt", "yuv420p", path],
+            check=True
+        )
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_pool_matches_video_file_clip():
+    """풀 클립의 메타데이터/프레임 == VideoFileClip"""
+    print("\n" + "="*60)
+    print("[TEST 1] PooledVideoClip == VideoFileClip")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = _make_clips(find_ffmpeg(), temp_dir, 2)[1]
+
+        pool = VideoReaderPool(max_open=2)
+        clip = pool.clip(path)
+        assert pool.open_count == 0  # 생성 시점에는 디코더 없음
+
+        reference = VideoFileClip(path, audio=False)
+        try:
+            assert tuple(clip.size) == tuple(reference.size)
+            assert clip.fps == reference.fps
+            assert abs(clip.duration - reference.duration) < 1e-6
+
+            for t in (0.0, 0.7, 1.2, 0.3):
+                assert np.array_equal(clip.get_frame(t), reference.get_frame(t))
+
+            # MoviePy 변환도 그대로 동작
+            sub = clip.subclipped(0.5, 1.0).resized((80, 44))
+            assert sub.get_frame(0.1).shape == (44, 80, 3)
+        finally:
+            reference.close()
+            pool.close()
+
+        assert pool.open_count == 0
+
+
+@pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg 없음")
+def test_pool_caps_and_reuses_decoders():
+    """동시 디코더 수 제한 (LRU) + 같은 파일은 디코더 하나 공유"""
+    print("\n" + "="*60)
+    print("[TEST 2] 디코더 수 제한 / 재사용")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = _make_clips(find_ffmpeg(), temp_dir, 3)
+        pool = VideoReaderPool(max_open=2)
+
+        # 같은 에셋이 타임라인 두 곳에 나옴
+        clips = [pool.clip(paths[0]), pool.clip(paths[1]), pool.clip(paths[0])]
+        for clip in clips:
+            clip.get_frame(0.2)
+        assert pool.opened_count == 2
+        assert pool.open_count == 2
+
+        # 세 번째 파일 → 가장 오래 쓰지 않은 paths[1] 디코더가 닫힘
+        pool.clip(paths[2]).get_frame(0.1)
+        assert pool.open_count == 2
+        assert set(pool._readers) == {paths[0], paths[2]}
+
+        # 닫힌 디코더는 다시 요청되면 새로 열림
+        clips[1].get_frame(0.5)
+        assert pool.opened_count == 4
+        assert pool.open_count == 2
+
+        # close()는 해당 경로 디코더만 반납
+        clips[1].close()
+        assert paths[1] not in pool._readers
+        pool.close()
+        assert pool.open_count == 0
+
+
+if __name__ == "__main__":
+    test_pool_matches_video_file_clip()
+    test_pool_caps_and_reuses_decoders()
+    print("\n[OK] 모든 테스트 통과")
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Whisper 상주 워커 + 정렬 결과 캐시 테스트 스크립트
+
+실제 Whisper 대신 로드 횟수와 pid를 돌려주는 가짜 모델 모듈을 워커에 로드합니다.
+"""
+import sys
+import os
+import shutil
+import socket
+import tempfile
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.whisper_worker import WhisperWorkerPool, RemoteWhisperWorker, serve
+from core.services.alignment_service import AlignmentService, AlignmentCache
+
+
+FAKE_MODEL = textwrap.dedent('''
+    import os
+    import time
+
+    LOADS = 0
+
+
+    class FakeModel:
+        def transcribe(self, audio_path, language=None, word_timestamps=True, verbose=False):
+            time.sleep(0.05)
+            words = [
+                {"word": " 안녕하세요 ", "start": 0.0, "end": 0.5},
+                {"word": language or "", "start": 0.5, "end": 1.0},
+                {"word": "loads=%d" % LOADS, "start": 1.0, "end": 1.5},
+            ]
+            return {"segments": [{"text": "", "start": 0.0, "end": 1.5, "words": words}]}
+
+
+    def load_model(model_size):
+        global LOADS
+        LOADS += 1
+        time.sleep(0.2)
+        return FakeModel()
+''')
+
+
+CRASHING_MODEL = textwrap.dedent('''
+    import os
+    import time
+
+
+    class CrashingModel:
+        def transcribe(self, audio_path, language=None, word_timestamps=True, verbose=False):
+            time.sleep(0.3)
+            if "crash" in os.path.basename(audio_path):
+                os._exit(3)  # 크래시 / OOM kill 흉내
+            return {"segments": [{"text": "ok", "start": 0.0, "end": 1.0}]}
+
+
+    def load_model(model_size):
+        return CrashingModel()
+''')
+
+
+def _install_fake_model(temp_dir: str) -> str:
+    """가짜 모델 모듈을 sys.path에 추가 (spawn 워커에도 sys.path가 전달됨)"""
+    Path(temp_dir, "fake_whisper_model.py").write_text(FAKE_MODEL, encoding="utf-8")
+    sys.path.insert(0, temp_dir)
+    return "fake_whisper_model:load_model"
+
+
+def test_pool_keeps_model_resident():
+    """여러 스레드 요청을 한 워커가 모델 1회 로드로 처리"""
+    print("\n" + "="*60)
+    print("[TEST 1] 상주 워커 풀")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        loader = _install_fake_model(temp_dir)
+        audio = Path(temp_dir, "a.wav")
+        audio.write_bytes(b"RIFF")
+
+        pool = WhisperWorkerPool("tiny", workers=1, loader=loader)
+        try:
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(pool.transcribe(str(audio), language="ko")))
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert len(results) == 4
+            assert len({pid for _, pid in results}) == 1
+            assert results[0][1] != os.getpid()  # 별도 프로세스에서 처리
+            for words, _ in results:
+                assert [w["word"] for w in words] == ["안녕하세요", "ko", "loads=1"]
+            assert pool.started_workers == 1
+        finally:
+            pool.close()
+            sys.path.remove(temp_dir)
+
+
+def test_crashed_worker_wakes_waiting_request():
+    """요청 처리 중 워커가 죽으면 그 요청은 RuntimeError, 기다리던 요청은 새 워커에서 처리"""
+    print("\n" + "="*60)
+    print("[TEST 2] 워커 크래시 후 대기 요청 처리")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Path(temp_dir, "crashing_whisper_model.py").write_text(CRASHING_MODEL, encoding="utf-8")
+        sys.path.insert(0, temp_dir)
+        crash = Path(temp_dir, "crash.wav")
+        normal = Path(temp_dir, "normal.wav")
+        crash.write_bytes(b"RIFF")
+        normal.write_bytes(b"RIFF")
+
+        pool = WhisperWorkerPool("tiny", workers=1, loader="crashing_whisper_model:load_model")
+        outcomes = {}
+
+        def run(name: str, audio: Path) -> None:
+            try:
+                outcomes[name] = pool.transcribe(str(audio))
+            except Exception as e:
+                outcomes[name] = e
+
+        try:
+            first = threading.Thread(target=run, args=("crash", crash), daemon=True)
+            first.start()
+            time.sleep(0.1)
+            # 워커 1개가 사용 중이므로 대기
+            second = threading.Thread(target=run, args=("normal", normal), daemon=True)
+            second.start()
+
+            first.join(30)
+            second.join(30)
+            assert not first.is_alive() and not second.is_alive(), "대기 중인 요청이 깨어나지 않음"
+
+            assert isinstance(outcomes["crash"], RuntimeError)
+            assert "exitcode=3" in str(outcomes["crash"])
+            words, pid = outcomes["normal"]
+            assert words[0]["word"] == "ok" and pid != os.getpid()
+            assert pool.started_workers == 1
+        finally:
+            pool.close()
+            sys.path.remove(temp_dir)
+
+        # 닫힌 풀은 즉시 오류
+        try:
+            pool.transcribe(str(normal))
+            assert False, "닫힌 풀에서 요청이 처리됨"
+        except RuntimeError:
+            pass
+
+
+def test_alignment_cache_skips_transcription():
+    """같은 오디오 바이트 + 모델 + 언어면 다른 경로여도 전사 생략"""
+    print("\n" + "="*60)
+    print("[TEST 3] 정렬 결과 캐시")
+    print("="*60)
+
+    calls = []
+
+    class CountingWorker:
+        def transcribe(self, audio_path, language=None, word_timestamps=True, **options):
+            calls.append((audio_path, language))
+            return [{"word": "안녕", "start": 0.0, "end": 0.4}], 1234
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        first = Path(temp_dir, "tts_combined_1.wav")
+        first.write_bytes(b"same audio bytes")
+        rerender = Path(temp_dir, "tts_combined_2.wav")
+        shutil.copyfile(first, rerender)
+        changed = Path(temp_dir, "tts_combined_3.wav")
+        changed.write_bytes(b"new audio bytes")
+
+        cache = AlignmentCache(os.path.join(temp_dir, "alignment.db"))
+        service = AlignmentService(model_size="tiny", cache=cache, worker=CountingWorker())
+
+        assert service.extract_word_timestamps(str(first), language="ko")[0]["word"] == "안녕"
+        assert service.extract_word_timestamps(str(rerender), language="ko")[0]["word"] == "안녕"
+        assert len(calls) == 1
+
+        # 언어 / 모델 / 오디오가 다르면 새로 전사
+        service.extract_word_timestamps(str(first), language="en")
+        service.extract_word_timestamps(str(changed), language="ko")
+        AlignmentService(model_size="small", cache=cache, worker=CountingWorker()).extract_word_timestamps(str(first), language="ko")
+        assert len(calls) == 4
+
+        # 캐시는 파일에 남아 다음 프로세스에서도 사용
+        reopened = AlignmentService(model_size="tiny", cache=AlignmentCache(os.path.join(temp_dir, "alignment.db")), worker=CountingWorker())
+        reopened.extract_word_timestamps(str(rerender), language="ko")
+        assert len(calls) == 4
+
+
+def test_remote_worker_server():
+    """워커 서버 하나를 여러 클라이언트(프로세스)가 공유"""
+    print("\n" + "="*60)
+    print("[TEST 4] 워커 서버 / 클라이언트")
+    print("="*60)
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    address = ("127.0.0.1", port)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        loader = _install_fake_model(temp_dir)
+        audio = Path(temp_dir, "a.wav")
+        audio.write_bytes(b"RIFF")
+
+        ready, stop = threading.Event(), threading.Event()
+        server = threading.Thread(
+            target=serve,
+            kwargs=dict(address=address, model_size="tiny", authkey=b"test", loader=loader, ready=ready, stop=stop),
+            daemon=True
+        )
+        server.start()
+        assert ready.wait(10)
+
+        try:
+            client_a = RemoteWhisperWorker(address, authkey=b"test")
+            client_b = RemoteWhisperWorker(address, authkey=b"test")
+            words_a, pid_a = client_a.transcribe(str(audio), language="ko")
+            words_b, pid_b = client_b.transcribe(str(audio), language="en")
+            assert pid_a == pid_b
+            assert words_a[-1]["word"] == words_b[-1]["word"] == "loads=1"
+            assert words_b[1]["word"] == "en"
+
+            # 키가 다르면 연결 거부
+            try:
+                RemoteWhisperWorker(address, authkey=b"wrong").transcribe(str(audio))
+                assert False, "잘못된 키로 요청이 처리됨"
+            except Exception as e:
+                assert not isinstance(e, AssertionError)
+        finally:
+            stop.set()
+            # accept() 대기 해제용 연결
+            try:
+                RemoteWhisperWorker(address, authkey=b"test").transcribe(str(audio))
+            except Exception:
+                pass
+            server.join(10)
+            sys.path.remove(temp_dir)
+
+
+def test_authkey_required():
+    """기본 인증 키 없음: 키가 없으면 서버 / 클라이언트 모두 시작하지 않음"""
+    print("\n" + "="*60)
+    print("[TEST 5] 워커 서버 인증 키 필수")
+    print("="*60)
+
+    saved = os.environ.pop("WHISPER_WORKER_AUTHKEY", None)
+    try:
+        for start in (lambda: serve(address=("127.0.0.1", 0)), lambda: RemoteWhisperWorker(("127.0.0.1", 1))):
+            try:
+                start()
+                assert False, "인증 키 없이 시작됨"
+            except RuntimeError as e:
+                assert "WHISPER_WORKER_AUTHKEY" in str(e)
+
+        os.environ["WHISPER_WORKER_AUTHKEY"] = "from-env"
+        assert RemoteWhisperWorker(("127.0.0.1", 1)).authkey == b"from-env"
+    finally:
+        os.environ.pop("WHISPER_WORKER_AUTHKEY", None)
+        if saved is not None:
+            os.environ["WHISPER_WORKER_AUTHKEY"] = saved
+
+
+if __name__ == "__main__":
+    test_pool_keeps_model_resident()
+    test_crashed_worker_wakes_waiting_request()
+    test_alignment_cache_skips_transcription()
+    test_remote_worker_server()
+    test_authkey_required()
+    print("\n[OK] 모든 테스트 통과")
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+ASR 없는 단어 타임스탬프 엔진 (세그먼트 TTS 길이 분배) 테스트 스크립트
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.word_timing import (
+    WordTimingService, syllable_weight, pause_weight, detect_silences, chunk_timestamps
+)
+
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def test_weighted_distribution():
+    """음절 수 비율 분배 + 문장부호 뒤 쉼"""
+    print("\n" + "="*60)
+    print("[TEST 1] 음절/문장부호 가중치 분배")
+    print("="*60)
+
+    assert syllable_weight("안녕하세요,") == 5
+    assert syllable_weight("AI") == 1 and syllable_weight("banana") == 3
+    assert syllable_weight("2024년") == 1.2 * 4 + 1
+    assert pause_weight("안녕하세요,") > 0 and pause_weight("끝.") > pause_weight("안녕하세요,")
+    assert pause_weight("단어") == 0
+
+    words = WordTimingService().estimate_words("가 나다라, 마바.", duration=4.0, offset=10.0)
+    assert [w["word"] for w in words] == ["가", "나다라,", "마바."]
+
+    # 단어 길이는 음절 수에 비례, 쉼표 뒤에는 간격
+    lengths = [w["end"] - w["start"] for w in words]
+    assert abs(lengths[1] / lengths[0] - 3) < 1e-3
+    assert words[0]["end"] == words[1]["start"]
+    assert words[2]["start"] - words[1]["end"] > 0.5
+
+    # 절대 시각 (offset 기준)으로 세그먼트 전체를 덮음
+    assert words[0]["start"] == 10.0 and words[-1]["end"] == 14.0
+    assert all(a["end"] <= b["start"] for a, b in zip(words, words[1:]))
+
+
+def test_silence_anchoring():
+    """PCM 무음 검출: 앞뒤 무음 제외, 발화 중 무음을 단어 경계에 고정"""
+    print("\n" + "="*60)
+    print("[TEST 2] 무음 구간 고정")
+    print("="*60)
+
+    # 0.2초 무음 + 1.0초 발화 + 0.6초 무음 + 0.5초 발화 + 0.3초 무음
+    samples = np.concatenate([_silence(0.2), _tone(1.0), _silence(0.6), _tone(0.5), _silence(0.3)])
+    speech_start, speech_end, gaps = detect_silences(samples, SAMPLE_RATE)
+    assert abs(speech_start - 0.2) < 0.03 and abs(speech_end - 2.3) < 0.03
+    assert len(gaps) == 1 and abs(gaps[0][0] - 1.2) < 0.03 and abs(gaps[0][1] - 1.8) < 0.03
+
+    # 글자 수만으로는 경계가 1.25초 근처에 오지만, 실제 무음(1.2~1.8초)에 맞춰짐
+    text = "하나둘셋 넷다섯 여섯일곱"
+    duration = len(samples) / SAMPLE_RATE
+    words = WordTimingService().estimate_words(text, duration, samples=samples, sample_rate=SAMPLE_RATE)
+
+    assert abs(words[0]["start"] - 0.2) < 0.03
+    assert abs(words[1]["end"] - 1.2) < 0.03
+    assert abs(words[2]["start"] - 1.8) < 0.03
+    assert abs(words[2]["end"] - 2.3) < 0.03
+
+    # 무음이 없으면 기본 분배 유지
+    flat = WordTimingService().estimate_words(text, 2.0, samples=_tone(2.0), sample_rate=SAMPLE_RATE)
+    assert flat[0]["start"] == 0.0 and abs(flat[-1]["end"] - 2.0) < 0.03
+
+
+def test_subtitle_chunks_follow_words():
+    """자막 청크가 첫 단어 시작 시각에 표시"""
+    print("\n" + "="*60)
+    print("[TEST 3] 자막 청크 타이밍")
+    print("="*60)
+
+    words = [
+        {"word": "짧은", "start": 0.0, "end": 0.4},
+        {"word": "문장.", "start": 0.4, "end": 0.8},
+        {"word": "아주아주아주", "start": 1.5, "end": 2.5},
+        {"word": "긴", "start": 2.5, "end": 2.7},
+        {"word": "두번째", "start": 2.7, "end": 3.2},
+    ]
+    spans = chunk_timestamps(["짧은 문장.", "아주아주아주 긴 두번째"], words, 0.0, 3.5)
+    assert spans == [(0.0, 1.5), (1.5, 3.5)]
+
+    # 단어 수가 맞지 않으면 None (기존 글자 수 비율로 대체)
+    assert chunk_timestamps(["짧은 문장."], words, 0.0, 3.5) is None
+    assert chunk_timestamps(["짧은 문장."], [], 0.0, 3.5) is None
+
+    from core.services.subtitle_service import SubtitleService
+    service = SubtitleService.__new__(SubtitleService)
+    service.create_subtitle_sprite = lambda chunk: (None, 0, 0)
+    service._split_long_text = lambda text, max_chars: ["짧은 문장.", "아주아주아주 긴 두번째"]
+
+    clips = service.create_subtitle_clips([{
+        "text": "짧은 문장. 아주아주아주 긴 두번째",
+        "start": 0.0, "end": 3.5, "duration": 3.5,
+        "words": words
+    }])
+    assert [(c["start"], c["duration"]) for c in clips] == [(0.0, 1.5), (1.5, 2.0)]
+
+
+def test_alignment_mode_default():
+    """ALIGNMENT_MODE 미설정 시 openai-whisper가 설치되어 있으면 "whisper", 없으면 "duration" """
+    print("\n" + "="*60)
+    print("[TEST 4] 정렬 방식 기본값")
+    print("="*60)
+
+    import importlib.util
+    import tempfile
+    from core import asset_manager
+    from core.asset_manager import AssetManager
+
+    installed = importlib.util.find_spec("whisper") is not None
+    assert asset_manager.WHISPER_AVAILABLE == installed
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        original = asset_manager.ALIGNMENT_MODE
+        try:
+            asset_manager.ALIGNMENT_MODE = None
+            expected = "whisper" if installed else "duration"
+            assert AssetManager(download_dir=temp_dir, bgm_enabled=False).alignment_mode == expected
+            assert AssetManager(download_dir=temp_dir, bgm_enabled=False,
+                                alignment_mode="duration").alignment_mode == "duration"
+
+            # 환경 변수로 고른 방식이 우선
+            asset_manager.ALIGNMENT_MODE = "duration"
+            assert AssetManager(download_dir=temp_dir, bgm_enabled=False).alignment_mode == "duration"
+        finally:
+            asset_manager.ALIGNMENT_MODE = original
+
+
+def test_failed_alignment_keeps_estimate():
+    """Whisper 정렬 결과가 없으면(입력 세그먼트 그대로 반환) 추정 단어 타임스탬프 유지, 있으면 세그먼트 순서대로 적용"""
+    print("\n" + "="*60)
+    print("[TEST 5] Whisper 정렬 실패 시 추정치 유지")
+    print("="*60)
+
+    from core.asset_manager import AssetManager
+    from core.models import ContentPlan, ScriptSegment, SegmentTiming, WordTiming
+
+    plan = ContentPlan(title="t", description="d", segments=[
+        ScriptSegment(text="하나 둘", keyword="k", duration=1.0),
+        ScriptSegment(text="실패", keyword="k", duration=1.0),
+        ScriptSegment(text="셋", keyword="k", duration=0.5),
+    ])
+    # 두 번째 세그먼트는 TTS 실패로 타이밍 없음
+    timings = [
+        SegmentTiming(segment_index=0, text="하나 둘", tts_duration=1.0, start_time=0.0, end_time=1.0,
+                      words=[WordTiming(word="하나", start=0.0, end=0.5), WordTiming(word="둘", start=0.5, end=1.0)]),
+        SegmentTiming(segment_index=2, text="셋", tts_duration=0.5, start_time=1.0, end_time=1.5,
+                      words=[WordTiming(word="셋", start=1.0, end=1.5)]),
+    ]
+    unaligned = [{"text": seg.text, "keyword": seg.keyword} for seg in plan.segments]
+
+    assert not AssetManager._apply_whisper_alignment(plan, timings, unaligned)
+    assert not AssetManager._apply_whisper_alignment(plan, timings, [])
+    assert [len(t.words) for t in timings] == [2, 1]
+    assert [t.end_time for t in timings] == [1.0, 1.5]
+
+    aligned = [dict(item, duration=d) for item, d in zip(unaligned, (0.8, 0.3, 0.4))]
+    assert AssetManager._apply_whisper_alignment(plan, timings, aligned)
+    assert [(round(t.start_time, 6), round(t.end_time, 6)) for t in timings] == [(0.0, 0.8), (0.8, 1.2)]
+    assert [seg.duration for seg in plan.segments] == [0.8, 1.0, 0.4]
+    assert all(t.words == [] for t in timings)
+
+
+if __name__ == "__main__":
+    test_weighted_distribution()
+    test_silence_anchoring()
+    test_subtitle_chunks_follow_words()
+    test_alignment_mode_default()
+    test_failed_alignment_keeps_estimate()
+    print("\n[OK] 모든 테스트 통과")